@@ -64,10 +64,18 @@ def from_fem(
     enable_cache=False,
     source_units=Units.M,
     fem_converter="default",
+    num_workers=1,
 ) -> Assembly:
+    """Import one or more FEM files. With a list of files and num_workers > 1 (or None for all cpus) each file is
+    parsed in a separate worker process. Unnamed files are then named by their file stem (see import_fem_files), while
+    a sequential import keeps the default names given by the FEM readers."""
     a = Assembly(enable_cache=enable_cache, units=source_units)
     if type(fem_file) is str or issubclass(type(fem_file), pathlib.Path):
         a.read_fem(fem_file, fem_format, name, fem_converter=fem_converter)
+    elif type(fem_file) is list and (num_workers is None or num_workers > 1) and enable_cache is False:
+        from ada.fem.formats.parallel_import import import_fem_files
+
+        import_fem_files(a, fem_file, fem_format, name, fem_converter=fem_converter, num_workers=num_workers)
     elif type(fem_file) is list:
         for i, f in enumerate(fem_file):
             fem_format_in = fem_format if fem_format is None else fem_format[i]
@@ -50,7 +50,6 @@ class BackendGeom(Root):
 
     def add_penetration(self, pen, add_to_layer: str = None):
         from ada import Penetration, Shape
-        from ada.base.changes import ChangeAction
 
         pen.parent = self
 
@@ -62,8 +61,7 @@ class BackendGeom(Root):
         else:
             raise ValueError("")
 
-        if self.change_type in (ChangeAction.NOCHANGE, ChangeAction.NOTDEFINED):
-            self.change_type = ChangeAction.MODIFIED
+        self.mark_modified()
 
         if add_to_layer is not None:
             a = self.get_assembly()
@@ -184,11 +182,12 @@ class BackendGeom(Root):
             self._colour = _cmap[value.lower()]
         else:
             self._colour = value
+        self.mark_modified()
 
     @property
     def colour_norm(self):
         if self._colour is None:
-            self.colour = "white"
+            self._colour = _cmap["white"]
         return [x / 255 for x in self.colour] if any(i > 1 for i in self.colour) else self.colour
 
     @property
@@ -218,6 +217,7 @@ class BackendGeom(Root):
             raise ValueError(f'Opacity is only valid between 1 and 0. "{value}" was passed in')
 
         self._opacity = value
+        self.mark_modified()
 
     @property
     def transparent(self):
@@ -242,6 +242,7 @@ class BackendGeom(Root):
     @placement.setter
     def placement(self, value: Placement):
         self._placement = value
+        self.mark_modified()
 
     def _repr_html_(self):
         from ada.config import Settings
@@ -54,6 +54,7 @@ class Root:
             logger.debug(f'Character "/" found in {value}')
 
         self._name = value.strip()
+        self.mark_modified()
 
     @property
     def guid(self):
@@ -94,6 +95,12 @@ class Root:
     def units(self, value):
         raise NotImplementedError("Assigning units is not yet represented for this object")
 
+    def mark_modified(self) -> None:
+        """Flag an unchanged object as modified. Only the objects flagged as added, modified or deleted are written to
+        (or removed from) the IFC file on the next sync."""
+        if getattr(self, "change_type", None) in (ChangeAction.NOCHANGE, ChangeAction.NOTDEFINED):
+            self.change_type = ChangeAction.MODIFIED
+
     def get_assembly(self) -> Union[Assembly, Part]:
         from ada import Assembly
 
@@ -112,13 +119,16 @@ class Root:
         return ancestry
 
     def remove(self):
-        """Remove this element/part from assembly/part"""
-        from ada import Beam, Part, Plate, Section, Shape
+        """Remove this element/part from assembly/part. Objects already written to the IFC file of the assembly are
+        removed from it on the next sync."""
+        from ada import Assembly, Beam, Part, Pipe, Plate, Section, Shape, Wall
 
         if self.parent is None:
             logger.error(f"Unable to delete {self.name} as it does not have a parent")
             return
 
+        a = self.get_assembly()
+
         if issubclass(type(self), Part):
             self.parent.parts.pop(self.name)
         elif issubclass(type(self), Shape):
@@ -127,7 +137,16 @@ class Root:
             self.parent.beams.remove(self)
         elif isinstance(self, Plate):
             self.parent.plates.remove(self)
+        elif isinstance(self, Pipe):
+            self.parent.pipes.remove(self)
+        elif isinstance(self, Wall):
+            self.parent.walls.remove(self)
         elif isinstance(self, Section):
             logger.warning("Section removal is not yet supported")
+            return
         else:
             raise NotImplementedError()
+
+        if self.change_type != ChangeAction.ADDED and isinstance(a, Assembly):
+            a.ifc_store.removed_objects.append(self)
+        self.change_type = ChangeAction.DELETED
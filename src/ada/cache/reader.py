@@ -1,9 +1,26 @@
 import json
+from functools import partial
 
 import h5py
-
-from ada import Beam, Material, Section
-from ada.concepts.containers import Beams, Materials, Nodes, Sections
+import numpy as np
+
+from ada import (
+    Beam,
+    Material,
+    Pipe,
+    Placement,
+    Plate,
+    PrimBox,
+    PrimCyl,
+    PrimExtrude,
+    PrimRevolve,
+    PrimSphere,
+    PrimSweep,
+    Section,
+    Shape,
+    Wall,
+)
+from ada.concepts.containers import Beams, Materials, Nodes, Plates, Sections
 from ada.concepts.points import Node
 from ada.concepts.spatial import Assembly, Part
 from ada.config import logger
@@ -46,7 +63,8 @@ def get_part_from_cache(name, part_cache):
     p = Part(name, metadata=metadata)
     fem = part_cache.get("FEM")
     if fem is not None:
-        p._fem = get_fem_from_cache(fem)
+        # The FEM is only read from the cache file on first access of Part.fem
+        p._fem_loader = partial(read_fem_from_cache, part_cache.file.filename, fem.name)
 
     node_group = part_cache.get("NODES")
     if node_group is not None:
@@ -64,18 +82,188 @@ def get_part_from_cache(name, part_cache):
     if beams is not None:
         p._beams = beams
 
+    plates = get_plates_from_cache(part_cache, p)
+    if plates is not None:
+        p._plates = plates
+
+    shapes = get_shapes_from_cache(part_cache, p)
+    if shapes is not None:
+        p._shapes = shapes
+
+    pipes = get_pipes_from_cache(part_cache, p)
+    if pipes is not None:
+        p._pipes = pipes
+
+    walls = get_walls_from_cache(part_cache, p)
+    if walls is not None:
+        p._walls = walls
+
     return p
 
 
+def placement_from_cache(place_flt) -> Placement:
+    return Placement(origin=place_flt[0:3], xdir=place_flt[3:6], zdir=place_flt[6:9])
+
+
+def colour_from_cache(colour_flt):
+    return None if np.isnan(colour_flt[0]) else tuple(colour_flt.tolist())
+
+
+def get_points_from_cache(part_cache, prefix, suffix="") -> list[list[tuple]]:
+    """Split the flat points dataset using the offsets index. NaN padding (i.e. missing radius) is removed"""
+    points = part_cache[f"{prefix}_PTS{suffix}"][()]
+    offsets = part_cache[f"{prefix}_IDX{suffix}"][()]
+    return [[tuple(x[~np.isnan(x)].tolist()) for x in points[i:j]] for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def get_plates_from_cache(part_cache, parent: Part):
+    prefix = "PLATES"
+    plates_str = part_cache.get(f"{prefix}_STR")
+    if plates_str is None:
+        return None
+
+    def pl_from_cache(pl_str, pl_flt, points):
+        guid, name, mat_name, meta_str = str_fix(pl_str)
+        mat = parent.materials.get_by_name(mat_name)
+        placement = placement_from_cache(pl_flt[1:10])
+        offset = None if np.isnan(pl_flt[10]) else float(pl_flt[10])
+        metadata = json.loads(meta_str)
+        return Plate(
+            name,
+            points,
+            pl_flt[0],
+            mat=mat,
+            placement=placement,
+            offset=offset,
+            colour=colour_from_cache(pl_flt[11:14]),
+            opacity=float(pl_flt[14]),
+            guid=guid,
+            parent=parent,
+            metadata=metadata,
+        )
+
+    pl_zip = zip(plates_str, part_cache[f"{prefix}_FLT"][()], get_points_from_cache(part_cache, prefix))
+
+    return Plates([pl_from_cache(*pl_data) for pl_data in pl_zip], parent=parent)
+
+
+def shape_from_cache(shp_type: str, name, params, points, sweep_points, **kwargs) -> Shape:
+    if shp_type == PrimBox.__name__:
+        return PrimBox(name, tuple(params[0:3]), tuple(params[3:6]), **kwargs)
+    elif shp_type == PrimCyl.__name__:
+        return PrimCyl(name, params[0:3], params[3:6], params[6], **kwargs)
+    elif shp_type == PrimSphere.__name__:
+        return PrimSphere(name, tuple(params[0:3]), params[3], **kwargs)
+    elif shp_type == PrimExtrude.__name__:
+        return PrimExtrude(name, points, params[0], params[7:10], params[1:4], params[4:7], **kwargs)
+    elif shp_type == PrimRevolve.__name__:
+        return PrimRevolve(name, points, params[1:4], params[4:7], params[7:10], params[0], **kwargs)
+    elif shp_type == PrimSweep.__name__:
+        return PrimSweep(name, sweep_points, params[6:9], params[3:6], points, origin=params[0:3], **kwargs)
+    else:
+        mass = params[0] if not np.isnan(params[0]) else None
+        cog = tuple(params[1:4]) if not np.isnan(params[1]) else None
+        return Shape(name, None, mass=mass, cog=cog, **kwargs)
+
+
+def get_shapes_from_cache(part_cache, parent: Part):
+    prefix = "SHAPES"
+    shapes_str = part_cache.get(f"{prefix}_STR")
+    if shapes_str is None:
+        return None
+
+    def shp_from_cache(shp_str, shp_flt, points, sweep_points):
+        guid, name, shp_type, mat_name, meta_str = str_fix(shp_str)
+        mat = parent.materials.get_by_name(mat_name)
+        placement = placement_from_cache(shp_flt[:9])
+        metadata = json.loads(meta_str)
+        shp = shape_from_cache(
+            shp_type,
+            name,
+            shp_flt[9:19],
+            points,
+            sweep_points,
+            material=mat,
+            placement=placement,
+            guid=guid,
+            colour=colour_from_cache(shp_flt[19:22]),
+            opacity=float(shp_flt[22]),
+        )
+        shp.metadata.update(metadata)
+        shp.parent = parent
+        return shp
+
+    shp_zip = zip(
+        shapes_str,
+        part_cache[f"{prefix}_FLT"][()],
+        get_points_from_cache(part_cache, prefix),
+        get_points_from_cache(part_cache, prefix, suffix="2"),
+    )
+
+    return [shp_from_cache(*shp_data) for shp_data in shp_zip]
+
+
+def get_pipes_from_cache(part_cache, parent: Part):
+    prefix = "PIPES"
+    pipes_str = part_cache.get(f"{prefix}_STR")
+    if pipes_str is None:
+        return None
+
+    def pipe_from_cache(pipe_str, pipe_flt, points):
+        guid, name, sec_name, mat_name, meta_str = str_fix(pipe_str)
+        sec = parent.sections.get_by_name(sec_name)
+        mat = parent.materials.get_by_name(mat_name)
+        colour = colour_from_cache(pipe_flt[:3])
+        pipe = Pipe(name, points, sec, mat=mat, guid=guid, metadata=json.loads(meta_str), colour=colour)
+        pipe.opacity = float(pipe_flt[3])
+        pipe.parent = parent
+        return pipe
+
+    pipe_zip = zip(pipes_str, part_cache[f"{prefix}_FLT"][()], get_points_from_cache(part_cache, prefix))
+
+    return [pipe_from_cache(*pipe_data) for pipe_data in pipe_zip]
+
+
+def get_walls_from_cache(part_cache, parent: Part):
+    prefix = "WALLS"
+    walls_str = part_cache.get(f"{prefix}_STR")
+    if walls_str is None:
+        return None
+
+    def wall_from_cache(wall_str, wall_flt, points):
+        guid, name, meta_str = str_fix(wall_str)
+        height, thickness, offset = wall_flt[:3]
+        placement = placement_from_cache(wall_flt[3:12])
+        wall = Wall(
+            name,
+            points,
+            height,
+            thickness,
+            placement,
+            float(offset),
+            metadata=json.loads(meta_str),
+            colour=colour_from_cache(wall_flt[12:15]),
+            guid=guid,
+            opacity=float(wall_flt[15]),
+        )
+        wall.parent = parent
+        return wall
+
+    wall_zip = zip(walls_str, part_cache[f"{prefix}_FLT"][()], get_points_from_cache(part_cache, prefix))
+
+    return [wall_from_cache(*wall_data) for wall_data in wall_zip]
+
+
 def get_beams_from_cache(part_cache, parent: Part):
     prefix = "BEAMS"
     beams_str = part_cache.get(f"{prefix}_STR")
     beams_int = part_cache.get(f"{prefix}_INT")
     beams_up = part_cache.get(f"{prefix}_UP")
+    beams_flt = part_cache.get(f"{prefix}_FLT")
     if beams_str is None:
         return None
 
-    def bm_from_cache(bm_str, bm_int, bm_up):
+    def bm_from_cache(bm_str, bm_int, bm_up, bm_flt):
         nid1, nid2 = [parent.nodes.from_id(nid) for nid in bm_int]
         guid, name, sec_name, mat_name, meta_str = str_fix(bm_str)
         sec = parent.sections.get_by_name(sec_name)
@@ -83,11 +271,23 @@ def get_beams_from_cache(part_cache, parent: Part):
         metadata = None
         if meta_str is not None:
             metadata = json.loads(meta_str)
-        return Beam(name, nid1, nid2, sec=sec, mat=mat, guid=guid, parent=parent, metadata=metadata, up=bm_up)
+        return Beam(
+            name,
+            nid1,
+            nid2,
+            sec=sec,
+            mat=mat,
+            guid=guid,
+            parent=parent,
+            metadata=metadata,
+            up=bm_up,
+            colour=colour_from_cache(bm_flt[:3]),
+            opacity=float(bm_flt[3]),
+        )
 
-    bm_zip = zip(beams_str, beams_int, beams_up)
+    bm_zip = zip(beams_str, beams_int, beams_up, beams_flt)
 
-    return Beams([bm_from_cache(bm_str, bm_int, bm_up) for bm_str, bm_int, bm_up in bm_zip], parent=parent)
+    return Beams([bm_from_cache(*bm_data) for bm_data in bm_zip], parent=parent)
 
 
 def get_sections_from_cache(part_cache, parent):
@@ -142,6 +342,11 @@ def get_materials_from_cache(part_cache, parent):
     return Materials([mat_from_list(mat_int, mat_str) for mat_int, mat_str in zip(mat_int, mat_str)], parent=parent)
 
 
+def read_fem_from_cache(h5_filename, fem_group_name) -> FEM:
+    with h5py.File(h5_filename, "r") as f:
+        return get_fem_from_cache(f[fem_group_name])
+
+
 def get_fem_from_cache(cache_fem):
     node_groups = cache_fem["NODES"]
     fem = FEM(cache_fem.attrs["NAME"])
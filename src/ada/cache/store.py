@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 
 from ada.config import logger
 
+from .utils import CACHE_VERSION
+
 if TYPE_CHECKING:
     from ada import Assembly
 
@@ -87,6 +89,12 @@ class CacheStore:
 
         write_assembly_to_cache(assembly, self.cache_file)
 
+    def get_cache_version(self) -> int | None:
+        import h5py
+
+        with h5py.File(self.cache_file, "r") as f:
+            return f["INFO"].attrs.get("VERSION")
+
     def is_cache_outdated(self, input_file=None):
         is_cache_outdated = False
         state = self._get_file_state()
@@ -106,6 +114,9 @@ class CacheStore:
         if self.cache_file.exists() is False:
             logger.debug("Cache file not found")
             is_cache_outdated = True
+        elif self.get_cache_version() != CACHE_VERSION:
+            logger.info(f'Cache file "{self.cache_file}" has an outdated format and will be rebuilt')
+            is_cache_outdated = True
 
         if input_file is not None:
             curr_in_file = pathlib.Path(input_file)
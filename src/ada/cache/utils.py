@@ -1,3 +1,7 @@
+# Increment when the layout of the cache file changes. Cache files of another version are outdated
+CACHE_VERSION = 2
+
+
 def str_fix(s):
     return [x.decode("utf-8") for x in s]
 
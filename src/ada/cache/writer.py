@@ -7,11 +7,27 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ada import Beam, Material, Part, Section
+from ada import (
+    Beam,
+    Material,
+    Part,
+    Pipe,
+    Placement,
+    Plate,
+    PrimBox,
+    PrimCyl,
+    PrimExtrude,
+    PrimRevolve,
+    PrimSphere,
+    PrimSweep,
+    Section,
+    Shape,
+    Wall,
+)
 from ada.concepts.containers import Nodes
 from ada.config import logger
 
-from .utils import to_safe_name
+from .utils import CACHE_VERSION, to_safe_name
 
 if TYPE_CHECKING:
     from ada import FEM, Assembly
@@ -25,10 +41,16 @@ def write_assembly_to_cache(assembly: "Assembly", cache_file_path):
 
     cache_file_path = pathlib.Path(cache_file_path)
     os.makedirs(cache_file_path.parent, exist_ok=True)
+
+    # FEM objects that are lazily loaded from an existing cache must be read before the cache file is overwritten
+    for p in assembly.get_all_parts_in_assembly():
+        p.load_lazy_fem()
+
     h5_filename = cache_file_path.with_suffix(".h5")
     with h5py.File(h5_filename, "w") as f:
         info = f.create_group("INFO")
         info.attrs.create("NAME", assembly.name)
+        info.attrs.create("VERSION", CACHE_VERSION)
 
         parts_group = f.create_group("PARTS")
 
@@ -62,16 +84,16 @@ def add_part_to_cache(part: Part, parent_part_group):
         add_beams_to_cache(part, part_group)
 
     if len(part.plates) > 0:
-        add_plates_to_cache()
+        add_plates_to_cache(part, part_group)
 
     if len(part.shapes) > 0:
-        add_shapes_to_cache()
+        add_shapes_to_cache(part, part_group)
 
     if len(part.pipes) > 0:
-        add_pipes_to_cache()
+        add_pipes_to_cache(part, part_group)
 
     if len(part.walls) > 0:
-        add_walls_to_cache()
+        add_walls_to_cache(part, part_group)
 
     # Add FEM object
     if len(part.fem.nodes) > 0:
@@ -108,20 +130,125 @@ def add_materials_to_cache(part, parts_group):
     parts_group.create_dataset(f"{prefix}_STR", data=[add_strings_to_cache(bm) for bm in part.materials])
 
 
-def add_plates_to_cache():
-    logger.error("Plate caching is not yet implemented")
+def placement_to_cache(place: Placement) -> list[float]:
+    return [*place.origin, *place.xdir, *place.zdir]
+
+
+def colour_to_cache(colour) -> list[float]:
+    return list(colour)[:3] if colour is not None else [np.nan] * 3
+
+
+def pad_points(points, width: int) -> np.ndarray:
+    """Points with optional radius (i.e. (x, y) and (x, y, r)) are stored as rows padded with NaN"""
+    padded = np.full((len(points), width), np.nan)
+    for i, p in enumerate(points):
+        p = p.p if hasattr(p, "p") else p
+        padded[i, : len(p)] = p
+    return padded
+
+
+def add_points_to_cache(prefix: str, points: list[np.ndarray], parts_group, suffix=""):
+    """Variable length point lists are stored in one flat dataset and an index of offsets"""
+    offsets = np.cumsum([0] + [len(x) for x in points])
+    parts_group.create_dataset(f"{prefix}_PTS{suffix}", data=np.concatenate(points))
+    parts_group.create_dataset(f"{prefix}_IDX{suffix}", data=offsets)
+
+
+def add_plates_to_cache(part: Part, parts_group):
+    prefix = "PLATES"
+
+    def add_flt_cache(pl: Plate):
+        offset = pl.offset if pl.offset is not None else np.nan
+        return [pl.t, *placement_to_cache(pl.poly.placement), offset, *colour_to_cache(pl.colour), pl.opacity]
+
+    def add_str_cache(pl: Plate):
+        return [pl.guid, pl.name, pl.material.name, json.dumps(pl.metadata)]
+
+    parts_group.create_dataset(f"{prefix}_FLT", data=[add_flt_cache(pl) for pl in part.plates])
+    parts_group.create_dataset(f"{prefix}_STR", data=[add_str_cache(pl) for pl in part.plates])
+    add_points_to_cache(prefix, [pad_points(pl.poly.points2d, 3) for pl in part.plates], parts_group)
+
 
+def shape_params_to_cache(shp: Shape) -> list[float]:
+    if isinstance(shp, PrimBox):
+        return [*shp.p1, *shp.p2]
+    elif isinstance(shp, PrimCyl):
+        return [*shp.p1, *shp.p2, shp.r]
+    elif isinstance(shp, PrimSphere):
+        return [*shp.cog, shp.radius]
+    elif isinstance(shp, PrimExtrude):
+        return [shp.extrude_depth, *placement_to_cache(shp.poly.placement)]
+    elif isinstance(shp, PrimRevolve):
+        place = shp.poly.placement
+        return [shp.revolve_angle, *shp.revolve_origin, *place.xdir, *place.zdir]
+    elif isinstance(shp, PrimSweep):
+        return placement_to_cache(shp.profile_curve_outer.placement)
+    else:
+        cog = shp.cog if shp.cog is not None else [np.nan] * 3
+        return [shp.mass if shp.mass is not None else np.nan, *cog]
 
-def add_shapes_to_cache():
-    logger.error("Shape caching is not yet implemented")
 
+def add_shapes_to_cache(part: Part, parts_group):
+    """Primitives are stored by their defining parameters. The geometry of generic shapes is not stored and is
+    retrieved from the IFC store on demand"""
+    prefix = "SHAPES"
+    num_params = 10
 
-def add_pipes_to_cache():
-    logger.error("Pipes caching is not yet implemented")
+    def add_flt_cache(shp: Shape):
+        params = shape_params_to_cache(shp)
+        padding = [np.nan] * (num_params - len(params))
+        return [*placement_to_cache(shp.placement), *params, *padding, *colour_to_cache(shp.colour), shp.opacity]
 
+    def add_str_cache(shp: Shape):
+        return [shp.guid, shp.name, type(shp).__name__, shp.material.name, json.dumps(shp.metadata)]
 
-def add_walls_to_cache():
-    logger.error("Walls caching is not yet implemented")
+    def curve_points(shp: Shape):
+        if isinstance(shp, (PrimExtrude, PrimRevolve)):
+            return pad_points(shp.poly.points2d, 3)
+        elif isinstance(shp, PrimSweep):
+            return pad_points(shp.profile_curve_outer.points2d, 3)
+        return np.zeros((0, 3))
+
+    def sweep_points(shp: Shape):
+        if isinstance(shp, PrimSweep):
+            return pad_points(shp.sweep_curve.points3d, 4)
+        return np.zeros((0, 4))
+
+    parts_group.create_dataset(f"{prefix}_FLT", data=[add_flt_cache(shp) for shp in part.shapes])
+    parts_group.create_dataset(f"{prefix}_STR", data=[add_str_cache(shp) for shp in part.shapes])
+    add_points_to_cache(prefix, [curve_points(shp) for shp in part.shapes], parts_group)
+    add_points_to_cache(prefix, [sweep_points(shp) for shp in part.shapes], parts_group, suffix="2")
+
+
+def add_pipes_to_cache(part: Part, parts_group):
+    prefix = "PIPES"
+
+    def add_flt_cache(pipe: Pipe):
+        return [*colour_to_cache(pipe.colour), pipe.opacity]
+
+    def add_str_cache(pipe: Pipe):
+        return [pipe.guid, pipe.name, pipe.section.name, pipe.material.name, json.dumps(pipe.metadata)]
+
+    parts_group.create_dataset(f"{prefix}_FLT", data=[add_flt_cache(pipe) for pipe in part.pipes])
+    parts_group.create_dataset(f"{prefix}_STR", data=[add_str_cache(pipe) for pipe in part.pipes])
+    add_points_to_cache(prefix, [pad_points(pipe.points, 3) for pipe in part.pipes], parts_group)
+
+
+def add_walls_to_cache(part: Part, parts_group):
+    prefix = "WALLS"
+
+    def add_flt_cache(wall: Wall):
+        placement = placement_to_cache(wall.placement)
+        return [wall.height, wall.thickness, wall.offset, *placement, *colour_to_cache(wall.colour), wall.opacity]
+
+    def add_str_cache(wall: Wall):
+        if len(wall.inserts) > 0:
+            logger.warning(f'Caching of wall inserts is not supported. Inserts of "{wall.name}" are skipped')
+        return [wall.guid, wall.name, json.dumps(wall.metadata)]
+
+    parts_group.create_dataset(f"{prefix}_FLT", data=[add_flt_cache(wall) for wall in part.walls])
+    parts_group.create_dataset(f"{prefix}_STR", data=[add_str_cache(wall) for wall in part.walls])
+    add_points_to_cache(prefix, [pad_points(wall.points, 3) for wall in part.walls], parts_group)
 
 
 def add_beams_to_cache(part: Part, parts_group):
@@ -139,7 +266,11 @@ def add_beams_to_cache(part: Part, parts_group):
     def add_str_cache(bm: Beam):
         return [bm.guid, bm.name, bm.section.name, bm.material.name, json.dumps(bm.metadata)]
 
+    def add_flt_cache(bm: Beam):
+        return [*colour_to_cache(bm.colour), bm.opacity]
+
     parts_group.create_dataset(f"{prefix}_INT", data=[add_int_cache(bm) for bm in part.beams])
+    parts_group.create_dataset(f"{prefix}_FLT", data=[add_flt_cache(bm) for bm in part.beams])
     parts_group.create_dataset(f"{prefix}_STR", data=[add_str_cache(bm) for bm in part.beams])
     parts_group.create_dataset(f"{prefix}_UP", data=[add_int_cache(bm, True) for bm in part.beams])
 
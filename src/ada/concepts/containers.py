@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import reprlib
-from bisect import bisect_left, bisect_right
+from bisect import bisect_left
 from itertools import chain
 from operator import attrgetter
 from typing import TYPE_CHECKING, Dict, Iterable, List, Union
@@ -15,6 +15,7 @@ from ada.concepts.stru_beams import Beam
 from ada.concepts.stru_plates import Plate
 from ada.concepts.transforms import Rotation
 from ada.config import Settings, logger
+from ada.core.spatial_index import HashGridIndex, SpatialIndex
 from ada.core.utils import Counter, roundoff
 from ada.core.vector_utils import (
     is_null_vector,
@@ -430,16 +431,20 @@ class Connections(BaseCollections):
         :param point_tol:
         """
         from ada.concepts.connections import JointBase
-        from ada.core.clash_check import are_beams_connected
+        from ada.core.clash_check import find_beam_intersections
 
         ass = self._parent.get_assembly()
-        bm_res = ass.beam_clash_check()
+        all_beams = [bm for p in ass.get_all_subparts() + [ass] for bm in p.beams]
 
         nodes = Nodes()
         nmap = dict()
 
-        for bm1_, beams_ in bm_res:
-            are_beams_connected(bm1_, beams_, out_of_plane_tol, point_tol, nodes, nmap)
+        for bm1, bm2, point in find_beam_intersections(all_beams, out_of_plane_tol=out_of_plane_tol):
+            n = nodes.add(Node(point), point_tol=point_tol)
+            members = nmap.setdefault(n, [])
+            for bm in (bm1, bm2):
+                if bm not in members:
+                    members.append(bm)
 
         for node, mem in nmap.items():
             if joint_func is not None:
@@ -583,6 +588,8 @@ class Materials(NumericMapped):
     def add(self, material) -> Material:
         if material in self:
             existing_mat = self._name_map[material.name]
+            if existing_mat is material:
+                return existing_mat
             for elem in material.refs:
                 if elem not in existing_mat.refs:
                     existing_mat.refs.append(elem)
@@ -759,8 +766,15 @@ class Sections(NumericMapped):
 
 
 class Nodes:
-    def __init__(self, nodes=None, parent=None, from_np_array=None):
+    """A sorted collection of Node objects.
+
+    Volume queries, duplicate detection on add, coincident node merging and nearest node lookups are served by a
+    spatial index kept in step with the node list (a HashGridIndex unless another SpatialIndex is passed).
+    """
+
+    def __init__(self, nodes=None, parent=None, from_np_array=None, spatial_index: SpatialIndex = None):
         self._parent = parent
+        self._spatial_index = HashGridIndex() if spatial_index is None else spatial_index
 
         if from_np_array is not None:
             self._array = from_np_array
@@ -787,14 +801,26 @@ class Nodes:
             self._idmap = {n.id: n for n in sorted(self._nodes, key=attrgetter("id"))}
         except TypeError as e:
             raise TypeError(e)
+        self._spatial_index.rebuild(self._nodes)
+
+    def rebuild_index(self) -> None:
+        """Re-sorts the nodes and rebuilds the spatial index. Required after node coordinates are modified in place"""
+        self._sort()
 
     def renumber(self, start_id: int = 1, renumber_map: dict = None):
         """Ensures that the node numberings starts at 1 and has no holes in its numbering."""
+        # Array based element containers (FemElementArrays) store node ids and must be updated after renumbering
+        remap_node_refs = getattr(getattr(self.parent, "elements", None), "remap_node_refs", None)
+        old_ids = [n.id for n in self._nodes] if remap_node_refs is not None else None
+
         if renumber_map is not None:
             self._renumber_from_map(renumber_map)
         else:
             self._renumber_linearly(start_id)
 
+        if remap_node_refs is not None and len(self._nodes) > 0:
+            remap_node_refs(old_ids, [n.id for n in self._nodes])
+
         self._sort()
         self._maxid = max(self._idmap.keys()) if len(self._nodes) > 0 else 0
         self._bbox = self._get_bbox() if len(self._nodes) > 0 else None
@@ -957,20 +983,7 @@ class Nodes:
             raise Exception("No valid search input provided. None is returned")
 
         vol_min, vol_max = zip(*vol)
-        xmin = bisect_left(self._nodes, Node(vol_min))
-        xmax = bisect_right(self._nodes, Node(vol_max))
-
-        xlist = sorted(self._nodes[xmin:xmax], key=attrgetter("y"))
-        ysorted = [n.y for n in xlist]
-        ymin = bisect_left(ysorted, vol_min[1])
-        ymax = bisect_right(ysorted, vol_max[1])
-
-        ylist = sorted(xlist[ymin:ymax], key=attrgetter("z"))
-        zsorted = [n.z for n in ylist]
-        zmin = bisect_left(zsorted, vol_min[2])
-        zmax = bisect_right(zsorted, vol_max[2])
-
-        simplesearch = ylist[zmin:zmax]
+        simplesearch = sorted(self._spatial_index.query_box(vol_min, vol_max), key=attrgetter("x", "y", "z"))
 
         if vol_cyl is not None:
             r, h, t = vol_cyl
@@ -990,7 +1003,13 @@ class Nodes:
 
             return list(filter(None, [eval_p_in_cyl(q) for q in simplesearch]))
         else:
-            return list(simplesearch)
+            return simplesearch
+
+    def get_nearest(self, p: Union[Node, Iterable[float]], max_dist: float = None) -> Union[Node, None]:
+        """Returns the node closest to point p. If max_dist is set, None is returned if no node is within max_dist"""
+        if isinstance(p, Node):
+            p = p.p
+        return self._spatial_index.nearest(p, max_dist=max_dist)
 
     def add(self, node: Node, point_tol: float = Settings.point_tol, allow_coincident: bool = False) -> Node:
         """Insert node into sorted list"""
@@ -1002,6 +1021,7 @@ class Nodes:
 
             self._nodes.insert(i, n)
             self._idmap[n.id] = n
+            self._spatial_index.insert(n)
             self._bbox = None
             self._maxid = n.id if n.id > self._maxid else self._maxid
 
@@ -1022,20 +1042,62 @@ class Nodes:
 
         return node
 
-    def remove(self, nodes: Union[Node, Iterable[Node]]):
-        """Remove node(s) from the nodes container"""
+    def remove(self, nodes: Union[Node, int, Iterable[Union[Node, int]]], renumber: bool = True):
+        """Remove node(s) from the nodes container. Nodes can be given as Node objects or node ids.
+
+        The nodes are removed in a single pass over the (sorted) node list and the remaining nodes are renumbered
+        once. Removing m nodes is thus a single O(n) pass instead of m passes (and m renumberings).
+
+        :param renumber: Renumber the remaining nodes from 1 (the default). Otherwise the node ids are kept
+        """
         nodes = list(nodes) if isinstance(nodes, Iterable) else [nodes]
+
+        to_remove = dict()
         for node in nodes:
-            if node in self._nodes:
-                logger.debug(f"Removing {node}")
-                self._nodes.pop(self._nodes.index(node))
-                self.renumber()
-            else:
+            is_id = isinstance(node, (int, np.integer))
+            stored = self._idmap.get(int(node) if is_id else node.id)
+            if stored is None or (is_id is False and stored != node):
                 logger.error(f"'{node}' not found in node-container.")
+                continue
+            to_remove[id(stored)] = stored
+
+        if len(to_remove) == 0:
+            return None
+
+        logger.debug(f"Removing {len(to_remove)} nodes")
+        self._nodes = [n for n in self._nodes if id(n) not in to_remove]
+        for node in to_remove.values():
+            del self._idmap[node.id]
+
+        if renumber:
+            # Renumbering re-sorts the nodes and rebuilds the spatial index
+            self.renumber()
+            return None
+
+        if len(to_remove) > len(self._nodes):
+            self._spatial_index.rebuild(self._nodes)
+        else:
+            for node in to_remove.values():
+                self._spatial_index.remove(node)
+
+        self._maxid = max(self._idmap.keys()) if len(self._nodes) > 0 else 0
+        self._bbox = None
+
+    def _get_ref_counts(self) -> Dict[int, int]:
+        """Number of usage references of each node id. Elements stored as arrays (FemElementArrays) are counted
+        without being registered in Node.refs"""
+        counts = {n.id: len(n.refs) for n in self._nodes}
+        get_node_ref_counts = getattr(getattr(self.parent, "elements", None), "get_node_ref_counts", None)
+        if get_node_ref_counts is not None:
+            for nid, count in get_node_ref_counts().items():
+                if nid in counts:
+                    counts[nid] += count
+        return counts
 
     def remove_standalones(self) -> None:
         """Remove nodes that are without any usage references"""
-        self.remove(filter(lambda x: not x.has_refs, self._nodes))
+        counts = self._get_ref_counts()
+        self.remove([n for n in self._nodes if counts[n.id] == 0])
 
     def merge_coincident(self, tol: float = Settings.point_tol) -> None:
         """
@@ -1044,27 +1106,48 @@ class Nodes:
         :return:
         """
 
+        # The merged nodes are collected and removed in bulk once all duplicates are found
+        removed = dict()
+        replaced = dict()
+        counts = self._get_ref_counts()
+
         def replace_duplicate_nodes(duplicates: Iterable[Node], new_node: Node):
-            if duplicates and len(new_node.refs) >= np.max(list(map(lambda x: len(x.refs), duplicates))):
+            if duplicates and counts[new_node.id] >= np.max(list(map(lambda x: counts[x.id], duplicates))):
                 for duplicate_node in duplicates:
                     replace_node(duplicate_node, new_node)
-                    self.remove(duplicate_node)
-
-        for node in filter(lambda x: x.has_refs, self._nodes):
+                    removed[id(duplicate_node)] = duplicate_node
+                    replaced[duplicate_node.id] = new_node.id
+                    counts[new_node.id] += counts[duplicate_node.id]
+                    counts[duplicate_node.id] = 0
+
+        for node in [n for n in self._nodes if counts[n.id] > 0]:
+            if id(node) in removed:
+                continue
             duplicate_nodes = list(
                 sorted(
-                    filter(lambda x: x.id != node.id, self.get_by_volume(node.p, tol=tol)), key=lambda x: len(x.refs)
+                    filter(lambda x: x.id != node.id and id(x) not in removed, self.get_by_volume(node.p, tol=tol)),
+                    key=lambda x: counts[x.id],
                 )
             )
             replace_duplicate_nodes(duplicate_nodes, node)
 
-        self._sort()
+        # Array based element containers (FemElementArrays) store node ids and are not updated by replace_node
+        replace_node_refs = getattr(getattr(self.parent, "elements", None), "replace_node_refs", None)
+        if replace_node_refs is not None:
+            replace_node_refs(replaced)
+
+        if len(removed) > 0:
+            self.remove(list(removed.values()))
+        else:
+            self._sort()
 
     def rounding_node_points(self, precision: int = Settings.precision) -> None:
         """Rounds all nodes to set precision"""
         for node in self.nodes:
             node.p_roundoff(precision=precision)
 
+        self._sort()
+
     @property
     def parent(self) -> Union[Part, FEM]:
         return self._parent
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Union
 
+import numpy as np
+
 from ada.base.changes import ChangeAction
 from ada.base.ifc_types import SpatialTypes
 from ada.base.physical_objects import BackendGeom
@@ -116,6 +118,7 @@ class Part(BackendGeom):
         self._groups: dict[str, Group] = dict()
         self._ifc_class = ifc_class
         self._props = settings
+        self._fem_loader: Callable[[], FEM] | None = None
         if fem is not None:
             fem.parent = self
 
@@ -291,7 +294,7 @@ class Part(BackendGeom):
             section.units = self.units
         return self._sections.add(section)
 
-    def add_mass (self, mass: MassPoint) -> MassPoint:
+    def add_mass(self, mass: MassPoint) -> MassPoint:
         self._masses.append(mass)
         return mass
 
@@ -657,14 +660,21 @@ class Part(BackendGeom):
         and it returns a dictionary of all beam ids and the touching beams. A margin to the beam volume can be included.
 
         :param margins: Add margins to the volume box (equal in all directions). Input is in meters. Can be negative.
-        :return: A map generator for the list of beams and resulting intersecting beams
+        :return: A list of all beams and their resulting intersecting beams
         """
-        from ada.core.clash_check import basic_intersect
+        from ada.core.clash_check import get_beam_bbox_arrays, sweep_and_prune
 
         all_parts = self.get_all_subparts() + [self]
         all_beams = [bm for p in all_parts for bm in p.beams]
 
-        return filter(None, [basic_intersect(bm, margins, all_parts) for bm in all_beams])
+        mins, maxs, valid = get_beam_bbox_arrays(all_beams)
+        valid_idx = np.flatnonzero(valid)
+        neighbours = [[] for _ in all_beams]
+        for i, j in valid_idx[sweep_and_prune(mins[valid_idx], maxs[valid_idx], margins=margins)]:
+            neighbours[i].append(all_beams[j])
+            neighbours[j].append(all_beams[i])
+
+        return [(bm, neighbours[i]) for i, bm in enumerate(all_beams) if valid[i] or bm.section.type == "gensec"]
 
     def move_all_mats_and_sec_here_from_subparts(self):
         for p in self.get_all_subparts():
@@ -680,12 +690,10 @@ class Part(BackendGeom):
         for p in self.get_all_subparts():
             self._nodes += p.nodes
 
-
     def move_all_masses_here_from_subparts(self):
         for p in self.get_all_subparts():
             self._masses += p.masses
 
-
     def _flatten_list_of_subparts(self, p, list_of_parts=None):
         for value in p.parts.values():
             list_of_parts.append(value)
@@ -866,12 +874,22 @@ class Part(BackendGeom):
 
     @property
     def fem(self) -> FEM:
+        if self._fem_loader is not None:
+            self.load_lazy_fem()
         return self._fem
 
     @fem.setter
     def fem(self, value: FEM):
         value.parent = self
         self._fem = value
+        self._fem_loader = None
+
+    def load_lazy_fem(self) -> None:
+        """Load the FEM object if it is set to be loaded on first access (i.e. when the part is read from cache)"""
+        if self._fem_loader is None:
+            return None
+        loader, self._fem_loader = self._fem_loader, None
+        self.fem = loader()
 
     @property
     def connections(self) -> Connections:
@@ -921,6 +939,7 @@ class Part(BackendGeom):
     @placement.setter
     def placement(self, value: Placement):
         self._placement = value
+        self.mark_modified()
 
     @property
     def instances(self) -> dict[Any, Instance]:
@@ -958,6 +977,7 @@ class Part(BackendGeom):
 
             self.sections.units = value
             self.materials.units = value
+            self.nodes.rebuild_index()
             self._units = value
 
             if isinstance(self, Assembly):
@@ -1039,17 +1059,35 @@ class Assembly(Part):
             self.cache_store.sync(self, clear_cache=clear_cache)
 
     def read_ifc(
-        self, ifc_file: str | os.PathLike | ifcopenshell.file, data_only=False, elements2part=None, create_cache=False
+        self,
+        ifc_file: str | os.PathLike | ifcopenshell.file,
+        data_only=False,
+        elements2part=None,
+        create_cache=False,
+        ifc_classes: Iterable[str] = None,
+        storeys: Iterable[str] = None,
+        guids: Iterable[str] = None,
     ):
-        """Import from IFC file."""
+        """Import from IFC file. The imported physical objects can be limited to IFC classes (e.g. ["IfcBeam"]),
+        spatial elements (names or GlobalIds of e.g. IfcBuildingStorey) and/or GlobalIds."""
+
+        # The cache holds the complete model and is not used when importing a selection of the objects
+        use_cache = self.cache_store is not None and all(x is None for x in (ifc_classes, storeys, guids))
 
-        if self.cache_store is not None and isinstance(ifc_file, ifcopenshell.file) is False:
+        if use_cache and isinstance(ifc_file, ifcopenshell.file) is False:
             if self.cache_store.from_cache(self, ifc_file) is True:
                 return None
 
-        self.ifc_store.load_ifc_content_from_file(ifc_file, data_only=data_only, elements2part=elements2part)
+        self.ifc_store.load_ifc_content_from_file(
+            ifc_file,
+            data_only=data_only,
+            elements2part=elements2part,
+            ifc_classes=ifc_classes,
+            storeys=storeys,
+            guids=guids,
+        )
 
-        if self.cache_store is not None:
+        if use_cache:
             self.cache_store.to_cache(self, ifc_file, create_cache)
 
     def read_fem(
@@ -1098,6 +1136,7 @@ class Assembly(Part):
         run_in_shell=False,
         make_zip_file=False,
         return_fea_results=True,
+        processes: int = None,
     ) -> FEAResult | None:
         """
         Create a FEM input file deck for executing fem analysis in a specified FEM format.
@@ -1131,6 +1170,8 @@ class Assembly(Part):
         :param run_in_shell:
         :param make_zip_file:
         :param return_fea_results: Automatically import the result mesh into
+        :param processes: Number of worker processes writing the input deck where supported (the Abaqus part files).
+            Default writes the input deck in the current process
 
             Note! Meshio implementation currently only supports reading & writing elements and nodes.
 
@@ -1153,7 +1194,7 @@ class Assembly(Part):
 
         scratch_dir = Settings.scratch_dir if scratch_dir is None else pathlib.Path(scratch_dir)
 
-        write_to_fem(self, name, fem_format, overwrite, fem_converter, scratch_dir, metadata, make_zip_file)
+        write_to_fem(self, name, fem_format, overwrite, fem_converter, scratch_dir, metadata, make_zip_file, processes)
 
         if execute:
             execute_fem(
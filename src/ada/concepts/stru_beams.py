@@ -377,6 +377,7 @@ class Beam(BackendGeom):
     @section.setter
     def section(self, value: Section):
         self._section = value
+        self.mark_modified()
 
     @property
     def taper(self) -> Section:
@@ -385,6 +386,7 @@ class Beam(BackendGeom):
     @taper.setter
     def taper(self, value: Section):
         self._taper = value
+        self.mark_modified()
 
     @property
     def material(self) -> Material:
@@ -393,6 +395,7 @@ class Beam(BackendGeom):
     @material.setter
     def material(self, value: Material):
         self._material = value
+        self.mark_modified()
 
     @property
     def member_type(self):
@@ -479,6 +482,7 @@ class Beam(BackendGeom):
         self._n1.remove_obj_from_refs(self)
         self._n1 = new_node  # .get_main_node_at_point()
         self._n1.add_obj_to_refs(self)
+        self.mark_modified()
 
     @property
     def n2(self) -> Node:
@@ -489,6 +493,7 @@ class Beam(BackendGeom):
         self._n2.remove_obj_from_refs(self)
         self._n2 = new_node  # .get_main_node_at_point()
         self._n2.add_obj_to_refs(self)
+        self.mark_modified()
 
     def bbox(self) -> BoundingBox:
         """Bounding Box of beam"""
@@ -504,6 +509,7 @@ class Beam(BackendGeom):
     @e1.setter
     def e1(self, value):
         self._e1 = np.array(value)
+        self.mark_modified()
 
     @property
     def e2(self) -> np.ndarray:
@@ -512,6 +518,7 @@ class Beam(BackendGeom):
     @e2.setter
     def e2(self, value):
         self._e2 = np.array(value)
+        self.mark_modified()
 
     @property
     def hinge_prop(self) -> HingeProp:
@@ -530,6 +537,14 @@ class Beam(BackendGeom):
     def curve(self) -> CurvePoly:
         return self._curve
 
+    def _cached_geom(self, geom_repr: str, create: Callable[[], TopoDS_Shape]) -> TopoDS_Shape:
+        if Settings.use_geom_cache is False:
+            return create()
+
+        from ada.occ.geom_cache import beam_geom_key, get_geom_cache
+
+        return get_geom_cache().get_or_create(beam_geom_key(self, geom_repr), create)
+
     def line(self):
         from ada.occ.utils import make_wire_from_points
 
@@ -540,21 +555,23 @@ class Beam(BackendGeom):
 
         points = [self.n1.p, self.n2.p]
 
-        return make_wire_from_points(points)
+        return self._cached_geom("line", lambda: make_wire_from_points(points))
 
     def shell(self) -> TopoDS_Shape:
         from ada.occ.utils import apply_penetrations, create_beam_geom
 
-        geom = apply_penetrations(create_beam_geom(self, False), self.penetrations)
+        def create():
+            return apply_penetrations(create_beam_geom(self, False), self.penetrations)
 
-        return geom
+        return self._cached_geom("shell", create)
 
     def solid(self) -> TopoDS_Shape:
         from ada.occ.utils import apply_penetrations, create_beam_geom
 
-        geom = apply_penetrations(create_beam_geom(self, True), self.penetrations)
+        def create():
+            return apply_penetrations(create_beam_geom(self, True), self.penetrations)
 
-        return geom
+        return self._cached_geom("solid", create)
 
     @property
     def nodes(self) -> list[Node]:
@@ -567,6 +584,7 @@ class Beam(BackendGeom):
     @angle.setter
     def angle(self, value: float):
         self._init_orientation(value)
+        self.mark_modified()
 
     @property
     def vector(self) -> np.ndarray:
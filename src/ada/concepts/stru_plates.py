@@ -116,6 +116,7 @@ class Plate(BackendGeom):
     @material.setter
     def material(self, value: Material):
         self._material = value
+        self.mark_modified()
 
     @property
     def n(self) -> np.ndarray:
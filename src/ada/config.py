@@ -38,6 +38,11 @@ class Settings:
     silence_display = False
     use_experimental_cache = False
 
+    # Memoise OCC geometry of beams. Beams with equal geometry share the same (mutable) shape instances, so the cached
+    # shapes must not be modified in place. Set geom_cache_dir to also store the geometry as BREP files on disk
+    use_geom_cache = False
+    geom_cache_dir = os.getenv("ADA_geom_cache_dir", None)
+
     # IFC export settings
     model_export: ModelExportOptions = ModelExportOptions()
 
@@ -8,7 +8,7 @@ from typing import Iterable, List
 import numpy as np
 
 from ada import Assembly, Beam, Node, Part, Pipe, PipeSegStraight, Plate, PrimCyl
-from ada.config import logger
+from ada.config import Settings, logger
 
 from .utils import Counter
 from .vector_utils import EquationOfPlane, intersect_calc, is_parallel, vector_length
@@ -30,6 +30,148 @@ def basic_intersect(bm: Beam, margins, all_parts: [Part]):
     return bm, beams
 
 
+def sweep_and_prune(mins: np.ndarray, maxs: np.ndarray, margins=0.0, chunk_size=100_000) -> np.ndarray:
+    """Broad phase search for all overlapping axis aligned bounding boxes.
+
+    The boxes are sorted along the axis with the largest spread of box centres. The overlap candidates along that
+    axis are found by a binary search on the sorted box minimums and then pruned on the two remaining axes.
+
+    :param mins: (n, 3) array of box minimums
+    :param maxs: (n, 3) array of box maximums
+    :param margins: Max clearance between two boxes for them to count as overlapping. Half of it is added to each box
+        (equal in all directions), so the clearance matches the volume margins of get_beams_within_volume. Can be
+        negative.
+    :param chunk_size: Max number of candidate pairs evaluated at once. Limits memory use for dense models.
+    :return: (m, 2) array of index pairs (i < j) of overlapping boxes
+    """
+    mins = np.asarray(mins, dtype=float) - margins / 2
+    maxs = np.asarray(maxs, dtype=float) + margins / 2
+    num = len(mins)
+    if num < 2:
+        return np.zeros((0, 2), dtype=int)
+
+    axis = int(np.argmax(np.var(mins + maxs, axis=0)))
+    order = np.argsort(mins[:, axis], kind="stable")
+    smins = mins[order]
+    smaxs = maxs[order]
+
+    # For each box, all boxes after it in sorted order starting before it ends overlap on the sweep axis
+    ends = np.searchsorted(smins[:, axis], smaxs[:, axis], side="right")
+    counts = np.maximum(ends - np.arange(1, num + 1), 0)
+    cum_counts = np.cumsum(counts)
+
+    pairs = []
+    start = 0
+    while start < num:
+        # Split the sweep into chunks of boxes with roughly chunk_size candidate pairs
+        offset = cum_counts[start - 1] if start > 0 else 0
+        stop = max(int(np.searchsorted(cum_counts, offset + chunk_size, side="right")), start + 1)
+        stop = min(stop, num)
+        idx = np.arange(start, stop)
+        chunk_counts = counts[start:stop]
+        ii = np.repeat(idx, chunk_counts)
+        jj = ii + 1 + np.arange(len(ii)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        overlap = np.all((smins[ii] <= smaxs[jj]) & (smins[jj] <= smaxs[ii]), axis=1)
+        pairs.append(np.column_stack((order[ii[overlap]], order[jj[overlap]])))
+        start = stop
+
+    pairs = np.concatenate(pairs)
+    pairs.sort(axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def segment_intersections(
+    p1: np.ndarray,
+    p2: np.ndarray,
+    q1: np.ndarray,
+    q2: np.ndarray,
+    out_of_plane_tol=0.1,
+    parallel_tol=Settings.point_tol,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized narrow phase of beam_cross_check for arrays of line pairs (p1->p2, q1->q2).
+
+    :return: A mask of the intersecting pairs, the intersection points (on the p-lines) and the line parameters s, t
+    """
+    u = p2 - p1
+    v = q2 - q1
+    w0 = p1 - q1
+    a = np.einsum("ij,ij->i", u, u)
+    b = np.einsum("ij,ij->i", u, v)
+    c = np.einsum("ij,ij->i", v, v)
+    d = np.einsum("ij,ij->i", u, w0)
+    e = np.einsum("ij,ij->i", v, w0)
+    denom = a * c - b**2
+
+    # The squared sine of the angle between the lines is denom / (a * c)
+    is_parallel = denom <= (parallel_tol**2) * a * c
+    safe_denom = np.where(is_parallel, 1.0, denom)
+    s = np.where(is_parallel, 0.0, (b * e - c * d) / safe_denom)
+    t = np.where(is_parallel, 0.0, (a * e - b * d) / safe_denom)
+
+    points = p1 + s[:, None] * u
+    dist = np.linalg.norm(points - (q1 + t[:, None] * v), axis=1)
+    mask = ~is_parallel & (dist <= out_of_plane_tol)
+    return mask, points, s, t
+
+
+@dataclass
+class BeamIntersections:
+    """Intersecting beam pairs (as indices into beams) with their intersection points and line parameters"""
+
+    beams: list[Beam]
+    pairs: np.ndarray
+    points: np.ndarray
+    s: np.ndarray
+    t: np.ndarray
+
+    def __iter__(self) -> Iterable[tuple[Beam, Beam, np.ndarray]]:
+        for (i, j), point in zip(self.pairs, self.points):
+            yield self.beams[i], self.beams[j], point
+
+
+def get_beam_bbox_arrays(beams: list[Beam]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bounding box minimums and maximums of all beams. Beams without a valid bounding box are masked out"""
+    mins = np.zeros((len(beams), 3))
+    maxs = np.zeros((len(beams), 3))
+    valid = np.ones(len(beams), dtype=bool)
+    for i, bm in enumerate(beams):
+        if bm.section.type == "gensec":
+            valid[i] = False
+            continue
+        try:
+            mins[i], maxs[i] = bm.bbox().minmax
+        except ValueError as e:
+            logger.error(f"Intersect bbox skipped: {e}\n{traceback.format_exc()}")
+            valid[i] = False
+
+    return mins, maxs, valid
+
+
+def get_beam_clash_candidates(beams: list[Beam], margins=5e-5) -> np.ndarray:
+    """Return index pairs of all beams with overlapping bounding boxes"""
+    mins, maxs, valid = get_beam_bbox_arrays(beams)
+    valid_idx = np.flatnonzero(valid)
+    pairs = sweep_and_prune(mins[valid_idx], maxs[valid_idx], margins=margins)
+    return valid_idx[pairs]
+
+
+def find_beam_intersections(beams: list[Beam], margins=5e-5, out_of_plane_tol=0.1) -> BeamIntersections:
+    """Find all intersecting beam pairs using a sweep and prune broad phase and a vectorized segment-segment narrow
+    phase. Beams whose intersection point lies more than half a beam length outside either beam are skipped."""
+    beams = list(beams)
+    pairs = get_beam_clash_candidates(beams, margins)
+    ends = np.array([(bm.n1.p, bm.n2.p) for bm in beams], dtype=float).reshape((len(beams), 2, 3))
+    lengths = np.array([bm.length for bm in beams], dtype=float)
+
+    pi, pj = pairs[:, 0], pairs[:, 1]
+    mask, points, s, t = segment_intersections(ends[pi, 0], ends[pi, 1], ends[pj, 0], ends[pj, 1], out_of_plane_tol)
+    s_len = (np.abs(s) - 1) * lengths[pi]
+    t_len = (np.abs(t) - 1) * lengths[pj]
+    mask &= (t_len <= lengths[pj] / 2) & (s_len <= lengths[pi] / 2)
+
+    return BeamIntersections(beams, pairs[mask], points[mask], s[mask], t[mask])
+
+
 def beam_cross_check(bm1: Beam, bm2: Beam, outofplane_tol=0.1):
     """Calculate intersection of beams and return point, s, t"""
     p_check = is_parallel
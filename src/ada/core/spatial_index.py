@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ada import Node
+
+
+class SpatialIndex:
+    """Base class for spatial indexes kept in step with a Nodes container"""
+
+    def insert(self, node: Node) -> None:
+        raise NotImplementedError()
+
+    def remove(self, node: Node) -> None:
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+    def query_box(self, vol_min: Iterable[float], vol_max: Iterable[float]) -> list[Node]:
+        """Return all nodes inside the (inclusive) axis aligned box defined by vol_min and vol_max"""
+        raise NotImplementedError()
+
+    def nearest(self, p: Iterable[float], max_dist: float = None) -> Node | None:
+        """Return the node closest to point p (optionally within max_dist)"""
+        raise NotImplementedError()
+
+    def rebuild(self, nodes: Iterable[Node]) -> None:
+        self.clear()
+        for n in nodes:
+            self.insert(n)
+
+    def __len__(self):
+        raise NotImplementedError()
+
+
+class HashGridIndex(SpatialIndex):
+    """A uniform hash grid. Nodes are bucketed on integer cell coordinates, so point and box lookups only visit the
+    cells overlapping the search volume.
+
+    The cell size is derived from the node density when the number of indexed nodes has doubled since the last
+    rebuild, which keeps insertion amortized O(1) when building models node by node.
+
+    :param cell_size: Fixed cell size. If None the cell size is derived from the node density.
+    :param min_nodes: Number of nodes below which all nodes are kept in a single bucket
+    """
+
+    def __init__(self, cell_size: float = None, min_nodes: int = 32):
+        self._fixed_cell_size = cell_size
+        self._cell_size = cell_size
+        self._min_nodes = min_nodes
+        self._cells: dict[tuple[int, int, int], list[Node]] = dict()
+        self._keys: dict[int, tuple[int, int, int]] = dict()
+        self._next_rebuild = min_nodes
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def cell_size(self) -> float | None:
+        return self._cell_size
+
+    def _key(self, p) -> tuple[int, int, int]:
+        if self._cell_size is None:
+            return 0, 0, 0
+        cs = self._cell_size
+        return math.floor(p[0] / cs), math.floor(p[1] / cs), math.floor(p[2] / cs)
+
+    def _nodes(self) -> list[Node]:
+        return [n for cell in self._cells.values() for n in cell]
+
+    def _derive_cell_size(self, nodes: list[Node]) -> float | None:
+        if len(nodes) < self._min_nodes:
+            return None
+        points = np.array([n.p for n in nodes])
+        extents = np.ptp(points, axis=0)
+        max_ext = extents.max()
+        if max_ext == 0.0:
+            return None
+        # Only count the dimensions the nodes are actually spread out in (lines, planes and volumes)
+        active = extents[extents > max_ext * 1e-6]
+        cell_size = (np.prod(active) / len(nodes)) ** (1.0 / len(active))
+        return float(max(cell_size, max_ext * 1e-6))
+
+    def _insert(self, node: Node) -> None:
+        key = self._key(node.p)
+        self._keys[id(node)] = key
+        self._cells.setdefault(key, []).append(node)
+
+    def insert(self, node: Node) -> None:
+        if id(node) in self._keys:
+            return None
+        self._insert(node)
+        if self._fixed_cell_size is None and len(self._keys) >= self._next_rebuild:
+            self.rebuild(self._nodes())
+
+    def remove(self, node: Node) -> None:
+        key = self._keys.pop(id(node), None)
+        if key is None:
+            return None
+        cell = self._cells[key]
+        for i, n in enumerate(cell):
+            if n is node:
+                cell.pop(i)
+                break
+        if len(cell) == 0:
+            del self._cells[key]
+
+    def clear(self) -> None:
+        self._cells = dict()
+        self._keys = dict()
+        self._cell_size = self._fixed_cell_size
+        self._next_rebuild = self._min_nodes
+
+    def rebuild(self, nodes: Iterable[Node]) -> None:
+        nodes = list(nodes)
+        self.clear()
+        if self._fixed_cell_size is None:
+            self._cell_size = self._derive_cell_size(nodes)
+            self._next_rebuild = max(2 * len(nodes), self._min_nodes)
+        for n in nodes:
+            self._insert(n)
+
+    def _candidates(self, vol_min, vol_max) -> Iterable[Node]:
+        if self._cell_size is None:
+            return self._cells.get((0, 0, 0), [])
+
+        k0 = self._key(vol_min)
+        k1 = self._key(vol_max)
+        num_cells = (k1[0] - k0[0] + 1) * (k1[1] - k0[1] + 1) * (k1[2] - k0[2] + 1)
+
+        if num_cells > len(self._cells):
+            # Search volume spans more cells than are occupied. Visit the occupied cells instead.
+            return (
+                n
+                for key, cell in self._cells.items()
+                if k0[0] <= key[0] <= k1[0] and k0[1] <= key[1] <= k1[1] and k0[2] <= key[2] <= k1[2]
+                for n in cell
+            )
+
+        cells = self._cells
+        return (
+            n
+            for i in range(k0[0], k1[0] + 1)
+            for j in range(k0[1], k1[1] + 1)
+            for k in range(k0[2], k1[2] + 1)
+            for n in cells.get((i, j, k), [])
+        )
+
+    def query_box(self, vol_min: Iterable[float], vol_max: Iterable[float]) -> list[Node]:
+        x0, y0, z0 = vol_min
+        x1, y1, z1 = vol_max
+        result = []
+        for n in self._candidates((x0, y0, z0), (x1, y1, z1)):
+            x, y, z = n.p
+            if x0 <= x <= x1 and y0 <= y <= y1 and z0 <= z <= z1:
+                result.append(n)
+        return result
+
+    def nearest(self, p: Iterable[float], max_dist: float = None) -> Node | None:
+        if len(self._keys) == 0:
+            return None
+
+        p = np.asarray(p, dtype=float)
+
+        def closest(nodes: list[Node]) -> tuple[Node | None, float]:
+            if len(nodes) == 0:
+                return None, math.inf
+            dists = np.linalg.norm(np.array([n.p for n in nodes]) - p, axis=1)
+            i = int(np.argmin(dists))
+            return nodes[i], float(dists[i])
+
+        radius = self._cell_size
+        if radius is None:
+            node, dist = closest(self._nodes())
+        else:
+            node, dist = closest(self.query_box(p - radius, p + radius))
+            if node is None:
+                # Nothing in the neighbouring cells. Fall back to a linear scan
+                node, dist = closest(self._nodes())
+            elif dist > radius:
+                # The closest node in the box is not necessarily the closest node outside the box
+                node, dist = closest(self.query_box(p - dist, p + dist))
+
+        if max_dist is not None and dist > max_dist:
+            return None
+
+        return node
@@ -4,8 +4,9 @@ from bisect import bisect_left
 from dataclasses import dataclass
 from functools import partial
 from itertools import chain, groupby
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Union
+from weakref import WeakValueDictionary
 
 import numpy as np
 
@@ -18,6 +19,7 @@ from ada.fem.exceptions.model_definition import FemSetNameExists
 from ada.fem.sections import FemSection
 from ada.fem.sets import FemSet, SetTypes
 from ada.fem.shapes import ElemType
+from ada.fem.shapes.definitions import LineShapes, ShellShapes, SolidShapes
 from ada.materials import Material
 from ada.sections import Section
 
@@ -135,8 +137,7 @@ class FemElements:
 
     def remove_elements_by_set(self, elset: FemSet):
         """Remove elements from element set. Will remove element set on completion"""
-        for el in elset.members:
-            self.remove(el)
+        self.remove(elset.members)
         self._sort()
         p = elset.parent
         p.sets.elements.pop(elset.name)
@@ -144,8 +145,7 @@ class FemElements:
     def remove_elements_by_id(self, ids: Union[int, List[int]]):
         """Remove elements from element ids. Will remove elements on completion"""
         ids = list(ids) if isinstance(ids, Iterable) else [ids]
-        for elem_id in ids:
-            self.remove(self._idmap[elem_id])
+        self.remove([self._idmap[elem_id] for elem_id in ids])
         self._sort()
 
     def to_elem_blocks(self) -> list[ElementBlock]:
@@ -192,6 +192,8 @@ class FemElements:
         return f"FemElementsCollection(Elements: {len(self._elements)}, By Type: {data_str})"
 
     def by_types(self):
+        if self._by_types is None:
+            self._build_by_types()
         return self._by_types
 
     def calc_cog(self) -> COG:
@@ -382,18 +384,30 @@ class FemElements:
     def remove(self, elems: Union[Elem, List[Elem]]):
         """Remove elem or list of elements from container"""
         elems = list(elems) if isinstance(elems, Iterable) else [elems]
+        found = set(elems).intersection(self._elements)
         for elem in elems:
-            if elem in self._elements:
+            if elem in found:
                 logger.warning(f"Element removal is WIP. Removing element: {elem}")
-                self._elements.pop(self._elements.index(elem))
             else:
                 logger.error(f"'{elem}' not found in {self.__class__.__name__}-container.")
-        # self._sort()
+
+        if len(found) == 0:
+            return None
+
+        self._elements = [el for el in self._elements if el not in found]
+        for elem in found:
+            if self._idmap.get(elem.id, None) is elem:
+                self._idmap.pop(elem.id)
+        self._by_types = None
 
     def group_by_type(self):
         return groupby(sorted(self._elements, key=attrgetter("type")), key=attrgetter("type"))
 
     def _group_by_types(self):
+        """Grouping is done lazily (see by_types) to avoid re-sorting all elements on every add"""
+        self._by_types = None
+
+    def _build_by_types(self):
         if len(self._elements) > 0:
             self._by_types = groupby(
                 sorted(self._elements, key=attrgetter("type")), key=attrgetter("type", SetTypes.ELSET)
@@ -424,6 +438,588 @@ class FemElements:
         self.remove(list(filter(lambda x: x.id is None, self._elements)))
 
 
+@dataclass
+class ElemArrayBlock:
+    """Element ids and node id connectivity of a single element type stored in contiguous arrays sorted by id"""
+
+    el_type: LineShapes | ShellShapes | SolidShapes
+    identifiers: np.ndarray
+    node_refs: np.ndarray
+
+    def __len__(self):
+        return len(self.identifiers)
+
+    def index(self, el_id: int) -> int | None:
+        i = int(np.searchsorted(self.identifiers, el_id))
+        if i < len(self.identifiers) and self.identifiers[i] == el_id:
+            return i
+        return None
+
+    def append(self, identifiers: np.ndarray, node_refs: np.ndarray) -> None:
+        self.identifiers = np.concatenate([self.identifiers, identifiers])
+        self.node_refs = np.concatenate([self.node_refs, node_refs])
+        self.sort()
+
+    def keep(self, mask: np.ndarray) -> None:
+        self.identifiers = self.identifiers[mask]
+        self.node_refs = self.node_refs[mask]
+
+    def sort(self) -> None:
+        order = np.argsort(self.identifiers, kind="stable")
+        self.identifiers = self.identifiers[order]
+        self.node_refs = self.node_refs[order]
+
+
+class ElemView(Elem):
+    """An Elem created on access from the arrays of a FemElementArrays container. The container only holds a weak
+    reference to the view until one of its attributes is set, after which the view is kept by the container. Note!
+    In-place changes of mutable attributes (e.g. metadata) are not detected."""
+
+    # Attributes set by Elem itself on access (e.g. the lazily created shape) do not count as changes
+    _untracked = ("_shape",)
+
+    def __init__(self, el_id: int, nodes: list[Node], el_type, container: FemElementArrays):
+        super(ElemView, self).__init__(el_id, None, el_type, parent=container.parent)
+        self._nodes = nodes
+        self.__dict__["_container"] = container
+
+    def __setattr__(self, key, value):
+        super(ElemView, self).__setattr__(key, value)
+        container = self.__dict__.get("_container", None)
+        if container is not None and key not in self._untracked:
+            self.__dict__["_container"] = None
+            container._keep_view(self)
+
+
+class FemElementArrays(FemElements):
+    """Container class for FEM elements storing element ids and node connectivity in contiguous numpy arrays per
+    element type. An opt-in alternative to FemElements for large models, i.e. FEM(name, elements=FemElementArrays()).
+
+    Elements are returned as ElemView objects created on access. The container only keeps the views (and the Elem
+    objects passed to add) holding data not stored in the arrays, e.g. a section, set or eccentricity. Without a
+    parent FEM all Elem objects passed to add are kept. Other views are held weakly and are released once they are no
+    longer referenced. Mass and Connector elements are stored as objects. Note! Nodes only hold references (Node.refs)
+    to kept elements. The node collection of the parent FEM counts the stored connectivity when removing or merging
+    nodes.
+    """
+
+    def __init__(
+        self, elements: Iterable[Union[Elem, Mass, Connector]] = None, fem_obj: FEM = None, from_np_array=None
+    ):
+        self._fem_obj = fem_obj
+        self._blocks: Dict[LineShapes | ShellShapes | SolidShapes, ElemArrayBlock] = dict()
+        self._pending: Dict[LineShapes | ShellShapes | SolidShapes, List[Tuple[int, List[int]]]] = dict()
+        self._pending_ids = set()
+        self._views: Dict[int, Elem] = dict()
+        self._view_cache: WeakValueDictionary[int, Elem] = WeakValueDictionary()
+        self._sorted_ids = None
+        self._elements: List[Union[Mass, Connector]] = []
+        self._objmap: Dict[int, Union[Mass, Connector]] = dict()
+        self._max_id = 0
+        self._by_types = None
+
+        if from_np_array is not None:
+            elements = self.elements_from_array(from_np_array)
+
+        if elements is not None:
+            for elem in sorted(elements, key=attrgetter("id")):
+                self.add(elem)
+
+    def _flush(self) -> None:
+        """Move elements added one by one into the contiguous arrays"""
+        for el_type, rows in self._pending.items():
+            identifiers, node_refs = zip(*rows)
+            self._add_to_block(el_type, np.array(identifiers, dtype=np.int64), np.array(node_refs, dtype=np.int64))
+        self._pending = dict()
+        self._pending_ids = set()
+
+    def _add_to_block(self, el_type, identifiers: np.ndarray, node_refs: np.ndarray) -> None:
+        block = self._blocks.get(el_type, None)
+        if block is None:
+            block = ElemArrayBlock(el_type, identifiers, node_refs)
+            block.sort()
+            self._blocks[el_type] = block
+        else:
+            block.append(identifiers, node_refs)
+
+    def _all_ids(self) -> np.ndarray:
+        self._flush()
+        arrays = [block.identifiers for block in self._blocks.values()]
+        arrays.append(np.array(list(self._objmap.keys()), dtype=np.int64))
+        return np.concatenate(arrays)
+
+    def _update_max_id(self) -> None:
+        ids = self._all_ids()
+        self._max_id = int(ids.max()) if len(ids) > 0 else 0
+
+    def has_id(self, el_id: int) -> bool:
+        if el_id in self._pending_ids or el_id in self._objmap.keys():
+            return True
+        return any(block.index(el_id) is not None for block in self._blocks.values())
+
+    def _changed(self) -> None:
+        self._by_types = None
+        self._sorted_ids = None
+
+    def _get_view(self, el_id: int) -> Elem | None:
+        el = self._views.get(el_id, None)
+        if el is None:
+            el = self._view_cache.get(el_id, None)
+        return el
+
+    def _keep_view(self, elem: Elem) -> None:
+        """Keep an element holding data that is not stored in the arrays and register it in Node.refs"""
+        if self._view_cache.get(elem.id, None) is not elem:
+            return None
+        self._view_cache.pop(elem.id)
+        self._views[elem.id] = elem
+        for node in elem.nodes:
+            node.add_obj_to_refs(elem)
+
+    def add(self, elem: Elem, skip_grouping=False) -> Elem:
+        if elem.id is None:
+            elem._el_id = self._max_id + 1
+        if self.has_id(elem.id):
+            raise ValueError(f'Elem id "{elem.id}" already exists or is not set.')
+
+        if elem.parent is None:
+            elem.parent = self._fem_obj
+
+        if isinstance(elem, (Mass, Connector)):
+            self._elements.append(elem)
+            self._objmap[elem.id] = elem
+        else:
+            self._pending.setdefault(elem.type, []).append((elem.id, [n.id for n in elem.nodes]))
+            self._pending_ids.add(elem.id)
+            # Views are created from the nodes of the parent FEM. Without it the elements must be kept
+            if self._fem_obj is None or _has_elem_data(elem):
+                self._views[elem.id] = elem
+            else:
+                for node in elem.nodes:
+                    node.remove_obj_from_refs(elem)
+                self._view_cache[elem.id] = elem
+
+        self._max_id = max(self._max_id, elem.id)
+        self._changed()
+        return elem
+
+    def add_block(
+        self,
+        el_type: str | LineShapes | ShellShapes | SolidShapes,
+        identifiers: Iterable[int],
+        node_refs: Iterable[Iterable[int]],
+    ) -> ElemArrayBlock:
+        """Add elements of a single element type from element ids and a (num_elements, num_nodes) array of node ids"""
+        from ada.fem.shapes.definitions import ShapeResolver
+
+        if isinstance(el_type, str):
+            el_type = ShapeResolver.get_el_type_from_str(el_type)
+
+        identifiers = np.asarray(identifiers, dtype=np.int64)
+        node_refs = np.asarray(node_refs, dtype=np.int64).reshape(len(identifiers), -1)
+        if len(np.unique(identifiers)) != len(identifiers) or np.any(np.isin(identifiers, self._all_ids())):
+            raise ValueError("Element ids are doubly defined or already exists")
+
+        self._add_to_block(el_type, identifiers, node_refs)
+        if len(identifiers) > 0:
+            self._max_id = max(self._max_id, int(identifiers.max()))
+        self._changed()
+        return self._blocks[el_type]
+
+    def _create_view(self, el_id: int, block: ElemArrayBlock = None, i: int = None) -> Elem | None:
+        if block is None:
+            self._flush()
+            for block in self._blocks.values():
+                i = block.index(el_id)
+                if i is not None:
+                    break
+            else:
+                return None
+
+        nodes = [self._fem_obj.nodes.from_id(int(n)) for n in block.node_refs[i]]
+        elem = ElemView(int(el_id), nodes, block.el_type, self)
+        self._view_cache[elem.id] = elem
+        return elem
+
+    def from_id(self, el_id: int) -> Union[Elem, Connector]:
+        el = self._get_view(el_id)
+        if el is None:
+            el = self._objmap.get(el_id, None)
+        if el is None:
+            el = self._create_view(el_id)
+        if el is None:
+            spring_id_map = {m.id: m for m in self.parent.springs.values()}
+            res = spring_id_map.get(el_id, None)
+            if res is not None:
+                return res
+
+            raise ValueError(f'The elem id "{el_id}" is not found')
+        return el
+
+    def _iter_block(self, block: ElemArrayBlock) -> Iterable[Elem]:
+        for i, el_id in enumerate(block.identifiers.tolist()):
+            el = self._get_view(el_id)
+            yield el if el is not None else self._create_view(el_id, block, i)
+
+    def _iter_blocks(self, shape_types=None) -> Iterable[Elem]:
+        self._flush()
+        for el_type, block in list(self._blocks.items()):
+            if shape_types is not None and isinstance(el_type, shape_types) is False:
+                continue
+            yield from self._iter_block(block)
+
+    def remap_node_refs(self, old_ids: np.ndarray, new_ids: np.ndarray) -> None:
+        """Update the stored node connectivity after the parent node collection is renumbered"""
+        self._flush()
+        old_ids = np.asarray(old_ids, dtype=np.int64)
+        new_ids = np.asarray(new_ids, dtype=np.int64)
+        sorter = np.argsort(old_ids)
+        for block in self._blocks.values():
+            pos, found = _lookup_ids(old_ids, sorter, block.node_refs)
+            if not np.all(found):
+                missing = np.unique(block.node_refs[~found]).tolist()
+                raise KeyError(f"Node ids {missing} referenced by elements are missing from the renumbered nodes")
+            block.node_refs = new_ids[pos]
+
+    def replace_node_refs(self, node_map: Dict[int, int]) -> None:
+        """Replace the node ids (keys) in the stored node connectivity with other node ids (values)"""
+        self._flush()
+        if len(node_map) == 0:
+            return None
+        old_ids = np.array(list(node_map.keys()), dtype=np.int64)
+        new_ids = np.array(list(node_map.values()), dtype=np.int64)
+        sorter = np.argsort(old_ids)
+        for block in self._blocks.values():
+            pos, found = _lookup_ids(old_ids, sorter, block.node_refs)
+            block.node_refs = np.where(found, new_ids[pos], block.node_refs)
+
+        # Kept elements are updated through Node.refs by the node collection
+        for el in list(self._view_cache.values()):
+            if any(n.id in node_map for n in el.nodes):
+                nodes = [self._fem_obj.nodes.from_id(node_map.get(n.id, n.id)) for n in el.nodes]
+                _set_unchanged(el, "_nodes", nodes)
+
+    def get_node_ref_counts(self) -> Dict[int, int]:
+        """Number of references to each node id from the stored node connectivity of elements that are not
+        materialised as Elem objects (Elem objects register themselves in Node.refs)"""
+        self._flush()
+        kept_ids = np.array(list(self._views.keys()), dtype=np.int64)
+        node_refs = [block.node_refs[~np.isin(block.identifiers, kept_ids)].ravel() for block in self._blocks.values()]
+        if len(node_refs) == 0:
+            return dict()
+        node_ids, counts = np.unique(np.concatenate(node_refs), return_counts=True)
+        return dict(zip(node_ids.tolist(), counts.tolist()))
+
+    def renumber(self, start_id=1, renumber_map: dict = None):
+        """Ensures that the element numbering starts at 1 and has no holes in its numbering."""
+        self._flush()
+        if renumber_map is not None:
+            keys = np.array(list(renumber_map.keys()), dtype=np.int64)
+            values = np.array(list(renumber_map.values()), dtype=np.int64)
+        else:
+            keys = np.sort(self._all_ids())
+            values = np.arange(start_id, start_id + len(keys), dtype=np.int64)
+
+        sorter = np.argsort(keys)
+
+        def remap(ids: np.ndarray) -> np.ndarray:
+            pos = np.searchsorted(keys, ids, sorter=sorter) if len(keys) > 0 else np.zeros(len(ids), dtype=int)
+            pos = np.clip(pos, 0, max(len(keys) - 1, 0))
+            if len(ids) > 0 and not np.array_equal(keys[sorter[pos]], ids):
+                raise KeyError("Element ids are missing from the renumber map")
+            return values[sorter[pos]]
+
+        for block in self._blocks.values():
+            block.identifiers = remap(block.identifiers)
+            block.sort()
+
+        kept = list(self._views.values())
+        cached = list(self._view_cache.values())
+        views = kept + cached
+        if len(views) > 0:
+            for el, new_id in zip(views, remap(np.array([el.id for el in views], dtype=np.int64))):
+                _set_unchanged(el, "id", int(new_id))
+        self._views = {el.id: el for el in kept}
+        self._view_cache = WeakValueDictionary({el.id: el for el in cached})
+
+        for el in self._elements:
+            if renumber_map is not None and (isinstance(el, Mass) or el.type == Elem.EL_TYPES.MASS_SHAPES.MASS):
+                # Mass elements are points and have been renumbered during node-renumbering
+                continue
+            el.id = int(remap(np.array([el.id], dtype=np.int64))[0])
+
+        self._elements = sorted(self._elements, key=attrgetter("id"))
+        self._objmap = {el.id: el for el in self._elements}
+        self._update_max_id()
+        self._changed()
+
+    def _remove_ids(self, ids: Iterable[int]) -> None:
+        self._flush()
+        ids = np.asarray(list(ids), dtype=np.int64)
+        for el_type, block in list(self._blocks.items()):
+            block.keep(~np.isin(block.identifiers, ids))
+            if len(block) == 0:
+                self._blocks.pop(el_type)
+
+        for el_id in ids.tolist():
+            self._views.pop(el_id, None)
+            self._objmap.pop(el_id, None)
+            el = self._view_cache.pop(el_id, None)
+            if el is not None:
+                el.__dict__["_container"] = None
+
+        self._elements = [el for el in self._elements if el.id in self._objmap.keys()]
+        self._update_max_id()
+        self._changed()
+
+    def remove(self, elems: Union[Elem, List[Elem]]):
+        """Remove elem or list of elements from container"""
+        elems = list(elems) if isinstance(elems, Iterable) else [elems]
+        ids = []
+        for elem in elems:
+            if elem in self:
+                ids.append(elem.id)
+            else:
+                logger.error(f"'{elem}' not found in {self.__class__.__name__}-container.")
+        self._remove_ids(ids)
+
+    def remove_elements_by_id(self, ids: Union[int, List[int]]):
+        """Remove elements from element ids. Will remove elements on completion"""
+        ids = list(ids) if isinstance(ids, Iterable) else [ids]
+        self._remove_ids(ids)
+        self._sort()
+
+    def _sort(self):
+        self.renumber()
+
+    def _build_by_types(self):
+        self._by_types = groupby(sorted(self, key=attrgetter("type")), key=attrgetter("type", SetTypes.ELSET))
+
+    def group_by_type(self):
+        self._flush()
+        groups = [(el_type, self._iter_block(block)) for el_type, block in self._blocks.items()]
+        for el_type, el_group in groupby(sorted(self._elements, key=attrgetter("type")), key=attrgetter("type")):
+            groups.append((el_type, list(el_group)))
+        return sorted(groups, key=itemgetter(0))
+
+    def to_elem_blocks(self) -> list[ElementBlock]:
+        from ada.fem.results.common import ElementBlock, ElementInfo, FEATypes
+
+        self._flush()
+        elements = []
+        for el_type, block in self._blocks.items():
+            info = ElementInfo(el_type, FEATypes.GMSH, None)
+            elements.append(ElementBlock(info, block.node_refs.copy(), block.identifiers.copy()))
+
+        for el_type, el_group in groupby(sorted(self._elements, key=attrgetter("type")), key=attrgetter("type")):
+            info = ElementInfo(el_type, FEATypes.GMSH, None)
+            elem_data = np.array([tuple([e.id, *[n.id for n in e.nodes]]) for e in el_group], dtype=int)
+            elements.append(ElementBlock(info, elem_data[:, 1:], elem_data[:, 0]))
+
+        return sorted(elements, key=lambda x: x.elem_info.type)
+
+    def calc_cog(self) -> COG:
+        """Calculate COG of your FEM model based on element mass distributed to element and nodes"""
+        self._flush()
+        fem = self.parent
+        node_data = fem.nodes.to_np_array(include_id=True)
+        node_ids = node_data[:, 0].astype(np.int64)
+        node_sorter = np.argsort(node_ids)
+        coords = node_data[:, 1:]
+
+        def get_coords(node_refs: np.ndarray) -> np.ndarray:
+            return coords[node_sorter[np.searchsorted(node_ids, node_refs, sorter=node_sorter)]]
+
+        sec_map = {el.id: fs for fs in fem.sections for el in fs.elset.members}
+
+        def section_props(identifiers: np.ndarray, prop_getter) -> np.ndarray:
+            return np.array([prop_getter(sec_map[el_id]) for el_id in identifiers.tolist()], dtype=float)
+
+        sh_mass, bm_mass = 0.0, 0.0
+        tot_vol = 0.0
+        mcog_ = np.zeros(3)
+
+        for el_type, block in self._blocks.items():
+            if isinstance(el_type, Elem.EL_TYPES.SOLID_SHAPES) or len(block) == 0:
+                continue
+            points = get_coords(block.node_refs)
+            center = points.mean(axis=1)
+            rho = section_props(block.identifiers, lambda fs: fs.material.model.rho)
+            if isinstance(el_type, Elem.EL_TYPES.SHELL_SHAPES):
+                area = 0.5 * np.linalg.norm(np.cross(points, np.roll(points, -1, axis=1)).sum(axis=1), axis=1)
+                vol = section_props(block.identifiers, attrgetter("thickness")) * area
+                mass = vol * rho
+                sh_mass += mass.sum()
+            else:
+                ends = points[:, [0, -1], :]
+                for i, el_id in enumerate(block.identifiers.tolist()):
+                    el = self._get_view(el_id)
+                    if el is not None and el.eccentricity is not None:
+                        offset_coords = el.get_offset_coords()
+                        ends[i] = offset_coords[0], offset_coords[-1]
+                elem_len = np.linalg.norm(ends[:, 1] - ends[:, 0], axis=1)
+                vol = section_props(block.identifiers, lambda fs: fs.section.properties.Ax) * elem_len
+                mass = vol * rho
+                bm_mass += mass.sum()
+
+            tot_vol += vol.sum()
+            mcog_ += (mass[:, None] * center).sum(axis=0)
+
+        no_mass = 0.0
+        for el in self.masses:
+            if el.type != MassTypes.MASS:
+                raise NotImplementedError(f'Mass type "{el.mass_props.type}" is not yet implemented')
+            no_mass += el.mass
+            mcog_ += el.mass * np.array(el.nodes[0].p).astype(float)
+
+        tot_mass = sh_mass + bm_mass + no_mass
+        cog_ = mcog_ / tot_mass
+
+        return COG(cog_, tot_mass, tot_vol, sh_mass, bm_mass, no_mass)
+
+    def filter_elements(self, keep_elem=None, delete_elem=None):
+        from ada.fem.shapes.definitions import ShapeResolver
+
+        keep_elem = [ShapeResolver.get_el_type_from_str(el_) for el_ in keep_elem] if keep_elem is not None else None
+        delete_elem = (
+            [ShapeResolver.get_el_type_from_str(el_) for el_ in delete_elem] if delete_elem is not None else None
+        )
+
+        def eval_type(el_type):
+            if keep_elem is not None:
+                return el_type in keep_elem
+            else:
+                return el_type not in delete_elem
+
+        self._flush()
+        ids = [block.identifiers for el_type, block in self._blocks.items() if eval_type(el_type) is False]
+        ids.append(np.array([el.id for el in self._elements if eval_type(el.type) is False], dtype=np.int64))
+        self._remove_ids(np.concatenate(ids))
+
+    def link_nodes(self):
+        """Link element nodes with the parent fem node collection"""
+        for elem in chain(self._elements, self._views.values(), list(self._view_cache.values())):
+            nodes = [self._fem_obj.nodes.from_id(no) for no in elem.nodes if type(no) in (int, np.int32)]
+            if len(nodes) != len(elem.nodes):
+                raise ValueError("Unable to convert element nodes")
+            elem._nodes = nodes
+
+    def build_sets(self):
+        """Create sets from attached elset attribute on elements"""
+        views = list(self._view_cache.values())
+        elements = sorted(chain(self._elements, self._views.values(), views), key=attrgetter("id"))
+        for elset, elements in groupby(elements, key=attrgetter("elset")):
+            if elset is None:
+                continue
+            self._build_sets_from_elsets(elset, elements)
+
+    def to_fem_elements(self) -> FemElements:
+        """Returns a regular object based FemElements container (creates all Elem objects)"""
+        return FemElements(self.elements, fem_obj=self.parent)
+
+    def _extend(self, other: FemElements) -> None:
+        if isinstance(other, FemElementArrays):
+            other._flush()
+            for el_type, block in other._blocks.items():
+                self.add_block(el_type, block.identifiers, block.node_refs)
+            for el in other._views.values():
+                el.parent = self.parent
+                self._views[el.id] = el
+            for el in list(other._view_cache.values()):
+                _set_unchanged(el, "parent", self.parent)
+                if isinstance(el, ElemView):
+                    el.__dict__["_container"] = self
+                self._view_cache[el.id] = el
+            elements = other._elements
+        else:
+            elements = other.elements
+
+        for el in elements:
+            el.parent = self.parent
+            self.add(el)
+
+    def __getstate__(self):
+        # The weakly held views are recreated on access
+        state = self.__dict__.copy()
+        state["_view_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._view_cache = WeakValueDictionary()
+
+    def __contains__(self, item: Elem):
+        return self._get_view(item.id) is item or self._objmap.get(item.id, None) is item
+
+    def __len__(self):
+        return sum(len(block) for block in self._blocks.values()) + len(self._pending_ids) + len(self._elements)
+
+    def __iter__(self):
+        if self._sorted_ids is None:
+            self._sorted_ids = np.sort(self._all_ids())
+        return (self.from_id(el_id) for el_id in self._sorted_ids.tolist())
+
+    def __getitem__(self, index):
+        result = self.elements[index]
+        return FemElementArrays(result) if isinstance(index, slice) else result
+
+    def __add__(self, other: FemElements):
+        other.renumber(self.max_el_id + 1)
+        merged = FemElementArrays(fem_obj=self.parent)
+        merged._extend(self)
+        merged._extend(other)
+        return merged
+
+    def __repr__(self):
+        self._flush()
+        data = {el_type: len(block) for el_type, block in self._blocks.items()}
+        for key, val in groupby(sorted(self._elements, key=attrgetter("type")), key=attrgetter("type")):
+            data[key] = data.get(key, 0) + len(list(val))
+        data_str = ", ".join([f'"{key}": {val}' for key, val in data.items()])
+        return f"FemElementArrays(Elements: {len(self)}, By Type: {data_str})"
+
+    @property
+    def max_el_id(self):
+        return self._max_id
+
+    @property
+    def min_el_id(self):
+        ids = self._all_ids()
+        return int(ids.min()) if len(ids) > 0 else 0
+
+    @property
+    def elements(self) -> List[Union[Elem, Connector, Mass]]:
+        return list(self)
+
+    @property
+    def idmap(self):
+        return {el.id: el for el in self}
+
+    @property
+    def solids(self) -> Iterable[Elem]:
+        return self._iter_blocks(Elem.EL_TYPES.SOLID_SHAPES)
+
+    @property
+    def shell(self) -> Iterable[Elem]:
+        return self._iter_blocks(Elem.EL_TYPES.SHELL_SHAPES)
+
+    @property
+    def lines(self) -> Iterable[Elem]:
+        return self._iter_blocks(Elem.EL_TYPES.LINE_SHAPES)
+
+    @property
+    def connectors(self) -> Iterable[Connector]:
+        return filter(lambda x: isinstance(x, Connector), self._elements)
+
+    @property
+    def masses(self) -> Iterable[Mass]:
+        return filter(lambda x: isinstance(x, Mass), self._elements)
+
+    @property
+    def stru_elements(self) -> Iterable[Elem]:
+        return self._iter_blocks()
+
+
 class FemSections:
     def __init__(self, sections: Iterable[FemSection] = None, fem_obj: "FEM" = None):
         self._fem_obj = fem_obj
@@ -817,3 +1413,25 @@ class FemSets:
         self._instantiate_all_members(fe_set)
 
         return fe_set
+
+
+def _lookup_ids(ids: np.ndarray, sorter: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions (in ids) of values and a mask of the values found in ids"""
+    if len(ids) == 0:
+        return np.zeros(values.shape, dtype=int), np.zeros(values.shape, dtype=bool)
+    pos = sorter[np.clip(np.searchsorted(ids, values, sorter=sorter), 0, len(ids) - 1)]
+    return pos, ids[pos] == values
+
+
+def _has_elem_data(elem: Elem) -> bool:
+    """Whether the element holds data that is not stored in the arrays of FemElementArrays"""
+    attrs = (elem.fem_sec, elem.elset, elem.eccentricity, elem.hinge_prop, elem.mass_props)
+    return any(x is not None for x in attrs) or len(elem.refs) > 0 or len(elem.metadata) > 0
+
+
+def _set_unchanged(elem: Elem, name: str, value) -> None:
+    """Set an attribute of an element without marking an ElemView as changed"""
+    container = elem.__dict__.pop("_container", None)
+    setattr(elem, name, value)
+    if container is not None:
+        elem.__dict__["_container"] = container
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pathlib
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from ada.fem.formats.abaqus.elem_shapes import abaqus_el_type_to_ada
+from ada.fem.shapes.definitions import ShapeResolver
+
+# Lines starting with "*". Keyword lines and "**" comment lines both end the data lines of the preceding keyword
+_re_star_lines = re.compile(rb"^\*[^\n]*", re.MULTILINE)
+_re_include = re.compile(rb"^\*include\s*,\s*input\s*=\s*([^\n]*?)\s*$", re.IGNORECASE)
+_re_letters = re.compile(rb"[a-zA-Z]")
+
+BLOCK_MARKER = "@block="
+
+
+@dataclass
+class BulkBlock:
+    """A *NODE or *ELEMENT data block. Chunks are (start, end) byte offsets of the data lines in the source file,
+    split at record boundaries so that each chunk can be decoded on its own."""
+
+    keyword: str
+    source: pathlib.Path
+    num_cols: int
+    chunks: list[tuple[int, int]]
+
+    def decode_chunk(self, buffer, chunk: int) -> np.ndarray:
+        start, end = self.chunks[chunk]
+        return decode_bulk_block(buffer[start:end], self.keyword, self.num_cols)
+
+    def decode(self, buffer) -> np.ndarray:
+        return np.concatenate([self.decode_chunk(buffer, i) for i in range(len(self.chunks))])
+
+
+def split_chunks(buffer, start: int, end: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split the data lines between start and end into chunks of about chunk_size bytes. Chunks end at a newline
+    that is not preceded by a comma (i.e. not within a continued element record)."""
+    chunks = []
+    while end - start > chunk_size:
+        split = buffer.find(b"\n", start + chunk_size, end)
+        while split != -1 and buffer[split - 16 : split].rstrip().endswith(b","):
+            split = buffer.find(b"\n", split + 1, end)
+        if split == -1:
+            break
+        chunks.append((start, split + 1))
+        start = split + 1
+
+    chunks.append((start, end))
+    return chunks
+
+
+def decode_bulk_block(data: bytes, keyword: str, num_cols: int) -> np.ndarray:
+    """Decode the comma separated data lines of a *NODE (id, x, y, z) or *ELEMENT (id, n1, n2, ...) block into a
+    2d numpy array. Element lines ending with a comma are continued on the next line. Nodes given with only 1 or 2
+    coordinates are padded with zeros."""
+    data = data.replace(b"\r", b"").strip()
+    dtype = np.float64 if keyword == "node" else int
+    if len(data) == 0:
+        return np.zeros((0, num_cols), dtype=dtype)
+
+    data_cols = num_cols
+    if keyword == "node":
+        data_cols = data.split(b"\n", 1)[0].rstrip(b", ").count(b",") + 1
+    else:
+        data = data.replace(b",\n", b",")
+
+    res = np.fromstring(data.replace(b"\n", b",").rstrip(b",").decode(), sep=",", dtype=dtype)
+    if res.size % data_cols != 0:
+        raise ValueError(f"Unable to decode *{keyword} block. {res.size} values is not divisible by {data_cols}")
+
+    res = res.reshape(res.size // data_cols, data_cols)
+    if data_cols < num_cols:
+        res = np.column_stack([res, np.zeros((len(res), num_cols - data_cols), dtype=dtype)])
+
+    return res
+
+
+def _to_str(data: bytes) -> str:
+    return data.decode().replace("\r\n", "\n")
+
+
+def _decode_chunk_from_file(block: BulkBlock, chunk: int) -> np.ndarray:
+    with open(block.source, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return block.decode_chunk(mm, chunk)
+
+
+class InpIndex:
+    """Memory maps an Abaqus input file (and its *INCLUDE files) and indexes the keyword lines in a single pass.
+
+    The data lines of numeric *NODE and *ELEMENT blocks are kept out of the bulk string returned by skeleton(). They
+    are replaced by a marker line referencing the block, and decoded straight from the memory map into numpy arrays
+    by decode_blocks(). Use it as a context manager to close the memory maps.
+
+    :param inp_path: Path to the Abaqus input file
+    :param chunk_size: Approximate size in bytes of the pieces large data blocks are decoded in
+    """
+
+    def __init__(self, inp_path: str | os.PathLike, chunk_size: int = 32 * 1024**2):
+        self.inp_path = pathlib.Path(inp_path)
+        self.chunk_size = chunk_size
+        self.blocks: list[BulkBlock] = []
+        self._files = dict()
+        self._maps: dict[pathlib.Path, mmap.mmap] = dict()
+        self._pieces: list[str] = []
+        self._index_file(self.inp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        for mm in self._maps.values():
+            mm.close()
+        for f in self._files.values():
+            f.close()
+        self._maps = dict()
+        self._files = dict()
+
+    def _map_file(self, file_path: pathlib.Path) -> mmap.mmap | bytes:
+        if file_path in self._maps:
+            return self._maps[file_path]
+
+        f = open(file_path, "rb")
+        if os.fstat(f.fileno()).st_size == 0:
+            f.close()
+            return b""
+
+        self._files[file_path] = f
+        self._maps[file_path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[file_path]
+
+    def _index_file(self, file_path: pathlib.Path) -> None:
+        mm = self._map_file(file_path)
+        star_lines = [(m.start(), m.end()) for m in _re_star_lines.finditer(mm)]
+        if len(star_lines) == 0 or star_lines[0][0] != 0:
+            first = star_lines[0][0] if len(star_lines) > 0 else len(mm)
+            self._pieces.append(_to_str(mm[:first]))
+
+        for i, (start, line_end) in enumerate(star_lines):
+            end = star_lines[i + 1][0] if i + 1 < len(star_lines) else len(mm)
+            line = mm[start:line_end]
+
+            include = _re_include.match(line.rstrip(b"\r"))
+            if include is not None:
+                self._index_file(file_path.parent / include.group(1).decode().strip("\"'"))
+                self._pieces.append("\n")
+                continue
+
+            block = self._get_bulk_block(mm, file_path, line, line_end + 1, end)
+            if block is None:
+                self._pieces.append(_to_str(mm[start:end]))
+                continue
+
+            self._pieces.append(f"{line.decode().rstrip()}\n{BLOCK_MARKER}{len(self.blocks)}\n")
+            self.blocks.append(block)
+
+    def _get_bulk_block(self, mm, file_path, line: bytes, start: int, end: int) -> BulkBlock | None:
+        keyword, _, params = line[1:].decode().partition(",")
+        keyword = keyword.strip().lower()
+        if keyword == "node":
+            return BulkBlock(keyword, file_path, 4, split_chunks(mm, start, end, self.chunk_size))
+
+        if keyword != "element" or start >= end or _re_letters.search(mm, start, end) is not None:
+            return None
+
+        for param in params.split(","):
+            key, _, value = param.partition("=")
+            if key.strip().lower() != "type":
+                continue
+            try:
+                num_nodes = ShapeResolver.get_el_nodes_from_type(abaqus_el_type_to_ada(value.strip()))
+            except ValueError:
+                # Unsupported element types are left to the string based element parser
+                return None
+            return BulkBlock(keyword, file_path, num_nodes + 1, split_chunks(mm, start, end, self.chunk_size))
+
+        return None
+
+    def skeleton(self) -> str:
+        """The input file with includes inlined and data lines of the indexed blocks replaced by marker lines"""
+        return "".join(self._pieces)
+
+    def decode_blocks(self, num_workers: int = 1) -> dict[int, np.ndarray]:
+        """Decode all indexed blocks. With num_workers > 1 the chunks of the blocks are decoded concurrently by worker
+        processes that each memory map the source files."""
+        if num_workers is None:
+            num_workers = os.cpu_count()
+
+        tasks = [(i, block, chunk) for i, block in enumerate(self.blocks) for chunk in range(len(block.chunks))]
+        if num_workers <= 1 or len(tasks) <= 1:
+            return {i: block.decode(self._maps[block.source]) for i, block in enumerate(self.blocks)}
+
+        block_chunks = {i: [] for i in range(len(self.blocks))}
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(tasks))) as executor:
+            results = executor.map(_decode_chunk_from_file, [x[1] for x in tasks], [x[2] for x in tasks])
+            for (i, _, _), res in zip(tasks, results):
+                block_chunks[i].append(res)
+
+        return {i: np.concatenate(chunks) for i, chunks in block_chunks.items()}
+
+
+def get_block_id(members_str: str) -> int | None:
+    """Returns the block index if the data lines of a keyword is a marker line"""
+    members_str = members_str.strip()
+    if members_str.startswith(BLOCK_MARKER) is False:
+        return None
+    return int(members_str[len(BLOCK_MARKER) :])
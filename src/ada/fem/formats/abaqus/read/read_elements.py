@@ -17,6 +17,7 @@ from ada.fem.formats.utils import str_to_int
 from ada.fem.shapes.definitions import ShapeResolver, SolidShapes
 
 from . import cards
+from .inp_index import get_block_id
 
 if TYPE_CHECKING:
     from ada.fem import FEM
@@ -24,11 +25,15 @@ if TYPE_CHECKING:
 _re_in = re.IGNORECASE | re.MULTILINE | re.DOTALL
 
 
-def get_elem_from_bulk_str(bulk_str, fem: "FEM") -> FemElements:
-    """Read and import all *Element flags"""
+def get_elem_from_bulk_str(bulk_str, fem: "FEM", bulk_blocks: dict = None) -> FemElements:
+    """Read and import all *Element flags. Data lines replaced by block markers (see InpIndex) are taken from the
+    decoded bulk_blocks"""
     elements = FemElements(
         chain.from_iterable(
-            filter(lambda x: x is not None, (grab_elements(m, fem) for m in cards.re_el.finditer(bulk_str)))
+            filter(
+                lambda x: x is not None,
+                (grab_elements(m, fem, bulk_blocks) for m in cards.re_el.finditer(bulk_str)),
+            )
         ),
         fem_obj=fem,
     )
@@ -36,7 +41,7 @@ def get_elem_from_bulk_str(bulk_str, fem: "FEM") -> FemElements:
     return elements
 
 
-def grab_elements(match, fem: "FEM"):
+def grab_elements(match, fem: "FEM", bulk_blocks: dict = None):
     d = match.groupdict()
     eltype = d["eltype"]
 
@@ -49,6 +54,10 @@ def grab_elements(match, fem: "FEM"):
     ada_el_type = abaqus_el_type_to_ada(eltype)
     elset = d["elset"]
     el_type_members_str = d["members"]
+    block_id = get_block_id(el_type_members_str) if bulk_blocks is not None else None
+    if block_id is not None:
+        return numpy_array_to_list_of_elements(bulk_blocks[block_id], eltype, elset, ada_el_type, fem)
+
     res = re.search("[a-zA-Z]", el_type_members_str)
     is_cubic = ada_el_type in [SolidShapes.HEX20, SolidShapes.HEX27]
     if is_cubic or res is None:
@@ -4,6 +4,7 @@ import mmap
 import os
 import pathlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from itertools import chain
 from typing import TYPE_CHECKING, Dict, List, Union
@@ -31,6 +32,7 @@ from ada.fem.shapes import ElemType
 
 from . import cards
 from .helper_utils import _re_in, get_set_from_assembly, list_cleanup
+from .inp_index import InpIndex, get_block_id
 from .read_elements import get_elem_from_bulk_str, update_connector_data
 from .read_masses import get_mass_from_bulk
 from .read_materials import get_materials_from_bulk
@@ -53,8 +55,12 @@ class InstanceData:
     transform: Transform = field(default_factory=Transform)
 
 
-def read_fem(fem_file, fem_name=None) -> Assembly:
-    """This will create and add an AbaqusPart object based on a path reference to a Abaqus input file."""
+def read_fem(fem_file, fem_name=None, num_workers=1) -> Assembly:
+    """This will create and add an AbaqusPart object based on a path reference to a Abaqus input file.
+
+    The input file and its includes are memory mapped and *NODE/*ELEMENT data blocks are decoded directly into numpy
+    arrays (concurrently if num_workers > 1). The remaining keywords are parsed from a bulk string without them.
+    """
     from ada import Assembly
 
     print("Starting import of Abaqus input file")
@@ -65,7 +71,10 @@ def read_fem(fem_file, fem_name=None) -> Assembly:
 
     assembly = Assembly("TempAssembly")
 
-    bulk_str = read_bulk_w_includes(fem_file)
+    with InpIndex(fem_file) as inp_index:
+        bulk_str = inp_index.skeleton()
+        bulk_blocks = inp_index.decode_blocks(num_workers)
+
     lbulk = bulk_str.lower()
     ass_start = lbulk.find("\n*assembly")
     ass_end = lbulk.rfind("\n*end assembly")
@@ -92,16 +101,16 @@ def read_fem(fem_file, fem_name=None) -> Assembly:
 
     ass_data = extract_instance_data(assembly_str[:inst_end])
 
-    part_list = import_parts(bulk_str[:ass_start], ass_data, assembly)
+    part_list = import_parts(bulk_str[:ass_start], ass_data, assembly, bulk_blocks)
     if len(part_list) == 0:
-        add_fem_without_assembly(bulk_str, assembly)
+        add_fem_without_assembly(bulk_str, assembly, bulk_blocks)
 
     if uses_assembly_parts is True:
         ass_sets = assembly_str[inst_end:]
-        assembly.fem.nodes += get_nodes_from_inp(ass_sets, assembly.fem)
+        assembly.fem.nodes += get_nodes_from_inp(ass_sets, assembly.fem, bulk_blocks)
         assembly.fem.lcsys.update(get_lcsys_from_bulk(ass_sets, assembly.fem))
         assembly.fem.connector_sections.update(get_connector_sections_from_bulk(props_str, assembly.fem))
-        assembly.fem.elements += get_elem_from_bulk_str(ass_sets, assembly.fem)
+        assembly.fem.elements += get_elem_from_bulk_str(ass_sets, assembly.fem, bulk_blocks)
         assembly.fem.elements.build_sets()
         assembly.fem.sets += get_sets_from_bulk(ass_sets, assembly.fem)
         assembly.fem.sets.link_data()
@@ -161,7 +170,9 @@ def extract_instance_data(assembly_bulk) -> dict[str, List[InstanceData]]:
     return ass_data
 
 
-def import_parts(bulk_str, instance_data: dict[str, List[InstanceData]], assembly: Assembly) -> List[Part]:
+def import_parts(
+    bulk_str, instance_data: dict[str, List[InstanceData]], assembly: Assembly, bulk_blocks: dict = None
+) -> List[Part]:
     part_list = []
 
     for m in cards.parts_matches.finditer(bulk_str):
@@ -171,12 +182,12 @@ def import_parts(bulk_str, instance_data: dict[str, List[InstanceData]], assembl
 
         for i in instance_data[name]:
             p_bulk_str = i.instance_bulk if part_bulk_str == "" and i.instance_bulk != "" else part_bulk_str
-            part = get_fem_from_bulk_str(name, p_bulk_str, assembly, i)
+            part = get_fem_from_bulk_str(name, p_bulk_str, assembly, i, bulk_blocks)
             part_list.append(part)
     return part_list
 
 
-def add_fem_without_assembly(bulk_str, assembly: Assembly) -> Part:
+def add_fem_without_assembly(bulk_str, assembly: Assembly, bulk_blocks: dict = None) -> Part:
     part_name_matches = list(cards.part_names.finditer(bulk_str))
     p_nmatch = tuple(part_name_matches)
 
@@ -190,10 +201,12 @@ def add_fem_without_assembly(bulk_str, assembly: Assembly) -> Part:
     p_name = next(part_name_counter) if p_name is None else p_name
     inst = InstanceData("", p_name, "")
 
-    return get_fem_from_bulk_str(p_name, p_bulk, assembly, inst)
+    return get_fem_from_bulk_str(p_name, p_bulk, assembly, inst, bulk_blocks)
 
 
-def get_fem_from_bulk_str(name, bulk_str, assembly: Assembly, instance_data: InstanceData) -> "Part":
+def get_fem_from_bulk_str(
+    name, bulk_str, assembly: Assembly, instance_data: InstanceData, bulk_blocks: dict = None
+) -> "Part":
     from ada import FEM, Part
 
     instance_name = name if instance_data.instance_name is None else instance_data.instance_name
@@ -201,9 +214,9 @@ def get_fem_from_bulk_str(name, bulk_str, assembly: Assembly, instance_data: Ins
         name = instance_name
     part = assembly.add_part(Part(name, fem=FEM(name=instance_name)))
     fem = part.fem
-    fem.nodes = get_nodes_from_inp(bulk_str, fem)
+    fem.nodes = get_nodes_from_inp(bulk_str, fem, bulk_blocks)
     fem.nodes.move(move=instance_data.transform.translation, rotate=instance_data.transform.rotation)
-    fem.elements = get_elem_from_bulk_str(bulk_str, fem)
+    fem.elements = get_elem_from_bulk_str(bulk_str, fem, bulk_blocks)
     fem.elements.build_sets()
     fem.sets += get_sets_from_bulk(bulk_str, fem)
     fem.sections = get_sections_from_inp(bulk_str, fem)
@@ -341,11 +354,12 @@ def get_instance_data(inst_name, p_ref, inst_bulk) -> InstanceData:
     return InstanceData(p_ref, inst_name, inst_bulk, transform)
 
 
-def import_multiple_inps(input_files_dir):
+def import_multiple_inps(input_files_dir, num_workers=1):
     """
     Import a set of inp files from a folder
 
     :param input_files_dir:
+    :param num_workers: Number of threads reading the files concurrently. The files are joined in directory order
     """
 
     def read_inp(fname):
@@ -355,11 +369,17 @@ def import_multiple_inps(input_files_dir):
             with open(pathlib.Path(input_files_dir) / fname, "r") as d:
                 return d.read()
 
-    return "".join([x for x in map(read_inp, os.listdir(input_files_dir)) if x is not None])
+    fnames = os.listdir(input_files_dir)
+    if num_workers is None or num_workers > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return "".join([x for x in executor.map(read_inp, fnames) if x is not None])
 
+    return "".join([x for x in map(read_inp, fnames) if x is not None])
 
-def get_nodes_from_inp(bulk_str, parent: FEM) -> Nodes:
-    """Extract node information from abaqus input file string"""
+
+def get_nodes_from_inp(bulk_str, parent: FEM, bulk_blocks: dict = None) -> Nodes:
+    """Extract node information from abaqus input file string. Data lines replaced by block markers (see InpIndex)
+    are taken from the decoded bulk_blocks"""
     re_no = re.compile(
         r"^\*Node\s*(?:,\s*nset=(?P<nset>.*?)\n|\n)(?P<members>(?:.*?)(?=\*|\Z))",
         _re_in,
@@ -367,8 +387,12 @@ def get_nodes_from_inp(bulk_str, parent: FEM) -> Nodes:
 
     def getnodes(m):
         d = m.groupdict()
-        res = np.fromstring(list_cleanup(d["members"]), sep=",", dtype=np.float64)
-        res_ = res.reshape(int(res.size / 4), 4)
+        block_id = get_block_id(d["members"]) if bulk_blocks is not None else None
+        if block_id is not None:
+            res_ = bulk_blocks[block_id]
+        else:
+            res = np.fromstring(list_cleanup(d["members"]), sep=",", dtype=np.float64)
+            res_ = res.reshape(int(res.size / 4), 4)
         members = [Node(n[1:4], int(n[0]), parent=parent) for n in res_]
         if d["nset"] is not None:
             parent.sets.add(FemSet(d["nset"], members, "nset", parent=parent))
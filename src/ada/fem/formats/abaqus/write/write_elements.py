@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import io
 from itertools import groupby
 from operator import attrgetter
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, TextIO
+
+import numpy as np
 
 from ada.core.utils import NewLine
 from ada.fem.shapes import definitions as shape_def
 
 from .helper_utils import get_instance_name
 from .write_masses import write_mass_elem
+from .write_nodes import CHUNK_SIZE
 
 if TYPE_CHECKING:
     from ada import FEM
@@ -16,19 +20,42 @@ if TYPE_CHECKING:
 
 
 def elements_str(fem: "FEM", written_on_assembly_level: bool) -> str:
-    part_el = fem.elements
-    grouping = groupby(part_el, key=attrgetter("type", "elset"))
+    buffer = io.StringIO()
+    write_all_elements(buffer, fem, written_on_assembly_level)
+    return buffer.getvalue()
+
+
+def write_all_elements(f: TextIO, fem: "FEM", written_on_assembly_level: bool) -> None:
+    """Write the element blocks of a FEM. Gives the same result as the (right stripped) concatenation of the element
+    blocks, but the blocks of regular elements are streamed in chunks"""
     if len(fem.elements) == 0:
-        return "** No elements"
+        f.write("** No elements")
+        return None
+
+    groups = [
+        (x, list(elements))
+        for x, elements in groupby(fem.elements, key=attrgetter("type", "elset"))
+        if not isinstance(x[0], shape_def.ConnectorTypes)
+    ]
+    for i, ((eltype, elset), elements) in enumerate(groups):
+        is_last = i == len(groups) - 1
+        if isinstance(eltype, shape_def.MassTypes) or can_format_in_bulk(elements, written_on_assembly_level) is False:
+            res = elwriter((eltype, elset), elements, fem, written_on_assembly_level)
+            f.write(res.rstrip() if is_last else res)
+            continue
 
-    return "".join(
-        list(
-            filter(
-                lambda x: x is not None,
-                [elwriter(x, elements, fem, written_on_assembly_level) for x, elements in grouping],
-            )
-        )
-    ).rstrip()
+        f.write(elements_header_str(eltype, elset, fem))
+        write_elem_lines(f, [el.id for el in elements], [[n.id for n in el.nodes] for el in elements])
+        if is_last is False:
+            f.write("\n")
+
+
+def elements_header_str(
+    eltype: shape_def.LineShapes | shape_def.ShellShapes | shape_def.SolidShapes, elset: FemSet, fem: FEM
+) -> str:
+    el_type = fem.options.ABAQUS.default_elements.get_element_type(eltype)
+    el_set_str = f", ELSET={elset.name}" if elset is not None else ""
+    return f"*ELEMENT, type={el_type}{el_set_str}"
 
 
 def write_elements(
@@ -38,10 +65,33 @@ def write_elements(
     elements: Iterable[Elem],
     alevel: bool,
 ):
-    el_type = fem.options.ABAQUS.default_elements.get_element_type(eltype)
-    el_set_str = f", ELSET={elset.name}" if elset is not None else ""
     el_str = "\n".join((write_elem(el, alevel) for el in elements))
-    return f"""*ELEMENT, type={el_type}{el_set_str}\n{el_str}\n"""
+    return f"""{elements_header_str(eltype, elset, fem)}\n{el_str}\n"""
+
+
+def can_format_in_bulk(elements: list[Elem], alevel: bool) -> bool:
+    """Elements referring to their nodes by id (i.e. not by instance name) and with no more than 10 nodes (i.e. on a
+    single line) can be formatted from arrays of element and node ids."""
+    if alevel is True:
+        return False
+    num_nodes = len(elements[0].nodes)
+    return num_nodes <= 10 and all(len(el.nodes) == num_nodes for el in elements)
+
+
+def get_elem_format(num_nodes: int) -> str:
+    """The %-format of an element line, see write_elem"""
+    node_fmt = "%13d," if num_nodes <= 6 else " %d,"
+    return "%7d, " + " ".join([node_fmt] * num_nodes)[:-1]
+
+
+def write_elem_lines(f: TextIO, el_ids: list[int], node_refs: list[list[int]], chunk_size: int = CHUNK_SIZE) -> None:
+    """Write a line (preceded by a line break) per element formatted in chunks from the element ids and the
+    (num_elements, num_nodes) node ids. Only for elements with at most 10 nodes"""
+    data = np.column_stack([np.asarray(el_ids, dtype=np.int64), np.asarray(node_refs, dtype=np.int64)])
+    line_fmt = "\n" + get_elem_format(data.shape[1] - 1)
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start : start + chunk_size]
+        f.write((line_fmt * len(chunk)) % tuple(chunk.ravel().tolist()))
 
 
 def write_elem(el: Elem, alevel: bool) -> str:
@@ -1,41 +1,75 @@
-from operator import attrgetter
-from typing import TYPE_CHECKING
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, TextIO
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ada import FEM
+    from ada.concepts.containers import Nodes
+
+NODE_FORMAT = "%7d, %13.6f, %13.6f, %13.6f"
+
+# Number of lines formatted at a time when writing node and element blocks
+CHUNK_SIZE = 50_000
 
 
 def nodes_str(fem: "FEM"):
-    f = "{nid:>7}, {x:>13.6f}, {y:>13.6f}, {z:>13.6f}"
+    buffer = io.StringIO()
+    write_nodes(buffer, fem)
+    return buffer.getvalue()
+
+
+def write_nodes(f: TextIO, fem: "FEM") -> None:
     if len(fem.nodes) == 0:
-        return "** No Nodes"
-    return (
-        "*NODE\n"
-        + "\n".join(
-            [f.format(nid=no.id, x=no[0], y=no[1], z=no[2]) for no in sorted(fem.nodes, key=attrgetter("id"))]
-        ).rstrip()
-    )
+        f.write("** No Nodes")
+        return None
 
+    f.write("*NODE")
+    write_node_lines(f, fem.nodes)
 
-def rp_str(fem: "FEM") -> str:
-    from .write_sets import aba_set_str
 
-    f = "{nid:>7}, {x:>13.6f}, {y:>13.6f}, {z:>13.6f}"
+def write_node_lines(f: TextIO, nodes: "Nodes", chunk_size: int = CHUNK_SIZE) -> None:
+    """Write a line (preceded by a line break) per node sorted by id. The lines are formatted in chunks from an array
+    of node ids and coordinates."""
+    node_data = nodes.to_np_array(include_id=True)
+    node_data = node_data[np.argsort(node_data[:, 0], kind="stable")]
+    for start in range(0, len(node_data), chunk_size):
+        chunk = node_data[start : start + chunk_size]
+        f.write((("\n" + NODE_FORMAT) * len(chunk)) % tuple(chunk.ravel().tolist()))
 
+
+def rp_str(fem: "FEM") -> str:
     if len(fem.ref_points.nodes) == 0:
         return "** No Nodes"
 
+    number_ref_points(fem)
+    return ref_points_str(fem)
+
+
+def number_ref_points(fem: "FEM") -> None:
+    """Number the reference points after the nodes and suffix the names of their sets. This modifies the FEM and is
+    done once before the reference points are written."""
+    if len(fem.ref_points.nodes) == 0:
+        return None
+
     ref_int = fem.nodes.max_nid
     fem.ref_points.renumber(int(ref_int + 1))
-
-    rp_nodes_str = (
-        "*NODE\n"
-        + "\n".join(
-            [f.format(nid=no.id, x=no[0], y=no[1], z=no[2]) for no in sorted(fem.ref_points, key=attrgetter("id"))]
-        ).rstrip()
-    )
     for nset in fem.ref_sets:
         nset.name += "-RefPt_"
+
+
+def ref_points_str(fem: "FEM") -> str:
+    """The reference points and their sets of a FEM already numbered using number_ref_points"""
+    from .write_sets import aba_set_str
+
+    if len(fem.ref_points.nodes) == 0:
+        return "** No Nodes"
+
+    buffer = io.StringIO()
+    buffer.write("*NODE")
+    write_node_lines(buffer, fem.ref_points)
     rp_sets_str = "\n" + "\n".join([aba_set_str(no, True, False) for no in fem.ref_sets]).rstrip()
 
-    return rp_nodes_str + rp_sets_str
+    return buffer.getvalue() + rp_sets_str
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
 import os
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, TextIO
 
 from ada.fem.conversion_utils import convert_ecc_to_mpc, convert_hinges_2_couplings
 
 from .write_constraints import constraints_str
-from .write_elements import elements_str
+from .write_elements import write_all_elements
 from .write_masses import masses_str
-from .write_nodes import nodes_str, rp_str
+from .write_nodes import number_ref_points, ref_points_str, write_nodes
 from .write_sections import sections_str
 from .write_sets import elsets_str, nsets_str
 from .write_springs import springs_str
@@ -15,8 +20,22 @@ from .write_surfaces import surfaces_str
 if TYPE_CHECKING:
     from ada import Assembly, Part
 
+BUFFER_SIZE = 2**20
+
+# The parts written by forked worker processes (see write_all_parts)
+_forked_parts: list[Part] | None = None
+
 
-def write_all_parts(assembly: "Assembly", analysis_dir):
+def write_all_parts(assembly: "Assembly", analysis_dir, processes: int = None):
+    """Write the bulk file of every part with elements.
+
+    The part files are independent of each other and can be written concurrently in forked worker processes (on
+    platforms supporting the fork start method). Forking is opt-in as it is unsafe in multithreaded processes.
+
+    :param processes: Maximum number of worker processes. Default (None or 1) writes the parts one by one in the
+        current process
+    """
+    parts = []
     for part in assembly.get_all_subparts():
         if len(part.fem.elements) == 0:
             continue
@@ -27,10 +46,35 @@ def write_all_parts(assembly: "Assembly", analysis_dir):
         if assembly.convert_options.ecc_to_mpc is True:
             convert_ecc_to_mpc(part.fem)
 
-        write_part_bulk(part, analysis_dir)
+        # Modifications of the parts must be made here, as changes made in worker processes are lost
+        if part.fem.initial_state is None:
+            number_ref_points(part.fem)
+        parts.append(part)
+
+    if processes is None or processes <= 1 or len(parts) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for part in parts:
+            write_part_bulk(part, analysis_dir)
+        return None
+
+    # Forked workers inherit the parts, so only the index of a part is sent to the workers (and nothing is pickled)
+    global _forked_parts
+    _forked_parts = parts
+    try:
+        mp_context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as executor:
+            futures = [executor.submit(_write_forked_part_bulk, i, analysis_dir) for i in range(len(parts))]
+            for future in futures:
+                future.result()
+    finally:
+        _forked_parts = None
+
+
+def _write_forked_part_bulk(index: int, analysis_dir) -> None:
+    write_part_bulk(_forked_parts[index], analysis_dir)
 
 
 def write_part_bulk(part_in: "Part", analysis_dir):
+    """Write the bulk file of a part. The reference points must be numbered using number_ref_points first"""
     bulk_path = analysis_dir / f"bulk_{part_in.name}"
     bulk_file = bulk_path / "aba_bulk.inp"
     os.makedirs(bulk_path, exist_ok=True)
@@ -40,24 +84,35 @@ def write_part_bulk(part_in: "Part", analysis_dir):
             d.write("** This part is replaced by an initial state step")
         return None
 
-    with open(bulk_file, "w") as d:
-        d.write(write_abaqus_part_str(part_in))
+    with open(bulk_file, "w", buffering=BUFFER_SIZE) as d:
+        write_abaqus_part(d, part_in)
 
 
 def write_abaqus_part_str(part: "Part") -> str:
+    number_ref_points(part.fem)
+    buffer = io.StringIO()
+    write_abaqus_part(buffer, part)
+    return buffer.getvalue()
+
+
+def write_abaqus_part(f: TextIO, part: "Part") -> None:
+    """Write a part with the nodes and elements streamed in chunks. The reference points must be numbered using
+    number_ref_points first"""
     fem = part.fem
-    return f"""** Abaqus Part {part.name}
-** Exported using ADA OpenSim
-{nodes_str(fem)}
-{elements_str(fem, False)}
-{rp_str(fem)}
+    f.write(f"** Abaqus Part {part.name}\n** Exported using ADA OpenSim\n")
+    write_nodes(f, fem)
+    f.write("\n")
+    write_all_elements(f, fem, False)
+    f.write("\n")
+    tail = f"""{ref_points_str(fem)}
 {elsets_str(fem, False)}
 {nsets_str(fem, False)}
 {sections_str(fem)}
 {masses_str(fem, False)}
 {surfaces_str(fem, False)}
 {constraints_str(fem, False)}
-{springs_str(fem)}""".rstrip()
+{springs_str(fem)}"""
+    f.write(tail.rstrip())
 
 
 def instance_move_str(self):
@@ -8,14 +8,14 @@ from .write_amplitudes import amplitudes_str
 from .write_bc import boundary_conditions_str
 from .write_connectors import connector_sections_str, connectors_str
 from .write_constraints import constraints_str
-from .write_elements import elements_str
+from .write_elements import write_all_elements
 from .write_interactions import eval_interactions, int_prop_str
 from .write_main_inp import write_main_inp_str
 from .write_masses import masses_str
 from .write_materials import materials_str
-from .write_nodes import nodes_str
+from .write_nodes import write_nodes
 from .write_orientations import orientations_str
-from .write_parts import write_all_parts
+from .write_parts import BUFFER_SIZE, write_all_parts
 from .write_predefined_state import predefined_fields_str
 from .write_sets import elsets_str, nsets_str
 from .write_steps import write_step
@@ -28,10 +28,12 @@ __all__ = ["to_fem"]
 
 
 def to_fem(assembly: Assembly, name, analysis_dir=None, metadata=None, writable_obj: StringIO = None):
-    """Build the Abaqus Analysis input deck"""
+    """Build the Abaqus Analysis input deck. The part bulk files are written by metadata["processes"] worker
+    processes (default is in the current process)"""
 
     # Write part bulk files
-    write_all_parts(assembly, analysis_dir)
+    processes = metadata.get("processes", None) if metadata is not None else None
+    write_all_parts(assembly, analysis_dir, processes)
 
     # Write Assembly level files
     core_dir = analysis_dir / r"core_input_files"
@@ -56,16 +58,15 @@ def to_fem(assembly: Assembly, name, analysis_dir=None, metadata=None, writable_
         d.write(constraints_str(afem, True) if len(afem.constraints.keys()) > 0 else "**")
 
     # Assembly data
-    with open(core_dir / "assembly_data.inp", "w") as d:
-        assembly_nodes_str = "** No Nodes"
-        if len(afem.nodes) > 0:
-            assembly_nodes_str = nodes_str(afem)
-        d.write(f"{assembly_nodes_str}\n")
+    with open(core_dir / "assembly_data.inp", "w", buffering=BUFFER_SIZE) as d:
+        write_nodes(d, afem)
+        d.write("\n")
         d.write(f"{nsets_str(afem, True)}\n")
         d.write(f"{elsets_str(afem, True)}\n")
         d.write(f"{surfaces_str(afem, True)}\n")
         d.write(orientations_str(afem, True) + "\n")
-        d.write(elements_str(afem, True) + "\n")
+        write_all_elements(d, afem, True)
+        d.write("\n")
         d.write(masses_str(afem, True))
 
     # Amplitude data
@@ -4,6 +4,8 @@ import pathlib
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import groupby
+from operator import attrgetter
 from typing import Iterator
 
 import meshio
@@ -83,11 +85,17 @@ class ElemShape(Enum):
 
 @dataclass
 class CcxResultModel:
-    file: Iterator
+    """Streaming reader of Calculix .frd files. The file must be opened in binary mode.
+
+    Block boundaries are found in a single pass over the file while the numeric records of each block are decoded
+    in bulk from their fixed width columns.
+    """
+
+    file: Iterator[bytes]
 
     ccx_version: str = None
     nodes: np.ndarray = None
-    elements: np.ndarray = None
+    elements: list[np.ndarray] = None
     results: list[NodalFieldData | ElementFieldData] = field(default_factory=list)
 
     _curr_step: int = None
@@ -95,68 +103,37 @@ class CcxResultModel:
     _curr_eig_freq: float = None
     _curr_eig_value: float = None
 
-    def collect_nodes(self):
-        while True:
-            data = next(self.file)
-            stripped = data.strip()
-            if stripped.startswith("-1") is False:
-                break
-            split = stripped.split()
-            try:
-                yield [float(x) for x in split[1:]]
-            except ValueError:  # Typically it's a - character separating two columns not whitespace
-                split = list(filter(lambda x: x.strip() != "", re.split(r"(?=\s|(?<=[0-9])-(?=[0-9]))", stripped)))
-                yield [float(x) for x in split[1:]]
-
-    def collect_elements(self):
-        elements = []
-        curr_element = []
-
-        while True:
-            data = next(self.file)
-
-            stripped = data.strip()
-            if stripped.startswith("-1") is False:
-                if stripped.startswith("-2") is False:
-                    break
-
-            split = stripped.split()
-
-            if stripped.startswith("-1"):
-                if len(curr_element) != 0:
-                    elements.append(tuple(curr_element))
-                data = [int(x) for x in split[1:]]
-                curr_element = data
-            elif stripped.startswith("-2"):
-                data = [int(x) for x in split[1:]]
-                curr_element += data
-            else:
-                break
-
-        self.elements = np.asarray(elements)
-        self.eval_flags(data)
-
-    def collect_results(self, first_line):
-        name = first_line.split()[1]
-
-        component_names = []
-        component_data = []
-        while True:
-            data = next(self.file)
-            stripped = data.strip()
-
-            if stripped.startswith("-5"):
-                split = stripped.split()
-                component_names.append(split[1])
-            elif stripped.startswith("-1"):
-                slen = len(stripped)
-                x = 12
-                res = [stripped[i : i + x] for i in range(0, slen, x)]
-                first_batch = res[0].split()
-                nid = int(float(first_batch[1]))
-                component_data.append((nid, *[float(x) for x in res[1:]]))
-            else:
-                break
+    def collect_nodes(self, lines: Iterator[bytes]) -> np.ndarray:
+        records, _ = collect_records(lines)
+        ids, coords = decode_fixed_width_records(records)
+        return np.column_stack((ids, coords))
+
+    def collect_elements(self, lines: Iterator[bytes]) -> list[np.ndarray]:
+        """The element records as one (num_elements, 4 + num_nodes) array per element type (in order of appearance)"""
+        records, _ = collect_records(lines, continuation_offset=3)
+
+        # Records of the same element type (number of nodes) have the same length and are decoded together
+        records_by_length = dict()
+        for record in records:
+            records_by_length.setdefault(len(record), []).append(record[3:])
+
+        blocks = dict()
+        for group in records_by_length.values():
+            data = np.fromstring(b" ".join(group).decode(), dtype=int, sep=" ").reshape((len(group), -1))
+            blocks.setdefault(data.shape[1], []).append(data)
+
+        element_blocks = []
+        for arrays in blocks.values():
+            data = np.concatenate(arrays)
+            element_blocks.append(data[np.argsort(data[:, 0], kind="stable")])
+
+        return element_blocks
+
+    def collect_results(self, first_line: bytes, lines: Iterator[bytes]) -> NodalFieldData:
+        name = first_line.split()[1].decode()
+        records, component_lines = collect_records(lines, header_key=b" -5")
+        component_names = [x.split()[1].decode() for x in component_lines]
+        ids, values = decode_fixed_width_records(records)
 
         curr_step = self._curr_step
         curr_eig_freq = None
@@ -171,33 +148,27 @@ class CcxResultModel:
         if name.startswith("DISP"):
             field_type = NodalFieldType.DISP
 
-        self.results.append(
-            NodalFieldData(
-                name,
-                curr_step,
-                component_names,
-                np.asarray(component_data),
-                eigen_freq=curr_eig_freq,
-                eigen_value=curr_eig_value,
-                field_type=field_type,
-            )
+        return NodalFieldData(
+            name,
+            curr_step,
+            component_names,
+            np.column_stack((ids, values)),
+            eigen_freq=curr_eig_freq,
+            eigen_value=curr_eig_value,
+            field_type=field_type,
         )
-        self.eval_flags(data)
 
-    def eval_flags(self, data: str):
-        stripped = data.strip()
+    def eval_flags(self, data: bytes, lines: Iterator[bytes]) -> NodalFieldData | None:
+        stripped = data.decode().strip()
         if stripped.startswith("1UVERSION"):
             res = stripped.split()
             self.ccx_version = res[-1].lower().replace("version", "").strip()
 
         if stripped.startswith("2C"):
-            split = stripped.split()
-            num_len = int(float(split[1]))
-            # Note! np.fromiter have issues on older numpy versions such as (1.22.3)
-            self.nodes = np.fromiter(self.collect_nodes(), dtype=np.dtype((float, 4)), count=num_len)
+            self.nodes = self.collect_nodes(lines)
 
         if stripped.startswith("3C"):
-            self.collect_elements()
+            self.elements = self.collect_elements(lines)
 
         if stripped.startswith("1PSTEP"):
             split_data = stripped.split()
@@ -216,15 +187,26 @@ class CcxResultModel:
             self._curr_eig_freq = float(split_data[2])
 
         if stripped.startswith("-4"):
-            self.collect_results(stripped)
+            return self.collect_results(data, lines)
+
+        return None
+
+    def iter_results(self) -> Iterator[NodalFieldData]:
+        """Yield the result blocks one at a time without keeping them in memory. Nodes and elements are stored on
+        the model as they are passed in the file."""
+        lines = iter(self.file)
+        for line in lines:
+            res = self.eval_flags(line, lines)
+            if res is not None:
+                yield res
+
+    def iter_steps(self) -> Iterator[tuple[int, list[NodalFieldData]]]:
+        """Yield all results belonging to the same step (or eigenmode) together"""
+        for step, results in groupby(self.iter_results(), key=attrgetter("step")):
+            yield step, list(results)
 
     def load(self):
-        while True:
-            try:
-                curr = next(self.file)
-                self.eval_flags(curr)
-            except StopIteration:
-                break
+        self.results += list(self.iter_results())
 
     def get_last_step_results(self, data_type: BaseEnum) -> list[FieldData]:
         results = dict()
@@ -241,8 +223,51 @@ class CcxResultModel:
         return list(results.values())
 
 
+def collect_records(
+    lines: Iterator[bytes], header_key: bytes = None, continuation_offset: int = 13
+) -> tuple[list[bytes], list[bytes]]:
+    """Collect the data records (-1) of a block up to the end of block marker (-3). Continuation lines (-2) are
+    appended to the preceding record.
+
+    :param header_key: Key of header lines preceding the data records (i.e. component definitions)
+    :param continuation_offset: Number of leading characters of a continuation line that are not data
+    :return: The data records and header lines
+    """
+    records = []
+    headers = []
+    for line in lines:
+        if line.startswith(b" -1"):
+            records.append(line.rstrip(b"\r\n"))
+        elif line.startswith(b" -2"):
+            records[-1] += line.rstrip(b"\r\n")[continuation_offset:]
+        elif header_key is not None and line.startswith(header_key):
+            headers.append(line)
+        else:
+            break
+
+    return records, headers
+
+
+def decode_fixed_width_records(records: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """Decode records formatted as (' -1', I10, nE12.5) in bulk"""
+    if len(records) == 0:
+        return np.zeros(0, dtype=int), np.zeros((0, 0))
+
+    width = max(len(x) for x in records)
+    num_values = (width - 13) // 12
+    buffer = np.frombuffer(b"".join([x.ljust(width) for x in records]), dtype="S1").reshape((len(records), width))
+    try:
+        ids = buffer[:, 3:13].copy().view("S10").ravel().astype(int)
+        values = buffer[:, 13 : 13 + 12 * num_values].copy().view("S12").astype(float)
+    except ValueError:  # Records not following the fixed width format
+        data = np.array([[float(x) for x in safesplit(r.decode())[1:]] for r in records])
+        ids, values = data[:, 0].astype(int), data[:, 1:]
+
+    return ids, values
+
+
 def read_from_frd_file(frd_file) -> meshio.Mesh:
-    with open(frd_file, "r") as f:
+    with open(frd_file, "rb") as f:
         ccx_res_model = CcxResultModel(f)
         ccx_res_model.load()
 
@@ -251,7 +276,7 @@ def read_from_frd_file(frd_file) -> meshio.Mesh:
 
 
 def read_from_frd_file_proto(frd_file) -> FEAResult:
-    with open(frd_file, "r", encoding="utf8") as f:
+    with open(frd_file, "rb") as f:
         ccx_res_model = CcxResultModel(f)
         ccx_res_model.load()
 
@@ -261,6 +286,13 @@ def read_from_frd_file_proto(frd_file) -> FEAResult:
     return to_fea_result_obj(ccx_res_model, frd_file)
 
 
+def iter_frd_steps(frd_file) -> Iterator[tuple[int, list[NodalFieldData]]]:
+    """Read the results of a .frd file one step at a time to keep memory bounded for large result files"""
+    with open(frd_file, "rb") as f:
+        ccx_res_model = CcxResultModel(f)
+        yield from ccx_res_model.iter_steps()
+
+
 def to_fea_result_obj(ccx_results: CcxResultModel, frd_file) -> FEAResult:
     from ada.fem.formats.general import FEATypes
 
@@ -268,18 +300,18 @@ def to_fea_result_obj(ccx_results: CcxResultModel, frd_file) -> FEAResult:
         frd_file = pathlib.Path(frd_file)
 
     description = f"Adapy - Calculix ({ccx_results.ccx_version}) Results"
-    shape = ElemShape.get_type_from_elem_array_shape(ccx_results.elements)
-    node_refs = ccx_results.elements[:, 4:]
-    elem_info = ElementInfo(
-        type=ElemShape.el_shape_to_baseshape(shape), source_software=FEATypes.CALCULIX, source_type=str(shape.value)
-    )
-    identifiers = ccx_results.elements[:, 0]
-    elem_block = ElementBlock(elem_info=elem_info, node_refs=node_refs, identifiers=identifiers)
+    elem_blocks = []
+    for elements in ccx_results.elements:
+        shape = ElemShape.get_type_from_elem_array_shape(elements)
+        elem_info = ElementInfo(
+            type=ElemShape.el_shape_to_baseshape(shape), source_software=FEATypes.CALCULIX, source_type=str(shape.value)
+        )
+        elem_blocks.append(ElementBlock(elem_info=elem_info, node_refs=elements[:, 4:], identifiers=elements[:, 0]))
 
     coords = ccx_results.nodes[:, 1:]
     identifiers = ccx_results.nodes[:, 0]
     nodes = FemNodes(coords=coords, identifiers=identifiers)
-    mesh = Mesh(elements=[elem_block], nodes=nodes)
+    mesh = Mesh(elements=elem_blocks, nodes=nodes)
 
     return FEAResult(
         frd_file.name,
@@ -303,13 +335,14 @@ def to_meshio_mesh(ccx_results: CcxResultModel) -> meshio.Mesh:
         monotonic_point_map[x] = i
 
     # Cells
-    elements = ccx_results.elements
-    cells = elements[:, 4:]
-    for original_num, new_num in monotonic_point_map.items():
-        cells[cells == original_num] = new_num
+    cell_blocks = []
+    for elements in ccx_results.elements:
+        cells = elements[:, 4:]
+        for original_num, new_num in monotonic_point_map.items():
+            cells[cells == original_num] = new_num
 
-    shape = ElemShape.get_type_from_elem_array_shape(elements)
-    cell_block = meshio.CellBlock(str(shape.value), cells)
+        shape = ElemShape.get_type_from_elem_array_shape(elements)
+        cell_blocks.append(meshio.CellBlock(str(shape.value), cells))
 
     # Point Data
     # Multiple steps are AFAIK not supported in the meshio Mesh object. So only the last step is used
@@ -324,7 +357,7 @@ def to_meshio_mesh(ccx_results: CcxResultModel) -> meshio.Mesh:
         values = np.asarray(res.values)[:, 1:]
         cell_data[res.name] = [values]
 
-    mesh = meshio.Mesh(points=points, cells=[cell_block], cell_data=cell_data, point_data=point_data)
+    mesh = meshio.Mesh(points=points, cells=cell_blocks, cell_data=cell_data, point_data=point_data)
     return mesh
 
 
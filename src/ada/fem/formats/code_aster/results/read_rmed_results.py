@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import pathlib
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import h5py
@@ -19,147 +20,175 @@ if TYPE_CHECKING:
         NodalFieldData,
     )
 
+_re_name_number = re.compile(rb"^\D*(\d+)\s*$")
+_NO_PROFILE = "MED_NO_PROFILE_INTERNAL"
 
-def read_rmed_file(rmed_file: str | pathlib.Path) -> FEAResult:
+
+def read_rmed_file(rmed_file: str | pathlib.Path, fields: list[str] = None, steps: list[int] = None) -> FEAResult:
+    """Read the mesh and results of a Code_Aster MED result file
+
+    :param fields: Names of the fields to read. Default is all fields
+    :param steps: The (1-based) step numbers to read. Default is all steps
+    """
     from ada.fem.results.common import FEAResult, FEATypes
 
     if isinstance(rmed_file, str):
         rmed_file = pathlib.Path(rmed_file)
 
-    mr = MedReader(rmed_file)
-    mr.load()
+    with MedResultStore(rmed_file) as store:
+        mesh = store.mesh
+        results = store.get_results(fields, steps)
 
     return FEAResult(
-        rmed_file.name, software=FEATypes.CODE_ASTER, results=mr.results, mesh=mr.mesh, results_file_path=rmed_file
+        rmed_file.name, software=FEATypes.CODE_ASTER, results=results, mesh=mesh, results_file_path=rmed_file
     )
 
 
 @dataclass
-class MedReader:
-    rmed_file: str | pathlib.Path
-    f: h5py.File = None
-
-    mesh: Mesh = None
-    results: list[ElementFieldData | NodalFieldData] = None
+class MedFieldStep:
+    """A time step (or eigen mode) of a MED field and the supports (NOE, MAI.QU4, NOE.SE2 etc.) it has data on"""
 
-    _dim: int = None
-    is_eigen_analysis: bool = False
+    step: int
+    key: str
+    time: float
+    supports: list[str]
 
-    def __post_init__(self):
-        if isinstance(self.rmed_file, str):
-            self.rmed_file = pathlib.Path(self.rmed_file)
 
-    def load(self):
-        self.f = h5py.File(self.rmed_file)
-        self.mesh = self.get_mesh()
-        self.results = self.get_results()
-        self.f.close()
+@dataclass
+class MedField:
+    name: str
+    components: list[str]
+    steps: list[MedFieldStep] = field(default_factory=list)
 
-    def get_mesh(self) -> Mesh:
-        from ada.fem.results.common import Mesh
+    def get_step(self, step: int) -> MedFieldStep:
+        for med_step in self.steps:
+            if med_step.step == step:
+                return med_step
+        raise ValueError(f'Field "{self.name}" has no step {step}')
 
-        mesh = self._load_mesh()
+    def get_step_name(self, med_step: MedFieldStep) -> str:
+        if len(self.steps) == 1:
+            return self.name
+        return self.name + f"[{med_step.step - 1:d}] - {med_step.time:g}"
 
-        nodes = self.get_nodes(mesh)
-        elements = self.get_elements(mesh)
 
-        return Mesh(elements=elements, nodes=nodes)
+class MedResultStore:
+    """Lazy access to the mesh and fields of a Code_Aster MED result file (.rmed).
 
-    def get_nodes(self, mesh) -> FemNodes:
-        from ada.fem.results.common import FemNodes
+    The file is opened once and only the attributes of the field groups are read to build the catalogue of fields,
+    steps and supports. Field values are read on request, and only for the requested rows when a subset of the
+    nodes is given. Use it as a context manager to close the file.
 
-        pts_dataset = mesh["NOE"]["COO"]
-        n_points = pts_dataset.attrs["NBR"]
-        coords = pts_dataset[()].reshape((n_points, self._dim), order="F")
-        node_identifiers = np.array(range(1, len(coords) + 1))
+    :param rmed_file: Path to the MED file
+    :param chunk_cache_size: Size in bytes of the h5py chunk cache of each dataset
+    """
 
-        # TODO: Figure out where the actual point identifiers are stored in med files
-        return FemNodes(coords=coords, identifiers=node_identifiers)
+    def __init__(self, rmed_file: str | pathlib.Path, chunk_cache_size: int = 32 * 1024**2):
+        self.rmed_file = pathlib.Path(rmed_file)
+        self.f = h5py.File(self.rmed_file, "r", rdcc_nbytes=chunk_cache_size)
+        self._fields: dict[str, MedField] = None
+        self._mesh: Mesh = None
+        self._mesh_group: h5py.Group = None
+        self._dim: int = None
 
-    def get_elements(self, mesh) -> list[ElementBlock]:
-        from ada.fem.formats.code_aster.common import med_to_ada_type
-        from ada.fem.results.common import ElementBlock, ElementInfo, FEATypes
+    def __enter__(self):
+        return self
 
-        cell_types = []
-        med_cells = mesh["MAI"]
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-        blocks = []
-        for med_cell_type, med_cell_type_group in med_cells.items():
-            if med_cell_type == "PO1":
-                logger.warning("Point elements are still not supported")
-                continue
+    def close(self) -> None:
+        self.f.close()
 
-            cell_type = med_to_ada_type(med_cell_type)
-            cell_types.append(cell_type)
+    @property
+    def fields(self) -> dict[str, MedField]:
+        """The catalogue of fields in the file"""
+        if self._fields is None:
+            self._fields = self._get_catalogue()
+        return self._fields
+
+    @property
+    def is_eigen_analysis(self) -> bool:
+        return "modes___DEPL" in self.fields
+
+    @property
+    def mesh(self) -> Mesh:
+        if self._mesh is None:
+            self._mesh = self.get_mesh()
+        return self._mesh
+
+    def _get_catalogue(self) -> dict[str, MedField]:
+        fields = dict()
+        for name, data in self.f.get("CHA", dict()).items():
+            nom = data.attrs.get("NOM")
+            if nom is None:
+                raise ValueError(f'Field "{name}" has no component names')
 
-            nod = med_cell_type_group["NOD"]
-            n_cells = nod.attrs["NBR"]
-            node_refs = nod[()].reshape(n_cells, -1, order="F")
+            med_field = MedField(name, nom.decode().split())
+            for i, key in enumerate(sorted(data.keys()), start=1):
+                med_step = data[key]
+                med_field.steps.append(MedFieldStep(i, key, float(med_step.attrs["PDT"]), list(med_step.keys())))
+            fields[name] = med_field
 
-            if "NUM" in med_cell_type_group.keys():
-                num = np.array(med_cell_type_group["NUM"])
-            else:
-                num = np.arange(0, len(node_refs))
+        return fields
 
-            elem_info = ElementInfo(type=cell_type, source_software=FEATypes.CODE_ASTER, source_type=med_cell_type)
-            elem_block = ElementBlock(elem_info=elem_info, node_refs=node_refs, identifiers=num)
-            blocks.append(elem_block)
+    def get_results(self, fields: list[str] = None, steps: list[int] = None) -> list[ElementFieldData | NodalFieldData]:
+        """Read the data of all supports of the given fields and steps
 
-        return blocks
+        :param fields: Names of the fields. Default is all fields
+        :param steps: The (1-based) step numbers. Default is all steps
+        """
+        fields = self.fields.keys() if fields is None else fields
 
-    def get_results(self) -> list[ElementFieldData | NodalFieldData]:
-        fields = self.f.get("CHA")
         results = []
-
-        for name, data in fields.items():
-            nom = data.attrs.get("NOM")
-            if nom is None:
-                raise ValueError()
-
-            components = nom.decode().split()
-            time_step = sorted(data.keys())  # associated time-steps
-            time_steps = []
-            if len(time_step) == 1:  # single time-step
-                names = [name]  # do not change field name
-                res = data[time_step[0]].attrs.get("PDT")
-                time_steps.append(res)
-            else:  # many time-steps
-                names = [None] * len(time_step)
-                for i, key in enumerate(time_step):
-                    t = data[key].attrs["PDT"]  # current time
-                    time_steps.append(float(t))
-                    names[i] = name + f"[{i:d}] - {t:g}"
-
-            if name == "modes___DEPL":
-                self.is_eigen_analysis = True
-
-            # MED field can contain multiple types of data
-            for i, key in enumerate(time_step):
-                med_data = data[key]  # at a particular time step
-                step_name = names[i]
-                ts = time_steps[i]
-                step_index = i + 1
-                for supp in med_data:
-                    if supp == "NOE":  # continuous nodal (NOEU) data
-                        result = self._load_nodal_field_data(step_index, step_name, med_data, ts, components)
-                        results.append(result)
-                    else:  # Gauss points (ELGA) or DG (ELNO) data
-                        result = self._load_element_field_data(step_index, step_name, med_data[supp], ts, components)
-                        results.append(result)
+        for name in fields:
+            med_field = self.fields[name]
+            for med_step in med_field.steps:
+                if steps is not None and med_step.step not in steps:
+                    continue
+                for support in med_step.supports:
+                    results.append(self.get_field_data(name, med_step.step, support))
 
         return results
 
-    def _load_element_field_data(self, i, name, med_data, step, components) -> ElementFieldData:
+    def get_field_data(
+        self, name: str, step: int = 1, support: str = "NOE", rows: np.ndarray | slice = None
+    ) -> ElementFieldData | NodalFieldData:
+        """Read the values of a field at a single step and support
+
+        :param name: Name of the field
+        :param step: The (1-based) step number
+        :param support: The support of the values. NOE for nodal values, or MAI.<cell type> for cell values
+        :param rows: Read the values of these node indices only. Only supported for nodal (NOE) values, as the cell
+            values are returned without element identifiers
+        """
+        med_field = self.fields.get(name)
+        if med_field is None:
+            raise ValueError(f'Field "{name}" not found in "{self.rmed_file.name}"')
+
+        med_step = med_field.get_step(step)
+        if support not in med_step.supports:
+            raise ValueError(f'Field "{name}" has no data on support "{support}" at step {step}')
+
+        step_name = med_field.get_step_name(med_step)
+        med_data = self.f["CHA"][name][med_step.key][support]
+        if support == "NOE":  # continuous nodal (NOEU) data
+            return self._load_nodal_field_data(med_step, step_name, med_data, med_field.components, rows)
+
+        if rows is not None:
+            raise ValueError(f'Reading a subset of rows is only supported for nodal values, not "{support}"')
+
+        # Gauss points (ELGA) or DG (ELNO) data
+        return self._load_element_field_data(med_step, step_name, med_data, med_field.components)
+
+    def _load_element_field_data(self, med_step: MedFieldStep, name, med_data, components) -> ElementFieldData:
         from ada.fem.results.common import ElementFieldData
 
-        profile = med_data.attrs["PFL"]
-        data_profile = med_data[profile]
+        data_profile = _get_data_profile(med_data)
         n_cells = data_profile.attrs["NBR"]
         n_gauss_points = data_profile.attrs["NGA"]
-        if profile.decode() == "MED_NO_PROFILE_INTERNAL":  # default profile with everything
-            values = data_profile["CO"][()].reshape(n_cells, n_gauss_points, -1, order="F")
-        else:
-            raise NotImplementedError()
+        values = read_rows(data_profile["CO"], n_cells)
+        values = values.reshape(len(values), n_gauss_points, -1, order="F")
 
         # Only 1 data point per cell, shape -> (n_cells, n_components)
         if n_gauss_points == 1:
@@ -167,34 +196,25 @@ class MedReader:
             if values.shape[-1] == 1:  # cut off for scalars
                 values = values[:, 0]
 
-        eig_freq = None
-        if self.is_eigen_analysis:
-            eig_freq = step
-            step = i
-
+        step, eig_freq = self._get_step_and_freq(med_step)
         return ElementFieldData(name, step, components, values, eigen_freq=eig_freq)
 
-    def _load_nodal_field_data(self, i, name, med_data, step, components) -> NodalFieldData:
+    def _load_nodal_field_data(self, med_step: MedFieldStep, name, med_data, components, rows=None) -> NodalFieldData:
         from ada.fem.results.common import NodalFieldData, NodalFieldType
 
-        profile = med_data["NOE"].attrs["PFL"]
-        data_profile = med_data["NOE"][profile]
+        data_profile = _get_data_profile(med_data)
         n_points = data_profile.attrs["NBR"]
-        if profile.decode() == "MED_NO_PROFILE_INTERNAL":  # default profile with everything
-            values = data_profile["CO"][()].reshape(n_points, -1, order="F")
-        else:
-            raise NotImplementedError()
+        values = read_rows(data_profile["CO"], n_points, rows)
 
         if values.shape[-1] == 1:  # cut off for scalars
             values = values[:, 0]
 
-        node_ids = self.mesh.nodes.identifiers
+        node_ids = self.get_node_ids()
+        if rows is not None:
+            node_ids = node_ids[rows]
         values = np.insert(values, 0, node_ids, axis=1)
 
-        eig_freq = None
-        if self.is_eigen_analysis:
-            eig_freq = step
-            step = i
+        step, eig_freq = self._get_step_and_freq(med_step)
 
         field_type = None
         if "DX" in components:
@@ -202,7 +222,15 @@ class MedReader:
 
         return NodalFieldData(name, step, components, values, eigen_freq=eig_freq, field_type=field_type)
 
-    def _load_mesh(self):
+    def _get_step_and_freq(self, med_step: MedFieldStep) -> tuple[int | float, float | None]:
+        if self.is_eigen_analysis:
+            return med_step.step, med_step.time
+        return med_step.time, None
+
+    def _get_mesh_group(self) -> h5py.Group:
+        if self._mesh_group is not None:
+            return self._mesh_group
+
         mesh_ensemble = self.f["ENS_MAA"]
         meshes = mesh_ensemble.keys()
         if len(meshes) != 1:
@@ -220,4 +248,120 @@ class MedReader:
             if len(time_step) != 1:
                 raise ValueError(f"Must only contain exactly 1 time-step, found {len(time_step)}.")
             mesh = mesh[list(time_step)[0]]
+
+        self._mesh_group = mesh
         return mesh
+
+    def get_node_ids(self) -> np.ndarray:
+        """The node identifiers. Read from the node numbers (NUM) if present, otherwise from the numbers of the node
+        names (i.e. "N12"). Nodes are numbered by their position if neither are available."""
+        if self._mesh is not None:
+            return self._mesh.nodes.identifiers
+
+        noe = self._get_mesh_group()["NOE"]
+        n_points = noe["COO"].attrs["NBR"]
+        if "NUM" in noe.keys():
+            return np.asarray(noe["NUM"][()], dtype=int)
+
+        if "NOM" in noe.keys():
+            node_ids = get_ids_from_names(noe["NOM"][()])
+            if node_ids is not None:
+                return node_ids
+
+        return np.arange(1, n_points + 1)
+
+    def get_mesh(self) -> Mesh:
+        from ada.fem.results.common import Mesh
+
+        nodes = self.get_nodes()
+        elements = self.get_elements(nodes.identifiers)
+
+        return Mesh(elements=elements, nodes=nodes)
+
+    def get_nodes(self) -> FemNodes:
+        from ada.fem.results.common import FemNodes
+
+        pts_dataset = self._get_mesh_group()["NOE"]["COO"]
+        n_points = pts_dataset.attrs["NBR"]
+        coords = pts_dataset[()].reshape((n_points, self._dim), order="F")
+
+        return FemNodes(coords=coords, identifiers=self.get_node_ids())
+
+    def get_elements(self, node_ids: np.ndarray) -> list[ElementBlock]:
+        from ada.fem.formats.code_aster.common import med_to_ada_type
+        from ada.fem.results.common import ElementBlock, ElementInfo, FEATypes
+
+        # The connectivity refers to the nodes by their (1-based) position
+        is_positional = np.array_equal(node_ids, np.arange(1, len(node_ids) + 1))
+
+        blocks = []
+        for med_cell_type, med_cell_type_group in self._get_mesh_group()["MAI"].items():
+            if med_cell_type == "PO1":
+                logger.warning("Point elements are still not supported")
+                continue
+
+            cell_type = med_to_ada_type(med_cell_type)
+
+            nod = med_cell_type_group["NOD"]
+            n_cells = nod.attrs["NBR"]
+            node_refs = nod[()].reshape(n_cells, -1, order="F")
+            if is_positional is False:
+                node_refs = node_ids[node_refs - 1]
+
+            if "NUM" in med_cell_type_group.keys():
+                num = np.array(med_cell_type_group["NUM"])
+            else:
+                num = np.arange(0, len(node_refs))
+
+            elem_info = ElementInfo(type=cell_type, source_software=FEATypes.CODE_ASTER, source_type=med_cell_type)
+            elem_block = ElementBlock(elem_info=elem_info, node_refs=node_refs, identifiers=num)
+            blocks.append(elem_block)
+
+        return blocks
+
+
+def _get_data_profile(med_data: h5py.Group) -> h5py.Group:
+    profile = med_data.attrs["PFL"]
+    if profile.decode() != _NO_PROFILE:
+        raise NotImplementedError()
+
+    # default profile with everything
+    return med_data[profile]
+
+
+def read_rows(dataset: h5py.Dataset, n_rows: int, rows: np.ndarray | slice = None) -> np.ndarray:
+    """Read a MED value dataset as a 2d array with one row per node or cell.
+
+    The values are stored in column major order, i.e. all rows of the first column followed by all rows of the next.
+    Only the requested rows of each column are read when rows is given.
+    """
+    num_cols = dataset.shape[0] // n_rows
+    if rows is None:
+        return dataset[()].reshape(n_rows, num_cols, order="F")
+
+    rows = np.arange(n_rows)[rows]
+    if len(rows) > n_rows // 4:
+        # Reading everything is faster than scattered reads of large selections
+        return dataset[()].reshape(n_rows, num_cols, order="F")[rows]
+
+    # h5py point selections must be increasing and unique
+    unique_rows, inverse = np.unique(rows, return_inverse=True)
+    index = (np.arange(num_cols)[:, None] * n_rows + unique_rows[None, :]).ravel()
+    values = dataset[index].reshape(num_cols, len(unique_rows)).T
+    return values[inverse]
+
+
+def get_ids_from_names(names: np.ndarray) -> np.ndarray | None:
+    """Node numbers from MED node names (i.e. "N12" -> 12). Returns None unless all names hold a unique number"""
+    # Names are stored as fixed size arrays of (ascii) bytes
+    names = np.ascontiguousarray(names).view(np.uint8).reshape(len(names), -1)
+    names = names.view(f"S{names.shape[1]}").ravel()
+    numbers = [_re_name_number.match(name.strip()) for name in names.tolist()]
+    if len(numbers) == 0 or any(m is None for m in numbers):
+        return None
+
+    node_ids = np.array([int(m.group(1)) for m in numbers], dtype=int)
+    if len(np.unique(node_ids)) != len(node_ids):
+        return None
+
+    return node_ids
@@ -26,18 +26,15 @@ def elements_str(part: "Part", time_step, profile, families):
     :return:
     """
 
-    def get_node_ids_from_element(el_):
-        return [int(n.id) for n in el_.nodes]
-
     elements_group = time_step.create_group("MAI")
     elements_group.attrs.create("CGT", 1)
-    for group, elements in part.fem.elements.group_by_type():
+    for block in part.fem.elements.to_elem_blocks():
+        group = block.elem_info.type
         if isinstance(group, (shape_def.MassTypes, shape_def.SpringTypes)):
             logger.warning("NotImplemented: Skipping Mass or Spring Elements")
             continue
         med_type = ada_to_med_type(group)
-        elements = list(elements)
-        cells = np.array(list(map(get_node_ids_from_element, elements)))
+        cells = block.node_refs.astype(int)
 
         med_cells = elements_group.create_group(med_type)
         med_cells.attrs.create("CGT", 1)
@@ -49,7 +46,7 @@ def elements_str(part: "Part", time_step, profile, families):
         nod.attrs.create("NBR", len(cells))
 
         # Node Numbering is necessary for proper handling of
-        num = med_cells.create_dataset("NUM", data=[int(el.id) for el in elements])
+        num = med_cells.create_dataset("NUM", data=block.identifiers.astype(int))
         num.attrs.create("CGT", 1)
         num.attrs.create("NBR", len(cells))
 
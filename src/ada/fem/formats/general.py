@@ -103,6 +103,7 @@ def write_to_fem(
     scratch_dir,
     metadata: dict,
     make_zip_file,
+    processes: int = None,
 ):
     from ada.fem.formats.utils import default_fem_res_path, folder_prep, should_convert
 
@@ -111,6 +112,8 @@ def write_to_fem(
     res_path = fem_res_files.get(fem_format, None)
     metadata = dict() if metadata is None else metadata
     metadata["fem_format"] = fem_format.value
+    if processes is not None:
+        metadata["processes"] = processes
 
     out = None
     if should_convert(res_path, overwrite):
@@ -63,23 +63,14 @@ def fem_to_meshio(fem: FEM) -> Union[meshio.Mesh, None]:
     list(map(pmap, fem.nodes))
 
     # Elements
-
-    def get_node_ids_from_element(el_):
-        return [int(n.id - 1) for n in el_.nodes]
-
     cells = []
-    for element_type, elements in fem.elements.group_by_type():
+    for block in fem.elements.to_elem_blocks():
+        element_type = block.elem_info.type
         if isinstance(element_type, (MassTypes, SpringTypes)):
             logger.warning("NotImplemented: Skipping Mass or Spring Elements")
             continue
         med_el = ada_to_meshio[element_type]
-        elements = list(elements)
-        el_mapped = np.array(list(map(get_node_ids_from_element, elements)))
-        el_long = np.zeros((int(fem.elements.max_el_id + 1), len(el_mapped[0])))
-        for el in elements:
-            el_long[el.id] = get_node_ids_from_element(el)
-
-        cells.append((med_el, el_mapped))
+        cells.append((med_el, block.node_refs.astype(int) - 1))
 
     cell_sets = dict()
     for set_name, elset in fem.sets.elements.items():
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import io
+import os
+import pathlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ada.base.units import Units
+from ada.concepts.points import Node
+from ada.config import logger
+
+if TYPE_CHECKING:
+    from ada import Assembly
+
+# The assembly attributes merged by Assembly.__add__. Other state (i.e. IFC and cache state) is not transferred
+_ASSEMBLY_STATE_KEYS = ("_fem", "_parts", "_materials", "_sections", "_shapes", "_beams", "_plates", "_pipes", "_walls")
+_ASSEMBLY_PID = "assembly"
+
+
+@dataclass
+class AssemblyPayload:
+    """The model content merged by Assembly.__add__ (parts, fem, materials etc.) of an imported assembly.
+
+    The ids and coordinates of the FEM nodes are stored as arrays. The pickled model refers to the nodes by their
+    index in these arrays, which keeps the pickle flat (instead of recursing through node and element references)."""
+
+    name: str
+    units: str
+    node_ids: np.ndarray
+    node_coords: np.ndarray
+    state: bytes
+
+
+class _AssemblyPickler(pickle.Pickler):
+    """References to the assembly and its FEM nodes are stored as persistent ids so that the model objects can be
+    re-attached to a new assembly"""
+
+    def __init__(self, file, assembly: Assembly, node_index: dict[int, int]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._assembly = assembly
+        self._node_index = node_index
+
+    def persistent_id(self, obj):
+        if obj is self._assembly:
+            return _ASSEMBLY_PID
+        if type(obj) is Node:
+            return self._node_index.get(id(obj))
+        return None
+
+
+class _AssemblyUnpickler(pickle.Unpickler):
+    def __init__(self, file, assembly: Assembly, nodes: list[Node]):
+        super().__init__(file)
+        self._assembly = assembly
+        self._nodes = nodes
+
+    def persistent_load(self, pid):
+        if pid == _ASSEMBLY_PID:
+            return self._assembly
+        return self._nodes[pid]
+
+
+def dumps_assembly(assembly: Assembly) -> AssemblyPayload:
+    nodes = [n for p in assembly.get_all_parts_in_assembly(True) for n in p.fem.nodes]
+    node_index = {id(n): i for i, n in enumerate(nodes)}
+    node_ids = np.array([n.id for n in nodes], dtype=int)
+    node_coords = np.array([n.p for n in nodes], dtype=float).reshape(len(nodes), 3)
+    node_states = [{key: val for key, val in n.__dict__.items() if key not in ("_id", "p")} for n in nodes]
+
+    state = {key: assembly.__dict__[key] for key in _ASSEMBLY_STATE_KEYS}
+    buffer = io.BytesIO()
+    _AssemblyPickler(buffer, assembly, node_index).dump((state, node_states))
+    return AssemblyPayload(assembly.name, assembly.units.value, node_ids, node_coords, buffer.getvalue())
+
+
+def loads_assembly(payload: AssemblyPayload) -> Assembly:
+    from ada import Assembly
+
+    # The nodes get their id and coordinates up front, as they are hashed on them when added to sets and dicts
+    nodes = []
+    for nid, p in zip(payload.node_ids.tolist(), payload.node_coords):
+        node = Node.__new__(Node)
+        node._id, node.p = nid, p.copy()
+        nodes.append(node)
+
+    assembly = Assembly(payload.name, units=Units.from_str(payload.units))
+    state, node_states = _AssemblyUnpickler(io.BytesIO(payload.state), assembly, nodes).load()
+    for node, node_state in zip(nodes, node_states):
+        node.__dict__.update(node_state)
+
+    assembly.__dict__.update(state)
+    return assembly
+
+
+def get_fem_file_names(fem_files: list[str | os.PathLike], names: list = None) -> list[str]:
+    """The names of a list of imported FEM files. Unnamed files are named by their file stem"""
+    names = [None] * len(fem_files) if names is None else names
+    return [pathlib.Path(fem_file).stem if name is None else name for fem_file, name in zip(fem_files, names)]
+
+
+def _import_fem_file(fem_file: pathlib.Path, fem_format, name, fem_converter) -> AssemblyPayload:
+    from ada.fem.formats.general import get_fem_converters
+
+    fem_importer, _ = get_fem_converters(fem_file, fem_format, fem_converter)
+    return dumps_assembly(fem_importer(fem_file, name))
+
+
+def import_fem_files(
+    assembly: Assembly,
+    fem_files: list[str | os.PathLike],
+    fem_formats: list = None,
+    names: list = None,
+    fem_converter="default",
+    num_workers: int = None,
+) -> Assembly:
+    """Import multiple FEM files in parallel. Each file is parsed by a separate worker process and the resulting
+    models are added to the assembly in the order of fem_files (using the same id offsetting and interface node
+    merging as Assembly.read_fem), so the result does not depend on the order the workers finish in.
+
+    Unnamed files are named by their file stem (see get_fem_file_names), as the part name counters of the workers
+    are independent.
+
+    :param num_workers: Number of worker processes. Default is the number of cpus
+    """
+    from ada.concepts.spatial import FormatNotSupportedException
+    from ada.fem.formats.general import get_fem_converters
+
+    fem_files = [pathlib.Path(f) for f in fem_files]
+    fem_formats = [None] * len(fem_files) if fem_formats is None else fem_formats
+    names = get_fem_file_names(fem_files, names)
+
+    for fem_file, fem_format in zip(fem_files, fem_formats):
+        if fem_file.exists() is False:
+            raise FileNotFoundError(fem_file)
+        fem_importer, _ = get_fem_converters(fem_file, fem_format, fem_converter)
+        if fem_importer is None:
+            suffix = fem_file.suffix
+            raise FormatNotSupportedException(f'File "{fem_file.name}" [{suffix}] is not a supported FEM format.')
+
+    num_workers = os.cpu_count() if num_workers is None else num_workers
+    num_workers = min(num_workers, len(fem_files))
+    logger.info(f"Importing {len(fem_files)} FEM files using {num_workers} worker processes")
+
+    converters = [fem_converter] * len(fem_files)
+    with ProcessPoolExecutor(max_workers=max(num_workers, 1)) as executor:
+        for payload in executor.map(_import_fem_file, fem_files, fem_formats, names, converters):
+            assembly.__add__(loads_assembly(payload))
+
+    return assembly
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+from .cards import DataCard
+
+# A card starts with its name at the beginning of a line. Continuation lines (and text lines) start with blanks
+_re_card_names = re.compile(r"^[A-Z][A-Z0-9]*", re.MULTILINE)
+
+
+@dataclass
+class CardRecords:
+    """The numeric values of all records of a card decoded into a single flat array.
+
+    The values of record i are values[offsets[i] : offsets[i + 1]]. Records have a varying number of values when a
+    card has optional or variable length fields (i.e. the node ids of GELMNT1)."""
+
+    name: str
+    values: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def get(self, index: int) -> np.ndarray:
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    @staticmethod
+    def concatenate(name: str, records: list[CardRecords]) -> CardRecords:
+        if len(records) == 1:
+            return records[0]
+        values = np.concatenate([r.values for r in records]) if len(records) > 0 else np.zeros(0)
+        offsets = [np.zeros(1, dtype=int)]
+        for r in records:
+            offsets.append(r.offsets[1:] + offsets[-1][-1])
+        return CardRecords(name, values, np.concatenate(offsets))
+
+    def take(self, indices: np.ndarray) -> CardRecords:
+        """A subset of the records (by record index or boolean mask)"""
+        indices = np.arange(len(self))[indices]
+        counts = self.counts[indices]
+        starts = self.offsets[:-1][indices]
+        values_index = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return CardRecords(self.name, self.values[values_index], np.concatenate([[0], np.cumsum(counts)]))
+
+    def to_lists(self) -> list[list[float]]:
+        values = self.values.tolist()
+        offsets = self.offsets.tolist()
+        return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def to_array(self, num_cols: int, fill_value=np.nan) -> np.ndarray:
+        """The first num_cols values of each record as a 2d array. Missing values are set to fill_value"""
+        take = np.minimum(self.counts, num_cols)
+        rows = np.repeat(np.arange(len(self)), take)
+        cols = np.arange(take.sum()) - np.repeat(np.cumsum(take) - take, take)
+        res = np.full((len(self), num_cols), fill_value, dtype=float)
+        res[rows, cols] = self.values[self.offsets[:-1][rows] + cols]
+        return res
+
+    def to_dicts(self, card: DataCard, tail: str = None) -> list[dict]:
+        """The records as dicts keyed on the component names of the card. Components not present in a record (i.e.
+        optional components suffixed by "|") are None. The tail component holds the remaining values of a record
+        as a list.
+
+        :param card: The card definition
+        :param tail: Name of the (last) component with a variable number of values
+        """
+        names = [x.replace("|", "") for x in card.components]
+        num_fixed = len(names) - 1 if tail is not None else len(names)
+        records = []
+        for values in self.to_lists():
+            d = dict.fromkeys(names)
+            d.update(zip(names[:num_fixed], values[:num_fixed]))
+            if tail is not None and len(values) > num_fixed:
+                d[tail] = values[num_fixed:]
+            records.append(d)
+        return records
+
+
+class CardIndex:
+    """Indexes the cards of a Sesam input file (i.e. a T1.FEM file) in a single pass.
+
+    The start and end offset of every card record is stored by card name. Purely numeric cards are decoded in bulk
+    using get_records(), while cards containing text can be fetched with get_str() for the regex based readers.
+    This avoids running every card regex over the complete input file.
+
+    :param bulk_str: The content string of the input file
+    """
+
+    def __init__(self, bulk_str: str):
+        self.bulk_str = bulk_str
+        self._spans: dict[str, np.ndarray] = dict()
+        self._records: dict[str, CardRecords] = dict()
+
+        # Non-ascii characters (in text cards) are replaced one by one to keep the offsets of the string
+        buffer = np.frombuffer(bulk_str.encode("ascii", errors="replace"), dtype=np.uint8)
+        line_starts = np.concatenate([[0], np.flatnonzero(buffer[:-1] == ord("\n")) + 1])
+        line_starts = line_starts[line_starts < len(buffer)]
+        first_char = buffer[line_starts]
+        starts = line_starts[(first_char >= ord("A")) & (first_char <= ord("Z"))]
+        ends = np.append(starts[1:], len(buffer))
+
+        names, inverse = np.unique(_re_card_names.findall(bulk_str), return_inverse=True)
+        for i, name in enumerate(names.tolist()):
+            mask = inverse == i
+            self._spans[name] = np.column_stack([starts[mask], ends[mask]])
+
+    def __contains__(self, name: str):
+        return name in self._spans
+
+    @property
+    def card_names(self) -> list[str]:
+        return list(self._spans.keys())
+
+    def count(self, name: str) -> int:
+        return len(self._spans.get(name, []))
+
+    def get_str(self, *names: str) -> str:
+        """The records of the given cards (in the order they appear in the input file) as a single string"""
+        spans = sorted(span for name in names if name in self._spans for span in self._spans[name].tolist())
+        res = "".join(self.bulk_str[start:end] for start, end in spans)
+        if res.endswith("\n") is False:
+            res += "\n"
+        return res
+
+    def get_records(self, name: str) -> CardRecords:
+        """Decode all records of a numeric card into a flat array of values (see CardRecords)"""
+        if name not in self._records:
+            self._records[name] = self._decode(name)
+        return self._records[name]
+
+    def _decode(self, name: str) -> CardRecords:
+        if name not in self._spans:
+            return CardRecords(name, np.zeros(0), np.zeros(1, dtype=int))
+
+        spans = self._spans[name]
+        text = "".join(self.bulk_str[start:end] for start, end in spans.tolist())
+        record_starts = np.concatenate([[0], np.cumsum(spans[:-1, 1] - spans[:-1, 0])])
+        return decode_card_records(name, text, record_starts)
+
+
+def decode_card_records(name: str, text: str, record_starts: np.ndarray) -> CardRecords:
+    """Decode the text of consecutive records of a numeric card. Each record starts with the card name at the
+    given (character) offsets in text."""
+    # Count the values of each record by locating the start of every whitespace separated token
+    buffer = np.frombuffer(text.encode("ascii", errors="replace"), dtype=np.uint8)
+    is_blank = buffer <= ord(" ")
+    token_starts = np.flatnonzero(~is_blank & np.concatenate([[True], is_blank[:-1]]))
+    num_tokens = np.diff(np.searchsorted(token_starts, np.append(record_starts, len(buffer))))
+    offsets = np.concatenate([[0], np.cumsum(num_tokens - 1)])
+
+    values = np.fromstring(text.replace(name, " " * len(name)), sep=" ")
+    if len(values) != offsets[-1]:
+        raise ValueError(f'Unable to decode "{name}". Only numeric cards can be decoded in bulk')
+
+    return CardRecords(name, values, offsets)
@@ -112,28 +112,31 @@ GELREF1 = DataCard(
 
 TDSECT = DataCard("TDSECT", ("nfield", "geono", "codnam", "codtxt", "set_name"))
 re_sectnames = TDSECT.to_ff_re()
-re_gbeamg = get_ff_regex(
+GBEAMG = DataCard(
     "GBEAMG",
-    "geono",
-    "comp",
-    "area",
-    "ix",
-    "iy",
-    "iz",
-    "iyz",
-    "wxmin",
-    "wymin",
-    "wzmin",
-    "shary",
-    "sharz",
-    "shceny",
-    "shcenz",
-    "sy",
-    "sz",
-    "wy|",
-    "wz|",
-    "fabr|",
+    (
+        "geono",
+        "comp",
+        "area",
+        "ix",
+        "iy",
+        "iz",
+        "iyz",
+        "wxmin",
+        "wymin",
+        "wzmin",
+        "shary",
+        "sharz",
+        "shceny",
+        "shcenz",
+        "sy",
+        "sz",
+        "wy|",
+        "wz|",
+        "fabr|",
+    ),
 )
+re_gbeamg = GBEAMG.to_ff_re()
 GIORH = DataCard("GIORH", ("geono", "hz", "ty", "bt", "tt", "bb", "tb", "sfy", "sfz", "NLOBYT|", "NLOBYB|", "NLOBZ|"))
 GBOX = DataCard("GBOX", ("geono", "hz", "ty", "tb", "tt", "by", "sfy", "sfz"))
 re_gbox = GBOX.to_ff_re()
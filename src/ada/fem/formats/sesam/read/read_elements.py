@@ -11,29 +11,24 @@ from ada.fem.formats.utils import str_to_int
 from ada.fem.shapes.lines import SpringTypes
 
 from . import cards
+from .card_index import CardIndex
 
 
-def get_elements(bulk_str: str, fem: FEM) -> tuple[FemElements, dict, dict, dict]:
-    """Import elements from Sesam Bulk str"""
+def get_elements(card_index: CardIndex, fem: FEM) -> tuple[FemElements, dict, dict, dict]:
+    """Import elements from the GELMNT1 records of a Sesam input file"""
 
     mass_elem = dict()
     spring_elem = dict()
     internal_external_element_map = dict()
 
-    def grab_elements(match):
-        d = match.groupdict()
+    def grab_elements(d: dict):
         el_no = str_to_int(d["elno"])
         el_nox = str_to_int(d["elnox"])
         internal_external_element_map[el_no] = el_nox
-        nodes = [
-            fem.nodes.from_id(x)
-            for x in filter(
-                lambda x: x != 0,
-                map(str_to_int, d["nids"].replace("\n", "").split()),
-            )
-        ]
-        eltyp = d["eltyp"]
-        el_type = sesam_eltype_2_general(str_to_int(eltyp))
+        d["nids"] = [int(x) for x in d["nids"] if x != 0]
+        nodes = [fem.nodes.from_id(x) for x in d["nids"]]
+        eltyp = str_to_int(d["eltyp"])
+        el_type = sesam_eltype_2_general(eltyp)
 
         if isinstance(el_type, SpringTypes):
             spring_elem[el_no] = dict(gelmnt=d)
@@ -49,9 +44,8 @@ def get_elements(bulk_str: str, fem: FEM) -> tuple[FemElements, dict, dict, dict
 
         return elem
 
-    elements = FemElements(
-        filter(lambda x: x is not None, map(grab_elements, cards.GELMNT1.to_ff_re().finditer(bulk_str))), fem_obj=fem
-    )
+    gelmnt1 = card_index.get_records("GELMNT1").to_dicts(cards.GELMNT1, tail="nids")
+    elements = FemElements(filter(lambda x: x is not None, map(grab_elements, gelmnt1)), fem_obj=fem)
     return elements, mass_elem, spring_elem, internal_external_element_map
 
 
@@ -113,7 +107,7 @@ def get_mass(bulk_str: str, fem: FEM, mass_elem: dict) -> FemElements:
         )
         # use symmetry to complete the 6x6 matrix
         mass_matrix_6x6 = np.tril(A) + np.triu(A.T, 1)
-        nodeno = str_to_int(mass_el["gelmnt"].get("nids"))
+        nodeno = mass_el["gelmnt"]["nids"][0]
         elno = str_to_int(mass_el["gelmnt"].get("elno"))
         no = fem.nodes.from_id(nodeno)
         fem_set = fem.sets.add(FemSet(f"m{nodeno}", [no], FemSet.TYPES.NSET, parent=fem))
@@ -144,8 +138,7 @@ def get_springs(bulk_str, fem: FEM, spring_elem: dict):
         bulk = d["bulk"].replace("\n", "").split()
 
         spr_name = f"spr{elid}"
-        nid = res["gelmnt"].get("nids", None)
-        n1 = fem.nodes.from_id(str_to_int(nid))
+        n1 = fem.nodes.from_id(res["gelmnt"]["nids"][0])
         a = 1
         row = 0
         spring = []
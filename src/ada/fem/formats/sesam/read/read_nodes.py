@@ -2,29 +2,20 @@ from typing import TYPE_CHECKING
 
 from ada.concepts.containers import Nodes
 from ada.concepts.points import Node
-from ada.fem.formats.utils import str_to_int
 
-from . import cards
+from .card_index import CardIndex
 
 if TYPE_CHECKING:
     from ada.fem import FEM
 
 
-def get_nodes(bulk_str: str, parent: "FEM") -> Nodes:
-    nodes = [get_node(m, parent) for m in cards.GCOORD.to_ff_re().finditer(bulk_str)]
+def get_nodes(card_index: CardIndex, parent: "FEM") -> Nodes:
+    gcoord = card_index.get_records("GCOORD").to_array(4)
+    nodes = [Node(row[1:], nid, parent=parent) for nid, row in zip(gcoord[:, 0].astype(int).tolist(), gcoord)]
     return Nodes(nodes, parent=parent)
 
 
-def renumber_nodes(bulk_str: str, fem: "FEM") -> None:
-    node_map = {nodeno: nodex for nodex, nodeno in map(get_nodeno, cards.GNODE.to_ff_re().finditer(bulk_str))}
+def renumber_nodes(card_index: CardIndex, fem: "FEM") -> None:
+    gnode = card_index.get_records("GNODE").to_array(2).astype(int)
+    node_map = dict(zip(gnode[:, 1].tolist(), gnode[:, 0].tolist()))
     fem.nodes.renumber(renumber_map=node_map)
-
-
-def get_nodeno(m_gnod):
-    d = m_gnod.groupdict()
-    return str_to_int(d["nodex"]), str_to_int(d["nodeno"])
-
-
-def get_node(m, parent):
-    d = m.groupdict()
-    return Node([float(d["x"]), float(d["y"]), float(d["z"])], str_to_int(d["id"]), parent=parent)
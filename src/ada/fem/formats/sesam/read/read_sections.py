@@ -17,35 +17,37 @@ from ada.materials import Material
 from ada.sections import GeneralProperties
 
 from . import cards
+from .card_index import CardIndex
 
 
-def get_sections(bulk_str, fem: FEM, mass_elem, spring_elem) -> FemSections:
+def get_sections(card_index: CardIndex, fem: FEM, mass_elem, spring_elem) -> FemSections:
     # Section Names
-    sect_names = {sec_id: name for sec_id, name in map(get_section_names, cards.re_sectnames.finditer(bulk_str))}
+    sect_names = dict(map(get_section_names, cards.re_sectnames.finditer(card_index.get_str("TDSECT"))))
     # Local Coordinate Systems
-    lcsysd = {transno: vec for transno, vec in map(get_lcsys, cards.GUNIVEC.to_ff_re().finditer(bulk_str))}
+    lcsysd = dict(map(get_lcsys, cards.GUNIVEC.to_ff_re().finditer(card_index.get_str("GUNIVEC"))))
     # Hinges
-    hinges = {fixno: values for fixno, values in map(get_hinges, cards.re_belfix.finditer(bulk_str))}
+    hinges = dict(map(get_hinges, cards.re_belfix.finditer(card_index.get_str("BELFIX"))))
     # Thickness'
-    thick = {geono: t for geono, t in map(get_thicknesses, cards.GELTH.to_ff_re().finditer(bulk_str))}
+    gelth = card_index.get_records("GELTH").to_array(2)
+    thick = dict(zip(gelth[:, 0].astype(int).tolist(), gelth[:, 1].tolist()))
     # Eccentricities
-    ecc = {eccno: values for eccno, values in map(get_eccentricities, cards.re_geccen.finditer(bulk_str))}
+    ecc = dict(map(get_eccentricities, cards.re_geccen.finditer(card_index.get_str("GECCEN"))))
 
     list_of_sections = chain(
-        (get_isection(m, sect_names, fem) for m in cards.GIORH.to_ff_re().finditer(bulk_str)),
-        (get_box_section(m, sect_names, fem) for m in cards.GBOX.to_ff_re().finditer(bulk_str)),
-        (get_tubular_section(m, sect_names, fem) for m in cards.re_gpipe.finditer(bulk_str)),
-        (get_flatbar(m, sect_names, fem) for m in cards.re_gbarm.finditer(bulk_str)),
+        (get_isection(m, sect_names, fem) for m in cards.GIORH.to_ff_re().finditer(card_index.get_str("GIORH"))),
+        (get_box_section(m, sect_names, fem) for m in cards.GBOX.to_ff_re().finditer(card_index.get_str("GBOX"))),
+        (get_tubular_section(m, sect_names, fem) for m in cards.re_gpipe.finditer(card_index.get_str("GPIPE"))),
+        (get_flatbar(m, sect_names, fem) for m in cards.re_gbarm.finditer(card_index.get_str("GBARM"))),
     )
 
     fem.parent._sections = Sections(list_of_sections, parent=fem.parent)
-    [add_general_sections(m, fem) for m in cards.re_gbeamg.finditer(bulk_str)]
+    [add_general_sections(d, fem) for d in card_index.get_records("GBEAMG").to_dicts(cards.GBEAMG)]
 
     geom = count(1)
     total_geo = count(1)
     res = (
-        get_femsecs(m, total_geo, geom, lcsysd, hinges, ecc, thick, fem, mass_elem, spring_elem)
-        for m in cards.GELREF1.to_ff_re().finditer(bulk_str)
+        get_femsecs(d, total_geo, geom, lcsysd, hinges, ecc, thick, fem, mass_elem, spring_elem)
+        for d in card_index.get_records("GELREF1").to_dicts(cards.GELREF1, tail="members")
     )
     sections = filter(lambda x: type(x) is FemSection, res)
 
@@ -103,8 +105,7 @@ def get_flatbar(match, sect_names, fem) -> Section:
     )
 
 
-def add_general_sections(match, fem) -> None:
-    d = match.groupdict()
+def add_general_sections(d: dict, fem) -> None:
     sec_id = str_to_int(d["geono"])
     gen_props = GeneralProperties(
         Ax=roundoff(d["area"], 10),
@@ -171,7 +172,7 @@ def read_line_section(elem: Elem, fem: FEM, mat: Material, geono, d, lcsysd, hin
 
     members = None
     if d["members"] is not None:
-        members = [str_to_int(x) for x in d["members"].replace("\n", " ").split()]
+        members = [str_to_int(x) for x in d["members"]]
 
     if fix_data == -1:
         add_hinge_prop_to_elem(elem, members, hinges_global, xvec, yvec)
@@ -210,9 +211,10 @@ def read_shell_section(elem: Elem, fem: FEM, mat: Material, elno, thicknesses, g
     return fem_sec
 
 
-def get_femsecs(match, total_geo, curr_geom_num, lcsysd, hinges_global, ecc, thicknesses, fem, mass_elem, spring_elem):
+def get_femsecs(
+    d: dict, total_geo, curr_geom_num, lcsysd, hinges_global, ecc, thicknesses, fem, mass_elem, spring_elem
+):
     next(total_geo)
-    d = match.groupdict()
     geono = str_to_int(d["geono"])
     elno = str_to_int(d["elno"])
     matno = str_to_int(d["matno"])
@@ -240,13 +242,6 @@ def get_femsecs(match, total_geo, curr_geom_num, lcsysd, hinges_global, ecc, thi
         raise ValueError("Section not added to conversion")
 
 
-def get_thicknesses(match):
-    d = match.groupdict()
-    sec_id = str_to_int(d["geono"])
-    t = d["th"]
-    return sec_id, t
-
-
 def get_hinges(match):
     d = match.groupdict()
     fixno = str_to_int(d["fixno"])
@@ -2,6 +2,7 @@ import os
 
 from ada.concepts.spatial import Assembly, Part
 
+from .card_index import CardIndex
 from .read_constraints import get_bcs, get_constraints
 from .read_elements import get_elements, get_mass, get_springs
 from .read_materials import get_materials
@@ -26,19 +27,20 @@ def read_sesam_fem(bulk_str, part_name) -> Part:
 
     part = Part(part_name)
     fem = part.fem
+    card_index = CardIndex(bulk_str)
 
-    fem.nodes = get_nodes(bulk_str, fem)
-    elements, mass_elem, spring_elem, el_id_map = get_elements(bulk_str, fem)
+    fem.nodes = get_nodes(card_index, fem)
+    elements, mass_elem, spring_elem, el_id_map = get_elements(card_index, fem)
     fem.elements = elements
     fem.elements.build_sets()
-    part._materials = get_materials(bulk_str, part)
-    fem.sections = get_sections(bulk_str, fem, mass_elem, spring_elem)
-    fem.elements += get_mass(bulk_str, part.fem, mass_elem)
-    fem.springs = get_springs(bulk_str, fem, spring_elem)
-    fem.sets = part.fem.sets + get_sets(bulk_str, fem)
-    fem.constraints.update(get_constraints(bulk_str, fem))
-    fem.bcs += get_bcs(bulk_str, fem)
-    renumber_nodes(bulk_str, fem)
+    part._materials = get_materials(card_index.get_str("TDMATER", "MISOSEL", "MORSMEL"), part)
+    fem.sections = get_sections(card_index, fem, mass_elem, spring_elem)
+    fem.elements += get_mass(card_index.get_str("BNMASS", "MGMASS"), part.fem, mass_elem)
+    fem.springs = get_springs(card_index.get_str("MGSPRNG"), fem, spring_elem)
+    fem.sets = part.fem.sets + get_sets(card_index.get_str("TDSETNAM", "GSETMEMB"), fem)
+    fem.constraints.update(get_constraints(card_index.get_str("BLDEP"), fem))
+    fem.bcs += get_bcs(card_index.get_str("BNBCD"), fem)
+    renumber_nodes(card_index, fem)
     fem.elements.renumber(renumber_map=el_id_map)
 
     print(8 * "-" + f'Imported "{fem.instance_name}"')
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import pathlib
 from dataclasses import dataclass, field
-from itertools import groupby
 from typing import TYPE_CHECKING, Iterator
 
 import numpy as np
@@ -10,10 +9,11 @@ import numpy as np
 from ada.core.utils import Counter
 from ada.fem.formats.sesam.common import sesam_eltype_2_general
 from ada.fem.formats.sesam.read import cards
+from ada.fem.formats.sesam.read.card_index import CardRecords, decode_card_records
+from ada.fem.formats.sesam.read.cards import DataCard
 
 if TYPE_CHECKING:
     from ada import Material, Section
-    from ada.fem.formats.sesam.read.cards import DataCard
     from ada.fem.results.common import ElementFieldData, FEAResult, Mesh, NodalFieldData
 
 FEM_SEC_NAME = Counter(prefix="FS")
@@ -85,69 +85,134 @@ RESULT_CARDS = [
 ]
 
 
+# Cards with a line of text (i.e. a name) following their nfield numeric values
+TEXT_CARDS = [cards.TDSECT, cards.TDMATER, cards.TDSETNAM, cards.TDRESREF]
+# Cards holding result values per result case (ires). These can be selected when reading the SIF file
+RESULT_VALUE_CARDS = [cards.RVNODDIS, cards.RVSTRESS, cards.RVFORCES]
+
+
 @dataclass
 class SifReader:
+    """Reads a Sesam Interface File (SIF). The card name of each record is looked up in a dispatch table of the cards
+    used. Consecutive records of a card are grouped and decoded as numpy blocks of up to chunk_size records, while
+    records of all other cards are skipped without being decoded.
+
+    :param file: Iterator over the lines of the SIF file
+    :param result_cards: Names of the result value cards (RVNODDIS, RVSTRESS, RVFORCES) to read. Default is all
+    :param load_cases: Result case numbers (ires) to read result values of. Default is all
+    :param chunk_size: Max number of records decoded per block
+    """
+
     file: Iterator
+    result_cards: list[str] = None
+    load_cases: list[int] = None
+    chunk_size: int = 100_000
 
     nodes: np.ndarray = None
     node_ids: np.ndarray = None
-    elements: list[tuple] = None
-    results: list[tuple] = field(default_factory=list)
+    elements: CardRecords = None
+    results: list[tuple[str, CardRecords]] = field(default_factory=list)
 
     skipped_flags: list[str] = field(default_factory=list)
 
-    _last_line: str | None = None
-
-    _gelref1: list = None
+    _gelref1: CardRecords = None
     _other: dict[str, list] = field(default_factory=dict)
     _sections: dict[str, list] = field(default_factory=dict)
+    _blocks: dict[str, list[CardRecords]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        result_cards = [c.name for c in RESULT_VALUE_CARDS] if self.result_cards is None else self.result_cards
+        read_cards = [cards.GCOORD, cards.GNODE, cards.GELMNT1, cards.GELREF1, *OTHER_CARDS, *SECTION_CARDS]
+        read_cards += [c for c in RESULT_CARDS if c not in RESULT_VALUE_CARDS or c.name in result_cards]
+
+        text_cards = [c.name for c in TEXT_CARDS]
+        self._card_decoders = {
+            c.name: self._decode_text_records if c.name in text_cards else self._decode_records for c in read_cards
+        }
+        self._value_cards = {c.name for c in RESULT_VALUE_CARDS}
+        self._load_cases = None if self.load_cases is None else set(self.load_cases)
+
+    def _is_selected(self, card_name: str, line: str) -> bool:
+        """Filters records of result value cards on load case. The header record (negative nfield) is always kept"""
+        if self._load_cases is None or card_name not in self._value_cards:
+            return True
+
+        nfield, ires = line.split(None, 3)[1:3]
+        return float(nfield) < 0 or int(float(ires)) in self._load_cases
+
+    def _decode_records(self, card_name: str, lines: list[str], record_lines: list[int]) -> None:
+        line_starts = np.concatenate([[0], np.cumsum([len(x) for x in lines])])
+        records = decode_card_records(card_name, "".join(lines), line_starts[record_lines])
+        self._blocks.setdefault(card_name, []).append(records)
+
+    def _decode_text_records(self, card_name: str, lines: list[str], record_lines: list[int]) -> None:
+        record_ends = record_lines[1:] + [len(lines)]
+        records = [read_text_record(lines[start:end]) for start, end in zip(record_lines, record_ends)]
+        self._other.setdefault(card_name, []).extend(records)
 
-    def _read_single_line_statements(self, startswith: str, first_line: str):
-        first_vals = [float(x) for x in first_line.split()[1:]]
-        yield first_vals
+    def load(self):
+        card_name = None
+        decoder = None
+        lines: list[str] = []
+        record_lines: list[int] = []
+        is_kept = False
+
+        for line in self.file:
+            # Continuation lines (and text lines) start with blanks
+            if line[0].isspace():
+                if is_kept:
+                    lines.append(line)
+                continue
 
-        while True:
-            line = next(self.file)
-            stripped = line.strip()
+            curr_name = line.split(None, 1)[0]
+            if curr_name != card_name or len(record_lines) >= self.chunk_size:
+                if len(record_lines) > 0:
+                    decoder(card_name, lines, record_lines)
+                lines, record_lines = [], []
 
-            if stripped.startswith(startswith) is False:
-                self._last_line = line
-                break
+            if curr_name != card_name:
+                card_name = curr_name
+                decoder = self._card_decoders.get(card_name)
+                if decoder is None and card_name not in self.skipped_flags:
+                    self.skipped_flags.append(card_name)
 
-            yield [float(x) for x in stripped.split()[1:]]
+            is_kept = decoder is not None and self._is_selected(card_name, line)
+            if is_kept:
+                record_lines.append(len(lines))
+                lines.append(line)
 
-    def _read_multi_line_statements(self, startswith: str, first_line: str):
-        curr_elements = [float(x) for x in first_line.split()[1:]]
-        while True:
-            stripped = next(self.file).strip()
+        if len(record_lines) > 0:
+            decoder(card_name, lines, record_lines)
 
-            if stripped.startswith(startswith) is False and stripped[0].isnumeric() is False and stripped[0] != "-":
-                self._last_line = stripped
-                yield curr_elements
-                break
+        self._collect_blocks()
 
-            if stripped.startswith(startswith):
-                yield curr_elements
-                curr_elements = [float(x) for x in stripped.split()[1:]]
-            else:
-                curr_elements += [float(x) for x in stripped.split()]
+    def _collect_blocks(self):
+        blocks = {name: CardRecords.concatenate(name, values) for name, values in self._blocks.items()}
+        self._blocks = dict()
+
+        if cards.GCOORD.name in blocks:
+            self.nodes = blocks[cards.GCOORD.name].to_array(4)
+        if cards.GNODE.name in blocks:
+            self.node_ids = blocks[cards.GNODE.name].to_array(2)
 
-    def read_gcoords(self, first_line: str):
-        for data in self._read_single_line_statements("GCOORD", first_line):
-            yield data
+        self.elements = blocks.get(cards.GELMNT1.name)
+        self._gelref1 = blocks.get(cards.GELREF1.name)
 
-    def read_gnodes(self, first_line: str):
-        for data in self._read_single_line_statements("GNODE", first_line):
-            yield data[:2]
+        for other_card in OTHER_CARDS:
+            if other_card.name in blocks:
+                self._other[other_card.name] = blocks[other_card.name].to_lists()
 
-    def read_gelmnts(self, first_line: str):
-        elno_id, eltyp, members = cards.GELMNT1.get_indices_from_names(["elno", "eltyp", "nids"])
-        for data in self._read_multi_line_statements("GELMNT1", first_line):
-            yield data[eltyp], data[elno_id], data[members:]
+        for sec_card in SECTION_CARDS:
+            if sec_card.name in blocks:
+                self._sections[sec_card.name] = blocks[sec_card.name].to_lists()
 
-    def read_results(self, result_variable: str, first_line: str) -> tuple:
-        for data in self._read_multi_line_statements(result_variable, first_line):
-            yield data
+        for res_card in RESULT_CARDS:
+            records = blocks.get(res_card.name)
+            if records is None:
+                continue
+            # Skip the header records (negative nfield)
+            is_header = records.values[records.offsets[:-1][records.counts > 0]] < 0
+            self.results.append((res_card.name, records.take(np.flatnonzero(records.counts > 0)[~is_header])))
 
     def get_sections(self) -> dict[int, Section]:
         from ada import Section
@@ -235,99 +300,6 @@ class SifReader:
     def get_gelref(self):
         return self._gelref1
 
-    def eval_flags(self, line: str):
-        stripped = line.strip()
-        is_skipped_flag = False
-
-        # Nodes
-        if stripped.startswith(cards.GCOORD.name):
-            self.nodes = np.array(list(self.read_gcoords(stripped)))
-        elif stripped.startswith(cards.GNODE.name):
-            self.node_ids = np.array(list(self.read_gnodes(stripped)))
-
-        # Elements
-        elif stripped.startswith(cards.GELMNT1.name):
-            self.elements = list(self.read_gelmnts(stripped))
-
-        elif stripped[0].isnumeric() is False and stripped[0] != "-":
-            is_skipped_flag = True
-
-        # Sections
-        if stripped.startswith(cards.GELREF1.name):
-            self._gelref1 = list(self.iter_card(cards.GELREF1, self.file, stripped))
-
-        for other_card in OTHER_CARDS:
-            if stripped.startswith(other_card.name):
-                if other_card.name in self._other.keys():
-                    self._other[other_card.name] += list(self.iter_card(other_card, self.file, stripped))
-                else:
-                    self._other[other_card.name] = list(self.iter_card(other_card, self.file, stripped))
-
-        for sec_card in SECTION_CARDS:
-            if stripped.startswith(sec_card.name):
-                self._sections[sec_card.name] = list(self.iter_card(sec_card, self.file, stripped))
-
-        # if len(self._other) > 0 and self._gelref1 is not None and len(self._sections) > 0:
-        #     self.read_fem_sections()
-
-        # Results
-        for res_card in RESULT_CARDS:
-            if stripped.startswith(res_card.name):
-                self.results.append((res_card.name, list(self.read_results(res_card.name, stripped))))
-                is_skipped_flag = False
-
-        if is_skipped_flag:
-            flag = stripped.split()[0]
-            if flag not in self.skipped_flags:
-                self.skipped_flags.append(flag)
-
-    def iter_card(self, datacard: DataCard, f: Iterator, curr_line: str):
-        curr_elements = [float(x) for x in curr_line.split()[1:]]
-        startswith = datacard.name
-        n_field = None
-        if datacard.components[0] == "nfield":
-            n_field = int(curr_elements[0])
-
-        while True:
-            num_el = len(curr_elements)
-            stripped = next(f).strip()
-
-            if n_field is not None and num_el >= n_field:
-                result = datacard.str_to_proper_types(stripped)
-                if len(result) == 0:
-                    curr_elements += [stripped]
-                else:
-                    if datacard.name in ("TDSECT", "TDSETNAM", "TDMATER", "TDRESREF"):
-                        curr_elements += result
-                yield curr_elements
-                break
-
-            if n_field is None:
-                if stripped.startswith(startswith) is False and datacard.is_numeric(stripped) is False:
-                    yield curr_elements
-                    break
-
-                if stripped.startswith(startswith):
-                    yield curr_elements
-                    curr_elements = [float(x) if datacard.is_numeric(x) else x for x in stripped.split()[1:]]
-                    continue
-
-            curr_elements += datacard.str_to_proper_types(stripped)
-
-        self._last_line = stripped
-
-    def load(self):
-        while True:
-            try:
-                if self._last_line is not None:
-                    line = self._last_line
-                    self._last_line = None
-                else:
-                    line = next(self.file)
-                self.eval_flags(line)
-            except StopIteration:
-                break
-
     def get_result(self, name: str) -> list:
         result = list(filter(lambda x: x[0] == name, self.results))
 
@@ -338,19 +310,19 @@ class SifReader:
 
     def get_rdpoints_map(self) -> dict:
         rdpoints = self.get_result(cards.RDPOINTS.name)[0][1]
-        return {x[2]: x for x in rdpoints[1:]}
+        return {x[2]: x for x in rdpoints.to_lists()}
 
     def get_rdstress_map(self) -> dict:
         rdstress = self.get_result(cards.RDSTRESS.name)
-        return {int(x[1]): tuple([int(i) for i in x[3:]]) for x in rdstress[0][1]}
+        return {int(x[1]): tuple([int(i) for i in x[3:]]) for x in rdstress[0][1].to_lists()}
 
     def get_rdielcor_map(self) -> dict:
         rdielcor = self.get_result(cards.RDIELCOR.name)
-        return {int(x[1]): x[2:] for x in rdielcor[0][1]}
+        return {int(x[1]): x[2:] for x in rdielcor[0][1].to_lists()}
 
     def get_rdforces_map(self) -> dict:
         rdforces = self.get_result(cards.RDFORCES.name)
-        return {int(x[1]): tuple([int(i) for i in x[3:]]) for x in rdforces[0][1]}
+        return {int(x[1]): tuple([int(i) for i in x[3:]]) for x in rdforces[0][1].to_lists()}
 
     def get_tdsect_map(self):
         res = self._other.get(cards.TDSECT.name)
@@ -371,10 +343,10 @@ class SifReader:
         return {int(x[1]): [int(i) for i in x] for x in res}
 
     def get_rdresref(self):
-        res = self.get_result(cards.RDRESREF.name)[0][1]
-        if res is None:
+        res = self.get_result(cards.RDRESREF.name)
+        if len(res) == 0:
             return None
-        return {int(x[1]): [int(i) for i in x] for x in res}
+        return {int(x[1]): [int(i) for i in x] for x in res[0][1].to_lists()}
 
     def get_tdresref(self):
         res = self._other.get(cards.TDRESREF.name)
@@ -383,11 +355,18 @@ class SifReader:
         return {int(x[1]): x for x in res}
 
 
-def read_sif_file(sif_file: str | pathlib.Path) -> FEAResult:
+def read_sif_file(
+    sif_file: str | pathlib.Path, result_cards: list[str] = None, load_cases: list[int] = None
+) -> FEAResult:
+    """Read the mesh and results of a Sesam Interface File (SIF).
+
+    :param result_cards: Names of the result value cards (RVNODDIS, RVSTRESS, RVFORCES) to read. Default is all
+    :param load_cases: Result case numbers (ires) to read result values of (i.e. a single eigenmode). Default is all
+    """
     sif_file = pathlib.Path(sif_file)
 
     with open(sif_file, "r") as f:
-        sif = SifReader(f)
+        sif = SifReader(f, result_cards=result_cards, load_cases=load_cases)
         sif.load()
 
     s2m = Sif2Mesh(sif)
@@ -431,14 +410,18 @@ class Sif2Mesh:
         sif = self.sif
 
         nodes = FemNodes(coords=sif.nodes[:, 1:], identifiers=sif.node_ids[:, 0])
+        elno_i, eltyp_i, nids_i = cards.GELMNT1.get_indices_from_names(["elno", "eltyp", "nids"])
+        gelmnt1 = sif.elements.to_array(sif.elements.counts.max())
+
+        # Blocks of consecutive elements of the same type
+        block_starts = np.flatnonzero(np.diff(gelmnt1[:, eltyp_i], prepend=np.nan) != 0)
         elem_blocks = []
-        for eltype, elements in groupby(sif.elements, key=lambda x: x[0]):
-            elem_type = int(eltype)
-            elem_data = list(elements)
+        for start, end in zip(block_starts, np.append(block_starts[1:], len(gelmnt1))):
+            elem_type = int(gelmnt1[start, eltyp_i])
             general_elem_type = sesam_eltype_2_general(elem_type)
             num_nodes = ShapeResolver.get_el_nodes_from_type(general_elem_type)
-            elem_identifiers = np.array([x[1] for x in elem_data], dtype=int)
-            elem_node_refs = np.array([x[2][:num_nodes] for x in elem_data], dtype=float)
+            elem_identifiers = gelmnt1[start:end, elno_i].astype(int)
+            elem_node_refs = gelmnt1[start:end, nids_i : nids_i + num_nodes]
             res = sesam_eltype_2_general(elem_type)
             elem_info = ElementInfo(type=res, source_software=FEATypes.SESAM, source_type=elem_type)
             elem_blocks.append(
@@ -449,7 +432,8 @@ class Sif2Mesh:
         sections = self.sif.get_sections()
         materials = self.sif.get_materials()
         vectors = self.sif.get_vectors()
-        elem_refs = cards.GELREF1.cast_to_np(["elno", "matno", "geono", "transno"], self.sif.get_gelref())
+        elem_ref_cols = cards.GELREF1.get_indices_from_names(["elno", "matno", "geono", "transno"])
+        elem_refs = self.sif.get_gelref().to_array(len(cards.GELREF1.components) - 1)[:, elem_ref_cols]
 
         return Mesh(
             elements=elem_blocks,
@@ -470,10 +454,15 @@ class Sif2Mesh:
     def get_result_name_map(self):
         tdresref = self.sif.get_tdresref()
         rdresref = self.sif.get_rdresref()
+        if tdresref is None or rdresref is None:
+            return None
         return {key: tdresref[value[1]][-1] for key, value in rdresref.items()}
 
     def get_nodal_data(self) -> list[NodalFieldData]:
-        return get_nodal_results(self.sif.get_result(cards.RVNODDIS.name)[0][1])
+        result = self.sif.get_result(cards.RVNODDIS.name)
+        if len(result) == 0:
+            return []
+        return get_nodal_results(result[0][1])
 
     def get_field_data(self) -> list[ElementFieldData | NodalFieldData]:
         sif = self.sif
@@ -489,36 +478,24 @@ class Sif2Mesh:
 
     def get_field_line_data(self):
         ires_i, ielno_i, irforc_i = cards.RVFORCES.get_indices_from_names(["ires", "ielno", "irforc|"])
-        nsp_i, eltyp_i = cards.RDPOINTS.get_indices_from_names(["nsp", "ieltyp"])
-
-        rdpoints_map = self.sif.get_rdpoints_map()
-
-        def keyfunc(x):
-            iielno = x[ielno_i]
-            rdpoints_res = rdpoints_map[iielno]
-            _nsp = int(rdpoints_res[nsp_i])
-            _elem_type = int(rdpoints_res[eltyp_i])
-            return x[ires_i], _nsp, _elem_type, x[irforc_i]
+        rv_forces = self.sif.get_result(cards.RVFORCES.name)[0][1]
+        rdforces_map = self.sif.get_rdforces_map()
 
         field_results = []
-
-        force_res_name = cards.RVFORCES.name
-        for (ires, nsp, elem_type, irforc), rv_forces in groupby(
-            sorted(self.sif.get_result(force_res_name)[0][1][1:], key=keyfunc), key=keyfunc
+        for (ires, nsp, elem_type, irforc), data in _iter_element_results(
+            rv_forces, ires_i, ielno_i, irforc_i, self.sif.get_rdpoints_map(), rdforces_map
         ):
             if elem_type not in (15,):
                 continue
-            field_data = self._get_line_field_data(rv_forces, int(ires), int(irforc), elem_type, nsp)
+            field_data = self._get_line_field_data(data, ires, irforc, elem_type, rdforces_map)
             field_results.append(field_data)
 
         return field_results
 
-    def _get_line_field_data(self, rv_forces, ires, irforc, elem_type, nsp) -> ElementFieldData:
+    def _get_line_field_data(self, data, ires, irforc, elem_type, rdforces_map) -> ElementFieldData:
         from ada.fem.results.common import ElementFieldData
 
-        rdforces_map = self.sif.get_rdforces_map()
         force_types = [FORCE_MAP[c][0] for c in rdforces_map[irforc]]
-        data = np.array(list(_iter_line_forces(rv_forces, rdforces_map, nsp)))
         return ElementFieldData(
             "FORCES",
             int(ires),
@@ -529,38 +506,26 @@ class Sif2Mesh:
         )
 
     def get_field_shell_data(self):
-        sif = self.sif
         ires_i, irstrs_i, iielno_i = cards.RVSTRESS.get_indices_from_names(["ires", "irstrs", "iielno"])
-        nsp_i, eltyp_i = cards.RDPOINTS.get_indices_from_names(["nsp", "ieltyp"])
-
-        rdpoints_map = sif.get_rdpoints_map()
-
-        def keyfunc(x):
-            iielno = x[iielno_i]
-            rdpoints_res = rdpoints_map[iielno]
-            _nsp = int(rdpoints_res[nsp_i])
-            _elem_type = int(rdpoints_res[eltyp_i])
-            return x[ires_i], _nsp, _elem_type, x[irstrs_i]
+        rv_stresses = self.sif.get_result(cards.RVSTRESS.name)[0][1]
+        rdstress_map = self.sif.get_rdstress_map()
 
         field_results = []
-
-        for (ires, nsp, elem_type, irstrs), rv_stresses in groupby(
-            sorted(sif.get_result(cards.RVSTRESS.name)[0][1][1:], key=keyfunc), key=keyfunc
+        for (ires, nsp, elem_type, irstrs), data in _iter_element_results(
+            rv_stresses, ires_i, iielno_i, irstrs_i, self.sif.get_rdpoints_map(), rdstress_map
         ):
             if elem_type not in (25, 24):
                 continue
 
-            field_data = self._get_shell_field_data(rv_stresses, ires, irstrs, elem_type, nsp)
+            field_data = self._get_shell_field_data(data, ires, irstrs, elem_type, rdstress_map)
             field_results.append(field_data)
 
         return field_results
 
-    def _get_shell_field_data(self, rv_stresses, ires, irstrs, elem_type: int, nsp) -> ElementFieldData:
+    def _get_shell_field_data(self, data, ires, irstrs, elem_type: int, rdstress_map) -> ElementFieldData:
         from ada.fem.results.common import ElementFieldData
 
-        rdstress_map = self.sif.get_rdstress_map()
         stress_types = [STRESS_MAP[c][0] for c in rdstress_map[irstrs]]
-        data = np.array(list(_iter_shell_stress(rv_stresses, rdstress_map, nsp)))
         return ElementFieldData(
             "STRESS",
             int(ires),
@@ -601,18 +566,20 @@ class Sif2Mesh:
         return INT_LOCATIONS[el_type]
 
 
-def get_nodal_results(res) -> list[NodalFieldData]:
+def get_nodal_results(res: CardRecords) -> list[NodalFieldData]:
     from ada.fem.results.common import NodalFieldData
 
     comps = "U1|", "U2|", "U3|", "U4|", "U5|", "U6|"
-    indices = cards.RVNODDIS.get_indices_from_names(["inod", *comps])
-    nid = indices[0]
-    start = indices[1]
-    stop = indices[-1] + 1
+    ires_i, *indices = cards.RVNODDIS.get_indices_from_names(["ires", "inod", *comps])
+    data = res.to_array(indices[-1] + 1)
+
+    # Consecutive records of the same result case
+    case_starts = np.flatnonzero(np.diff(data[:, ires_i], prepend=np.nan) != 0)
     results = []
-    for ires, data in groupby(res[1:], key=lambda x: x[1]):
-        field_data = np.asarray([(x[nid], *x[start:stop]) for x in data], dtype=float)
-        fd = NodalFieldData(cards.RVNODDIS.name, int(ires), [x.replace("|", "") for x in comps], field_data)
+    for start, end in zip(case_starts, np.append(case_starts[1:], len(data))):
+        field_data = data[start:end, indices]
+        ires = int(data[start, ires_i])
+        fd = NodalFieldData(cards.RVNODDIS.name, ires, [x.replace("|", "") for x in comps], field_data)
         results.append(fd)
 
     return results
@@ -651,30 +618,46 @@ def _get_rdpoints_nox_data(rdpoints_res, nlay_i, nsptra_len):
     return nox_data_clean
 
 
-def _iter_shell_stress(rv_stresses: Iterator, rdstress_map, nsp) -> Iterator:
-    ires_i, iielno_i, ispalt_i, irstrs_i = cards.RVSTRESS.get_indices_from_names(["ires", "iielno", "ispalt", "irstrs"])
-    for rv_stress in rv_stresses:
-        iielno = int(rv_stress[iielno_i])
-        irstrs = int(rv_stress[irstrs_i])
-        rdstress_res = rdstress_map[irstrs]
-        data = np.array(rv_stress[irstrs_i + 1 :])
-
-        reshaped_data = data.reshape((nsp, len(rdstress_res)))
-
-        for i, data_per_int in enumerate(reshaped_data, start=1):
-            yield iielno, i, *data_per_int
-
-
-def _iter_line_forces(rv_forces: Iterator, rdforces_map, nsp) -> Iterator:
-    ires_i, iielno_i, ispalt_i, irforc_i = cards.RVFORCES.get_indices_from_names(["ires", "ielno", "ispalt", "irforc|"])
+def _iter_element_results(
+    records: CardRecords, ires_i: int, elno_i: int, rd_i: int, rdpoints_map: dict, rd_map: dict
+) -> Iterator[tuple[tuple, np.ndarray]]:
+    """Group element result records (RVSTRESS or RVFORCES) on result case, number of result points, element type
+    and result component definition (rd_i). The values of each group are returned as rows of (element id, result
+    point, *component values). Groups are sorted on their key, and the element order is kept within each group."""
+    nsp_i, eltyp_i = cards.RDPOINTS.get_indices_from_names(["nsp", "ieltyp"])
+    data = records.to_array(records.counts.max())
+
+    elem_ids, elem_index = np.unique(data[:, elno_i], return_inverse=True)
+    elem_points = np.array([[rdpoints_map[x][nsp_i], rdpoints_map[x][eltyp_i]] for x in elem_ids]).astype(int)
+    keys = np.column_stack([data[:, ires_i], elem_points[elem_index], data[:, rd_i]])
+
+    order = np.lexsort(keys.T[::-1])
+    keys = keys[order]
+    group_starts = np.flatnonzero(np.any(np.diff(keys, axis=0, prepend=np.nan) != 0, axis=1))
+    for start, end in zip(group_starts, np.append(group_starts[1:], len(keys))):
+        rows = order[start:end]
+        ires, nsp, elem_type, rd_no = keys[start]
+        nsp, num_comps = int(nsp), len(rd_map[int(rd_no)])
+        values = data[rows, rd_i + 1 : rd_i + 1 + nsp * num_comps].reshape(len(rows) * nsp, num_comps)
+        elem_ids = np.repeat(data[rows, elno_i], nsp)
+        int_points = np.tile(np.arange(1, nsp + 1), len(rows))
+        yield (ires, nsp, int(elem_type), rd_no), np.column_stack([elem_ids, int_points, values])
+
+
+def read_text_record(lines: list[str]) -> list[float | str]:
+    """Read a record of a card with nfield numeric values followed by text lines (i.e. TDMATER)"""
+    values = [float(x) for x in lines[0].split()[1:]]
+    n_field = int(values[0])
+    text_lines = lines[1:]
+    while len(values) < n_field and len(text_lines) > 0:
+        values += [float(x) for x in text_lines.pop(0).split()]
+
+    for line in text_lines:
+        stripped = line.strip()
+        result = DataCard.str_to_proper_types(stripped)
+        values += result if len(result) > 0 else [stripped]
 
-    for rv_force in rv_forces:
-        iielno = int(rv_force[iielno_i])
-        irforc = int(rv_force[irforc_i])
-        rdstress_res = rdforces_map[irforc]
-        data = np.array(rv_force[irforc_i + 1 :])
-        for i, data_per_int in enumerate(data.reshape((nsp, len(rdstress_res))), start=1):
-            yield iielno, i, *data_per_int
+    return values
 
 
 def get_grade(sig_y, tol=1):
@@ -1,10 +1,16 @@
-from typing import List, Tuple
+from __future__ import annotations
+
+import io
+from itertools import groupby
+from typing import TextIO
+
+import numpy as np
 
 from ada import FEM
 from ada.fem import Elem
 
 from ..common import sesam_el_map
-from .write_utils import write_ff
+from .write_utils import write_ff_block
 
 
 def eltype_2_sesam(eltyp) -> int:
@@ -22,42 +28,61 @@ def elem_str(fem: FEM, thick_map) -> str:
 
     'GELMNT1', 'elnox', 'elno', 'eltyp', 'eltyad', 'nids'
     """
+    buffer = io.StringIO()
+    write_elements(buffer, fem, thick_map)
+    return buffer.getvalue()
 
-    out_str = "".join(
-        [
-            write_ff(
-                "GELMNT1",
-                [(el.id, el.id, eltype_2_sesam(el.type), 0)] + write_nodal_data(el),
-            )
-            for el in fem.elements.stru_elements
-        ]
-    )
-
-    for el in fem.elements.stru_elements:
-        out_str += write_elem(el, thick_map)
-
-    return out_str
 
+def write_elements(f: TextIO, fem: FEM, thick_map) -> None:
+    """Write the GELMNT1 and GELREF1 cards of all structural elements. The element ids, types, node ids and property
+    references are collected into arrays, and consecutive elements with records of equal length are written as a
+    single block."""
+    elements = list(fem.elements.stru_elements)
+    sesam_types = dict()
 
-def write_nodal_data(el: Elem) -> List[Tuple[int]]:
-    if len(el.nodes) <= 4:
-        return [tuple([e.id for e in el.nodes])]
+    for _, el_group in groupby(elements, key=lambda el: len(el.nodes)):
+        el_group = list(el_group)
+        el_ids = [el.id for el in el_group]
+        el_types = [sesam_types.setdefault(el.type, eltype_2_sesam(el.type)) for el in el_group]
+        node_refs = [[n.id for n in el.nodes] for el in el_group]
+        write_gelmnt1(f, el_ids, el_types, node_refs)
 
-    nodes = []
-    curr_tup = []
-    counter = 0
-    for n in el.nodes:
-        curr_tup.append(n.id)
-        counter += 1
-        if counter == 4:
-            counter = 0
-            nodes.append(tuple(curr_tup))
-            curr_tup = []
+    for _, el_group in groupby(elements, key=lambda el: el.metadata.get("fixno", None) is None):
+        write_gelref1(f, [get_elem_refs(el, thick_map) for el in el_group])
 
-    return nodes + [tuple(curr_tup)]
 
+def write_gelmnt1(f: TextIO, el_ids: np.ndarray, el_types: np.ndarray, node_refs: np.ndarray) -> None:
+    """Write GELMNT1 records of elements with the same number of nodes.
 
-def write_elem(el: Elem, thick_map) -> str:
+    :param el_ids: The element ids
+    :param el_types: The Sesam element type numbers
+    :param node_refs: The (num_elements, num_nodes) node ids
+    """
+    el_ids = np.asarray(el_ids)
+    node_refs = np.asarray(node_refs)
+    num_nodes = node_refs.shape[1]
+    row_lengths = [4] + [4] * (num_nodes // 4) + ([num_nodes % 4] if num_nodes % 4 != 0 else [])
+    data = np.column_stack([el_ids, el_ids, el_types, np.zeros(len(el_ids)), node_refs])
+    write_ff_block(f, "GELMNT1", data, row_lengths)
+
+
+def write_gelref1(f: TextIO, refs: np.ndarray) -> None:
+    """Write GELREF1 records from rows of (elno, matno, geono, fixno, transno) or (elno, matno, geono, fixno,
+    transno, fixno_end1, fixno_end2) for elements with hinges."""
+    refs = np.asarray(refs)
+    num_refs = len(refs)
+    zeros = np.zeros((num_refs, 1))
+    data = [refs[:, 0:2], np.zeros((num_refs, 6)), refs[:, 2:4], zeros, refs[:, 4:5]]
+    row_lengths = [4, 4, 4]
+    if refs.shape[1] == 7:
+        data.append(refs[:, 5:7])
+        row_lengths.append(2)
+
+    write_ff_block(f, "GELREF1", np.column_stack(data), row_lengths)
+
+
+def get_elem_refs(el: Elem, thick_map) -> tuple:
+    """The property references of the GELREF1 record of an element (see write_gelref1)"""
     from ada.fem.elements import ElemType
 
     fem_sec = el.fem_sec
@@ -71,16 +96,7 @@ def write_elem(el: Elem, thick_map) -> str:
     fixno = el.metadata.get("fixno", None)
     transno = el.metadata.get("transno")
     if fixno is None:
-        last_tuples = [(sec_id, 0, 0, transno)]
-    else:
-        h1_fix, h2_fix = fixno
-        last_tuples = [(sec_id, -1, 0, transno), (h1_fix, h2_fix)]
-
-    return write_ff(
-        "GELREF1",
-        [
-            (el.id, el.fem_sec.material.id, 0, 0),
-            (0, 0, 0, 0),
-        ]
-        + last_tuples,
-    )
+        return el.id, fem_sec.material.id, sec_id, 0, transno
+
+    h1_fix, h2_fix = fixno
+    return el.id, fem_sec.material.id, sec_id, -1, transno, h1_fix, h2_fix
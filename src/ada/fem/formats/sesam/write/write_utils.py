@@ -1,5 +1,13 @@
+from __future__ import annotations
+
+import io
+from typing import Iterable, TextIO
+
 import numpy as np
 
+# Number of records formatted at a time by write_ff_block
+CHUNK_SIZE = 50_000
+
 
 def write_ff(flag: str, data):
     """
@@ -13,24 +21,13 @@ def write_ff(flag: str, data):
     :param data:
     :return:
     """
-
-    out_str = f"{flag:<8}"
-    for row in data:
-        v = [format_data(x) for x in row]
-        if row == data[-1]:
-            out_str += "".join(v) + "\n"
-        else:
-            out_str += "".join(v) + "\n" + 8 * " "
-    return out_str
+    lines = ["".join([format_data(x) for x in row]) for row in data]
+    return f"{flag:<8}" + ("\n" + 8 * " ").join(lines) + "\n"
 
 
 def format_data(d):
-    if type(d) in (np.float64, float, int, np.uint64, np.int32) and d >= 0:
-        d = make_zero(d)
-        return f"  {d:<14.8E}"
-    elif type(d) in (np.float64, float, int, np.uint64, np.int32) and d < 0:
-        d = make_zero(d)
-        return f" {d:<15.8E}"
+    if isinstance(d, (int, float, np.integer, np.floating)):
+        return " % .8E" % make_zero(d)
     elif type(d) is str:
         return d
     else:
@@ -39,3 +36,46 @@ def format_data(d):
 
 def make_zero(d):
     return d if abs(d) != 0.0 else 0.0
+
+
+def get_record_format(flag: str, row_lengths: Iterable[int]) -> str:
+    """The %-format string of a single record of a numeric card with the given number of values per line"""
+    return f"{flag:<8}" + ("\n" + 8 * " ").join([" % .8E" * n for n in row_lengths]) + "\n"
+
+
+def write_ff_block(
+    f: TextIO, flag: str, data: np.ndarray, row_lengths: Iterable[int] = None, chunk_size: int = CHUNK_SIZE
+) -> None:
+    """Write the records of a numeric card given as a (num_records, num_values) array. Gives the same output as
+    calling write_ff for each record, but the records are formatted chunk by chunk using a single %-format
+    operation instead of value by value.
+
+    :param f: The file (or any text stream) to write to
+    :param flag: The card name
+    :param data: The values of each record
+    :param row_lengths: The number of values on each line of a record. Default is 4 values per line
+    :param chunk_size: The number of records formatted and written at a time
+    """
+    data = np.asarray(data, dtype=float)
+    if data.ndim == 1:
+        data = data.reshape(1, -1)
+
+    num_values = data.shape[1]
+    if row_lengths is None:
+        row_lengths = [4] * (num_values // 4) + ([num_values % 4] if num_values % 4 != 0 else [])
+    row_lengths = list(row_lengths)
+    if sum(row_lengths) != num_values:
+        raise ValueError(f"The row lengths {row_lengths} of {flag} do not match the {num_values} values per record")
+
+    record_fmt = get_record_format(flag, row_lengths)
+    for start in range(0, len(data), chunk_size):
+        # Adding 0.0 turns negative zeros into (positive) zeros, i.e. the same as make_zero
+        values = data[start : start + chunk_size] + 0.0
+        f.write((record_fmt * len(values)) % tuple(values.ravel().tolist()))
+
+
+def format_ff_block(flag: str, data: np.ndarray, row_lengths: Iterable[int] = None) -> str:
+    """The records of a numeric card given as a (num_records, num_values) array as a string (see write_ff_block)"""
+    buffer = io.StringIO()
+    write_ff_block(buffer, flag, data, row_lengths)
+    return buffer.getvalue()
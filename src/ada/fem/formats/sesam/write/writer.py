@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import datetime
-from operator import attrgetter
-from typing import TYPE_CHECKING
+import io
+from typing import TYPE_CHECKING, TextIO
+
+import numpy as np
 
 from ada.config import logger
-from ada.core.utils import Counter, get_current_user
+from ada.core.utils import get_current_user
 from ada.fem import FEM
 
 from .templates import top_level_fem_str
-from .write_utils import write_ff
+from .write_utils import format_ff_block, write_ff, write_ff_block
 
 if TYPE_CHECKING:
     from ada import Material
@@ -17,7 +19,7 @@ if TYPE_CHECKING:
 
 def to_fem(assembly, name, analysis_dir=None, metadata=None):
     from .write_constraints import constraint_str
-    from .write_elements import elem_str
+    from .write_elements import write_elements
     from .write_loads import loads_str
     from .write_masses import mass_str
     from .write_sections import sections_str
@@ -64,12 +66,12 @@ def to_fem(assembly, name, analysis_dir=None, metadata=None):
         d.write(materials_str(materials))
         d.write(sections_str(part.fem, thick_map))
         d.write(univec_str(part.fem))
-        d.write(nodes_str(part.fem))
+        write_nodes(d, part.fem)
         d.write(mass_str(part.fem))
         d.write(bc_str(part.fem) + bc_str(assembly.fem))
         d.write(constraint_str(part.fem) + constraint_str(assembly.fem))
         d.write(hinges_str(part.fem))
-        d.write(elem_str(part.fem, thick_map))
+        write_elements(d, part.fem, thick_map)
         d.write(loads_str(assembly.fem) + loads_str(part.fem))
         d.write("IEND                0.00            0.00            0.00            0.00\n")
 
@@ -78,97 +80,89 @@ def to_fem(assembly, name, analysis_dir=None, metadata=None):
 
 def materials_str(materials: list[Material]):
     out_str = "".join([write_ff("TDMATER", [(4, mat.id, 100 + len(mat.name), 0), (mat.name,)]) for mat in materials])
+    if len(materials) == 0:
+        return out_str
 
-    out_str += "".join(
-        [
-            write_ff(
-                "MISOSEL",
-                [
-                    (mat.id, mat.model.E, mat.model.v, mat.model.rho),
-                    (mat.model.zeta, mat.model.alpha, 1, mat.model.sig_y),
-                ],
-            )
-            for mat in materials
-        ]
-    )
-    return out_str
+    misosel = [
+        (mat.id, mat.model.E, mat.model.v, mat.model.rho, mat.model.zeta, mat.model.alpha, 1, mat.model.sig_y)
+        for mat in materials
+    ]
+    return out_str + format_ff_block("MISOSEL", misosel)
 
 
 def nodes_str(fem: FEM) -> str:
-    nodes = sorted(fem.nodes, key=attrgetter("id"))
-
-    nids = []
-    for n in nodes:
-        if n.id not in nids:
-            nids.append(n.id)
-        else:
-            raise Exception('Doubly defined node id "{}". TODO: Make necessary code updates'.format(n[0]))
-    if len(nodes) == 0:
-        return "** No Nodes"
-    else:
-        out_str = "".join([write_ff("GNODE", [(no.id, no.id, 6, 123456)]) for no in nodes])
-        out_str += "".join([write_ff("GCOORD", [(no.id, no[0], no[1], no[2])]) for no in nodes])
-        return out_str
+    buffer = io.StringIO()
+    write_nodes(buffer, fem)
+    return buffer.getvalue()
+
+
+def write_nodes(f: TextIO, fem: FEM) -> None:
+    """Write the GNODE and GCOORD cards of all nodes (sorted by id) formatted from a single array of node data"""
+    if len(fem.nodes) == 0:
+        f.write("** No Nodes")
+        return None
+
+    node_data = fem.nodes.to_np_array(include_id=True)
+    node_data = node_data[np.argsort(node_data[:, 0], kind="stable")]
+    nids = node_data[:, 0]
+
+    duplicates = nids[1:][nids[1:] == nids[:-1]]
+    if len(duplicates) > 0:
+        raise ValueError(f'Doubly defined node id "{int(duplicates[0])}". TODO: Make necessary code updates')
+
+    num_nodes = len(nids)
+    gnode = np.column_stack([nids, nids, np.full(num_nodes, 6), np.full(num_nodes, 123456)])
+    write_ff_block(f, "GNODE", gnode)
+    write_ff_block(f, "GCOORD", node_data)
 
 
 def bc_str(fem: FEM) -> str:
-    out_str = ""
+    bnbcd = []
     for bc in fem.bcs:
-        for m in bc.fem_set.members:
-            dofs = [1 if i in bc.dofs else 0 for i in range(1, 7)]
-            data = [tuple([m.id, 6] + dofs[:2]), tuple(dofs[2:])]
-            out_str += write_ff("BNBCD", data)
-    return out_str
+        dofs = [1 if i in bc.dofs else 0 for i in range(1, 7)]
+        bnbcd += [(m.id, 6, *dofs) for m in bc.fem_set.members]
+
+    if len(bnbcd) == 0:
+        return ""
+
+    return format_ff_block("BNBCD", bnbcd)
 
 
 def hinges_str(fem: FEM) -> str:
-    out_str = ""
-    h = Counter(1)
+    belfix = []
 
-    def write_hinge(hinge):
+    def add_hinge(hinge) -> int:
         dofs = [0 if i in hinge else 1 for i in range(1, 7)]
-        fix_id = next(h)
-        data = [tuple([fix_id, 3, 0, 0]), tuple(dofs[:4]), tuple(dofs[4:])]
-        return fix_id, write_ff("BELFIX", data)
+        fix_id = len(belfix) + 1
+        belfix.append((fix_id, 3, 0, 0, *dofs))
+        return fix_id
 
     for el in fem.elements:
         h1, h2 = el.metadata.get("h1", None), el.metadata.get("h2", None)
         if h2 is None and h1 is None:
             continue
-        h1_fix, h2_fix = 0, 0
-        if h1 is not None:
-            h1_fix, res_str = write_hinge(h1)
-            out_str += res_str
-        if h2 is not None:
-            h2_fix, res_str = write_hinge(h2)
-            out_str += res_str
+        h1_fix = add_hinge(h1) if h1 is not None else 0
+        h2_fix = add_hinge(h2) if h2 is not None else 0
         el.metadata["fixno"] = h1_fix, h2_fix
 
-    return out_str
+    if len(belfix) == 0:
+        return ""
 
+    return format_ff_block("BELFIX", belfix, (4, 4, 2))
 
-def univec_str(fem: FEM) -> str:
-    out_str = ""
-    uvec_id = Counter(1)
 
+def univec_str(fem: FEM) -> str:
     unit_vecs = dict()
 
-    def write_local_z(vec):
-        tvec = tuple(vec)
-        if tvec in unit_vecs.keys():
-            return unit_vecs[tvec], None
-        trans_no = next(uvec_id)
-        data = [tuple([trans_no, *vec])]
-        unit_vecs[tvec] = trans_no
-        return trans_no, write_ff("GUNIVEC", data)
-
     for el in fem.elements.stru_elements:
-        local_z = el.fem_sec.local_z
-        transno, res_str = write_local_z(local_z)
-        if res_str is None:
-            el.metadata["transno"] = transno
-            continue
-        out_str += res_str
+        tvec = tuple(el.fem_sec.local_z)
+        transno = unit_vecs.get(tvec, None)
+        if transno is None:
+            transno = len(unit_vecs) + 1
+            unit_vecs[tvec] = transno
         el.metadata["transno"] = transno
 
-    return out_str
+    if len(unit_vecs) == 0:
+        return ""
+
+    return format_ff_block("GUNIVEC", [(transno, *vec) for vec, transno in unit_vecs.items()])
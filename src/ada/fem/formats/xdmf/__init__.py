@@ -1,4 +1,4 @@
 from .reader import XdmfReader
-from .writer import XdmfWriter
+from .writer import XdmfTimeSeriesWriter, XdmfWriter
 
-__all__ = ["XdmfWriter", "XdmfReader"]
+__all__ = ["XdmfWriter", "XdmfTimeSeriesWriter", "XdmfReader"]
@@ -25,9 +25,13 @@ def attribute_type(data):
 
 
 dtype_to_format_string = {
+    "int8": "%d",
+    "uint8": "%d",
+    "int16": "%d",
+    "uint16": "%d",
     "int32": "%d",
     "int64": "%d",
-    "unit32": "%d",
+    "uint32": "%d",
     "uint64": "%d",
     "float32": "%.7e",
     "float64": "%.16e",
@@ -43,6 +47,10 @@ class ReadError(Exception):
 
 
 numpy_to_xdmf_dtype = {
+    "int8": ("Char", "1"),
+    "uint8": ("UChar", "1"),
+    "int16": ("Int", "2"),
+    "uint16": ("UInt", "2"),
     "int32": ("Int", "4"),
     "int64": ("Int", "8"),
     "uint32": ("UInt", "4"),
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import os
 import pathlib
 from io import BytesIO
@@ -13,6 +15,8 @@ from .common import (
     raw_from_cell_data,
 )
 
+XINCLUDE_NS = "http://www.w3.org/2003/XInclude"
+
 
 class XdmfWriter:
     """
@@ -21,26 +25,31 @@ class XdmfWriter:
 
     :param filename:
     :param data_format:
-    :param compression:
-    :param compression_opts:
+    :param compression: HDF5 compression filter. None (or "none"), "lzf" or "gzip"
+    :param compression_opts: The compression level (0-9) when using gzip
+    :param chunk_rows: Number of rows per chunk of the (compressed) HDF5 datasets
     """
 
-    def __init__(self, filename, data_format="HDF", compression="gzip", compression_opts=4):
+    def __init__(
+        self, filename, data_format="HDF", compression="gzip", compression_opts=4, chunk_rows=64 * 1024, mode="w"
+    ):
         if data_format not in ["XML", "Binary", "HDF"]:
-            raise ValueError("Unknown XDMF data format " f"'{data_format}' (use 'XML', 'Binary', or 'HDF'.)")
+            raise ValueError(f"Unknown XDMF data format '{data_format}' (use 'XML', 'Binary', or 'HDF'.)")
 
         self.filename = pathlib.Path(filename).with_suffix(".xdmf")
         os.makedirs(self.filename.parent, exist_ok=True)
         self.data_format = data_format
         self.data_counter = 0
         self.compression = compression
-        self.compression_opts = None if compression is None else compression_opts
+        self.compression_opts = compression_opts
+        self.chunk_rows = chunk_rows
+        self._h5_kwargs = get_h5_compression_kwargs(compression, compression_opts)
 
         if data_format == "HDF":
             import h5py
 
             self.h5_filename = os.path.splitext(self.filename)[0] + ".h5"
-            self.h5_file = h5py.File(self.h5_filename, "w")
+            self.h5_file = h5py.File(self.h5_filename, mode)
 
         self.xdmf_file = ET.Element("Xdmf", Version="3.0")
 
@@ -48,11 +57,11 @@ class XdmfWriter:
         self.grid = ET.SubElement(domain, "Grid", Name="Grid")
 
     def write(self):
-        ET.register_namespace("xi", "https://www.w3.org/2001/XInclude/")
+        ET.register_namespace("xi", XINCLUDE_NS)
         tree = ET.ElementTree(self.xdmf_file)
         tree.write(self.filename)
 
-    def add_points(self, points):
+    def add_points(self, points, grid: ET.Element = None):
         if points.shape[1] == 1:
             geometry_type = "X"
         elif points.shape[1] == 2:
@@ -62,7 +71,8 @@ class XdmfWriter:
                 raise ValueError()
             geometry_type = "XYZ"
 
-        geo = ET.SubElement(self.grid, "Geometry", GeometryType=geometry_type)
+        grid = self.grid if grid is None else grid
+        geo = ET.SubElement(grid, "Geometry", GeometryType=geometry_type)
         dt, prec = numpy_to_xdmf_dtype[points.dtype.name]
         dim = "{} {}".format(*points.shape)
         data_item = ET.SubElement(
@@ -75,9 +85,10 @@ class XdmfWriter:
         )
         data_item.text = self.numpy_to_xml_string(points)
 
-    def add_cells(self, cells):
+    def add_cells(self, cells, grid: ET.Element = None):
         import collections
 
+        grid = self.grid if grid is None else grid
         CellBlock = collections.namedtuple("CellBlock", ["type", "data"])
         if isinstance(cells, dict):
             cells = [CellBlock(cell_type, data) for cell_type, data in cells.items()]
@@ -89,7 +100,7 @@ class XdmfWriter:
             num_cells = len(cells[0].data)
             xdmf_type = meshio_to_xdmf_type[meshio_type][0]
             topo = ET.SubElement(
-                self.grid,
+                grid,
                 "Topology",
                 TopologyType=xdmf_type,
                 NumberOfElements=str(num_cells),
@@ -111,7 +122,7 @@ class XdmfWriter:
             assert len(cells) > 1
             total_num_cells = sum(c.data.shape[0] for c in cells)
             topo = ET.SubElement(
-                self.grid,
+                grid,
                 "Topology",
                 TopologyType="Mixed",
                 NumberOfElements=str(total_num_cells),
@@ -144,10 +155,12 @@ class XdmfWriter:
             )
             data_item.text = self.numpy_to_xml_string(cd)
 
-    def add_point_data(self, point_data):
+    def add_point_data(self, point_data, grid: ET.Element = None):
+        grid = self.grid if grid is None else grid
         for name, data in point_data.items():
+            data = as_xdmf_array(data)
             att = ET.SubElement(
-                self.grid,
+                grid,
                 "Attribute",
                 Name=name,
                 AttributeType=attribute_type(data),
@@ -165,11 +178,13 @@ class XdmfWriter:
             )
             data_item.text = self.numpy_to_xml_string(data)
 
-    def add_cell_data(self, cell_data):
+    def add_cell_data(self, cell_data, grid: ET.Element = None):
+        grid = self.grid if grid is None else grid
         raw = raw_from_cell_data(cell_data)
         for name, data in raw.items():
+            data = as_xdmf_array(data)
             att = ET.SubElement(
-                self.grid,
+                grid,
                 "Attribute",
                 Name=name,
                 AttributeType=attribute_type(data),
@@ -206,12 +221,10 @@ class XdmfWriter:
             raise ValueError(f'Unknown data format "{self.data_format}"')
         name = f"data{self.data_counter}"
         self.data_counter += 1
-        self.h5_file.create_dataset(
-            name,
-            data=data,
-            compression=self.compression,
-            compression_opts=self.compression_opts,
-        )
+        chunks = None
+        if len(self._h5_kwargs) > 0 and data.size > 0:
+            chunks = (min(len(data), self.chunk_rows), *data.shape[1:])
+        self.h5_file.create_dataset(name, data=data, chunks=chunks, **self._h5_kwargs)
         return os.path.basename(self.h5_filename) + ":/" + name
 
     # The original idea was to implement field data as XML CDATA. Unfortunately, in
@@ -226,3 +239,111 @@ class XdmfWriter:
     #         data_item.text = str(data[0])
     #     information.text = ET.CDATA(ET.tostring(info))
     #     information.append(CDATA(ET.tostring(info).decode("utf-8")))
+
+
+class XdmfTimeSeriesWriter(XdmfWriter):
+    """Writes a mesh and the results of a series of steps (i.e. time steps or eigen modes) to XDMF with the data
+    stored in HDF5. The data of a step is written to the HDF5 file as soon as it is added, so only a single step has
+    to be kept in memory. The XDMF file is (re)written by write() and when the writer is closed.
+
+    Steps can be appended to a time series written earlier by using append=True. The mesh is then reused from the
+    existing file.
+
+    :param filename: Path to the XDMF file. The HDF5 file is placed next to it.
+    :param append: Add steps to an existing time series
+    """
+
+    MESH_NAME = "mesh"
+
+    def __init__(self, filename, compression="gzip", compression_opts=4, chunk_rows=64 * 1024, append=False):
+        filename = pathlib.Path(filename).with_suffix(".xdmf")
+        if append and filename.exists() is False:
+            raise FileNotFoundError(f'Unable to append steps. "{filename}" does not exist')
+
+        mode = "a" if append else "w"
+        super().__init__(filename, "HDF", compression, compression_opts, chunk_rows, mode=mode)
+
+        if append:
+            self.xdmf_file = ET.parse(self.filename).getroot()
+            domain = self.xdmf_file.find("Domain")
+            self.collection = domain.find("Grid[@GridType='Collection']")
+            self.grid = domain.find(f"Grid[@Name='{self.MESH_NAME}']")
+            if self.collection is None or self.grid is None:
+                raise ValueError(f'"{self.filename}" is not a time series written by {self.__class__.__name__}')
+
+            counters = [int(key[4:]) for key in self.h5_file.keys() if key.startswith("data") and key[4:].isdigit()]
+            self.data_counter = max(counters, default=-1) + 1
+        else:
+            domain = self.xdmf_file.find("Domain")
+            domain.remove(self.grid)
+            self.grid = None
+            self.collection = ET.SubElement(
+                domain, "Grid", Name="TimeSeries", GridType="Collection", CollectionType="Temporal"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.write()
+        self.h5_file.close()
+
+    @property
+    def steps(self) -> list[str]:
+        """The time values of the steps written to the time series"""
+        return [grid.find("Time").get("Value") for grid in self.collection.findall("Grid")]
+
+    def write_points_cells(self, points: numpy.ndarray, cells) -> None:
+        if self.grid is not None:
+            raise ValueError("The mesh of the time series is already written")
+
+        domain = self.xdmf_file.find("Domain")
+        self.grid = ET.Element("Grid", Name=self.MESH_NAME, GridType="Uniform")
+        domain.insert(0, self.grid)
+        self.add_points(numpy.asarray(points))
+        self.add_cells(cells)
+
+    def write_data(self, t, point_data: dict = None, cell_data: dict = None) -> None:
+        """Write the data of a single step.
+
+        :param t: The time value of the step
+        :param point_data: Nodal values by name
+        :param cell_data: Values by name given as a list with an array per cell block
+        """
+        if self.grid is None:
+            raise ValueError("The mesh must be written before the data of the steps")
+
+        grid = ET.SubElement(self.collection, "Grid")
+        ptr = f'xpointer(//Grid[@Name="{self.MESH_NAME}"]/*[self::Topology or self::Geometry])'
+        ET.SubElement(grid, f"{{{XINCLUDE_NS}}}include", xpointer=ptr)
+        ET.SubElement(grid, "Time", Value=str(t))
+
+        if point_data:
+            self.add_point_data(point_data, grid)
+        if cell_data:
+            self.add_cell_data(cell_data, grid)
+
+        self.h5_file.flush()
+
+
+def get_h5_compression_kwargs(compression: str | None, compression_opts: int = None) -> dict:
+    """The h5py create_dataset arguments of a compression codec"""
+    if compression is None or compression == "none":
+        return dict()
+    if compression == "lzf":
+        return dict(compression="lzf")
+    if compression == "gzip":
+        return dict(compression="gzip", compression_opts=compression_opts)
+
+    raise ValueError(f'Unsupported compression "{compression}". Use None, "lzf" or "gzip"')
+
+
+def as_xdmf_array(data) -> numpy.ndarray:
+    """Boolean values are stored as unsigned bytes, as XDMF has no boolean data type"""
+    data = numpy.asarray(data)
+    if data.dtype == bool:
+        return data.astype(numpy.uint8)
+    return data
@@ -1,14 +1,60 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
-from ada import FEM
+from ada import FEM, Pipe
+from ada.concepts.containers import Nodes
+from ada.concepts.points import replace_node
+from ada.config import Settings, logger
 from ada.core.utils import Counter
 
 from .concepts import GmshSession, GmshTask
 
+# Model objects shared with the forked worker processes. Keyed on id() which is preserved across a fork.
+_shared_objects: dict[int, object] = dict()
+_worker_tasks: list[GmshTask] = []
+
+
+def multisession_gmsh_tasker(
+    fem: FEM,
+    gmsh_tasks: List[GmshTask],
+    num_workers: int = 1,
+    point_tol=Settings.point_tol,
+    merge_nodes: bool = False,
+) -> FEM:
+    """Run multiple meshing operations. By default all tasks are run within a single GmshSession.
+
+    If num_workers is larger than 1 (or None for all cores) the tasks are meshed in parallel by separate worker
+    processes, each with its own gmsh instance. The resulting meshes are added to the FEM in task order, so node and
+    element ids do not depend on the number of workers or the order they finish in.
+
+    :param merge_nodes: Merge nodes coincident (within point_tol) with nodes of previously added tasks
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count()
+
+    num_workers = min(num_workers, len(gmsh_tasks))
+    if num_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning("Parallel meshing requires the fork start method. Meshing tasks sequentially")
+        num_workers = 1
+
+    if num_workers <= 1:
+        return _sequential_gmsh_tasker(fem, gmsh_tasks, point_tol, merge_nodes)
+
+    for tmp_fem in _parallel_gmsh_tasker(gmsh_tasks, num_workers):
+        add_task_fem(fem, tmp_fem, point_tol, merge_nodes)
+
+    return fem
 
-def multisession_gmsh_tasker(fem: FEM, gmsh_tasks: List[GmshTask]):
-    """Run multiple meshing operations within a single GmshSession."""
 
+def _sequential_gmsh_tasker(
+    fem: FEM, gmsh_tasks: List[GmshTask], point_tol=Settings.point_tol, merge_nodes: bool = False
+) -> FEM:
     model_names = Counter(1, "gmsh")
     with GmshSession(silent=True) as gs:
         for gtask in gmsh_tasks:
@@ -18,9 +64,115 @@ def multisession_gmsh_tasker(fem: FEM, gmsh_tasks: List[GmshTask]):
                 gs.add_obj(obj, gtask.geom_repr)
             gs.mesh(gtask.mesh_size)
 
-            # TODO: Add operand type += for FEM
             tmp_fem = gs.get_fem()
-            tmp_fem.parent = fem.parent
-            fem += tmp_fem
+            add_task_fem(fem, tmp_fem, point_tol, merge_nodes)
             gs.model_map = dict()
     return fem
+
+
+def _parallel_gmsh_tasker(gmsh_tasks: List[GmshTask], num_workers: int) -> list[FEM]:
+    global _shared_objects, _worker_tasks
+
+    _shared_objects = get_shared_objects(gmsh_tasks)
+    _worker_tasks = gmsh_tasks
+    try:
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=ctx) as executor:
+            results = list(executor.map(_mesh_task, range(len(gmsh_tasks))))
+        return [_loads_fem(res) for res in results]
+    finally:
+        _shared_objects = dict()
+        _worker_tasks = []
+
+
+def get_shared_objects(gmsh_tasks: List[GmshTask]) -> dict[int, object]:
+    """Model objects (and their materials, sections and parents) referenced by the meshed FEM objects"""
+    shared = dict()
+
+    def add(obj):
+        if obj is not None:
+            shared[id(obj)] = obj
+
+    for gtask in gmsh_tasks:
+        for obj in gtask.ada_obj:
+            add(obj)
+            for attr in ("material", "section", "taper"):
+                add(getattr(obj, attr, None))
+            if isinstance(obj, Pipe):
+                for seg in obj.segments:
+                    add(seg)
+            parent = obj.parent
+            while parent is not None:
+                add(parent)
+                parent = parent.parent
+
+    return shared
+
+
+class _SharedObjectsPickler(pickle.Pickler):
+    """Pickles references to shared model objects instead of copies of them"""
+
+    def persistent_id(self, obj):
+        if _shared_objects.get(id(obj)) is obj:
+            return id(obj)
+        return None
+
+
+class _SharedObjectsUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return _shared_objects[pid]
+
+
+def _mesh_task(task_index: int) -> bytes:
+    gtask = _worker_tasks[task_index]
+    with GmshSession(silent=True) as gs:
+        gs.model.add(f"gmsh{task_index + 1}")
+        gs.options = gtask.options
+        for obj in gtask.ada_obj:
+            gs.add_obj(obj, gtask.geom_repr)
+        gs.mesh(gtask.mesh_size)
+        tmp_fem = gs.get_fem()
+
+    buffer = io.BytesIO()
+    _SharedObjectsPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(tmp_fem)
+    return buffer.getvalue()
+
+
+def _loads_fem(data: bytes) -> FEM:
+    tmp_fem: FEM = _SharedObjectsUnpickler(io.BytesIO(data)).load()
+
+    # Re-apply the references to the model objects that were made in the worker process
+    elem_refs = dict()
+    for el in tmp_fem.elements:
+        for obj in el.refs:
+            elem_refs.setdefault(id(obj), (obj, []))[1].append(el)
+
+    for obj, elements in elem_refs.values():
+        obj.elem_refs.extend(elements)
+
+    for fem_sec in tmp_fem.sections:
+        if fem_sec not in fem_sec.material.refs:
+            fem_sec.material.refs.append(fem_sec)
+        if fem_sec.section is not None and fem_sec not in fem_sec.section.refs:
+            fem_sec.section.refs.append(fem_sec)
+
+    return tmp_fem
+
+
+def add_task_fem(fem: FEM, tmp_fem: FEM, point_tol=Settings.point_tol, merge_nodes: bool = False) -> None:
+    """Add the mesh of a single task to fem. If merge_nodes is True, the node ids are offset from the current max
+    node id and nodes coincident with existing nodes of fem are merged into the existing nodes."""
+    tmp_fem.parent = fem.parent
+    if merge_nodes and len(fem.nodes) > 0:
+        kept_nodes = []
+        for node in tmp_fem.nodes:
+            existing = fem.nodes.get_nearest(node.p, max_dist=point_tol)
+            if existing is None:
+                kept_nodes.append(node)
+            else:
+                replace_node(node, existing)
+
+        tmp_fem.nodes = Nodes(kept_nodes, parent=tmp_fem)
+        tmp_fem.nodes.renumber(start_id=fem.nodes.max_nid + 1)
+
+    fem += tmp_fem
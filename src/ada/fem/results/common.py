@@ -2,17 +2,18 @@ from __future__ import annotations
 
 import os
 import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Callable, Iterable
 
 import meshio
 import numpy as np
 
-from ada.config import logger
 from ada.fem.formats.general import FEATypes
-from ada.fem.shapes.definitions import LineShapes, MassTypes, ShellShapes, SolidShapes
+from ada.fem.shapes.definitions import LineShapes, ShellShapes, SolidShapes
 
-from .field_data import ElementFieldData, NodalFieldData, NodalFieldType
+from .field_data import ElementFieldData, NodalFieldData, NodalFieldType, ReduceMethod
+from .frames import FrameCache
+from .id_map import IdIndexMap
 
 if TYPE_CHECKING:
     from ada import Material, Node, Section
@@ -33,22 +34,36 @@ class ElementBlock:
     node_refs: np.ndarray
     identifiers: np.ndarray
 
+    _id_map: IdIndexMap = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def id_map(self) -> IdIndexMap:
+        """Maps element ids to their row in node_refs"""
+        if self._id_map is None or self._id_map.is_valid_for(self.identifiers) is False:
+            self._id_map = IdIndexMap(self.identifiers)
+        return self._id_map
+
 
 @dataclass
 class FemNodes:
     coords: np.ndarray
     identifiers: np.ndarray
 
-    def get_node_by_id(self, node_id: int | list[int]) -> list[Node]:
-        from typing import Iterable
+    _id_map: IdIndexMap = field(default=None, init=False, repr=False, compare=False)
 
-        from ada import Node
+    @property
+    def id_map(self) -> IdIndexMap:
+        """Maps node ids to their index in coords"""
+        if self._id_map is None or self._id_map.is_valid_for(self.identifiers) is False:
+            self._id_map = IdIndexMap(self.identifiers)
+        return self._id_map
 
-        if isinstance(node_id, Iterable) is False:
-            node_id = [node_id]
+    def get_node_by_id(self, node_id: int | list[int]) -> list[Node]:
+        from ada import Node
 
-        node_indices = [np.where(self.identifiers == x)[0][0] for x in node_id]
-        return [Node(x, int(node_id[i])) for i, x in enumerate(self.coords[node_indices])]
+        node_id = np.atleast_1d(node_id)
+        node_indices = self.id_map.get_indices(node_id)
+        return [Node(x, nid) for nid, x in zip(node_id.astype(int).tolist(), self.coords[node_indices])]
 
 
 @dataclass
@@ -62,58 +77,50 @@ class Mesh:
     elem_data: np.ndarray = None  # el_id, mat_id, sec_id, vec_id
     sets: dict[str, FemSet] = None
 
+    _elem_data_map: IdIndexMap = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def elem_data_map(self) -> IdIndexMap:
+        """Maps element ids to their row in elem_data"""
+        if self._elem_data_map is None or self._elem_data_map.is_valid_for(self.elem_data) is False:
+            self._elem_data_map = IdIndexMap(self.elem_data[:, 0], source=self.elem_data)
+        return self._elem_data_map
+
     def get_elem_by_id(self, elem_id: int) -> Elem:
         from ada.base.types import GeomRepr
         from ada.fem import Elem, FemSection, FemSet
 
-        el_id, mat_id, sec_id, vec_id = self.elem_data[np.where(self.elem_data[:, 0] == elem_id)[0], :][0]
+        row = self.elem_data_map.get_indices(elem_id)
+        el_id, mat_id, sec_id, vec_id = self.elem_data[row]
         mat = self.materials.get(int(mat_id))
         sec = self.sections.get(int(sec_id))
         vec = self.vectors.get(int(vec_id))
 
         elem = None
         for block in self.elements:
-            res = np.where(block.identifiers == elem_id)
-            for node_ids in block.node_refs[res]:
-                nodes = self.nodes.get_node_by_id(node_ids)
-                elem = Elem(elem_id, nodes, block.elem_info.type)
-                break
+            index = block.id_map.get_indices(elem_id, fill_value=-1)
+            if index < 0:
+                continue
+            nodes = self.nodes.get_node_by_id(block.node_refs[index])
+            elem = Elem(elem_id, nodes, block.elem_info.type)
+            break
 
         fs = FemSection(f"FS{sec_id}", GeomRepr.LINE, FemSet(f"El{el_id}", [elem]), mat, sec, local_z=vec)
         elem.fem_sec = fs
         return elem
 
-    def get_edges_and_faces_from_mesh(self) -> tuple[np.ndarray, np.ndarray]:
-        from ada.fem.shapes import ElemShape
-        from ada.fem.shapes import definitions as shape_def
+    def get_edges_and_faces_from_mesh(
+        self, remove_duplicate_edges: bool = False, boundary_only: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The edges and triangulated faces of all elements referring to the nodes by index.
 
-        nmap = {x: i for i, x in enumerate(self.nodes.identifiers)}
-        keys = np.array(list(nmap.keys()))
+        :param remove_duplicate_edges: Keep only a single copy of edges shared by elements
+        :param boundary_only: Skip the interior faces shared by two solid elements
+        """
+        from ada.fem.shapes.topology import get_edges_and_faces
 
-        edges = []
-        faces = []
-        for cell_block in self.elements:
-            el_type = cell_block.elem_info.type
-
-            nodes_copy = cell_block.node_refs.copy()
-            nodes_copy[np.isin(nodes_copy, keys)] = np.vectorize(nmap.get)(nodes_copy[np.isin(nodes_copy, keys)])
-
-            for elem in nodes_copy:
-                elem_shape = ElemShape(el_type, elem)
-                if elem_shape.type in (MassTypes.MASS,):
-                    continue
-                try:
-                    edges += elem_shape.edges
-                except IndexError as e:
-                    logger.error(e)
-                    continue
-                if isinstance(elem_shape.type, shape_def.LineShapes):
-                    continue
-                faces += elem_shape.get_faces()
-
-        faces = np.array(faces).reshape(int(len(faces) / 3), 3)
-        edges = np.array(edges).reshape(int(len(edges) / 2), 2)
-        return edges, faces
+        blocks = ((block.elem_info.type, self.nodes.id_map.get_indices(block.node_refs)) for block in self.elements)
+        return get_edges_and_faces(blocks, remove_duplicate_edges, boundary_only)
 
 
 @dataclass
@@ -207,9 +214,7 @@ class FEAResult:
         cells = []
         for cb in self.mesh.elements:
             cell_type = cb.elem_info.type.value.lower()
-            ncopy = cb.node_refs.copy()
-            for i, v in enumerate(self.mesh.nodes.identifiers):
-                ncopy[np.where(ncopy == v)] = i
+            ncopy = self.mesh.nodes.id_map.get_indices(cb.node_refs)
             cells += [meshio.CellBlock(cell_type=cell_type, data=ncopy)]
         return cells
 
@@ -241,7 +246,7 @@ class FEAResult:
 
         data = self.get_data(field, step)
         vertex_colors = DataColorizer.colorize_data(data, func=colorize_function)
-        return np.array([[i * 255 for i in x] + [1] for x in vertex_colors], dtype=np.int32)
+        return to_rgba_255(vertex_colors)
 
     def _warp_data(self, vertices: np.ndarray, field: str, step, scale: float = 1.0):
         data = self.get_data(field, step)
@@ -249,31 +254,103 @@ class FEAResult:
         result = vertices + data[:, :3] * scale
         return result
 
+    def get_frames(
+        self,
+        field: str,
+        warp_field: str = None,
+        colorize_function: Callable = None,
+        palette: list[tuple] = None,
+        vectorized: bool = False,
+    ) -> FrameCache:
+        """Cached vertex and colour buffers of the steps (or eigen modes) of a field. The frames are looked up by step.
+
+        :param field: The field used to colour the vertices
+        :param warp_field: The field used to warp the vertices. Default is field
+        :param vectorized: The colorize function is called once with the transposed data instead of once per row
+        """
+        from ada.visualize.colors import ColorMap, DataColorizer
+
+        warp_field = field if warp_field is None else warp_field
+        palette = DataColorizer.default_palette if palette is None else palette
+        return FrameCache(
+            self.mesh.nodes.coords,
+            lambda step: self.get_data(field, step),
+            lambda step: self.get_data(warp_field, step),
+            color_map=ColorMap(palette),
+            colorize_function=colorize_function,
+            vectorized=vectorized,
+        )
+
     def to_meshio_mesh(self) -> meshio.Mesh:
         cells = self._get_cell_blocks()
         cell_data, point_data = self._get_point_and_cell_data()
 
         return meshio.Mesh(points=self.mesh.nodes.coords, cells=cells, cell_data=cell_data, point_data=point_data)
 
-    def to_xdmf(self, filepath):
-        cells = self._get_cell_blocks()
-        with meshio.xdmf.TimeSeriesWriter(filepath) as writer:
-            writer.write_points_cells(self.mesh.nodes.coords, cells)
-            for key, values in self.get_results_grouped_by_field_value().items():
-                for x in values:
-                    res = x.get_all_values()
-                    name = x.name
-                    point_data = dict()
+    def iter_results_by_step(self) -> Iterable[tuple[int | float, list[ElementFieldData | NodalFieldData]]]:
+        """The results grouped by step (in the order the steps first appear)"""
+        steps = dict()
+        for x in self.results:
+            steps.setdefault(x.step, []).append(x)
+        yield from steps.items()
+
+    def _get_cell_data(self, field_data: ElementFieldData, method: ReduceMethod | str) -> list[np.ndarray]:
+        """Integration point data reduced to a single row per element, as an array per element block. Elements
+        without data are NaN."""
+        elem_ids, values = field_data.get_element_values(method)
+        elem_map = IdIndexMap(elem_ids)
+
+        cell_data = []
+        for block in self.mesh.elements:
+            indices = elem_map.get_indices(block.identifiers, fill_value=-1)
+            block_values = np.full((len(indices), values.shape[1]), np.nan)
+            block_values[indices >= 0] = values[indices[indices >= 0]]
+            cell_data.append(block_values[:, 0] if values.shape[1] == 1 else block_values)
+
+        return cell_data
+
+    def to_xdmf(
+        self,
+        filepath,
+        compression: str = "gzip",
+        compression_opts: int = 4,
+        append: bool = False,
+        method: ReduceMethod | str = ReduceMethod.MEAN,
+    ):
+        """Export the results as an XDMF time series. The data of a step is written to the HDF5 file before the next
+        step is processed, so the exported data of all steps is never held in memory at once.
+
+        Integration point data is exported as cell data, reduced to a single value per element.
+
+        :param compression: HDF5 compression. None, "lzf" or "gzip"
+        :param compression_opts: The gzip compression level
+        :param append: Add the steps to an existing XDMF time series of the same mesh
+        :param method: The reduction of the integration point values of each element
+        """
+        from ada.fem.formats.xdmf import XdmfTimeSeriesWriter
+
+        with XdmfTimeSeriesWriter(filepath, compression, compression_opts, append=append) as writer:
+            if append is False:
+                writer.write_points_cells(self.mesh.nodes.coords, [(c.type, c.data) for c in self._get_cell_blocks()])
+
+            for step, step_results in self.iter_results_by_step():
+                point_data = dict()
+                cell_data = dict()
+                for x in step_results:
                     if isinstance(x, NodalFieldData):
-                        point_data[name] = res
+                        point_data[x.name] = x.get_all_values()
                     elif isinstance(x, ElementFieldData) and x.field_pos == x.field_pos.NODAL:
-                        point_data[name] = res
+                        point_data[x.name] = x.get_all_values(method)
                     elif isinstance(x, ElementFieldData) and x.field_pos == x.field_pos.INT:
-                        raise NotImplementedError("Currently not supporting element data directly from int. points")
+                        values = self._get_cell_data(x, method)
+                        if x.name in cell_data:
+                            # Data of the same field split on several results (i.e. per element type)
+                            values = [np.where(np.isnan(a), b, a) for a, b in zip(cell_data[x.name], values)]
+                        cell_data[x.name] = values
                     else:
                         raise ValueError()
 
-                    writer.write_data(x.step, point_data=point_data)
+                writer.write_data(step, point_data=point_data, cell_data=cell_data)
 
     def to_fem_file(self, fem_file: str | pathlib.Path):
         if isinstance(fem_file, str):
@@ -337,3 +414,9 @@ class FEAResult:
             m = EigenMode(x.step, f_hz=x.eigen_freq, eigenvalue=x.eigen_value)
             modes.append(m)
         return EigenDataSummary(modes)
+
+
+def to_rgba_255(colors: np.ndarray) -> np.ndarray:
+    """Convert (num_vertices, 3) colours (0-1) to integer rgb colours (0-255) with an alpha column"""
+    rgb = (np.asarray(colors) * 255).astype(np.int32)
+    return np.column_stack([rgb, np.ones(len(rgb), dtype=np.int32)])
@@ -19,6 +19,7 @@ from ..formats.calculix.results import read_calculix_results
 from ..formats.code_aster.results import read_code_aster_results
 from ..formats.sesam.results import read_sesam_results
 from .eigenvalue import EigenDataSummary
+from .frames import FrameCache, ResultFrame
 
 if TYPE_CHECKING:
     from ada import Assembly
@@ -323,13 +324,19 @@ class ResultsMesh:
     vertices: np.ndarray = None
     edges: np.ndarray = None
     faces: np.ndarray = None
+    frames: FrameCache = None
 
     def __post_init__(self):
         self.palette = [(0, 149 / 255, 239 / 255), (1, 0, 0)] if self.palette is None else self.palette
 
     def add_results(self, mesh: meshio.Mesh):
+        from ada.visualize.colors import ColorMap
+
         self.mesh = mesh
         self.vertices = np.asarray(mesh.points, dtype="float32")
+        self.frames = FrameCache(
+            self.vertices, self._get_point_data, color_map=ColorMap(self.palette), colorize_function=magnitude
+        )
 
         edges, faces = get_edges_and_faces_from_meshio(mesh)
         self.edges = np.asarray(edges, dtype="uint16").ravel()
@@ -366,20 +373,17 @@ class ResultsMesh:
         self.renderer.controls.append(self.render_sets)
         return True
 
-    def colorize_data(self, data, func=magnitude):
-        res = [func(d) for d in data]
-        sorte = sorted(res)
-        min_r = sorte[0]
-        max_r = sorte[-1]
+    def _get_point_data(self, data_type: str) -> np.ndarray:
+        return np.asarray(self.mesh.point_data[data_type], dtype="float32")
 
-        start = np.array(self.palette[0])
-        end = np.array(self.palette[-1])
+    def colorize_data(self, data, func=magnitude):
+        from ada.visualize.colors import DataColorizer
 
-        def curr_p(t):
-            return start + (end - start) * t / (max_r - min_r)
+        return DataColorizer.colorize_data(data, func, self.palette)
 
-        colors = np.asarray([curr_p(x) for x in res], dtype="float32")
-        return colors
+    def get_frame(self, data_type: str, scale: float = 1.0) -> ResultFrame:
+        """The vertices warped by (scale times) the point data and the vertex colours of the point data"""
+        return self.frames.get_frame(data_type, scale)
 
     def create_viz_geom(self, data_type, displ_data=False, renderer: object = None) -> None:
         from ada.visualize.renderer_pythreejs import MyRenderer
@@ -391,8 +395,7 @@ class ResultsMesh:
 
         default_vertex_color = (8, 8, 8)
 
-        data = np.asarray(self.mesh.point_data[data_type], dtype="float32")
-        colors = self.colorize_data(data)
+        colors = self.frames.get_colors(data_type)
 
         if renderer is None:
             renderer = MyRenderer()
@@ -400,10 +403,10 @@ class ResultsMesh:
 
         # deformations
         if displ_data is True:
-            vertices = np.asarray([x + u[:3] for x, u in zip(self.vertices, data)], dtype="float32")
+            vertices = self.frames.get_vertices(data_type)
             if self.undeformed_mesh is None:
                 dark_grey = (0.66, 0.66, 0.66)
-                white_color = np.asarray([dark_grey for x in self.vertices], dtype="float32")
+                white_color = np.full(self.vertices.shape, dark_grey, dtype="float32")
                 o_mesh = faces_to_mesh("undeformed", self.vertices, self.faces, white_color, opacity=0.5)
                 self.undeformed_mesh = o_mesh
                 renderer._displayed_non_pickable_objects.add(o_mesh)
@@ -413,8 +416,6 @@ class ResultsMesh:
                 renderer._displayed_non_pickable_objects.remove(self.undeformed_mesh)
                 self.undeformed_mesh = None
 
-        vertices = np.array(vertices, dtype=np.float32)
-
         # Colours
         mesh = faces_to_mesh("deformed", vertices, self.faces, colors)
         points = vertices_to_mesh("deformed_vertices", vertices, default_vertex_color)
@@ -466,18 +467,17 @@ class ResultsMesh:
 
         id_map = dict()
         for step in step_names:
-            data = np.asarray(self.mesh.point_data[step], dtype="float32")
             if step.lower() in ["forc", "stress"]:
-                vertices = np.asarray([x for x, u in zip(self.vertices, data)], dtype="float32")
+                vertices = self.vertices
             else:
                 try:
-                    vertices = np.asarray([x + u[:3] for x, u in zip(self.vertices, data)], dtype="float32")
-                except IndexError:
+                    vertices = self.frames.get_vertices(step)
+                except ValueError:
                     logger.warning(f"Data step {step} contains invalid data. Skipping")
                     continue
             try:
-                colors = self.colorize_data(data)
-            except IndexError:
+                colors = self.frames.get_colors(step)
+            except (IndexError, ValueError):
                 logger.warning(f"Data step {step} was unable to colorize data. Skipping")
                 continue
 
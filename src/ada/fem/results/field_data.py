@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 import numpy as np
 
+from .id_map import IdIndexMap
+
+if TYPE_CHECKING:
+    from ada.fem.results.common import Mesh
+
 
 @dataclass
 class FieldData:
@@ -16,6 +21,9 @@ class FieldData:
     eigen_freq: float = None
     eigen_value: float = None
 
+    # The mesh of the result the field data belongs to. Set by FEAResult
+    _mesh: Mesh = field(default=None, init=False, repr=False, compare=False)
+
 
 class NodalFieldType(Enum):
     DISP = "displacement"
@@ -45,80 +53,143 @@ class FieldPosition(Enum):
     INT = "integration_point"
 
 
+class ReduceMethod(Enum):
+    MEAN = "mean"
+    MAX = "max"
+    MIN = "min"
+    SUM = "sum"
+
+
+_REDUCE_UFUNCS = {
+    ReduceMethod.MEAN: np.add,
+    ReduceMethod.SUM: np.add,
+    ReduceMethod.MAX: np.maximum,
+    ReduceMethod.MIN: np.minimum,
+}
+
+
+def group_reduce(keys: np.ndarray, values: np.ndarray, method: ReduceMethod | str = ReduceMethod.MEAN):
+    """Reduce all rows of values sharing the same key in a single pass.
+
+    :return: The sorted unique keys and the reduced values (one row per unique key)
+    """
+    method = ReduceMethod(method)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    if len(unique_keys) == 0:
+        return unique_keys, values[:0]
+
+    order = np.argsort(inverse, kind="stable")
+    counts = np.bincount(inverse)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    result = _REDUCE_UFUNCS[method].reduceat(values[order], starts, axis=0)
+    if method == ReduceMethod.MEAN:
+        result = result / counts.reshape((-1,) + (1,) * (result.ndim - 1))
+
+    return unique_keys, result
+
+
+def group_to_array(keys: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Scatter values into a (num unique keys, max rows per key) array keeping the original row order per key.
+    Keys with fewer rows than the maximum are padded with NaN.
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    counts = np.bincount(inverse, minlength=len(unique_keys))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_inverse = inverse[order]
+    rank = np.arange(len(order)) - starts[sorted_inverse]
+
+    result = np.full((len(unique_keys), counts.max(initial=0)) + values.shape[1:], np.nan)
+    result[sorted_inverse, rank] = values[order]
+    return unique_keys, result
+
+
 @dataclass
 class ElementFieldData(FieldData):
     """Values from element integration points"""
 
     field_pos: FieldPosition = FieldPosition.NODAL
     COLS: ClassVar[list[str]] = ["elem_label", "sec_num"]
+    NODAL_COLS: ClassVar[list[str]] = ["elem_label", "sec_num", "node_label"]
     int_positions: list[tuple] = None
 
     def get_by_element_id(self, elem_ids: list[int], int_points: list[int] = None) -> ElementFieldData:
-        data = []
-        for x in self.values:
-            if int(x[0]) not in elem_ids:
+        mask = np.isin(self.values[:, 0].astype(int), elem_ids)
+        if int_points is not None:
+            mask &= np.isin(self.values[:, 1], int_points)
+
+        return ElementFieldData(
+            self.name,
+            self.step,
+            self.components,
+            self.values[mask],
+            field_pos=self.field_pos,
+            int_positions=self.int_positions,
+        )
+
+    def _get_component_values(self) -> np.ndarray:
+        cols = self.NODAL_COLS if self.field_pos == FieldPosition.NODAL else self.COLS
+        return self.values[:, len(cols) :]
+
+    def get_element_values(self, method: ReduceMethod | str = ReduceMethod.MEAN) -> tuple[np.ndarray, np.ndarray]:
+        """Reduce the integration point (or element nodal) values of each element to a single row per element"""
+        return group_reduce(self.values[:, 0].astype(int), self._get_component_values(), method)
+
+    def get_nodal_values(
+        self, method: ReduceMethod | str = ReduceMethod.MEAN, mesh: Mesh = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Reduce the element data to a single row per node.
+
+        Element nodal data is reduced directly on the node label. Integration point data is first reduced per element
+        and then extrapolated (as a constant value per element) to the nodes of each element using the mesh.
+
+        :param mesh: The mesh of the element data. Default is the mesh of the FEAResult the data belongs to
+        :return: The sorted node ids and their reduced values
+        """
+        if self.field_pos == FieldPosition.NODAL:
+            return group_reduce(self.values[:, 2].astype(int), self._get_component_values(), method)
+
+        mesh = mesh if mesh is not None else self._mesh
+        if mesh is None:
+            raise ValueError("A mesh is required to extrapolate integration point data to nodes")
+
+        elem_ids, elem_values = self.get_element_values(method)
+        elem_map = IdIndexMap(elem_ids)
+        node_ids = []
+        node_values = []
+        for block in mesh.elements:
+            indices = elem_map.get_indices(block.identifiers, fill_value=-1)
+            mask = indices >= 0
+            if not mask.any():
                 continue
-            if int_points is not None and x[1] not in int_points:
-                continue
-            data.append(x)
-
-        return ElementFieldData(self.name, self.step, self.components, np.array(data))
-
-    def _get_field_nodal(self, cr: int):
-        nodes = self.values[:, 2]
-        unique_nodes = np.unique(nodes)
-        num_unique = len(unique_nodes)
-
-        result_data = np.arange(0, num_unique)
-
-        for i, unique_nodal in enumerate(unique_nodes):
-            instances = np.where(nodes == unique_nodal)
-            if cr != -1:
-                field_data = self.values[instances, cr[0] : cr[-1]].ravel()
-            else:
-                field_data = self.values[instances, cr].ravel()
-            averaged_data = sum(field_data) / len(field_data)
-            result_data[i] = averaged_data
-
-        return result_data
-
-    def _get_field_int(self, cr) -> np.ndarray | dict[str, np.ndarray]:
-        elements = self.values[:, 0]
-        unique_element_ids = np.unique(elements)
-        num_unique = len(unique_element_ids)
-
-        if cr != -1:
-            num_int_points = int(len(self.values) / num_unique)
-            result_dict = {}
-            for j, x in enumerate(self.components, start=cr[0]):
-                result_data = np.zeros((num_unique, num_int_points))
-                for i, unique_elements in enumerate(unique_element_ids):
-                    instances = np.where(elements == unique_elements)
-                    comp = self.values[instances, j]
-                    result_data[i] = comp
-
-                result_dict[x] = [result_data]
-
-            return result_dict
-        else:
-            num_int_points = int(len(self.values) / num_unique) * len(self.components)
-            result_data = np.zeros((num_unique, num_int_points))
-            for i, unique_elements in enumerate(unique_element_ids):
-                instances = np.where(elements == unique_elements)
-                field_data = self.values[instances, cr].ravel()
-                result_data[i] = field_data
+            node_refs = block.node_refs[mask]
+            node_ids.append(node_refs.ravel())
+            node_values.append(np.repeat(elem_values[indices[mask]], node_refs.shape[1], axis=0))
 
-                return result_data
+        if len(node_ids) == 0:
+            return group_reduce(np.zeros(0, dtype=int), elem_values[:0], method)
 
-    def get_all_values(self):
-        num_cols = len(self.COLS)
-        num_comp = len(self.components)
-        cr = list(range(num_cols, num_cols + num_comp + 1)) if num_comp != 0 else -1
+        return group_reduce(np.concatenate(node_ids), np.concatenate(node_values), method)
+
+    def _get_field_nodal(self, method: ReduceMethod | str = ReduceMethod.MEAN) -> np.ndarray:
+        _, result = self.get_nodal_values(method)
+        if result.shape[1] == 1:
+            return result[:, 0]
+        return result
+
+    def _get_field_int(self) -> np.ndarray | dict[str, np.ndarray]:
+        _, result = group_to_array(self.values[:, 0].astype(int), self._get_component_values())
+
+        if len(self.components) == 0:
+            return result.reshape((len(result), -1))
+
+        return {x: [result[:, :, j]] for j, x in enumerate(self.components)}
 
+    def get_all_values(self, method: ReduceMethod | str = ReduceMethod.MEAN):
         if self.field_pos == self.field_pos.NODAL:
-            return self._get_field_nodal(cr)
+            return self._get_field_nodal(method)
         else:
-            return self._get_field_int(cr)
+            return self._get_field_int()
 
 
 class LineSectionIntegrationPoints:
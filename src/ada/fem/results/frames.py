@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+import numpy as np
+
+from ada.visualize.colors import ColorMap, DataColorizer, get_scalar_values
+
+
+@dataclass
+class ResultFrame:
+    """Ready to render buffers of a single step (or eigen mode)"""
+
+    vertices: np.ndarray
+    colors: np.ndarray
+
+
+class FrameCache:
+    """Vertex and colour buffers of result steps for rendering and animation.
+
+    The colours and the displacements (the first 3 components of the warp data) of a step are computed once and
+    kept as float32 arrays. Frames at other warp scales (i.e. when animating a mode shape) only scale the cached
+    displacements.
+
+    :param vertices: The undeformed (num_nodes, 3) vertex positions
+    :param get_data: Returns the (nodal) data used to colour a step
+    :param get_warp_data: Returns the displacements of a step. Default is get_data
+    :param color_map: Default is a colour map of the default palette
+    :param colorize_function: Reduces each row of data to the value mapped to a colour. Default is the magnitude
+    :param vectorized: The colorize function is called once with the transposed data instead of once per row
+    """
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        get_data: Callable[[Hashable], np.ndarray],
+        get_warp_data: Callable[[Hashable], np.ndarray] = None,
+        color_map: ColorMap = None,
+        colorize_function: Callable = None,
+        vectorized: bool = False,
+    ):
+        self.vertices = np.asarray(vertices, dtype="float32")
+        self.get_data = get_data
+        self.get_warp_data = get_data if get_warp_data is None else get_warp_data
+        self.color_map = ColorMap(DataColorizer.default_palette) if color_map is None else color_map
+        self.colorize_function = colorize_function
+        self.vectorized = vectorized
+        self._colors: dict[Hashable, np.ndarray] = dict()
+        self._displacements: dict[Hashable, np.ndarray] = dict()
+
+    def get_colors(self, key: Hashable) -> np.ndarray:
+        if key not in self._colors:
+            values = get_scalar_values(self.get_data(key), self.colorize_function, self.vectorized)
+            self._colors[key] = self.color_map.map(values)
+        return self._colors[key]
+
+    def get_displacements(self, key: Hashable) -> np.ndarray:
+        if key not in self._displacements:
+            data = np.asarray(self.get_warp_data(key), dtype="float32")
+            if data.ndim != 2 or data.shape[1] < 3 or len(data) != len(self.vertices):
+                raise ValueError(f'Data "{key}" of shape {data.shape} can not be used to warp the vertices')
+            self._displacements[key] = np.ascontiguousarray(data[:, :3])
+        return self._displacements[key]
+
+    def get_vertices(self, key: Hashable, scale: float = 1.0) -> np.ndarray:
+        if scale == 0.0:
+            return self.vertices
+        return self.vertices + np.float32(scale) * self.get_displacements(key)
+
+    def get_frame(self, key: Hashable, scale: float = 1.0, warp_key: Hashable = None) -> ResultFrame:
+        """The vertices warped by the displacements of the step (scaled) and the vertex colours of the step.
+
+        :param key: The step to colour by
+        :param scale: The scale of the displacements. Use 0.0 for the undeformed vertices
+        :param warp_key: The step to warp by. Default is key
+        """
+        warp_key = key if warp_key is None else warp_key
+        return ResultFrame(self.get_vertices(warp_key, scale), self.get_colors(key))
+
+    def iter_frames(self, keys: list[Hashable], scale: float = 1.0):
+        for key in keys:
+            yield key, self.get_frame(key, scale)
+
+    def clear(self) -> None:
+        self._colors = dict()
+        self._displacements = dict()
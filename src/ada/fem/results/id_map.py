@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class IdIndexMap:
+    """Maps identifiers (i.e. node or element ids) to their index in an array of identifiers.
+
+    A dense lookup table indexed by id is used when the ids are compact. Otherwise the ids are sorted once and looked
+    up using np.searchsorted. Either way a lookup of m ids among n identifiers is O(m) or O(m log n) instead of the
+    O(n·m) of searching the identifiers for each id. If an id occurs more than once, its first index is returned.
+
+    :param identifiers: The identifiers (integer valued)
+    :param source: The object the map is built from. Used to check if a cached map is still valid. Default is
+        identifiers
+    """
+
+    # A dense table is used when the range of ids is at most this many times the number of ids
+    MAX_DENSE_RATIO = 4
+
+    def __init__(self, identifiers: np.ndarray, source=None):
+        self.source = identifiers if source is None else source
+
+        ids = np.asarray(identifiers).astype(np.int64, copy=False).ravel()
+        self._size = len(ids)
+        self._table = None
+        self._min_id = 0
+        self._sorted_ids = None
+        self._order = None
+        if len(ids) == 0:
+            self._sorted_ids, self._order = ids, ids
+            return
+
+        self._min_id = int(ids.min())
+        id_range = int(ids.max()) - self._min_id + 1
+        if id_range <= self.MAX_DENSE_RATIO * len(ids):
+            # Assigning in reverse order makes the first occurrence of a repeated id win
+            self._table = np.full(id_range, -1, dtype=np.int64)
+            self._table[ids[::-1] - self._min_id] = np.arange(len(ids) - 1, -1, -1)
+        else:
+            self._order = np.argsort(ids, kind="stable")
+            self._sorted_ids = ids[self._order]
+
+    def __len__(self):
+        return self._size
+
+    def is_valid_for(self, source) -> bool:
+        return self.source is source
+
+    def get_indices(self, ids: np.ndarray | list[int] | int, fill_value: int = None) -> np.ndarray:
+        """The indices of the given ids. The result has the same shape as ids.
+
+        :param ids: The ids to look up
+        :param fill_value: Index returned for ids not found. If None a ValueError is raised for missing ids
+        """
+        ids = np.asarray(ids)
+        flat = ids.astype(np.int64, copy=False).ravel()
+
+        if self._table is not None:
+            pos = flat - self._min_id
+            found = (pos >= 0) & (pos < len(self._table))
+            indices = np.full(len(flat), -1, dtype=np.int64)
+            indices[found] = self._table[pos[found]]
+        elif self._size > 0:
+            pos = np.minimum(np.searchsorted(self._sorted_ids, flat), self._size - 1)
+            indices = np.where(self._sorted_ids[pos] == flat, self._order[pos], -1)
+        else:
+            indices = np.full(len(flat), -1, dtype=np.int64)
+
+        missing = indices < 0
+        if missing.any():
+            if fill_value is None:
+                missing_ids = np.unique(flat[missing])
+                raise ValueError(f"Unable to find {len(missing_ids)} ids, i.e. {missing_ids[:10].tolist()}")
+            indices[missing] = fill_value
+
+        return indices.reshape(ids.shape)
+
+    def contains(self, ids: np.ndarray | list[int]) -> np.ndarray:
+        """Boolean mask of the ids that are present"""
+        return self.get_indices(ids, fill_value=-1) >= 0
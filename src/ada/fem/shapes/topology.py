@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from ada.config import logger
+
+from .definitions import MassTypes, ShellShapes, SolidShapes
+from .lines import line_edges
+from .shells import shell_edges, shell_faces
+from .solids import solid_edges, solid_faces
+
+# Local (per element) node index templates. Applied to a (num_elements, num_nodes) connectivity array using numpy
+# fancy indexing, i.e. node_refs[:, template], they give the edges or faces of all elements of a block at once.
+EDGE_TEMPLATES = {
+    el_type: np.array(seq, dtype=int) for el_type, seq in {**line_edges, **shell_edges, **solid_edges}.items()
+}
+FACE_TEMPLATES = {el_type: np.array(seq, dtype=int) for el_type, seq in {**shell_faces, **solid_faces}.items()}
+
+
+def get_block_edges(el_type, node_refs: np.ndarray) -> np.ndarray | None:
+    """The edges of all elements of a block as a (num_elements * num_edges, 2) array. The edges of each element are
+    given in the order of the edge template of the element type.
+
+    :param el_type: The element type of the block
+    :param node_refs: The (num_elements, num_nodes) connectivity
+    """
+    template = EDGE_TEMPLATES.get(el_type)
+    if template is None:
+        raise ValueError(f"Element type {el_type} is currently not supported for Visualization")
+
+    return _apply_template(template, node_refs, el_type)
+
+
+def get_block_face_polygons(el_type, node_refs: np.ndarray) -> np.ndarray | None:
+    """The faces of all elements of a block as a (num_elements * num_faces, num_face_nodes) array. Solid elements
+    have triangular or quadrilateral faces, while shell faces are triangles."""
+    template = FACE_TEMPLATES.get(el_type)
+    if template is None:
+        raise ValueError(f"Element type {el_type} is currently not supported for Visualization")
+
+    return _apply_template(template, node_refs, el_type)
+
+
+def _apply_template(template: np.ndarray, node_refs: np.ndarray, el_type) -> np.ndarray | None:
+    node_refs = np.asarray(node_refs)
+    if template.max() >= node_refs.shape[1]:
+        logger.error(f"Element type {el_type} with {node_refs.shape[1]} nodes does not match its node template")
+        return None
+
+    return node_refs[:, template].reshape(-1, template.shape[1])
+
+
+def triangulate(polygons: np.ndarray) -> np.ndarray:
+    """Split (convex) polygons into triangles as a fan from the first node. A quad (0, 1, 2, 3) gives the triangles
+    (0, 1, 2) and (0, 2, 3)."""
+    num_nodes = polygons.shape[1]
+    if num_nodes == 3:
+        return polygons
+
+    fan = np.array([(0, i, i + 1) for i in range(1, num_nodes - 1)], dtype=int)
+    return polygons[:, fan].reshape(-1, 3)
+
+
+def unique_edges(edges: np.ndarray) -> np.ndarray:
+    """Remove repeated edges (i.e. edges shared by neighbouring elements) regardless of direction. The first
+    occurrence of each edge is kept in its original order and direction."""
+    if len(edges) == 0:
+        return edges
+
+    sorted_edges = np.sort(edges, axis=1).astype(np.int64)
+    keys = sorted_edges[:, 0] * (int(sorted_edges.max()) + 1) + sorted_edges[:, 1]
+    _, index = np.unique(keys, return_index=True)
+    return edges[np.sort(index)]
+
+
+def boundary_faces(polygons: np.ndarray) -> np.ndarray:
+    """The faces occurring only once, i.e. faces that are not shared by two solid elements. Faces are compared on
+    their sorted nodes, so shared faces are found regardless of their orientation."""
+    if len(polygons) == 0:
+        return polygons
+
+    # Each sorted row is viewed as a single opaque value, which is much faster to sort than rows (np.unique(axis=0))
+    sorted_rows = np.ascontiguousarray(np.sort(polygons, axis=1).astype(np.int64))
+    keys = sorted_rows.view(np.dtype((np.void, sorted_rows.itemsize * sorted_rows.shape[1]))).ravel()
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    return polygons[counts[inverse] == 1]
+
+
+def get_edges_and_faces(
+    blocks: Iterable[tuple], remove_duplicate_edges: bool = False, boundary_only: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Extract the edges and triangulated faces of element blocks.
+
+    Mass elements are skipped, and line elements only contribute edges.
+
+    :param blocks: Pairs of element type and (num_elements, num_nodes) connectivity. The connectivity should refer to
+        the nodes by index for the edges and faces to be used with a vertex array.
+    :param remove_duplicate_edges: Keep only a single copy of edges shared by elements
+    :param boundary_only: Skip the interior faces shared by two solid elements
+    :return: A (num_edges, 2) edge and a (num_faces, 3) face array
+    """
+    edges = []
+    faces = []
+    solid_polygons = dict()
+    for el_type, node_refs in blocks:
+        if isinstance(el_type, MassTypes):
+            continue
+
+        block_edges = get_block_edges(el_type, node_refs)
+        if block_edges is None:
+            continue
+        edges.append(block_edges)
+
+        if not isinstance(el_type, (ShellShapes, SolidShapes)):
+            continue
+
+        polygons = get_block_face_polygons(el_type, node_refs)
+        if polygons is None:
+            continue
+        if boundary_only and isinstance(el_type, SolidShapes):
+            # Faces of different solid blocks may be shared, so they are collected before the boundary is found
+            solid_polygons.setdefault(polygons.shape[1], []).append(polygons)
+            continue
+        faces.append(triangulate(polygons))
+
+    for polygons in solid_polygons.values():
+        faces.append(triangulate(boundary_faces(np.concatenate(polygons))))
+
+    edges = np.concatenate(edges) if len(edges) > 0 else np.zeros((0, 2), dtype=int)
+    faces = np.concatenate(faces) if len(faces) > 0 else np.zeros((0, 3), dtype=int)
+    if remove_duplicate_edges:
+        edges = unique_edges(edges)
+
+    return edges, faces
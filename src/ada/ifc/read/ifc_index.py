@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import ifcopenshell
+from ifcopenshell.util.element import get_container
+
+from ada.config import logger
+
+from .reader_utils import read_property_set
+
+
+@dataclass
+class IfcIndex:
+    """Property sets, parents and representation items of the products of an IFC file by product id. The index is
+    built by a single pass over each type of relationship instead of following the inverse attributes of every product.
+
+    :param f: The IFC file
+    """
+
+    f: ifcopenshell.file
+
+    # Property sets (name, props) of each product. The property sets shared by several products are read once
+    _property_sets: dict[int, list[tuple[str, dict]]] = field(default_factory=dict, init=False)
+
+    # The relating element of each related element in the order of precedence used by reader_utils.get_parent
+    _voids: dict[int, ifcopenshell.entity_instance] = field(default_factory=dict, init=False)
+    _fills: dict[int, ifcopenshell.entity_instance] = field(default_factory=dict, init=False)
+    _containers: dict[int, ifcopenshell.entity_instance] = field(default_factory=dict, init=False)
+    _decomposes: dict[int, ifcopenshell.entity_instance] = field(default_factory=dict, init=False)
+
+    # The product owning each representation item. Built on first use
+    _item_products: dict[int, ifcopenshell.entity_instance] = field(default=None, init=False)
+
+    def __post_init__(self):
+        f = self.f
+        property_sets = dict()
+        for rel in f.by_type("IfcRelDefinesByProperties"):
+            property_set = rel.RelatingPropertyDefinition
+            if property_set.is_a("IfcElementQuantity"):
+                continue
+            if property_set.id() not in property_sets:
+                property_sets[property_set.id()] = read_property_set(property_set)
+            for obj in rel.RelatedObjects:
+                self._property_sets.setdefault(obj.id(), []).append(property_sets[property_set.id()])
+
+        relationships = [
+            ("IfcRelVoidsElement", "RelatingBuildingElement", "RelatedOpeningElement", self._voids),
+            ("IfcRelFillsElement", "RelatingOpeningElement", "RelatedBuildingElement", self._fills),
+            ("IfcRelContainedInSpatialStructure", "RelatingStructure", "RelatedElements", self._containers),
+            ("IfcRelAggregates", "RelatingObject", "RelatedObjects", self._decomposes),
+        ]
+        for rel_type, relating_attr, related_attr, parents in relationships:
+            for rel in f.by_type(rel_type):
+                relating = getattr(rel, relating_attr)
+                related = getattr(rel, related_attr)
+                for obj in related if isinstance(related, tuple) else [related]:
+                    parents.setdefault(obj.id(), relating)
+
+    def get_property_sets(self, product: ifcopenshell.entity_instance) -> dict:
+        """Returns a dictionary of {pset_id: {prop_id: value}} like reader_utils.get_ifc_property_sets"""
+        props = dict()
+        for pset_name, pset_props in self._property_sets.get(product.id(), []):
+            props[pset_name] = {
+                key: list(value) if isinstance(value, list) else value for key, value in pset_props.items()
+            }
+        return props
+
+    def get_parent(self, product: ifcopenshell.entity_instance) -> ifcopenshell.entity_instance:
+        """Returns the same parent as reader_utils.get_parent"""
+        product_id = product.id()
+        if product.is_a("IfcOpeningElement"):
+            return self._voids[product_id]
+        if product.is_a("IfcElement"):
+            for parents in (self._fills, self._containers):
+                if product_id in parents:
+                    return parents[product_id]
+        if product_id in self._decomposes:
+            return self._decomposes[product_id]
+
+        return get_container(product)
+
+    def get_product_of_item(self, item: ifcopenshell.entity_instance) -> ifcopenshell.entity_instance | None:
+        """Returns the product with a shape representation containing the representation item"""
+        if self._item_products is None:
+            self._item_products = dict()
+            for product in self.f.by_type("IfcProduct"):
+                if product.Representation is None:
+                    continue
+                for representation in product.Representation.Representations:
+                    for rep_item in representation.Items:
+                        self._item_products.setdefault(rep_item.id(), product)
+
+        return self._item_products.get(item.id())
+
+    def get_products(
+        self, ifc_classes: Iterable[str] = None, storeys: Iterable[str] = None, guids: Iterable[str] = None
+    ) -> list[ifcopenshell.entity_instance]:
+        """Returns the products of the IFC file in file order. The products are optionally filtered by IFC class
+        (including subclasses), by the spatial elements (e.g. IfcBuildingStorey) they are (directly or indirectly)
+        part of, and by GlobalId.
+
+        :param ifc_classes: Names of IFC classes, e.g. ["IfcBeam", "IfcPlate"]
+        :param storeys: Names or GlobalIds of spatial elements
+        :param guids: GlobalIds of products
+        """
+        products = self.f.by_type("IfcProduct")
+
+        if guids is not None:
+            guids = set(guids)
+            products = [x for x in products if x.GlobalId in guids]
+            missing = guids - set(x.GlobalId for x in products)
+            if len(missing) > 0:
+                logger.warning(f"No IFC products found with GlobalIds {sorted(missing)}")
+
+        if ifc_classes is not None:
+            ifc_classes = list(ifc_classes)
+            products = [x for x in products if any(x.is_a(ifc_class) for ifc_class in ifc_classes)]
+
+        if storeys is not None:
+            storeys = set(storeys)
+            spatial_elements = [
+                x
+                for x in self.f.by_type("IfcProduct")
+                if x.is_a("IfcSpatialStructureElement") and (x.Name in storeys or x.GlobalId in storeys)
+            ]
+            if len(spatial_elements) == 0:
+                logger.warning(f"No spatial elements found with names or GlobalIds {sorted(storeys)}")
+            descendants = self.get_descendants(spatial_elements)
+            products = [x for x in products if x.id() in descendants]
+
+        return list(products)
+
+    def get_descendants(self, ifc_elems: Iterable[ifcopenshell.entity_instance]) -> set[int]:
+        """Returns the ids of the elements decomposing, contained in, filling or voiding the given elements, and of
+        their descendants in turn"""
+        children = dict()
+        for parents in (self._voids, self._fills, self._containers, self._decomposes):
+            for child_id, parent in parents.items():
+                children.setdefault(parent.id(), []).append(child_id)
+
+        descendants = set()
+        queue = [x.id() for x in ifc_elems]
+        while len(queue) > 0:
+            for child_id in children.get(queue.pop(), []):
+                if child_id not in descendants:
+                    descendants.add(child_id)
+                    queue.append(child_id)
+
+        return descendants
@@ -13,6 +13,7 @@ from .read_beam_section import import_section_from_ifc
 from .read_materials import read_material
 from .reader_utils import (
     get_associated_material,
+    get_material_by_name,
     get_placement,
     get_point,
     get_swept_area,
@@ -28,7 +29,7 @@ def import_ifc_beam(ifc_elem, name, ifc_store: IfcStore) -> Beam:
     mat_ref = get_associated_material(ifc_elem)
 
     mat_name = mat_ref.Material.Name if hasattr(mat_ref, "Material") else mat_ref.Name
-    mat = ifc_store.assembly.get_by_name(mat_name)
+    mat = get_material_by_name(ifc_store, mat_name)
     if mat is None:
         mat = read_material(mat_ref, ifc_store)
 
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable
 
+from ada import Pipe
 from ada.base.changes import ChangeAction
 from ada.config import logger
 from ada.ifc.read.read_physical_objects import import_physical_ifc_elem
 from ada.ifc.read.reader_utils import (
     add_to_assembly,
-    get_ifc_property_sets,
-    get_parent,
     resolve_name,
 )
 
+from .ifc_index import IfcIndex
 from .read_materials import MaterialImporter
 from .read_parts import PartImporter
 
 if TYPE_CHECKING:
+    from ada import Material
     from ada.ifc.store import IfcStore
 
 
@@ -24,6 +26,29 @@ if TYPE_CHECKING:
 class IfcReader:
     ifc_store: IfcStore
 
+    # The relationships of the IFC file looked up when loading objects (see get_index)
+    index: IfcIndex = None
+
+    # The materials of the assembly by name while loading objects
+    _materials: dict[str, Material] = field(default_factory=dict, init=False)
+
+    def get_index(self) -> IfcIndex:
+        if self.index is None or self.index.f is not self.ifc_store.f:
+            self.index = IfcIndex(self.ifc_store.f)
+        return self.index
+
+    def get_material(self, name: str) -> Material | None:
+        from ada import Material
+
+        mat = self._materials.get(name)
+        if mat is None:
+            mat = self.ifc_store.assembly.get_by_name(name)
+            if isinstance(mat, Material) is False:
+                return None
+            self._materials[name] = mat
+
+        return mat
+
     def load_spatial_hierarchy(self):
         pi = PartImporter(self.ifc_store)
         pi.load_hierarchies()
@@ -38,21 +63,25 @@ class IfcReader:
             PresentationLayers,
         )
 
+        index = self.get_index()
+        a = self.ifc_store.assembly
+        segments = chain.from_iterable(pipe.segments for pipe in a.get_all_physical_objects(by_type=Pipe))
+        objects_by_guid = {
+            obj.guid: obj
+            for obj in chain(a.get_all_subparts(include_self=True), a.get_all_physical_objects(), segments)
+        }
+
         layers = dict()
         for obj in self.ifc_store.f.by_type("IfcPresentationLayerAssignment"):
             members = []
+            member_guids = set()
             for x in obj.AssignedItems:
-                guid = None
-                for inverse in self.ifc_store.f.get_inverse(x):
-                    if inverse.is_a("IfcShapeRepresentation"):
-                        product = inverse.OfProductRepresentation[0].ShapeOfProduct[0]
-                        guid = product.GlobalId
-                        break
-                elem = self.ifc_store.assembly.get_by_guid(guid)
+                product = index.get_product_of_item(x)
+                elem = objects_by_guid.get(product.GlobalId) if product is not None else None
                 if elem is None:
-                    # raise ValueError()
                     continue
-                if elem not in members:
+                if elem.guid not in member_guids:
+                    member_guids.add(elem.guid)
                     members.append(elem)
 
             pl = PresentationLayer(
@@ -62,16 +91,34 @@ class IfcReader:
 
         self.ifc_store.assembly.presentation_layers = PresentationLayers(layers)
 
-    def load_objects(self, data_only=False, elements2part=None):
-        for product in self.ifc_store.f.by_type("IfcProduct"):
+    def load_objects(
+        self,
+        data_only=False,
+        elements2part=None,
+        ifc_classes: Iterable[str] = None,
+        storeys: Iterable[str] = None,
+        guids: Iterable[str] = None,
+    ):
+        """Import the physical objects. The property sets and parents of the products are looked up in an index of the
+        IFC file built once, and the objects can be filtered using the arguments of IfcIndex.get_products"""
+        a = self.ifc_store.assembly
+        index = self.get_index()
+
+        self._materials = dict()
+        # Keep the first of the parts sharing a name in depth-first order
+        parts_by_name = dict()
+        for p in a.get_all_subparts() + [a]:
+            parts_by_name.setdefault(p.name, p)
+
+        for product in index.get_products(ifc_classes=ifc_classes, storeys=storeys, guids=guids):
             if product.Representation is None or data_only is True:
                 logger.info(f'Passing product "{product}"')
                 continue
 
-            parent = get_parent(product)
+            parent = index.get_parent(product)
             name = product.Name
 
-            props = get_ifc_property_sets(product)
+            props = index.get_property_sets(product)
 
             if name is None:
                 name = resolve_name(props, product)
@@ -83,4 +130,6 @@ class IfcReader:
                 continue
 
             obj.metadata = props
-            add_to_assembly(self.ifc_store.assembly, obj, parent, elements2part)
+            add_to_assembly(a, obj, parent, elements2part, parts_by_name)
+
+        self._materials = dict()
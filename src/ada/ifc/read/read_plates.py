@@ -7,7 +7,7 @@ from ada.config import logger
 
 from .read_curves import import_indexedpolycurve, import_polycurve
 from .read_materials import read_material
-from .reader_utils import get_associated_material
+from .reader_utils import get_associated_material, get_material_by_name
 
 if TYPE_CHECKING:
     from ada.ifc.store import IfcStore
@@ -20,7 +20,8 @@ def import_ifc_plate(ifc_elem, name, ifc_store: IfcStore) -> Plate:
     ifc_mat = get_associated_material(ifc_elem)
     mat = None
     if ifc_store.assembly is not None:
-        mat = ifc_store.assembly.get_by_name(name)
+        mat_name = ifc_mat.Material.Name if hasattr(ifc_mat, "Material") else ifc_mat.Name
+        mat = get_material_by_name(ifc_store, mat_name)
 
     if mat is None:
         mat = read_material(ifc_mat, ifc_store)
@@ -12,7 +12,8 @@ from ada.concepts.transforms import Placement
 from ada.config import Settings, logger
 
 if TYPE_CHECKING:
-    from ada import Assembly, Part, Pipe
+    from ada import Assembly, Material, Part, Pipe
+    from ada.ifc.store import IfcStore
 
 tol_map = dict(m=Settings.mtol, mm=Settings.mmtol)
 
@@ -33,20 +34,40 @@ def get_ifc_property_sets(ifc_elem) -> dict:
         if property_set.is_a("IfcElementQuantity"):
             continue
 
-        pset_name = property_set.Name.split(":")[0].strip()
-        props[pset_name] = dict()
-        for prop in property_set.HasProperties:
-            if prop.is_a() not in ("IfcPropertySingleValue", "IfcPropertyListValue"):
-                continue
-            if prop.is_a("IfcPropertySingleValue"):
-                res = prop.NominalValue.wrappedValue if prop.NominalValue is not None else None
-                props[pset_name][prop.Name] = res
-            else:
-                props[pset_name][prop.Name] = [x.wrappedValue for x in prop.ListValues]
+        pset_name, pset_props = read_property_set(property_set)
+        props[pset_name] = pset_props
 
     return props
 
 
+def read_property_set(property_set) -> tuple[str, dict]:
+    """Returns the name and a dictionary of {prop_id: value} of the single and list values of a property set"""
+    pset_name = property_set.Name.split(":")[0].strip()
+    props = dict()
+    for prop in property_set.HasProperties:
+        if prop.is_a() not in ("IfcPropertySingleValue", "IfcPropertyListValue"):
+            continue
+        if prop.is_a("IfcPropertySingleValue"):
+            res = prop.NominalValue.wrappedValue if prop.NominalValue is not None else None
+            props[prop.Name] = res
+        else:
+            props[prop.Name] = [x.wrappedValue for x in prop.ListValues]
+
+    return pset_name, props
+
+
+def get_material_by_name(ifc_store: IfcStore, name: str) -> Material | None:
+    """The material of the assembly (or its parts) with the given name. While loading IFC content the materials are
+    looked up by name in the reader instead of searching the whole assembly."""
+    from ada import Material
+
+    if ifc_store.reader is not None:
+        return ifc_store.reader.get_material(name)
+
+    mat = ifc_store.assembly.get_by_name(name)
+    return mat if isinstance(mat, Material) else None
+
+
 def get_parent(instance):
     from ifcopenshell.util.element import get_container
 
@@ -140,8 +161,12 @@ def get_org(f, org_id):
     return None
 
 
-def add_to_assembly(assembly: Assembly, obj, ifc_parent, elements2part):
-    from ada import Pipe
+def add_to_assembly(assembly: Assembly, obj, ifc_parent, elements2part, parts_by_name: dict[str, Part] = None):
+    """Add an imported object to its parent found by name.
+
+    :param parts_by_name: The parts of the assembly by name. Parts are looked up here before searching the assembly
+    """
+    from ada import Pipe, PipeSegElbow, PipeSegStraight
 
     pp_name = ifc_parent.Name
 
@@ -155,7 +180,13 @@ def add_to_assembly(assembly: Assembly, obj, ifc_parent, elements2part):
         add_to_parent(assembly, obj)
         imported = True
     else:
-        res = assembly.get_by_name(pp_name)
+        res = None
+        is_pipe_segment = isinstance(obj, (PipeSegStraight, PipeSegElbow))
+        if parts_by_name is not None:
+            # A part with pipe segments is replaced by a pipe (see add_to_parent)
+            res = parts_by_name.get(pp_name) if is_pipe_segment is False else parts_by_name.pop(pp_name, None)
+        if res is None:
+            res = assembly.get_by_name(pp_name)
         if res is not None:
             add_to_parent(res, obj)
             imported = True
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Shape
 
     from ada import Assembly, Section, User
+    from ada.base.root import Root
     from ada.ifc.read.read_ifc import IfcReader
     from ada.ifc.write.write_ifc import IfcWriter
 
@@ -34,6 +35,9 @@ class IfcStore:
     reader: IfcReader = None
     callback: Callable[[int, int], None] | None = None
 
+    # Objects removed from the assembly which are removed from the IFC file on the next sync
+    removed_objects: list[Root] = field(default_factory=list)
+
     def __post_init__(self):
         if self.f is None:
             if self.ifc_file_path is not None:
@@ -111,23 +115,26 @@ class IfcStore:
 
         self.update_owner(a.user)
 
-        num_new_spatial_objects = self.writer.sync_spatial_hierarchy(include_fem=include_fem)
+        # The material and spatial container associations of all new objects are written once at the end
+        with self.writer.batch_associations():
+            num_new_spatial_objects = self.writer.sync_spatial_hierarchy(include_fem=include_fem)
 
-        self.writer.sync_sections()
-        self.writer.sync_materials()
+            self.writer.sync_sections()
+            self.writer.sync_materials()
 
-        num_new_objects = self.writer.sync_added_physical_objects()
+            num_new_objects = self.writer.sync_added_physical_objects()
 
-        self.writer.sync_added_welds()
+            self.writer.sync_added_welds()
 
-        self.writer.sync_mapped_instances()
+            self.writer.sync_mapped_instances()
 
+        # Only the objects flagged as modified or deleted (and the relationships referring to them) are updated
         num_mod = self.writer.sync_modified_physical_objects()
 
-        self.writer.sync_presentation_layers()
-
         num_del = self.writer.sync_deleted_physical_objects()
 
+        self.writer.sync_presentation_layers()
+
         add_str = f"Added {num_new_objects} objects and {num_new_spatial_objects} spatial elements"
         mod_str = f"Modified {num_mod} objects"
         del_str = f"Deleted {num_del} objects"
@@ -140,8 +147,17 @@ class IfcStore:
             f.write(self.f.wrapped_data.to_string())
 
     def load_ifc_content_from_file(
-        self, ifc_file: str | os.PathLike | ifcopenshell.file = None, data_only=False, elements2part=None
+        self,
+        ifc_file: str | os.PathLike | ifcopenshell.file = None,
+        data_only=False,
+        elements2part=None,
+        ifc_classes: Iterable[str] = None,
+        storeys: Iterable[str] = None,
+        guids: Iterable[str] = None,
     ) -> None:
+        """Load the spatial hierarchy, materials, physical objects and presentation layers of the IFC file. Only the
+        products of the given IFC classes, spatial elements (by name or GlobalId) and/or GlobalIds are imported as
+        physical objects if any of these filters are given."""
         from ada.ifc.read.read_ifc import IfcReader
 
         if self.ifc_file_path is None:
@@ -172,7 +188,9 @@ class IfcStore:
         self.reader.load_materials()
 
         # Load physical elements
-        self.reader.load_objects(data_only=data_only, elements2part=elements2part)
+        self.reader.load_objects(
+            data_only=data_only, elements2part=elements2part, ifc_classes=ifc_classes, storeys=storeys, guids=guids
+        )
 
         if target_units is not None:
             self.assembly.units = target_units
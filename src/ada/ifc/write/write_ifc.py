@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable
 
 import ifcopenshell
 import ifcopenshell.geom
+import ifcopenshell.util.element
 
 from ada.base.changes import ChangeAction
+from ada.config import logger
 from ada.ifc.read.reader_utils import get_ifc_body
 from ada.ifc.utils import add_negative_extrusion, create_guid, write_elem_property_sets
 from ada.ifc.write.write_beams import write_ifc_beam
@@ -19,6 +22,7 @@ from ada.ifc.write.write_plates import write_ifc_plate
 from ada.ifc.write.write_sections import export_beam_section_profile_def
 from ada.ifc.write.write_shapes import write_ifc_shape
 from ada.ifc.write.write_spatial_elements import (
+    update_ifc_part,
     write_ifc_part,
     write_ifc_spatial_hierarchy,
 )
@@ -46,6 +50,45 @@ class IfcWriter:
     ifc_store: IfcStore
     callback: Callable[[int, int], None] = None
 
+    # Elements by material guid and by spatial container guid collected while batching associations
+    _material_elements: dict[str, list[ifcopenshell.entity_instance]] = field(default_factory=dict, init=False)
+    _container_elements: dict[str, list[ifcopenshell.entity_instance]] = field(default_factory=dict, init=False)
+    _is_batching: bool = field(default=False, init=False)
+
+    @contextmanager
+    def batch_associations(self):
+        """Collect the elements associated with materials and spatial containers and write each
+        IfcRelAssociatesMaterial and IfcRelContainedInSpatialStructure once (with all its elements) on exit. Appending
+        the elements one by one rebuilds the tuple of related elements every time."""
+        if self._is_batching:
+            yield self
+            return None
+
+        self._is_batching = True
+        try:
+            yield self
+        except BaseException:
+            self._material_elements = dict()
+            self._container_elements = dict()
+            raise
+        finally:
+            self._is_batching = False
+
+        self.flush_associations()
+
+    def flush_associations(self) -> None:
+        """Write the material and spatial container associations collected while batching"""
+        f = self.ifc_store.f
+        for mat_guid, ifc_elems in self._material_elements.items():
+            rel_mat = f.by_guid(mat_guid)
+            rel_mat.RelatedObjects = [*rel_mat.RelatedObjects, *ifc_elems]
+
+        for guid, elements in self._container_elements.items():
+            self._write_spatial_containment(elements, guid)
+
+        self._material_elements = dict()
+        self._container_elements = dict()
+
     def sync_spatial_hierarchy(self, include_fem=False) -> int:
         if len(list(self.ifc_store.f.by_type("IfcSite"))) == 0:
             write_ifc_spatial_hierarchy(self.ifc_store)
@@ -57,7 +100,9 @@ class IfcWriter:
             num_new_spatial_objects += 1
         return num_new_spatial_objects
 
-    def sync_added_physical_objects(self) -> int:
+    def get_material_maps(self) -> tuple[dict, dict]:
+        """The materials of the assembly and the IfcRelAssociatesMaterial relationships by GlobalId (see
+        eval_validity)"""
         a = self.ifc_store.assembly
         mat_map = {mat.guid: mat for mat in a.get_all_materials()}
         rel_mats_map = {
@@ -66,11 +111,17 @@ class IfcWriter:
                 lambda x: x.RelatingMaterial.is_a("IfcMaterial"), self.ifc_store.f.by_type("IfcRelAssociatesMaterial")
             )
         }
+        return mat_map, rel_mats_map
 
-        num_new_objects = len(list(a.get_all_physical_objects()))
+    def sync_added_physical_objects(self) -> int:
+        a = self.ifc_store.assembly
+        mat_map, rel_mats_map = self.get_material_maps()
+
+        all_to_be_added = list(filter(is_added, a.get_all_physical_objects()))
+        num_new_objects = len(all_to_be_added)
         contained_in_spatial = {x.guid: [] for x in a.get_all_parts_in_assembly(include_self=True)}
 
-        for i, to_be_added in enumerate(filter(is_added, a.get_all_physical_objects()), start=1):
+        for i, to_be_added in enumerate(all_to_be_added, start=1):
             self.eval_validity(to_be_added, mat_map, rel_mats_map)
 
             ifc_elem = self.add(to_be_added)
@@ -91,15 +142,49 @@ class IfcWriter:
         return num_new_objects
 
     def sync_modified_physical_objects(self) -> int:
+        """Rewrite the IFC elements of the modified objects. The old elements (with their geometry, openings and
+        property sets) are removed and the objects are written again with the same GlobalId. Modified parts have their
+        name and placement updated. All other elements are left untouched."""
+        a = self.ifc_store.assembly
+        f = self.ifc_store.f
+
         num_mod = 0
-        for to_be_modified in filter(is_modified, self.ifc_store.assembly.get_all_physical_objects()):
-            self.create_ifc_openings(to_be_modified)
-            to_be_modified.change_type = ChangeAction.NOCHANGE
+        for part in filter(is_modified, a.get_all_parts_in_assembly()):
+            update_ifc_part(self.ifc_store, part)
+            part.change_type = ChangeAction.NOCHANGE
             num_mod += 1
-        return num_mod
+
+        to_be_modified = list(filter(is_modified, a.get_all_physical_objects()))
+        if len(to_be_modified) == 0:
+            return num_mod
+
+        # The objects are validated before any element is removed, i.e. a new material must be added to a part first
+        mat_map, rel_mats_map = self.get_material_maps()
+        for obj in to_be_modified:
+            self.eval_validity(obj, mat_map, rel_mats_map)
+
+        existing_ifc_elems = []
+        for obj in to_be_modified:
+            try:
+                existing_ifc_elems.append(f.by_guid(obj.guid))
+            except RuntimeError:
+                logger.debug(f'"{obj.name}" is not yet written to IFC and is added')
+
+        self.remove_ifc_elems(existing_ifc_elems)
+
+        with self.batch_associations():
+            for obj in to_be_modified:
+                ifc_elem = self.add(obj)
+                self.create_ifc_openings(obj, ifc_elem)
+                write_elem_property_sets(obj.metadata, ifc_elem, f, self.ifc_store.owner_history)
+                self.add_related_elements_to_spatial_container([ifc_elem], obj.parent.guid)
+                obj.change_type = ChangeAction.NOCHANGE
+
+        return num_mod + len(to_be_modified)
 
     def sync_added_welds(self):
-        for weld in self.ifc_store.assembly.welds:
+        for weld in filter(is_added, self.ifc_store.assembly.welds):
+            weld.change_type = ChangeAction.NOCHANGE
             ifc_weld = write_ifc_fastener(weld)
             self.add_related_elements_to_spatial_container([ifc_weld], weld.parent.guid)
             if weld.groove is None:
@@ -119,12 +204,40 @@ class IfcWriter:
                 )
 
     def sync_deleted_physical_objects(self) -> int:
-        num_mod = 0
-        for to_be_modified in filter(is_deleted, self.ifc_store.assembly.get_all_physical_objects()):
-            self.create_ifc_openings(to_be_modified)
-            to_be_modified.change_type = ChangeAction.NOCHANGE
-            num_mod += 1
-        return num_mod
+        """Remove the IFC elements of the objects removed from the assembly (see Root.remove) and of the objects
+        flagged as deleted, which are removed from their parts as well."""
+        from ada import Part
+
+        a = self.ifc_store.assembly
+        f = self.ifc_store.f
+
+        for obj in list(filter(is_deleted, a.get_all_physical_objects())):
+            obj.remove()
+
+        removed_objects = self.ifc_store.removed_objects
+        if len(removed_objects) == 0:
+            return 0
+
+        self.ifc_store.removed_objects = []
+
+        ifc_elems = []
+        removed_guids = set()
+        for obj in removed_objects:
+            removed_guids.add(obj.guid)
+            if isinstance(obj, Part):
+                removed_guids.update(x.guid for x in obj.get_all_physical_objects())
+            try:
+                ifc_elems.append(f.by_guid(obj.guid))
+            except RuntimeError:
+                logger.debug(f'"{obj.name}" is not written to IFC')
+
+        # The elements of removed parts are removed along with the spatial elements containing them
+        self.remove_ifc_elems(ifc_elems)
+
+        for layer in a.presentation_layers.layers.values():
+            layer.members = [mem for mem in layer.members if mem.guid not in removed_guids]
+
+        return len(removed_objects)
 
     def sync_presentation_layers(self) -> int:
         from ada import Part, Penetration, Pipe
@@ -145,6 +258,12 @@ class IfcWriter:
             else:
                 assigned_items_.append(ifc_body_)
 
+        # The existing layers and the openings (by name) are looked up once for all layers
+        existing_layers = dict()
+        for ifc_layer in f.by_type("IfcPresentationLayerAssignment"):
+            existing_layers.setdefault(ifc_layer.Name, ifc_layer)
+        openings_by_name = None
+
         for layer in self.ifc_store.assembly.presentation_layers.layers.values():
             assigned_items = []
             for member in layer.members:
@@ -155,24 +274,22 @@ class IfcWriter:
                 elif isinstance(member, Part):
                     continue
                 elif isinstance(member, Penetration):
-                    for ifc_opening in f.by_type("IfcOpeningElement"):
-                        if ifc_opening.Name != member.name:
-                            continue
+                    if openings_by_name is None:
+                        openings_by_name = dict()
+                        for ifc_opening in f.by_type("IfcOpeningElement"):
+                            openings_by_name.setdefault(ifc_opening.Name, []).append(ifc_opening)
+                    for ifc_opening in openings_by_name.get(member.name, []):
                         append_bodies(ifc_opening, assigned_items)
 
                 else:
                     append_bodies(member.guid, assigned_items)
 
-            exist_layer = None
-            for ifc_layer in f.by_type("IfcPresentationLayerAssignment"):
-                if ifc_layer.Name == layer.name:
-                    exist_layer = ifc_layer
-                    break
+            exist_layer = existing_layers.get(layer.name, None)
             if len(assigned_items) == 0:
                 continue
 
             if exist_layer is None:
-                f.create_entity(
+                existing_layers[layer.name] = f.create_entity(
                     "IfcPresentationLayerAssignment",
                     Name=layer.name,
                     Description=layer.description,
@@ -185,8 +302,10 @@ class IfcWriter:
                 )
             else:
                 updated_assigned_items = list(exist_layer.AssignedItems)
+                existing_ids = set(ai.id() for ai in updated_assigned_items)
                 for ai in assigned_items:
-                    if ai not in updated_assigned_items:
+                    if ai.id() not in existing_ids:
+                        existing_ids.add(ai.id())
                         updated_assigned_items.append(ai)
                 exist_layer.AssignedItems = updated_assigned_items
 
@@ -260,6 +379,99 @@ class IfcWriter:
                         RelatedOpeningElement=ifc_opening,
                     )
 
+    def remove_ifc_elems(self, ifc_elems: Iterable[ifcopenshell.entity_instance]) -> None:
+        """Remove IFC elements along with the elements they decompose, contain or are voided by (e.g. the physical
+        elements of a spatial element, the segments of a pipe and openings), and their placement, geometry, styles
+        and property sets.
+
+        The removed elements are dropped from the relationships relating them. Relationships left without related
+        objects are removed, except the associations with materials which are kept for objects written later.
+
+        :param ifc_elems: The IFC elements to remove
+        """
+        f = self.ifc_store.f
+
+        # The elements to remove by id in the order found. Elements decomposing or contained in another are found
+        # after it and removed before it
+        to_be_removed: dict[int, ifcopenshell.entity_instance] = dict()
+        # The relationships to remove and the relationships to drop removed (related) elements from
+        removed_rels: dict[int, ifcopenshell.entity_instance] = dict()
+        related_to_drop: dict[tuple[int, int], tuple[ifcopenshell.entity_instance, set[int]]] = dict()
+
+        queue = list(ifc_elems)
+        while len(queue) > 0:
+            ifc_elem = queue.pop(0)
+            if ifc_elem.id() in to_be_removed:
+                continue
+            to_be_removed[ifc_elem.id()] = ifc_elem
+
+            for rel in f.get_inverse(ifc_elem):
+                if rel.is_a("IfcRelationship") is False:
+                    continue
+
+                relating = [rel[i] for i in range(len(rel)) if rel.attribute_name(i).startswith("Relating")]
+                related = [(i, rel[i]) for i in range(len(rel)) if rel.attribute_name(i).startswith("Related")]
+
+                if ifc_elem in relating:
+                    if rel.is_a("IfcRelDecomposes") or rel.is_a("IfcRelContainedInSpatialStructure"):
+                        for _, value in related:
+                            queue.extend(value if isinstance(value, tuple) else [value])
+                    removed_rels[rel.id()] = rel
+                    continue
+
+                for i, value in related:
+                    if isinstance(value, tuple) and ifc_elem in value:
+                        related_to_drop.setdefault((rel.id(), i), (rel, set()))[1].add(ifc_elem.id())
+                    elif value == ifc_elem:
+                        removed_rels[rel.id()] = rel
+
+        for (rel_id, i), (rel, drop_ids) in related_to_drop.items():
+            if rel_id in removed_rels:
+                continue
+            remaining = [x for x in rel[i] if x.id() not in drop_ids]
+            if len(remaining) > 0 or (
+                rel.is_a("IfcRelAssociatesMaterial") and rel.RelatingMaterial.is_a("IfcMaterial")
+            ):
+                setattr(rel, rel.attribute_name(i), remaining)
+            else:
+                removed_rels[rel_id] = rel
+
+        # Profiles are shared by the sections of the model and are kept even if no element uses them
+        protected = set(f.by_type("IfcProfileDef"))
+
+        for rel in removed_rels.values():
+            # Property sets and material usages (e.g. the profile set of a beam) which are not shared
+            definitions = None
+            if rel.is_a("IfcRelDefinesByProperties"):
+                definitions = rel.RelatingPropertyDefinition
+            elif rel.is_a("IfcRelAssociatesMaterial") and rel.RelatingMaterial.is_a("IfcMaterial") is False:
+                definitions = rel.RelatingMaterial
+
+            f.remove(rel)
+            if definitions is None:
+                continue
+            for definition in definitions if isinstance(definitions, tuple) else [definitions]:
+                ifcopenshell.util.element.remove_deep2(f, definition, do_not_delete=protected)
+
+        for ifc_elem in reversed(to_be_removed.values()):
+            # Styles and presentation layers refer to the geometry of the element
+            styles_and_layers = dict()
+            for x in f.traverse(ifc_elem):
+                if x.is_a("IfcRepresentation") or x.is_a("IfcRepresentationItem"):
+                    for inverse in f.get_inverse(x):
+                        if inverse.is_a("IfcStyledItem") or inverse.is_a("IfcPresentationLayerAssignment"):
+                            styles_and_layers[inverse.id()] = inverse
+
+            ifcopenshell.util.element.remove_deep2(
+                f, ifc_elem, also_consider=list(styles_and_layers.values()), do_not_delete=protected
+            )
+
+            for inverse in styles_and_layers.values():
+                if inverse.is_a("IfcStyledItem") and inverse.Item is None:
+                    ifcopenshell.util.element.remove_deep2(f, inverse)
+                elif inverse.is_a("IfcPresentationLayerAssignment") and len(inverse.AssignedItems) == 0:
+                    f.remove(inverse)
+
     def eval_validity(self, to_be_added, mat_map, rel_mats_map):
         from ada import Pipe, Shape, Wall
 
@@ -277,15 +489,26 @@ class IfcWriter:
                     raise ValueError(f"Object {to_be_added.material} is not among synced materials {rel_mats_map}")
 
     def add_related_elements_to_spatial_container(self, elements: list[ifcopenshell.entity_instance], guid: str):
-        parent_ifc_elem = self.ifc_store.get_by_guid(guid)
+        if self._is_batching:
+            self._container_elements.setdefault(guid, []).extend(elements)
+            return None
 
-        existing_spatial = None
-        for existing_rel in self.ifc_store.f.by_type("IfcRelContainedInSpatialStructure"):
-            if parent_ifc_elem == existing_rel.RelatingStructure:
-                existing_spatial = existing_rel
-                break
+        self._write_spatial_containment(elements, guid)
 
-        if existing_spatial is not None:
+    def _write_spatial_containment(self, elements: list[ifcopenshell.entity_instance], guid: str):
+        parent_ifc_elem = self.ifc_store.get_by_guid(guid)
+
+        # Spatial elements refer to their containment relationship by the inverse attribute "ContainsElements"
+        existing_rels = getattr(parent_ifc_elem, "ContainsElements", None)
+        if existing_rels is None:
+            existing_rels = [
+                rel
+                for rel in self.ifc_store.f.by_type("IfcRelContainedInSpatialStructure")
+                if rel.RelatingStructure == parent_ifc_elem
+            ]
+
+        if len(existing_rels) > 0:
+            existing_spatial = existing_rels[0]
             existing_spatial.OwnerHistory = self.ifc_store.owner_history
             existing_spatial.RelatedElements = list(existing_spatial.RelatedElements) + elements
         else:
@@ -304,6 +527,11 @@ class IfcWriter:
             rel_mat = self.ifc_store.f.by_guid(material.guid)
         except RuntimeError as e:
             raise RuntimeError(e)
+
+        if self._is_batching:
+            self._material_elements.setdefault(material.guid, []).append(ifc_elem)
+            return rel_mat
+
         related_objects = [*rel_mat.RelatedObjects, ifc_elem]
         rel_mat.RelatedObjects = related_objects
         return rel_mat
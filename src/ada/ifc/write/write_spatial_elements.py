@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import ifcopenshell.util.element
+
 from ada.fem.formats.ifc.writer import to_ifc_fem
 from ada.ifc.utils import create_guid, create_local_placement, write_elem_property_sets
 
@@ -27,6 +29,10 @@ def write_ifc_part(ifc_store: IfcStore, part: Part, include_fem):
     return ifc_part
 
 
+def update_ifc_part(ifc_store: IfcStore, part: Part):
+    return SpatialWriter(ifc_store).update_ifc_part(part)
+
+
 @dataclass
 class SpatialWriter:
     ifc_store: IfcStore
@@ -142,3 +148,25 @@ class SpatialWriter:
         write_elem_property_sets(part.metadata, ifc_elem, f, owner_history)
 
         return ifc_elem
+
+    def update_ifc_part(self, part: Part):
+        """Write the name and placement of a modified part to its existing IFC element. The placement is updated in
+        place, as the placements of the elements of the part are relative to it."""
+        from ada.base.ifc_types import SpatialTypes as ITyp
+
+        f = self.ifc_store.f
+        ifc_elem = f.by_guid(part.guid)
+        ifc_elem.Name = part.name
+
+        new_placement = create_local_placement(
+            f, origin=part.placement.origin, loc_x=part.placement.xdir, loc_z=part.placement.zdir
+        )
+        old_axis2placement = ifc_elem.ObjectPlacement.RelativePlacement
+        ifc_elem.ObjectPlacement.RelativePlacement = new_placement.RelativePlacement
+        f.remove(new_placement)
+        ifcopenshell.util.element.remove_deep2(f, old_axis2placement)
+
+        if part.ifc_class == ITyp.IfcBuildingStorey:
+            ifc_elem.Elevation = float(part.placement.origin[2])
+
+        return ifc_elem
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pathlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from ada.config import Settings, logger
+
+if TYPE_CHECKING:
+    from OCC.Core.TopoDS import TopoDS_Shape
+
+    from ada import Beam, Section, Shape
+    from ada.sections.concept import GeneralProperties
+
+
+class GeomCache:
+    """Memoises OCC geometry on a hash of the inputs used to build it. Optionally the geometry is also stored as
+    BREP files in cache_dir so that it can be reused across sessions. The cached shapes are shared (not copied)
+    between all objects with equal geometry and must not be modified in place.
+
+    :param cache_dir: Directory of the on-disk BREP store. If None only the in-memory cache is used
+    :param max_size: Maximum number of shapes kept in memory (least recently used shapes are dropped first)
+    """
+
+    def __init__(self, cache_dir: str | pathlib.Path = None, max_size: int = 10000):
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else None
+        self.max_size = max_size
+        self._shapes: OrderedDict[str, TopoDS_Shape] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def __contains__(self, key: str):
+        return key in self._shapes or (self._brep_path(key) is not None and self._brep_path(key).exists())
+
+    def _brep_path(self, key: str) -> pathlib.Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.brep"
+
+    def _remember(self, key: str, shape: TopoDS_Shape) -> None:
+        self._shapes[key] = shape
+        self._shapes.move_to_end(key)
+        while len(self._shapes) > self.max_size:
+            self._shapes.popitem(last=False)
+
+    def get(self, key: str) -> TopoDS_Shape | None:
+        shape = self._shapes.get(key)
+        if shape is not None:
+            self._shapes.move_to_end(key)
+            return shape
+
+        brep_path = self._brep_path(key)
+        if brep_path is None or brep_path.exists() is False:
+            return None
+
+        try:
+            shape = read_brep(brep_path)
+        except BaseException as e:
+            logger.warning(f'Unable to read cached geometry "{brep_path}" due to "{e}"')
+            return None
+
+        self._remember(key, shape)
+        return shape
+
+    def put(self, key: str, shape: TopoDS_Shape) -> None:
+        self._remember(key, shape)
+        brep_path = self._brep_path(key)
+        if brep_path is None:
+            return None
+
+        os.makedirs(brep_path.parent, exist_ok=True)
+        write_brep(shape, brep_path)
+
+    def get_or_create(self, key: str | None, create: Callable[[], TopoDS_Shape]) -> TopoDS_Shape:
+        """Return the cached shape of key or create (and cache) it. If key is None the shape is not cached"""
+        if key is None:
+            return create()
+
+        shape = self.get(key)
+        if shape is not None:
+            self.hits += 1
+            return shape
+
+        self.misses += 1
+        shape = create()
+        self.put(key, shape)
+        return shape
+
+    def clear(self, include_disk=False) -> None:
+        self._shapes.clear()
+        self.hits = 0
+        self.misses = 0
+        if include_disk and self.cache_dir is not None and self.cache_dir.exists():
+            for brep_file in self.cache_dir.glob("*.brep"):
+                os.remove(brep_file)
+
+
+_geom_cache = GeomCache(Settings.geom_cache_dir)
+
+
+def get_geom_cache() -> GeomCache:
+    return _geom_cache
+
+
+def set_geom_cache(geom_cache: GeomCache) -> None:
+    global _geom_cache
+    _geom_cache = geom_cache
+
+
+def read_brep(brep_path: pathlib.Path) -> TopoDS_Shape:
+    from OCC.Core.BRep import BRep_Builder
+    from OCC.Core.BRepTools import breptools_Read
+    from OCC.Core.TopoDS import TopoDS_Shape
+
+    shape = TopoDS_Shape()
+    breptools_Read(shape, str(brep_path), BRep_Builder())
+    if shape.IsNull():
+        raise ValueError("Empty shape")
+    return shape
+
+
+def write_brep(shape: TopoDS_Shape, brep_path: pathlib.Path) -> None:
+    from OCC.Core.BRepTools import breptools_Write
+
+    breptools_Write(shape, str(brep_path))
+
+
+def _arr(value) -> tuple | None:
+    if value is None:
+        return None
+    if hasattr(value, "p"):
+        value = value.p
+    return tuple(float(x) for x in np.asarray(value, dtype=float).ravel())
+
+
+def _points_key(points) -> tuple | None:
+    if points is None:
+        return None
+    return tuple(_arr(p) for p in points)
+
+
+def section_key(sec: Section) -> tuple:
+    outer = sec.poly_outer.points2d if sec.poly_outer is not None else None
+    inner = sec.poly_inner.points2d if sec.poly_inner is not None else None
+    props = (sec.type, sec.h, sec.w_top, sec.w_btn, sec.t_w, sec.t_ftop, sec.t_fbtn, sec.r, sec.wt)
+    key = (*[str(x) if isinstance(x, str) else x for x in props], _points_key(outer), _points_key(inner))
+    if sec.type == sec.TYPES.GENERAL:
+        key += (general_properties_digest(sec.properties),)
+    return key
+
+
+def general_properties_digest(props: GeneralProperties) -> str:
+    """A digest of the property values (rounded to 10 significant digits) that is stable across sessions"""
+    values = [getattr(props, x.name) for x in dataclasses.fields(props) if x.name != "parent"]
+    rounded = [None if x is None else f"{float(x):.10g}" for x in values]
+    return hashlib.sha1(repr(rounded).encode()).hexdigest()
+
+
+def shape_key(shp: Shape) -> tuple | None:
+    """Hashable key of the parameters defining a primitive. Returns None for shapes that are not parametric"""
+    from ada import PrimBox, PrimCyl, PrimExtrude, PrimRevolve, PrimSphere, PrimSweep
+
+    place = shp.placement
+    key = (type(shp).__name__, _arr(place.origin), _arr(place.xdir), _arr(place.zdir))
+    if isinstance(shp, PrimBox):
+        return key + (_arr(shp.p1), _arr(shp.p2))
+    elif isinstance(shp, PrimCyl):
+        return key + (_arr(shp.p1), _arr(shp.p2), float(shp.r))
+    elif isinstance(shp, PrimSphere):
+        return key + (_arr(shp.cog), float(shp.radius))
+    elif isinstance(shp, PrimExtrude):
+        poly = shp.poly.placement
+        return key + (float(shp.extrude_depth), _points_key(shp.poly.points2d), _arr(poly.origin), _arr(poly.xdir))
+    elif isinstance(shp, PrimRevolve):
+        poly = shp.poly.placement
+        angle = float(shp.revolve_angle)
+        return key + (angle, _arr(shp.revolve_origin), _points_key(shp.poly.points2d), _arr(poly.xdir), _arr(poly.zdir))
+    elif isinstance(shp, PrimSweep):
+        return key + (_points_key(shp.sweep_curve.points3d), _points_key(shp.profile_curve_outer.points2d))
+
+    return None
+
+
+def beam_geom_key(beam: Beam, geom_repr: str) -> str | None:
+    """A hash of all inputs used to build the geometry of a beam. Returns None if the geometry cannot be cached
+    (i.e. a penetration is not a parametric primitive)."""
+    key = [geom_repr, _arr(beam.n1.p), _arr(beam.n2.p)]
+    if geom_repr != "line":
+        include_ecc = Settings.model_export.include_ecc
+        key += [include_ecc, _arr(beam.e1) if include_ecc else None, _arr(beam.e2) if include_ecc else None]
+        key += [_arr(beam.xvec), _arr(beam.yvec), _arr(beam.up), section_key(beam.section), section_key(beam.taper)]
+        for pen in beam.penetrations:
+            pen_key = shape_key(pen.primitive)
+            if pen_key is None:
+                return None
+            key.append(pen_key)
+
+    return hashlib.sha1(repr(key).encode()).hexdigest()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import difflib
+import json
+import pathlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+
+_PROFILE_DB_JSON = pathlib.Path(__file__).resolve().parent / "resources" / "ProfileDB.json"
+
+DIM_COLS = ["h", "w", "t_w", "t_f"]
+PROP_COLS = ["Ax", "Ix", "Iy", "Iz", "Wxmin", "Wymin", "Wzmin", "Shary", "Sharz", "Sy", "Sz", "Cy", "Cz"]
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    """Dimensions (in meters) of a standard profile"""
+
+    family: str
+    name: str
+    h: float
+    w: float
+    t_w: float
+    t_f: float
+
+
+class ProfileDB:
+    """Standard profile dimensions kept in numpy arrays with prebuilt indexes by name and family.
+
+    Use get_profile_db() to get the shared instance loaded from the bundled ProfileDB.json.
+    """
+
+    def __init__(self, families: Iterable[str], names: Iterable[str], dims: np.ndarray):
+        self.families = np.asarray(list(families), dtype=str)
+        self.names = np.asarray(list(names), dtype=str)
+        self.dims = np.asarray(dims, dtype=float).reshape((len(self.names), len(DIM_COLS)))
+        self._by_name = {name.upper(): i for i, name in enumerate(self.names)}
+        self._by_family = {fam: np.flatnonzero(self.families == fam) for fam in np.unique(self.families)}
+        self._properties = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name: str):
+        return name.upper() in self._by_name
+
+    @staticmethod
+    def from_json(json_file: str | pathlib.Path = _PROFILE_DB_JSON) -> ProfileDB:
+        with open(json_file) as data_file:
+            profile_db = json.load(data_file)["ProfileDB"]
+
+        families, names, dims = [], [], []
+        for family, profiles in profile_db.items():
+            for name, props in profiles.items():
+                families.append(family)
+                names.append(name)
+                dims.append([float(props[key]) for key in ("Height", "Width", "t_w", "t_f")])
+
+        return ProfileDB(families, names, np.array(dims))
+
+    @staticmethod
+    def from_npz(npz_file: str | pathlib.Path) -> ProfileDB:
+        data = np.load(npz_file)
+        return ProfileDB(data["families"], data["names"], data["dims"])
+
+    def to_npz(self, npz_file: str | pathlib.Path) -> None:
+        """Compact binary serialisation of the profile dimensions"""
+        np.savez_compressed(npz_file, families=self.families, names=self.names, dims=self.dims)
+
+    @property
+    def family_names(self) -> list[str]:
+        return list(self._by_family.keys())
+
+    def _record(self, index: int) -> ProfileRecord:
+        return ProfileRecord(str(self.families[index]), str(self.names[index]), *[float(x) for x in self.dims[index]])
+
+    def get_by_name(self, name: str) -> ProfileRecord | None:
+        index = self._by_name.get(name.upper())
+        if index is None:
+            return None
+        return self._record(index)
+
+    def get(self, family: str, dim: str) -> ProfileRecord | None:
+        """Return the profile of a family by its dimension string (i.e. "300" for IPE300 or "200x10" for HP200x10)"""
+        if family == "IP":
+            family = "IPE"
+
+        if family not in self._by_family:
+            return None
+
+        record = self.get_by_name(family + str(dim))
+        if record is not None or "x" not in str(dim):
+            return record
+
+        sec_dim = [int(float(x)) for x in str(dim).split("x")]
+        return self.get_by_name(f"{family}{sec_dim[0]}x{sec_dim[1]}")
+
+    def get_many(self, names: Iterable[str]) -> list[ProfileRecord | None]:
+        """Batch lookup of profiles by name"""
+        return [self.get_by_name(name) for name in names]
+
+    def get_family(self, family: str) -> list[ProfileRecord]:
+        return [self._record(i) for i in self._by_family.get(family, [])]
+
+    def get_closest_names(self, name: str, num: int = 3, cutoff: float = 0.6) -> list[str]:
+        """Fuzzy matching of profile names (i.e. to suggest alternatives for misspelled profile names)"""
+        matches = difflib.get_close_matches(name.upper(), self._by_name.keys(), n=num, cutoff=cutoff)
+        return [str(self.names[self._by_name[x]]) for x in matches]
+
+    def get_nearest(
+        self, family: str, h: float = None, w: float = None, t_w: float = None, t_f: float = None
+    ) -> ProfileRecord | None:
+        """Return the profile of a family with dimensions closest (relative difference) to the given dimensions.
+        Dimensions set to None are not considered."""
+        indices = self._by_family.get(family)
+        if indices is None:
+            return None
+
+        target = np.array([h, w, t_w, t_f], dtype=float)
+        cols = ~np.isnan(target)
+        if not cols.any():
+            raise ValueError("At least one dimension is needed to find the nearest profile")
+
+        rel_diff = (self.dims[indices][:, cols] - target[cols]) / target[cols]
+        return self._record(indices[np.argmin(np.linalg.norm(rel_diff, axis=1))])
+
+    def get_properties_table(self) -> np.ndarray:
+        """Precomputed cross section properties of all profiles as a structured array (in meters)"""
+        if self._properties is None:
+            self._properties = self._calc_properties_table()
+        return self._properties
+
+    def _calc_properties_table(self) -> np.ndarray:
+        from .utils import profile_db_collect
+
+        dtype = [("family", self.families.dtype), ("name", self.names.dtype)]
+        dtype += [(x, float) for x in DIM_COLS + PROP_COLS]
+        table = np.zeros(len(self), dtype=dtype)
+        table["family"] = self.families
+        table["name"] = self.names
+        for i, col in enumerate(DIM_COLS):
+            table[col] = self.dims[:, i]
+
+        for i, (family, name) in enumerate(zip(self.families, self.names)):
+            props = profile_db_collect(str(family), str(name)[len(family) :]).properties
+            for col in PROP_COLS:
+                table[col][i] = getattr(props, col)
+
+        return table
+
+
+@lru_cache(maxsize=None)
+def get_profile_db() -> ProfileDB:
+    """The bundled profile database. It is loaded once and shared."""
+    return ProfileDB.from_json()
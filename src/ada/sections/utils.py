@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-import json
-import pathlib
 import re
-from collections import OrderedDict
 
 import ada.core.utils
 from ada.base.units import Units
@@ -11,6 +8,7 @@ from ada.core.exceptions import UnsupportedUnits
 
 from . import Section
 from .categories import SectionCat
+from .profile_db import get_profile_db
 
 digit = r"\d{0,5}\.?\d{0,5}|\d{0,5}|\d{0,5}\/\d{0,5}"
 flex = r"?:\.|[A-Z]|"
@@ -28,42 +26,21 @@ def profile_db_collect(sec_type: str, dim: str, units: Units = Units.M):
     if scale_factor is None:
         raise UnsupportedUnits(f'Units "{units}" is not supported')
 
-    if sec_type == "IP":
-        sec_type = "IPE"
-    dir_path = pathlib.Path(__file__).resolve().parent
-
-    with open(dir_path / "resources" / "ProfileDB.json") as data_file:
-        profile_db_main = json.load(data_file, object_pairs_hook=OrderedDict)
-
-    profile_db = profile_db_main["ProfileDB"]
-    sec_dim = [int(x) for x in dim.split("x")]
-    sec_name_alt1 = sec_type + str(dim)
-
-    if "x" in str(dim):
-        sec_name_alt2 = sec_type + str(sec_dim[0]) + "x" + str(sec_dim[1])
-    else:
-        sec_name_alt2 = "Unknown"
-
-    if sec_type not in profile_db.keys():
-        return None
-
-    if sec_name_alt1 in profile_db[sec_type]:
-        sec_name = sec_name_alt1
-    elif sec_name_alt2 in profile_db[sec_type]:
-        sec_name = sec_name_alt2
-    else:
+    record = get_profile_db().get(sec_type, dim)
+    if record is None:
         return None
 
-    h = float(profile_db[sec_type][sec_name]["Height"]) * scale_factor
-    w_top = float(profile_db[sec_type][sec_name]["Width"]) * scale_factor
-    w_btn = float(profile_db[sec_type][sec_name]["Width"]) * scale_factor
-    t_w = float(profile_db[sec_type][sec_name]["t_w"]) * scale_factor
-    t_fbtn = float(profile_db[sec_type][sec_name]["t_f"]) * scale_factor
-    t_ftop = float(profile_db[sec_type][sec_name]["t_f"]) * scale_factor
+    sec_name = record.name
+    h = record.h * scale_factor
+    w_top = record.w * scale_factor
+    w_btn = record.w * scale_factor
+    t_w = record.t_w * scale_factor
+    t_fbtn = record.t_f * scale_factor
+    t_ftop = record.t_f * scale_factor
 
     return Section(
         sec_name,
-        sec_type=sec_type,
+        sec_type=record.family,
         h=h,
         w_top=w_top,
         w_btn=w_btn,
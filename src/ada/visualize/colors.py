@@ -19,34 +19,83 @@ class PbrMetallicRoughness:
     roughnessFactor: float
 
 
+@dataclass
+class ColorMap:
+    """A lookup table of colours interpolated linearly between the colours of a palette. Values are mapped to colours
+    by indexing the table, i.e. without evaluating the palette for every value.
+
+    :param palette: The colours (rgb 0-1) at evenly spaced positions from the min to the max value
+    :param num_colors: Number of colours in the lookup table
+    """
+
+    palette: list[tuple]
+    num_colors: int = 256
+
+    def __post_init__(self):
+        palette = np.asarray(self.palette, dtype="float32")
+        positions = np.linspace(0.0, 1.0, len(palette))
+        t = np.linspace(0.0, 1.0, self.num_colors)
+        self.table = np.column_stack([np.interp(t, positions, palette[:, i]) for i in range(palette.shape[1])])
+        self.table = self.table.astype("float32")
+
+    def map(self, values: np.ndarray, vmin: float = None, vmax: float = None) -> np.ndarray:
+        """The colours of the values as a (num_values, 3) array. Values outside vmin and vmax (default is the min and
+        max of values) are given the first or last colour"""
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return np.zeros((0, self.table.shape[1]), dtype="float32")
+
+        vmin = np.nanmin(values) if vmin is None else vmin
+        vmax = np.nanmax(values) if vmax is None else vmax
+        if vmax > vmin:
+            t = (values - vmin) / (vmax - vmin)
+        else:
+            t = np.zeros_like(values)
+
+        indices = np.rint(np.nan_to_num(t) * (self.num_colors - 1)).astype(int)
+        return self.table[np.clip(indices, 0, self.num_colors - 1)]
+
+
 class DataColorizer:
     default_palette = [(0, 149 / 255, 239 / 255), (1, 0, 0)]
 
     @staticmethod
-    def colorize_data(data: np.ndarray, func=None, palette=None):
-        if func is None:
-            shape = data.shape
-            num_cols = shape[1]
-            if num_cols in (3, 6):
-                func = magnitude
-            elif num_cols == 1:
-                func = magnitude1d
-
+    def colorize_data(data: np.ndarray, func=None, palette=None, num_colors: int = 256, vectorized: bool = False):
+        """Colours (rgb 0-1) of the rows of data. The rows are reduced to a single value by func (default is the
+        magnitude of the first 3 components of vector data) before they are mapped to the palette. Set vectorized to
+        call func once with the transposed data instead of once per row."""
         palette = DataColorizer.default_palette if palette is None else palette
+        values = get_scalar_values(data, func, vectorized)
+        return ColorMap(palette, num_colors).map(values)
 
-        res = [func(d) for d in data]
-        sorte = sorted(res)
-        min_r = sorte[0]
-        max_r = sorte[-1]
 
-        start = np.array(palette[0])
-        end = np.array(palette[-1])
+def get_scalar_values(data: np.ndarray, func=None, vectorized: bool = False) -> np.ndarray:
+    """Reduce the rows of data to a single value each.
 
-        def curr_p(t):
-            return start + (end - start) * t / (max_r - min_r)
+    The function is called per row unless vectorized is True, in which case it is called once with the transposed
+    data (i.e. func(u) with u[0] being the first component of all rows). The magnitude functions of this module are
+    always called vectorized.
+    """
+    data = np.asarray(data)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
 
-        colors = np.asarray(list([curr_p(x) for x in res]), dtype="float32")
-        return colors
+    if func is None:
+        if data.shape[1] == 1:
+            return data[:, 0]
+        if data.shape[1] < 3:
+            raise ValueError(f"Unable to colorize data with {data.shape[1]} components without a colorize function")
+        return np.linalg.norm(data[:, :3], axis=1)
+
+    if vectorized or func in _VECTORIZED_FUNCTIONS:
+        values = np.asarray(func(data.T), dtype=float)
+        if values.shape == (1, len(data)):
+            return values[0]
+        if values.shape != (len(data),):
+            raise ValueError(f"The vectorized colorize function returned values of shape {values.shape}")
+        return values
+
+    return np.asarray([func(d) for d in data], dtype=float).reshape(len(data), -1)[:, 0]
 
 
 def magnitude(u):
@@ -59,3 +108,6 @@ def magnitude2d(u):
 
 def magnitude1d(u):
     return u
+
+
+_VECTORIZED_FUNCTIONS = (magnitude, magnitude2d, magnitude1d)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from ada.ifc.utils import create_guid
 from ada.visualize.concept import ObjectMesh, PartMesh, VisMesh
 
@@ -15,9 +13,8 @@ def export_results_to_assembly_mesh(results: "Results", data_type) -> VisMesh:
     name = results.assembly.name
 
     res_mesh = results.result_mesh
-    data = np.asarray(res_mesh.mesh.point_data[data_type], dtype="float32")
-    vertices = np.asarray([x + u[:3] for x, u in zip(res_mesh.vertices, data)], dtype="float32")
-    colors = res_mesh.colorize_data(data)
+    frame = res_mesh.get_frame(data_type)
+    vertices, colors = frame.vertices, frame.colors
     faces = res_mesh.faces
     guid = create_guid(name)
     id_map = {
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Dict, Iterable, List
 import numpy as np
 
 from ada import FEM
-from ada.fem.utils import is_line_elem
 
 from .renderer_occ import occ_shape_to_faces
 
@@ -52,24 +51,16 @@ def get_vertices_from_fem(fem: FEM) -> np.ndarray:
     return np.asarray([n.p for n in fem.nodes.nodes], dtype="float32")
 
 
-def get_faces_from_fem(fem: FEM):
-    ids = []
-    for el in fem.elements.elements:
-        if is_line_elem(el):
-            continue
-        for f in el.shape.faces:
-            # Convert to indices, not id
-            ids += [[int(e.id - 1) for e in f]]
-    return ids
-
-
-def get_edges_from_fem(fem: FEM):
-    ids = []
-    for el in fem.elements.elements:
-        for f in el.shape.edges_seq:
-            # Convert to indices, not id
-            ids += [[int(el.nodes[e].id - 1) for e in f]]
-    return ids
+def get_faces_from_fem(fem: FEM) -> np.ndarray:
+    """The triangulated faces of the shell and solid elements referring to the nodes by their index"""
+    _, faces = fem.to_mesh().get_edges_and_faces_from_mesh()
+    return faces
+
+
+def get_edges_from_fem(fem: FEM) -> np.ndarray:
+    """The edges of the elements referring to the nodes by their index"""
+    edges, _ = fem.to_mesh().get_edges_and_faces_from_mesh()
+    return edges
 
 
 def organize_by_colour(objects: Iterable[ObjectMesh]) -> Dict[tuple, List[ObjectMesh]]:
@@ -0,0 +1,170 @@
+"""Timing and memory measurement of benchmarks with JSON baselines and comparison of benchmark runs"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import pathlib
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+SCALES = ["small", "medium", "large", "xlarge"]
+
+# Number of nodes/elements and number of beams of the synthetic models at each scale
+NUM_ELEM = dict(small=1_000, medium=10_000, large=100_000, xlarge=1_000_000)
+NUM_BEAMS = dict(small=100, medium=1_000, large=10_000, xlarge=50_000)
+
+DEFAULT_THRESHOLD = 0.2
+
+
+def get_scale() -> str:
+    scale = os.getenv("ADA_BENCH_SCALE", "small")
+    if scale not in SCALES:
+        raise ValueError(f'Unknown benchmark scale "{scale}". Use one of {SCALES}')
+    return scale
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    times: list[float]
+    peak_memory: int = None
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict:
+        return dict(**asdict(self), min=self.min, median=self.median)
+
+    @staticmethod
+    def from_dict(data: dict) -> BenchmarkResult:
+        return BenchmarkResult(data["name"], data["size"], data["times"], data.get("peak_memory"))
+
+
+@dataclass
+class BenchmarkRun:
+    scale: str
+    results: dict[str, BenchmarkResult] = field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
+
+    def add(self, result: BenchmarkResult) -> None:
+        self.results[result.name] = result
+
+    def to_json(self, json_file: str | os.PathLike) -> None:
+        json_file = pathlib.Path(json_file)
+        os.makedirs(json_file.parent, exist_ok=True)
+        data = dict(
+            scale=self.scale,
+            metadata=self.metadata,
+            results={name: res.to_dict() for name, res in self.results.items()},
+        )
+        with open(json_file, "w") as f:
+            json.dump(data, f, indent=2)
+
+    @staticmethod
+    def from_json(json_file: str | os.PathLike) -> BenchmarkRun:
+        with open(json_file) as f:
+            data = json.load(f)
+
+        results = {name: BenchmarkResult.from_dict(res) for name, res in data["results"].items()}
+        return BenchmarkRun(data["scale"], results, data.get("metadata", dict()))
+
+
+def get_metadata() -> dict:
+    return dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        processor=platform.processor(),
+        time=time.strftime("%Y-%m-%dT%H:%M:%S"),
+    )
+
+
+def measure(
+    name: str, func: Callable, size: int, setup: Callable = None, repeat: int = 3, trace_memory: bool = True
+) -> BenchmarkResult:
+    """Time func repeat times. If setup is given it is called before each run and its return value is passed to
+    func. The peak memory is measured with tracemalloc in a separate run so that it does not distort the timings."""
+    times = []
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if trace_memory:
+        args = (setup(),) if setup is not None else ()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(name, size, times, peak_memory)
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: BenchmarkResult | None
+    current: BenchmarkResult | None
+    threshold: float
+
+    @property
+    def time_ratio(self) -> float | None:
+        if self.baseline is None or self.current is None:
+            return None
+        return self.current.min / self.baseline.min
+
+    @property
+    def memory_ratio(self) -> float | None:
+        if self.baseline is None or self.current is None:
+            return None
+        if not self.baseline.peak_memory or self.current.peak_memory is None:
+            return None
+        return self.current.peak_memory / self.baseline.peak_memory
+
+    @property
+    def is_regression(self) -> bool:
+        ratios = [r for r in (self.time_ratio, self.memory_ratio) if r is not None]
+        return any(r > 1 + self.threshold for r in ratios)
+
+
+def compare_runs(baseline: BenchmarkRun, current: BenchmarkRun, threshold=DEFAULT_THRESHOLD) -> list[Comparison]:
+    """Compare the best time and the peak memory of each benchmark. A benchmark is flagged as a regression if it is
+    slower or uses more memory than the baseline by more than threshold (relative)."""
+    if baseline.scale != current.scale:
+        raise ValueError(f'Benchmarks run at different scales ("{baseline.scale}" and "{current.scale}")')
+
+    names = list(baseline.results.keys()) + [x for x in current.results.keys() if x not in baseline.results]
+    return [Comparison(x, baseline.results.get(x), current.results.get(x), threshold) for x in names]
+
+
+def _fmt_ratio(ratio: float | None) -> str:
+    return "-" if ratio is None else f"{ratio:.2f}x"
+
+
+def comparison_report(comparisons: list[Comparison]) -> str:
+    lines = [f"{'Benchmark':<50} {'Baseline [s]':>12} {'Current [s]':>12} {'Time':>8} {'Memory':>8}"]
+    for comp in comparisons:
+        base = f"{comp.baseline.min:.4f}" if comp.baseline is not None else "-"
+        curr = f"{comp.current.min:.4f}" if comp.current is not None else "-"
+        flag = " REGRESSION" if comp.is_regression else ""
+        time_ratio, memory_ratio = _fmt_ratio(comp.time_ratio), _fmt_ratio(comp.memory_ratio)
+        lines.append(f"{comp.name:<50} {base:>12} {curr:>12} {time_ratio:>8} {memory_ratio:>8}{flag}")
+
+    return "\n".join(lines)
@@ -0,0 +1,35 @@
+"""Compare a benchmark run with a baseline.
+
+    python -m tests.benchmarks.compare baseline.json current.json --threshold 0.2
+
+Exits with status 1 if any benchmark is slower (or uses more memory) than the baseline by more than the threshold.
+"""
+
+import argparse
+import sys
+
+from .benchmark import DEFAULT_THRESHOLD, BenchmarkRun, compare_runs, comparison_report
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare a benchmark run with a baseline")
+    parser.add_argument("baseline", help="JSON file of the baseline benchmark run")
+    parser.add_argument("current", help="JSON file of the benchmark run to check")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown")
+    parsed = parser.parse_args(args)
+
+    comparisons = compare_runs(
+        BenchmarkRun.from_json(parsed.baseline), BenchmarkRun.from_json(parsed.current), parsed.threshold
+    )
+    print(comparison_report(comparisons))
+
+    regressions = [x.name for x in comparisons if x.is_regression]
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {parsed.threshold:.0%}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
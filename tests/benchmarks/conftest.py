@@ -0,0 +1,99 @@
+"""Benchmarks of the hot paths on synthetic models.
+
+    ADA_BENCH_SCALE=medium ADA_BENCH_BASELINE=baseline.json pytest tests/benchmarks --benchmarks
+
+The benchmarks are skipped unless the --benchmarks option is given. ADA_BENCH_SCALE is one of small (1k elements,
+100 beams), medium, large or xlarge (1M elements, 50k beams).
+"""
+
+import os
+import pathlib
+
+import pytest
+
+from ada.config import Settings
+
+from .benchmark import (
+    NUM_BEAMS,
+    NUM_ELEM,
+    BenchmarkRun,
+    compare_runs,
+    comparison_report,
+    get_metadata,
+    get_scale,
+    measure,
+)
+
+_report = []
+BENCH_DIR = pathlib.Path(__file__).resolve().absolute().parent
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+
+    skip_bench = pytest.mark.skip(reason="Benchmarks are opt-in. Use --benchmarks to run them")
+    for item in items:
+        if BENCH_DIR in pathlib.Path(item.fspath).resolve().parents:
+            item.add_marker(skip_bench)
+
+
+@pytest.fixture(scope="session")
+def bench_scale() -> str:
+    return get_scale()
+
+
+@pytest.fixture(scope="session")
+def num_elem(bench_scale) -> int:
+    return NUM_ELEM[bench_scale]
+
+
+@pytest.fixture(scope="session")
+def num_beams(bench_scale) -> int:
+    return NUM_BEAMS[bench_scale]
+
+
+@pytest.fixture(scope="session")
+def benchmark_run(bench_scale):
+    """Collects the results of all benchmarks. On teardown the results are written to ADA_BENCH_OUTPUT (default is
+    the test dir) and compared with the baseline ADA_BENCH_BASELINE if it is set. If the baseline file does not exist
+    the results are stored as the new baseline."""
+    run = BenchmarkRun(bench_scale, metadata=get_metadata())
+    yield run
+
+    if len(run.results) == 0:
+        return
+
+    default_output = Settings.test_dir / "benchmarks" / f"benchmarks_{bench_scale}.json"
+    output = pathlib.Path(os.getenv("ADA_BENCH_OUTPUT", default_output))
+    run.to_json(output)
+    _report.append(f"Benchmark results written to {output}")
+
+    baseline = os.getenv("ADA_BENCH_BASELINE")
+    if baseline is None:
+        return
+
+    if pathlib.Path(baseline).exists() is False:
+        run.to_json(baseline)
+        _report.append(f"Stored new benchmark baseline {baseline}")
+        return
+
+    _report.append(comparison_report(compare_runs(BenchmarkRun.from_json(baseline), run)))
+
+
+@pytest.fixture
+def bench(request, benchmark_run):
+    """Measure a function and record the result under the name of the test"""
+
+    def run_bench(func, size, setup=None, repeat=3, name=None):
+        name = request.node.name if name is None else name
+        result = measure(name, func, size, setup=setup, repeat=repeat)
+        benchmark_run.add(result)
+        return result
+
+    return run_bench
+
+
+def pytest_terminal_summary(terminalreporter):
+    for section in _report:
+        terminalreporter.write_line(section)
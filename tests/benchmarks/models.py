@@ -0,0 +1,59 @@
+"""Synthetic models generated locally for the benchmarks"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import ada
+from ada.concepts.containers import Nodes
+from ada.fem import Elem, FemSection, FemSet
+
+
+def grid_coords(num_points: int, spacing=1.0) -> np.ndarray:
+    """Coordinates of num_points points in a square grid in the xy-plane"""
+    nx = int(np.ceil(np.sqrt(num_points)))
+    ix, iy = np.divmod(np.arange(num_points), nx)
+    return np.column_stack([ix * spacing, iy * spacing, np.zeros(num_points)])
+
+
+def make_nodes(num_nodes: int, start_id=1) -> list[ada.Node]:
+    return [ada.Node(p, i) for i, p in enumerate(grid_coords(num_nodes), start=start_id)]
+
+
+def make_shell_fem(num_elem: int, name="BenchFem") -> ada.FEM:
+    """A square grid of roughly num_elem quad shell elements with a single shell section. The FEM is added to a
+    part so that the material is numbered."""
+    nx = max(int(np.sqrt(num_elem)), 1)
+    fem = ada.Part(name).fem
+    fem.nodes = Nodes(make_nodes((nx + 1) ** 2), parent=fem)
+    nodes = fem.nodes.nodes
+
+    elements = []
+    for j in range(nx):
+        for i in range(nx):
+            n1 = j * (nx + 1) + i
+            el_nodes = [nodes[n1], nodes[n1 + 1], nodes[n1 + nx + 2], nodes[n1 + nx + 1]]
+            elements.append(Elem(len(elements) + 1, el_nodes, "QUAD", parent=fem))
+
+    for el in elements:
+        fem.elements.add(el)
+
+    elset = fem.add_set(FemSet("plates", elements, "elset"))
+    fem.add_section(FemSection("plate_sec", "shell", elset, ada.Material("S355"), thickness=0.01))
+    return fem
+
+
+def make_beam_part(num_beams: int, name="BenchPart") -> ada.Part:
+    """A part with num_beams beams arranged in a square grid of frames"""
+    part = ada.Part(name)
+    nx = max(int(np.sqrt(num_beams / 2)), 1)
+    count = 0
+    for j in range(nx + 1):
+        for i in range(nx):
+            for p1, p2 in [((i, j, 0), (i + 1, j, 0)), ((j, i, 0), (j, i + 1, 0))]:
+                if count >= num_beams:
+                    return part
+                part.add_beam(ada.Beam(f"bm{count}", p1, p2, "IPE300"))
+                count += 1
+
+    return part
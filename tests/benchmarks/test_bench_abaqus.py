@@ -0,0 +1,24 @@
+import ada
+from ada.fem.formats.abaqus.read.read_elements import get_elem_from_bulk_str
+from ada.fem.formats.abaqus.read.reader import get_nodes_from_inp
+from ada.fem.formats.abaqus.write.write_elements import elements_str
+from ada.fem.formats.abaqus.write.write_nodes import nodes_str
+
+from .models import make_shell_fem
+
+
+def test_bench_abaqus_write(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    bench(lambda: nodes_str(fem) + elements_str(fem, False), num_elem)
+
+
+def test_bench_abaqus_read(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    bulk_str = nodes_str(fem) + "\n" + elements_str(fem, False)
+
+    def read():
+        new_fem = ada.FEM("Read")
+        new_fem.nodes = get_nodes_from_inp(bulk_str, new_fem)
+        new_fem.elements = get_elem_from_bulk_str(bulk_str, new_fem)
+
+    bench(read, num_elem)
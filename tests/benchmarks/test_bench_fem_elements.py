@@ -0,0 +1,24 @@
+from ada.fem.containers import FemElements
+
+from .models import make_shell_fem
+
+
+def test_bench_fem_elements_create(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    elements = list(fem.elements)
+    bench(lambda: FemElements(elements, fem_obj=fem), num_elem)
+
+
+def test_bench_fem_elements_from_id(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    ids = [el.id for el in fem.elements]
+
+    def from_id():
+        for el_id in ids:
+            fem.elements.from_id(el_id)
+
+    bench(from_id, num_elem)
+
+
+def test_bench_fem_elements_renumber(bench, num_elem):
+    bench(lambda fem: fem.elements.renumber(start_id=1000), num_elem, setup=lambda: make_shell_fem(num_elem))
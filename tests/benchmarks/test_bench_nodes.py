@@ -0,0 +1,33 @@
+from ada.concepts.containers import Nodes
+
+from .models import grid_coords, make_nodes
+
+
+def test_bench_nodes_create(bench, num_elem):
+    bench(lambda nodes: Nodes(nodes), num_elem, setup=lambda: make_nodes(num_elem))
+
+
+def test_bench_nodes_get_by_volume(bench, num_elem):
+    nodes = Nodes(make_nodes(num_elem))
+    xmax = grid_coords(num_elem).max() / 2
+
+    def get_by_volume():
+        for x in range(int(xmax)):
+            nodes.get_by_volume((x, 0, 0), (x + 1, xmax, 0))
+
+    bench(get_by_volume, num_elem)
+
+
+def test_bench_nodes_renumber(bench, num_elem):
+    def setup():
+        return Nodes(make_nodes(num_elem, start_id=10))
+
+    bench(lambda nodes: nodes.renumber(start_id=1), num_elem, setup=setup)
+
+
+def test_bench_nodes_remove(bench, num_elem):
+    def setup():
+        nodes = Nodes(make_nodes(num_elem))
+        return nodes, nodes.nodes[::100]
+
+    bench(lambda args: args[0].remove(args[1]), num_elem, setup=setup)
@@ -0,0 +1,28 @@
+import ada
+from ada.fem.formats.sesam.read.card_index import CardIndex
+from ada.fem.formats.sesam.read.read_elements import get_elements
+from ada.fem.formats.sesam.read.read_nodes import get_nodes
+from ada.fem.formats.sesam.write.write_elements import elem_str
+from ada.fem.formats.sesam.write.writer import nodes_str, univec_str
+
+from .models import make_shell_fem
+
+
+def test_bench_sesam_write(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    thick_map = {fem_sec.thickness: i for i, fem_sec in enumerate(fem.sections, start=1)}
+    bench(lambda: nodes_str(fem) + univec_str(fem) + elem_str(fem, thick_map), num_elem)
+
+
+def test_bench_sesam_read(bench, num_elem):
+    fem = make_shell_fem(num_elem)
+    thick_map = {fem_sec.thickness: i for i, fem_sec in enumerate(fem.sections, start=1)}
+    bulk_str = nodes_str(fem) + univec_str(fem) + elem_str(fem, thick_map)
+
+    def read():
+        new_fem = ada.FEM("Read")
+        card_index = CardIndex(bulk_str)
+        new_fem.nodes = get_nodes(card_index, new_fem)
+        get_elements(card_index, new_fem)
+
+    bench(read, num_elem)
@@ -0,0 +1,10 @@
+import ada
+
+from .models import make_beam_part
+
+
+def test_bench_vismesh_beams(bench, num_beams):
+    def setup():
+        return ada.Assembly("BenchAssembly") / make_beam_part(num_beams)
+
+    bench(lambda a: a.to_vis_mesh(), num_beams, setup=setup, repeat=1)
@@ -13,6 +13,10 @@ print(TESTS_DIR)
 print(ROOT_DIR)
 
 
+def pytest_addoption(parser):
+    parser.addoption("--benchmarks", action="store_true", default=False, help="Run the benchmarks in tests/benchmarks")
+
+
 @pytest.fixture
 def this_dir() -> pathlib.Path:
     return TESTS_DIR
@@ -1,6 +1,15 @@
 import time
 
-from ada import Assembly, Part
+import h5py
+import pytest
+
+from ada import Assembly, Beam, Part, Pipe, Plate, PrimBox, Wall
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """The cache files are written to the .state directory of the current working directory"""
+    monkeypatch.chdir(tmp_path)
 
 
 def cache_validation(a, b):
@@ -49,3 +58,76 @@ def test_simplestru_fem_cache(bm_ipe300):
         pass
 
     print(f"Model generation time reduced from {time1:.2f}s to {time2:.2f}s -> {res:.2f} x Improvement")
+
+
+def test_pipes_and_walls_cache():
+    model_name = "PipesAndWalls"
+    p = Part("MyPart")
+    p.add_pipe(Pipe("Pipe1", [(0, 0, 0), (5, 0, 0), (5, 5, 0)], "OD200x10", colour=(0.0, 1.0, 0.0)))
+    p.add_wall(Wall("Wall1", [(0, 0), (5, 0), (5, 5)], 3.0, 0.15, offset=0.05, opacity=0.3))
+    p.add_shape(PrimBox("Box1", (0, 0, 0), (1, 1, 1), colour=(0.0, 0.0, 1.0), opacity=0.7))
+    a = Assembly(model_name, clear_cache=True, enable_cache=True) / p
+    a.cache_store.update_cache(a)
+
+    b = Assembly(model_name, enable_cache=True)
+    bp = b.get_part("MyPart")
+    (pipe,) = bp.pipes
+    (wall,) = bp.walls
+    (box,) = bp.shapes
+    assert pipe.guid == p.pipes[0].guid
+    assert pipe.section.name == p.pipes[0].section.name
+    assert [n.p.tolist() for n in pipe.points] == [n.p.tolist() for n in p.pipes[0].points]
+    assert wall.offset == 0.05
+    assert wall.height == 3.0
+    assert wall.thickness == 0.15
+    assert tuple(pipe.colour) == (0.0, 1.0, 0.0)
+    assert wall.colour is None
+    assert wall.opacity == 0.3
+    assert tuple(box.colour) == (0.0, 0.0, 1.0)
+    assert box.opacity == 0.7
+
+
+def test_plates_and_beams_cache():
+    model_name = "PlatesAndBeams"
+    p = Part("MyPart")
+    p.add_plate(Plate("Plate1", [(0, 0), (1, 0), (1, 1)], 0.01, offset=0.005, colour=(1.0, 0.0, 0.0), opacity=0.5))
+    p.add_plate(Plate("Plate2", [(0, 0), (1, 0), (1, 1)], 0.02))
+    p.add_beam(Beam("Beam1", (0, 0, 0), (1, 0, 0), "IPE300", colour="blue"))
+    p.add_beam(Beam("Beam2", (1, 0, 0), (1, 1, 0), "HP200x10"))
+    a = Assembly(model_name, clear_cache=True, enable_cache=True) / p
+    a.cache_store.update_cache(a)
+
+    b = Assembly(model_name, enable_cache=True)
+    bp = b.get_part("MyPart")
+    pl1, pl2 = bp.plates
+    assert pl1.offset == 0.005
+    assert tuple(pl1.colour) == (1.0, 0.0, 0.0)
+    assert pl1.opacity == 0.5
+    assert pl2.t == 0.02
+    assert pl2.offset == p.plates[1].offset
+    assert pl2.colour == p.plates[1].colour
+
+    for bm_a, bm_b in zip(p.beams, bp.beams):
+        assert bm_b.guid == bm_a.guid
+        assert bm_b.section.name == bm_a.section.name
+        assert bm_b.material.name == bm_a.material.name
+        assert bm_b.n1.p.tolist() == bm_a.n1.p.tolist()
+        assert bm_b.n2.p.tolist() == bm_a.n2.p.tolist()
+        assert bm_b.colour == bm_a.colour
+
+
+def test_outdated_cache_format_is_not_loaded():
+    model_name = "OutdatedCache"
+    p = Part("MyPart")
+    p.add_beam(Beam("Beam1", (0, 0, 0), (1, 0, 0), "IPE300"))
+    a = Assembly(model_name, clear_cache=True, enable_cache=True) / p
+    a.cache_store.update_cache(a)
+    assert a.cache_store.is_cache_outdated() is False
+
+    # Cache files written before the format was versioned have no version
+    with h5py.File(a.cache_store.cache_file, "a") as f:
+        del f["INFO"].attrs["VERSION"]
+
+    assert a.cache_store.is_cache_outdated() is True
+    b = Assembly(model_name, enable_cache=True)
+    assert len(b.parts) == 0
@@ -0,0 +1,51 @@
+from ada import Beam, PrimBox
+from ada.config import Settings
+from ada.occ.geom_cache import GeomCache, beam_geom_key, general_properties_digest
+from ada.sections.concept import GeneralProperties
+
+
+def test_geom_key_invalidation():
+    bm = Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    key = beam_geom_key(bm, "solid")
+    assert beam_geom_key(bm, "solid") == key
+    assert beam_geom_key(bm, "shell") != key
+
+    bm.n2.p = (2, 0, 0)
+    key_moved = beam_geom_key(bm, "solid")
+    assert key_moved != key
+
+    bm.section.w_top = 0.2
+    assert beam_geom_key(bm, "solid") != key_moved
+
+    # The line representation only depends on the beam end points
+    assert beam_geom_key(bm, "line") == beam_geom_key(Beam("bm2", (0, 0, 0), (2, 0, 0), "HP200x10"), "line")
+
+
+def test_general_properties_digest():
+    digest = general_properties_digest(GeneralProperties(Ax=0.01, Ix=1.2e-5))
+    assert digest == general_properties_digest(GeneralProperties(Ax=0.01, Ix=1.2e-5 + 1e-18))
+    assert digest != general_properties_digest(GeneralProperties(Ax=0.01, Ix=1.3e-5))
+    assert digest != general_properties_digest(GeneralProperties(Ax=0.01, Iy=1.2e-5))
+
+
+def test_geom_cache_memoisation():
+    cache = GeomCache(max_size=2)
+    shapes = [object() for _ in range(3)]
+    assert cache.get_or_create("a", lambda: shapes[0]) is shapes[0]
+    assert cache.get_or_create("a", lambda: shapes[1]) is shapes[0]
+    assert cache.hits == 1 and cache.misses == 1
+
+    cache.get_or_create("b", lambda: shapes[1])
+    cache.get_or_create("c", lambda: shapes[2])
+    assert len(cache) == 2
+    assert "a" not in cache
+
+
+def test_beam_solid_is_reused(monkeypatch):
+    monkeypatch.setattr(Settings, "use_geom_cache", True)
+    bm = Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    solid = bm.solid()
+    assert bm.solid() is solid
+
+    bm.add_penetration(PrimBox("pen", (0.5, -0.1, -0.1), (0.6, 0.1, 0.1)))
+    assert bm.solid() is not solid
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from ada import Node
@@ -23,3 +24,14 @@ def nodes():
 def contained3nodes(nodes):
     n1, n2, n3, n4, n5, n6, n7, n8, n9, n10 = nodes
     return Nodes([n1, n2, n3])
+
+
+@pytest.fixture
+def random_nodes():
+    """Create a number of nodes at random (seeded) positions within a 20 x 20 x 20 box centered at the origin"""
+
+    def create_nodes(num, seed=42) -> list[Node]:
+        rng = np.random.default_rng(seed)
+        return [Node(p, i) for i, p in enumerate(rng.uniform(-10, 10, (num, 3)), start=1)]
+
+    return create_nodes
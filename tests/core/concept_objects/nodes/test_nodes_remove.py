@@ -0,0 +1,41 @@
+import pytest
+
+from ada.concepts.containers import Nodes
+
+
+def test_remove_many_by_node_and_id(random_nodes):
+    nodes = random_nodes(1000)
+    s = Nodes(nodes)
+    removed = nodes[::3]
+    remaining = [n for i, n in enumerate(nodes) if i % 3 != 0]
+
+    s.remove(removed[:100] + [n.id for n in removed[100:]])
+
+    assert len(s) == len(remaining)
+    assert sorted(n.id for n in s) == list(range(1, len(remaining) + 1))
+    assert s.max_nid == len(remaining)
+    for n in remaining:
+        assert s.from_id(n.id) is n
+        assert n in s.get_by_volume(n.p)
+    for n in removed:
+        assert n not in s.get_by_volume(n.p)
+
+
+def test_remove_without_renumber(random_nodes):
+    nodes = random_nodes(50)
+    s = Nodes(nodes)
+    s.remove([nodes[-1], 10, 20], renumber=False)
+
+    assert len(s) == 47
+    assert s.max_nid == 49
+    with pytest.raises(ValueError):
+        s.from_id(10)
+    assert s.from_id(11) is nodes[10]
+    assert len(s.get_by_volume(nodes[19].p)) == 0
+
+
+def test_remove_missing_node(nodes):
+    n1, n2, n3, n4, *_ = nodes
+    s = Nodes([n1, n2, n3])
+    s.remove([n4, 99])
+    assert len(s) == 3
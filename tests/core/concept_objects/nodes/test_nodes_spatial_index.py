@@ -0,0 +1,50 @@
+import numpy as np
+
+from ada import Node
+from ada.concepts.containers import Nodes
+from ada.core.spatial_index import HashGridIndex
+
+
+def test_get_by_volume_box_matches_brute_force(random_nodes):
+    nodes = random_nodes(2000)
+    s = Nodes(nodes)
+    vol_min, vol_max = (-2.0, -3.0, 0.5), (4.0, 1.0, 6.0)
+    res = s.get_by_volume(p=vol_min, vol_box=vol_max)
+    expected = [n for n in nodes if all(a <= c <= b for a, c, b in zip(vol_min, n.p, vol_max))]
+    assert Nodes(res) == Nodes(expected)
+
+
+def test_add_detects_duplicates(random_nodes):
+    s = Nodes()
+    for n in random_nodes(500):
+        s.add(n)
+
+    existing = s.nodes[250]
+    res = s.add(Node(existing.p + 1e-6))
+    assert res is existing
+    assert len(s) == 500
+
+
+def test_get_nearest(random_nodes):
+    nodes = random_nodes(1000)
+    s = Nodes(nodes)
+    p = np.array([0.1, 0.2, 0.3])
+    expected = min(nodes, key=lambda n: np.linalg.norm(n.p - p))
+    assert s.get_nearest(p) is expected
+    assert s.get_nearest((1000, 0, 0), max_dist=1.0) is None
+
+
+def test_index_follows_move(random_nodes):
+    s = Nodes(random_nodes(100))
+    n = s.nodes[0]
+    s.move(move=(100, 0, 0))
+    assert s.get_by_volume(n.p) == [n]
+
+
+def test_hash_grid_remove(random_nodes):
+    nodes = random_nodes(100)
+    index = HashGridIndex()
+    index.rebuild(nodes)
+    index.remove(nodes[0])
+    assert len(index) == 99
+    assert nodes[0] not in index.query_box(nodes[0].p - 1e-3, nodes[0].p + 1e-3)
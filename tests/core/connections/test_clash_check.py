@@ -0,0 +1,37 @@
+import numpy as np
+
+from ada.core.clash_check import segment_intersections, sweep_and_prune
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = np.random.default_rng(42)
+    mins = rng.uniform(0, 100, (500, 3))
+    maxs = mins + rng.uniform(0, 8, (500, 3))
+
+    pairs = sweep_and_prune(mins, maxs, chunk_size=100)
+
+    overlap = np.all((mins[:, None] <= maxs[None, :]) & (mins[None, :] <= maxs[:, None]), axis=2)
+    expected = np.argwhere(np.triu(overlap, k=1))
+    assert pairs.tolist() == expected.tolist()
+
+
+def test_sweep_and_prune_margins():
+    mins = np.array([[0, 0, 0], [1.25, 0, 0]])
+    maxs = np.array([[1, 1, 1], [2, 1, 1]])
+    assert len(sweep_and_prune(mins, maxs)) == 0
+    # The margin is the clearance between the boxes, not the growth of each box
+    assert sweep_and_prune(mins, maxs, margins=0.25).tolist() == [[0, 1]]
+    assert len(sweep_and_prune(mins, maxs, margins=0.2)) == 0
+
+
+def test_segment_intersections():
+    p1 = np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0]], dtype=float)
+    p2 = np.array([[2, 0, 0], [2, 0, 0], [2, 0, 0]], dtype=float)
+    q1 = np.array([[1, -1, 0], [0, 1, 0], [1, -1, 1]], dtype=float)
+    q2 = np.array([[1, 1, 0], [2, 1, 0], [1, 1, 1]], dtype=float)
+
+    mask, points, s, t = segment_intersections(p1, p2, q1, q2, out_of_plane_tol=0.1)
+    # crossing, parallel and out of plane
+    assert mask.tolist() == [True, False, False]
+    assert points[0].tolist() == [1.0, 0.0, 0.0]
+    assert s[0] == 0.5 and t[0] == 0.5
@@ -0,0 +1,85 @@
+import numpy as np
+
+import ada
+from ada.fem.formats.abaqus.read.inp_index import InpIndex
+from ada.fem.formats.abaqus.read.read_elements import get_elem_from_bulk_str
+from ada.fem.formats.abaqus.read.reader import get_nodes_from_inp, read_bulk_w_includes
+
+MAIN_INP = """*Heading
+** A comment
+*Node, nset=all
+      1,           0.,           0.,           0.
+      2,           1.,           0.,           0.
+      3,           1.,           1.,           0.
+      4,           0.,           1.,           0.
+*Include, input=elements.inp
+*Elset, elset=plates
+ 1, 2
+"""
+
+ELEMENTS_INP = """*Element, type=S3, elset=plates
+1, 1, 2, 3
+2, 1, 3, 4
+"""
+
+
+def test_inp_index(tmp_path):
+    (tmp_path / "elements.inp").write_text(ELEMENTS_INP)
+    main_inp = tmp_path / "main.inp"
+    main_inp.write_text(MAIN_INP)
+
+    with InpIndex(main_inp) as inp_index:
+        bulk_str = inp_index.skeleton()
+        bulk_blocks = inp_index.decode_blocks()
+        assert [b.keyword for b in inp_index.blocks] == ["node", "element"]
+        parallel_blocks = inp_index.decode_blocks(num_workers=2)
+
+    assert "*Elset, elset=plates\n 1, 2\n" in bulk_str
+    assert "0.," not in bulk_str
+    for key, value in bulk_blocks.items():
+        np.testing.assert_array_equal(parallel_blocks[key], value)
+
+    np.testing.assert_array_equal(bulk_blocks[1], [[1, 1, 2, 3], [2, 1, 3, 4]])
+
+    fem = ada.FEM("indexed")
+    fem.nodes = get_nodes_from_inp(bulk_str, fem, bulk_blocks)
+    fem.elements = get_elem_from_bulk_str(bulk_str, fem, bulk_blocks)
+
+    ref_str = read_bulk_w_includes(main_inp)
+    ref_fem = ada.FEM("reference")
+    ref_fem.nodes = get_nodes_from_inp(ref_str, ref_fem)
+    ref_fem.elements = get_elem_from_bulk_str(ref_str, ref_fem)
+
+    assert [(n.id, *n.p) for n in fem.nodes] == [(n.id, *n.p) for n in ref_fem.nodes]
+    assert [[n.id for n in el.nodes] for el in fem.elements] == [[n.id for n in el.nodes] for el in ref_fem.elements]
+    assert set(fem.sets.nodes["all"].members) == set(fem.nodes.nodes)
+
+
+def test_continued_element_lines(tmp_path):
+    node_lines = "\n".join(f"{i}, {i}., 0., 0." for i in range(1, 21))
+    el_line_1 = ", ".join(str(i) for i in range(1, 16))
+    el_line_2 = ", ".join(str(i) for i in range(16, 21))
+    inp = tmp_path / "hex20.inp"
+    inp.write_text(f"*Node\n{node_lines}\n*Element, type=C3D20\n1, {el_line_1},\n{el_line_2}\n")
+
+    with InpIndex(inp) as inp_index:
+        bulk_blocks = inp_index.decode_blocks()
+
+    assert bulk_blocks[0].shape == (20, 4)
+    np.testing.assert_array_equal(bulk_blocks[1], [[1] + list(range(1, 21))])
+
+
+def test_chunked_decoding(tmp_path):
+    node_lines = "\n".join(f"{i}, {i}., 0., 0." for i in range(1, 1001))
+    el_lines = "\n".join(f"{i}, {i},\n{i + 1}" for i in range(1, 1000))
+    inp = tmp_path / "chunks.inp"
+    inp.write_text(f"*Node\n{node_lines}\n*Element, type=B31\n{el_lines}\n")
+
+    with InpIndex(inp, chunk_size=1000) as inp_index:
+        assert all(len(block.chunks) > 1 for block in inp_index.blocks)
+        bulk_blocks = inp_index.decode_blocks()
+        parallel_blocks = inp_index.decode_blocks(num_workers=2)
+
+    np.testing.assert_array_equal(bulk_blocks[0][:, 0], np.arange(1, 1001))
+    np.testing.assert_array_equal(bulk_blocks[1][:, 2], np.arange(2, 1001))
+    np.testing.assert_array_equal(parallel_blocks[1], bulk_blocks[1])
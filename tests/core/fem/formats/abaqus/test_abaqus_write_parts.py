@@ -0,0 +1,44 @@
+import ada
+from ada.fem import Elem, FemSection, FemSet
+from ada.fem.formats.abaqus.write.write_elements import elements_str, write_elem
+from ada.fem.formats.abaqus.write.write_parts import write_abaqus_part_str
+
+
+def make_part(name: str, num: int) -> ada.Part:
+    part = ada.Part(name)
+    fem = part.fem
+    nodes = [fem.nodes.add(ada.Node((i, i % 3, 0), i + 1)) for i in range(num + 2)]
+    elements = [fem.elements.add(Elem(i + 1, nodes[i : i + 3], "TRIANGLE", parent=fem)) for i in range(num)]
+    elset = fem.add_set(FemSet("plates", elements, "elset"))
+    fem.add_section(FemSection("plate_sec", "shell", elset, ada.Material("S355"), thickness=0.01))
+    return part
+
+
+def test_write_elements_in_bulk():
+    fem = make_part("MyPart", 10).fem
+    el_lines = [write_elem(el, False) for el in fem.elements]
+    assert elements_str(fem, False) == "*ELEMENT, type=S3\n" + "\n".join(el_lines)
+
+
+def test_write_part():
+    part = make_part("MyPart", 10)
+    part_str = write_abaqus_part_str(part)
+    assert part_str.startswith("** Abaqus Part MyPart\n** Exported using ADA OpenSim\n*NODE\n")
+    assert "\n     12,     11.000000,      2.000000,      0.000000\n*ELEMENT, type=S3\n" in part_str
+    assert "\n     10,            10,            11,            12\n" in part_str
+
+
+def test_write_parts_in_worker_processes(tmp_path):
+    from ada.fem.formats.abaqus.write.write_parts import write_all_parts
+
+    a = ada.Assembly("MyAssembly")
+    for i in range(3):
+        a.add_part(make_part(f"Part{i}", 10 + i))
+
+    write_all_parts(a, tmp_path / "serial", processes=1)
+    write_all_parts(a, tmp_path / "parallel", processes=3)
+    for i in range(3):
+        bulk_file = f"bulk_Part{i}/aba_bulk.inp"
+        serial_str = (tmp_path / "serial" / bulk_file).read_text()
+        assert serial_str == (tmp_path / "parallel" / bulk_file).read_text()
+        assert f"** Abaqus Part Part{i}" in serial_str
@@ -0,0 +1,52 @@
+import numpy as np
+
+from ada.fem.formats.sesam.read import cards
+from ada.fem.formats.sesam.read.card_index import CardIndex
+from ada.fem.formats.sesam.read.reader import read_sesam_fem
+
+bulk_str = """IDENT     1.00000000E+00  1.00000000E+00  3.00000000E+00  0.00000000E+00
+TDSECT    4.00000000E+00  1.00000000E+00  1.04000000E+02  0.00000000E+00
+        IPE300
+GCOORD    1.00000000E+00  0.00000000E+00  0.00000000E+00  0.00000000E+00
+GCOORD    2.00000000E+00  1.00000000E+00 -2.50000000E-01  0.00000000E+00
+GELREF1   1.00000000E+00  1.00000000E+00  0.00000000E+00  0.00000000E+00
+          0.00000000E+00  0.00000000E+00  0.00000000E+00  0.00000000E+00
+          1.00000000E+00 -1.00000000E+00  0.00000000E+00  1.00000000E+00
+          1.00000000E+00  0.00000000E+00
+GELREF1   2.00000000E+00  1.00000000E+00  0.00000000E+00  0.00000000E+00
+          0.00000000E+00  0.00000000E+00  0.00000000E+00  0.00000000E+00
+          1.00000000E+00  0.00000000E+00  0.00000000E+00  1.00000000E+00
+GCOORD    3.00000000E+00  2.00000000E+00  0.00000000E+00  5.00000000E-01"""
+
+
+def test_card_index_records():
+    card_index = CardIndex(bulk_str)
+    assert card_index.count("GCOORD") == 3
+    assert "GELMNT1" not in card_index
+
+    gcoord = card_index.get_records("GCOORD").to_array(4)
+    assert np.array_equal(gcoord[:, 0], [1, 2, 3])
+    assert np.array_equal(gcoord[1, 1:], [1.0, -0.25, 0.0])
+
+    gelref1 = card_index.get_records("GELREF1").to_dicts(cards.GELREF1, tail="members")
+    assert [d["elno"] for d in gelref1] == [1.0, 2.0]
+    assert gelref1[0]["fixno"] == -1.0
+    assert gelref1[0]["members"] == [1.0, 0.0]
+    assert gelref1[1]["members"] is None
+
+    assert len(card_index.get_records("GELMNT1")) == 0
+    assert card_index.get_str("TDSECT").splitlines()[1].strip() == "IPE300"
+
+
+def test_card_index_matches_file(example_files):
+    with open(example_files / "fem_files/sesam/beamMassT1.FEM", "r") as f:
+        content = f.read()
+
+    card_index = CardIndex(content)
+    gelmnt1 = card_index.get_records("GELMNT1")
+    assert len(gelmnt1) == content.count("\nGELMNT1")
+
+    part = read_sesam_fem(content, "T1")
+    assert len(part.fem.nodes) == card_index.count("GCOORD")
+    num_elem = len(list(part.fem.elements.lines)) + len(list(part.fem.elements.shell))
+    assert num_elem == len(gelmnt1)
@@ -1,4 +1,11 @@
-from ada.fem.formats.sesam.write.writer import write_ff
+import numpy as np
+
+import ada
+from ada.fem import Elem, FemSection, FemSet
+from ada.fem.formats.sesam.read.card_index import CardIndex
+from ada.fem.formats.sesam.write.write_elements import elem_str
+from ada.fem.formats.sesam.write.write_utils import format_ff_block
+from ada.fem.formats.sesam.write.writer import nodes_str, univec_str, write_ff
 
 
 def test_write_ff():
@@ -17,3 +24,30 @@ def test_write_ff():
     ]
     test_str += write_ff(fflag, ddata)
     # print(test_str)
+
+
+def test_write_ff_block():
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(50, 10)) * 10.0 ** rng.integers(-5, 5, (50, 10))
+    data[0, :3] = [0.0, -0.0, 1e100]
+
+    expected = "".join([write_ff("BELFIX", [tuple(r[:4]), tuple(r[4:8]), tuple(r[8:])]) for r in data.tolist()])
+    assert format_ff_block("BELFIX", data) == expected
+    assert format_ff_block("BELFIX", data, (4, 4, 2)) == expected
+
+
+def test_write_nodes_and_elements():
+    fem = ada.FEM("MyFem")
+    nodes = [fem.nodes.add(ada.Node(p, i)) for i, p in enumerate([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], 1)]
+    elem = fem.elements.add(Elem(1, nodes, "QUAD", parent=fem))
+    fem.add_section(
+        FemSection("plate", "shell", FemSet("plates", [elem], "elset"), ada.Material("S355", mat_id=1), thickness=0.01)
+    )
+    thick_map = {0.01: 1}
+
+    card_index = CardIndex(nodes_str(fem) + univec_str(fem) + elem_str(fem, thick_map))
+    gcoord = card_index.get_records("GCOORD").to_array(4)
+    assert np.array_equal(gcoord[:, 0], [1, 2, 3, 4])
+    assert np.array_equal(gcoord[2, 1:], [1, 1, 0])
+    assert card_index.get_records("GELMNT1").to_lists() == [[1, 1, 24, 0, 1, 2, 3, 4]]
+    assert card_index.get_records("GELREF1").to_lists() == [[1, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1]]
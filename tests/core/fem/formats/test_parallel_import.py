@@ -0,0 +1,29 @@
+import ada
+
+
+def _count(a: ada.Assembly):
+    parts = a.get_all_parts_in_assembly()
+    return sum(len(p.fem.nodes) for p in parts), sum(len(p.fem.elements) for p in parts)
+
+
+def test_parallel_import(fem_files):
+    files = [fem_files / "abaqus/box.inp", fem_files / "abaqus/box_rigid.inp", fem_files / "sesam/beamMassT1.FEM"]
+
+    a_seq = ada.from_fem(files, name=["box", "rigid", "beam_mass"])
+    a_par = ada.from_fem(files, name=["box", "rigid", "beam_mass"], num_workers=2)
+
+    assert _count(a_par) == _count(a_seq)
+    assert list(a_par.parts.keys()) == list(a_seq.parts.keys())
+    for part in a_par.get_all_parts_in_assembly():
+        assert part.get_assembly() is a_par
+
+
+def test_unnamed_files_are_named_by_file_stem_in_parallel(fem_files):
+    files = [fem_files / "abaqus/box.inp", fem_files / "sesam/beamMassT1.FEM"]
+
+    a_seq = ada.from_fem(files)
+    a_par = ada.from_fem(files, num_workers=2)
+
+    # The sequential import keeps the names given by the readers
+    assert list(a_seq.parts.keys()) == ["box", "T1"]
+    assert list(a_par.parts.keys()) == ["box", "beamMassT1"]
@@ -1,10 +1,10 @@
 import pytest
 
 import ada.fem.shapes
-from ada import Assembly, Beam, Part, Pipe, Plate, PrimBox, PrimSphere
+from ada import FEM, Assembly, Beam, Node, Part, Pipe, Plate, PrimBox, PrimSphere
 from ada.concepts.transforms import Placement
 from ada.fem.meshing.concepts import GmshOptions, GmshSession, GmshTask
-from ada.fem.meshing.multisession import multisession_gmsh_tasker
+from ada.fem.meshing.multisession import add_task_fem, multisession_gmsh_tasker
 from ada.fem.meshing.partitioning.partition_beams import make_ig_cutplanes
 
 
@@ -94,3 +94,43 @@ def test_diff_geom_repr_in_separate_sessions(assembly, test_meshing_dir):
     # from ada.fem.steps import StepImplicit
     # a.fem.add_step(StepImplicit("MyStep"))
     # a.to_fem("aba_mixed_order", "abaqus", overwrite=True, scratch_dir=test_meshing_dir)
+
+
+def test_diff_geom_repr_in_parallel_sessions(assembly):
+    shape = ada.fem.shapes.ElemShape.TYPES
+    bm1 = assembly.get_by_name("bm1")
+    bm2 = assembly.get_by_name("bm2")
+    p = assembly.get_part("MyFemObjects")
+
+    t1 = GmshTask([bm1], "shell", 0.1, options=GmshOptions(Mesh_ElementOrder=2))
+    t2 = GmshTask([bm2], "line", 0.1, options=GmshOptions(Mesh_ElementOrder=1))
+
+    fem = multisession_gmsh_tasker(p.fem, [t1, t2], num_workers=2)
+
+    assert len(fem.nodes) == 529
+    assert len(fem.elements) == 251
+    assert fem.elements.min_el_id == 1
+    assert fem.elements.max_el_id == 251
+
+    assert_map = {shape.shell.TRI6: 242, shape.lines.LINE: 9}
+    for key, val in p.fem.elements.group_by_type():
+        assert assert_map[key] == len(list(val))
+
+    assert len(bm1.elem_refs) == 242
+
+
+@pytest.mark.parametrize("merge_nodes, num_nodes", [(False, 4), (True, 3)])
+def test_add_task_fem_merges_nodes_on_request(merge_nodes, num_nodes):
+    def line_fem(name, p1, p2) -> FEM:
+        fem = FEM(name)
+        n1, n2 = fem.nodes.add(Node(p1, 1)), fem.nodes.add(Node(p2, 2))
+        fem.elements.add(ada.fem.Elem(1, [n1, n2], "LINE"))
+        return fem
+
+    fem = line_fem("Task1", (0, 0, 0), (1, 0, 0))
+    add_task_fem(fem, line_fem("Task2", (1, 0, 0), (2, 0, 0)), merge_nodes=merge_nodes)
+
+    assert len(fem.nodes) == num_nodes
+    assert len(fem.elements) == 2
+    el1, el2 = fem.elements
+    assert any(n is el1.nodes[1] for n in el2.nodes) is merge_nodes
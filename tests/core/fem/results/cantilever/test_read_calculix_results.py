@@ -1,7 +1,11 @@
 import pytest
 
 import ada
-from ada.fem.formats.calculix.results.read_frd_file import ReadFrdFailedException
+from ada.fem.formats.calculix.results.read_frd_file import (
+    CcxResultModel,
+    ReadFrdFailedException,
+    iter_frd_steps,
+)
 
 
 def test_read_static_line_calculix_results(cantilever_dir):
@@ -27,3 +31,30 @@ def test_read_eig_shell_calculix_results(cantilever_dir):
     res = ada.from_fem_res(cantilever_dir / "calculix/eigen_shell_cantilever_calculix.frd")
     eig_data = res.get_eig_summary()
     assert len(eig_data.modes) == 20
+
+
+def test_iter_calculix_steps(cantilever_dir):
+    steps = list(iter_frd_steps(cantilever_dir / "calculix/eigen_solid_cantilever_calculix.frd"))
+    assert [step for step, _ in steps] == list(range(1, 21))
+
+    step, results = steps[0]
+    assert [x.name for x in results] == ["DISP", "STRESS", "FORC", "ERROR"]
+    disp = results[0]
+    assert disp.values.shape == (930, 4)
+    assert disp.values[2, 1:].tolist() == [-2.86192e-04, -1.45068e-01, -1.26302e-06]
+
+
+def test_collect_mixed_element_types():
+    lines = [
+        b" -1         1    1    0    1\n",
+        b" -2         1         2         3         4         5         6         7         8\n",
+        b" -1         2    3    0    1\n",
+        b" -2         5         6         7         9\n",
+        b" -1         3    1    0    1\n",
+        b" -2         5         6         7         8         9        10        11        12\n",
+        b" -3\n",
+    ]
+    hex_elements, tet_elements = CcxResultModel(iter([])).collect_elements(iter(lines))
+    assert hex_elements.shape == (2, 12)
+    assert hex_elements[:, 0].tolist() == [1, 3]
+    assert tet_elements.tolist() == [[2, 3, 0, 1, 5, 6, 7, 9]]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from ada.fem.results.common import ElementBlock, ElementInfo, FEAResult, FemNodes, Mesh
+from ada.fem.results.field_data import ElementFieldData, FieldPosition
+from ada.fem.shapes.definitions import LineShapes
+
+
+def int_point_data():
+    # elem_label, int_point, S11, S22 (elements stored out of order)
+    return np.array(
+        [
+            [2, 1, 10.0, 1.0],
+            [1, 1, 1.0, 2.0],
+            [2, 2, 20.0, 3.0],
+            [1, 2, 3.0, 4.0],
+        ]
+    )
+
+
+def test_int_point_values():
+    fd = ElementFieldData("S", 1, ["S11", "S22"], int_point_data(), field_pos=FieldPosition.INT)
+    res = fd.get_all_values()
+    assert res["S11"][0].tolist() == [[1.0, 3.0], [10.0, 20.0]]
+    assert res["S22"][0].tolist() == [[2.0, 4.0], [1.0, 3.0]]
+
+    elem_ids, values = fd.get_element_values("max")
+    assert elem_ids.tolist() == [1, 2]
+    assert values.tolist() == [[3.0, 4.0], [20.0, 3.0]]
+
+
+def test_get_by_element_id():
+    fd = ElementFieldData("S", 1, ["S11", "S22"], int_point_data(), field_pos=FieldPosition.INT)
+    res = fd.get_by_element_id([2], int_points=[2])
+    assert res.values.tolist() == [[2, 2, 20.0, 3.0]]
+    assert res.field_pos == FieldPosition.INT
+
+
+def test_element_nodal_values():
+    # elem_label, sec_num, node_label, S11
+    data = np.array([[1, 1, 1, 1.0], [1, 1, 2, 3.0], [2, 1, 2, 5.0], [2, 1, 3, 7.0]])
+    fd = ElementFieldData("S", 1, ["S11"], data)
+    assert fd.get_all_values().tolist() == [1.0, 4.0, 7.0]
+    assert fd.get_all_values("min").tolist() == [1.0, 3.0, 7.0]
+
+
+def line_mesh() -> Mesh:
+    elem_info = ElementInfo(LineShapes.LINE, None, None)
+    block = ElementBlock(elem_info, np.array([[10, 11], [11, 12]]), np.array([1, 2]))
+    nodes = FemNodes(np.zeros((3, 3)), np.array([10, 11, 12]))
+    return Mesh([block], nodes)
+
+
+def test_extrapolate_int_points_to_nodes():
+    mesh = line_mesh()
+    fd = ElementFieldData("S", 1, ["S11", "S22"], int_point_data(), field_pos=FieldPosition.INT)
+    node_ids, values = fd.get_nodal_values(mesh=mesh)
+    assert node_ids.tolist() == [10, 11, 12]
+    assert values[:, 0].tolist() == [2.0, 8.5, 15.0]
+
+
+def test_extrapolate_int_points_to_nodes_of_result_mesh():
+    fd = ElementFieldData("S", 1, ["S11", "S22"], int_point_data(), field_pos=FieldPosition.INT)
+    with pytest.raises(ValueError):
+        fd.get_nodal_values()
+
+    FEAResult("Result", None, [fd], line_mesh())
+    node_ids, values = fd.get_nodal_values()
+    assert node_ids.tolist() == [10, 11, 12]
+    assert values[:, 0].tolist() == [2.0, 8.5, 15.0]
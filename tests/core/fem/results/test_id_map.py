@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from ada.fem.results.common import FemNodes
+from ada.fem.results.id_map import IdIndexMap
+
+
+@pytest.mark.parametrize("ids", [[5, 3, 4, 3, 7], [500000, 3, 40, 3, 7]])
+def test_id_index_map(ids):
+    id_map = IdIndexMap(np.array(ids))
+    lookup = np.array([[7, 3], [ids[0], ids[2]]])
+    expected = [[ids.index(x) for x in row] for row in lookup.tolist()]
+    assert np.array_equal(id_map.get_indices(lookup), expected)
+
+    assert np.array_equal(id_map.get_indices([1, 3], fill_value=-1), [-1, 1])
+    assert np.array_equal(id_map.contains([2, 7]), [False, True])
+    with pytest.raises(ValueError):
+        id_map.get_indices([2])
+
+
+def test_fem_nodes_id_map():
+    nodes = FemNodes(coords=np.arange(9, dtype=float).reshape(3, 3), identifiers=np.array([10, 2, 5]))
+    assert [n.id for n in nodes.get_node_by_id([5, 10])] == [5, 10]
+    assert np.array_equal(nodes.get_node_by_id(2)[0].p, [3, 4, 5])
+
+    nodes.identifiers = np.array([1, 2, 3])
+    assert nodes.get_node_by_id(3)[0].id == 3
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from ada.fem.formats.code_aster.results.read_rmed_results import (
+    MedResultStore,
+    get_ids_from_names,
+    read_rmed_file,
+)
+
+
+def test_rmed_store_catalogue(fem_files):
+    with MedResultStore(fem_files / "cantilever/code_aster/eigen_line_cantilever_code_aster.rmed") as store:
+        assert store.is_eigen_analysis
+        modes = store.fields["modes___DEPL"]
+        assert [x.step for x in modes.steps] == list(range(1, len(modes.steps) + 1))
+        assert modes.steps[0].supports == ["NOE"]
+
+        mode = store.get_field_data("modes___DEPL", 3)
+        assert mode.step == 3
+        assert mode.eigen_freq == modes.steps[2].time
+
+        rows = np.array([4, 0, 4])
+        subset = store.get_field_data("modes___DEPL", 3, rows=rows)
+        assert np.array_equal(subset.values, mode.values[rows])
+
+
+def test_read_selected_rmed_fields(fem_files):
+    rmed_file = fem_files / "cantilever/code_aster/eigen_line_cantilever_code_aster.rmed"
+    full = read_rmed_file(rmed_file)
+    result = read_rmed_file(rmed_file, fields=["modes___DEPL"], steps=[2])
+
+    assert len(result.results) == 1
+    expected = [x for x in full.results if x.name == result.results[0].name][0]
+    assert np.array_equal(result.results[0].values, expected.values)
+
+
+def test_node_ids_from_names():
+    names = np.array([list(x.ljust(16).encode()) for x in ["N12", "N3", "N7"]], dtype=np.int8)
+    assert np.array_equal(get_ids_from_names(names), [12, 3, 7])
+
+    names = np.array([list(x.ljust(16).encode()) for x in ["N12", "NA"]], dtype=np.int8)
+    assert get_ids_from_names(names) is None
+
+
+def test_rows_are_rejected_for_cell_values(fem_files):
+    with MedResultStore(fem_files / "cantilever/code_aster/static_shell_cantilever_code_aster.rmed") as store:
+        full = store.get_field_data("result__SIEF_ELGA", support="MAI.QU4")
+        assert len(full.values) > 0
+        with pytest.raises(ValueError):
+            store.get_field_data("result__SIEF_ELGA", support="MAI.QU4", rows=np.array([0, 1]))
@@ -0,0 +1,39 @@
+import numpy as np
+
+from ada.fem.formats.sesam.results.read_sif import SifReader, read_sif_file
+
+
+def test_read_eigen_modes(fem_files):
+    result = read_sif_file(fem_files / "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF")
+    nodal = [x for x in result.results if x.name == "RVNODDIS"]
+    assert [x.step for x in nodal] == list(range(1, 21))
+    assert len([x for x in result.results if x.name == "FORCES"]) == 20
+
+
+def test_read_selected_eigen_mode(fem_files):
+    sif_file = fem_files / "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF"
+    full = read_sif_file(sif_file)
+    result = read_sif_file(sif_file, result_cards=["RVNODDIS"], load_cases=[3])
+
+    assert len(result.results) == 1
+    mode = result.results[0]
+    assert mode.step == 3
+
+    expected = [x for x in full.results if x.name == "RVNODDIS" and x.step == 3][0]
+    assert np.array_equal(mode.values, expected.values)
+
+
+def test_sif_reader_chunks(fem_files):
+    sif_file = fem_files / "sesam/2EL_SHELL_R1.SIF"
+    with open(sif_file, "r") as f:
+        sif = SifReader(f)
+        sif.load()
+
+    with open(sif_file, "r") as f:
+        sif_chunked = SifReader(f, chunk_size=1)
+        sif_chunked.load()
+
+    assert np.array_equal(sif.nodes, sif_chunked.nodes)
+    assert sif.get_rdpoints_map().keys() == sif_chunked.get_rdpoints_map().keys()
+    for (name, records), (_, records_chunked) in zip(sif.results, sif_chunked.results):
+        assert records.to_lists() == records_chunked.to_lists()
@@ -0,0 +1,43 @@
+import numpy as np
+
+from ada.fem.formats.sesam.results.read_sif import read_sif_file
+from ada.visualize.colors import ColorMap, DataColorizer, get_scalar_values, magnitude
+
+
+def test_color_map():
+    cmap = ColorMap([(0, 0, 1), (1, 0, 0)], num_colors=11)
+    colors = cmap.map(np.array([2.0, 4.0, 3.0]))
+    assert np.allclose(colors, [(0, 0, 1), (1, 0, 0), (0.5, 0, 0.5)])
+
+    # Constant data is given the first colour
+    assert np.allclose(cmap.map(np.ones(2)), [(0, 0, 1), (0, 0, 1)])
+
+
+def test_scalar_values():
+    data = np.array([[3.0, 4.0, 0.0, 9.0], [0.0, 0.0, 1.0, 9.0]])
+    assert np.allclose(get_scalar_values(data), [5.0, 1.0])
+    assert np.allclose(get_scalar_values(data, lambda u: max(u)), [9.0, 9.0])
+    assert DataColorizer.colorize_data(data).shape == (2, 3)
+
+    # Functions are called per row unless they are known to be vectorized
+    data = np.array([[1.0, 5.0, 0.0, 2.0], [9.0, 0.0, 3.0, 1.0], [0.0, 1.0, 3.0, 2.0], [2.0, 1.0, 0.0, 2.0]])
+    assert np.allclose(get_scalar_values(data, lambda u: np.sort(u)[-1]), [5.0, 9.0, 3.0, 2.0])
+    w = np.array([1.0, 0.0, 0.0, 0.0])
+    assert np.allclose(get_scalar_values(data, lambda u: np.dot(u, w)), [1.0, 9.0, 0.0, 2.0])
+    assert np.allclose(get_scalar_values(data, magnitude), np.linalg.norm(data[:, :3], axis=1))
+    assert np.allclose(get_scalar_values(data, lambda u: u[0] + u[3], vectorized=True), [3.0, 10.0, 2.0, 4.0])
+
+
+def test_eigen_mode_frames(fem_files):
+    result = read_sif_file(fem_files / "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF")
+    frames = result.get_frames("RVNODDIS")
+
+    coords = result.mesh.nodes.coords
+    displ = result.get_data("RVNODDIS", 2)[:, :3]
+    frame = frames.get_frame(2, scale=0.5)
+    assert frame.colors.shape == (len(coords), 3)
+    assert np.allclose(frame.vertices, coords + 0.5 * displ, atol=1e-5)
+
+    # Frames of other scales reuse the cached displacements and colours
+    assert frames.get_frame(2, scale=2.0).colors is frame.colors
+    assert np.allclose(frames.get_frame(2, scale=0.0).vertices, coords)
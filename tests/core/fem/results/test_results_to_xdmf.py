@@ -0,0 +1,57 @@
+import h5py
+import meshio
+import numpy as np
+import pytest
+
+from ada.fem.formats.sesam.results.read_sif import read_sif_file
+from ada.fem.formats.xdmf import XdmfTimeSeriesWriter
+from ada.fem.results.common import FEAResult
+
+
+def test_static_shell_to_xdmf(fem_files, tmp_path):
+    result = read_sif_file(fem_files / "cantilever/sesam/static/shell/STATIC_SHELL_CANTILEVER_SESAMR1.SIF")
+    result.to_xdmf(tmp_path / "static_shell.xdmf")
+
+    with meshio.xdmf.TimeSeriesReader(tmp_path / "static_shell.xdmf") as reader:
+        _, cells = reader.read_points_cells()
+        _, point_data, cell_data = reader.read_data(0)
+
+    assert "RVNODDIS" in point_data
+    assert cell_data["STRESS"][0].shape[0] == len(cells[0].data)
+
+
+@pytest.mark.parametrize("compression", [None, "lzf", "gzip"])
+def test_append_steps_to_xdmf(fem_files, tmp_path, compression):
+    result = read_sif_file(fem_files / "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF")
+    first = [x for x in result.results if x.step <= 5]
+    rest = [x for x in result.results if x.step > 5]
+
+    xdmf_file = tmp_path / "eigen_line.xdmf"
+    FEAResult(result.name, result.software, first, result.mesh).to_xdmf(xdmf_file, compression=compression)
+    FEAResult(result.name, result.software, rest, result.mesh).to_xdmf(xdmf_file, compression=compression, append=True)
+
+    with meshio.xdmf.TimeSeriesReader(xdmf_file) as reader:
+        reader.read_points_cells()
+        assert reader.num_steps == 20
+        t, point_data, _ = reader.read_data(12)
+
+    expected = [x for x in result.results if x.step == 13 and x.name == "RVNODDIS"][0]
+    assert float(t) == 13
+    assert np.array_equal(point_data["RVNODDIS"], expected.get_all_values())
+
+    with h5py.File(xdmf_file.with_suffix(".h5"), "r") as f:
+        assert f["data0"].compression == compression
+
+
+def test_integer_point_data(tmp_path):
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0]], dtype=float)
+    with XdmfTimeSeriesWriter(tmp_path / "int_data.xdmf") as writer:
+        writer.write_points_cells(points, [("triangle", np.array([[0, 1, 2]]))])
+        writer.write_data(0, point_data={"labels": np.array([3, 1, 2], dtype=np.int32)})
+
+    with meshio.xdmf.TimeSeriesReader(tmp_path / "int_data.xdmf") as reader:
+        reader.read_points_cells()
+        _, point_data, _ = reader.read_data(0)
+
+    assert point_data["labels"].dtype == np.int32
+    assert point_data["labels"].tolist() == [3, 1, 2]
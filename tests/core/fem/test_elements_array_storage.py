@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from ada import FEM, Node
+from ada.concepts.containers import Nodes
+from ada.fem import Elem
+from ada.fem.containers import FemElementArrays, FemElements
+from ada.fem.shapes.definitions import ShellShapes
+
+
+@pytest.fixture
+def quad_fem() -> FEM:
+    """A 10 x 10 grid of quad elements stored as arrays"""
+    nx = 10
+    coords = [(x, y, 0.0) for y in range(nx + 1) for x in range(nx + 1)]
+    fem = FEM("ArrayFem", elements=FemElementArrays())
+    fem.nodes = Nodes([Node(p, i) for i, p in enumerate(coords, start=1)], parent=fem)
+
+    node_refs = []
+    for j in range(nx):
+        for i in range(nx):
+            n1 = j * (nx + 1) + i + 1
+            node_refs.append((n1, n1 + 1, n1 + nx + 2, n1 + nx + 1))
+
+    fem.elements.add_block(ShellShapes.QUAD, np.arange(1, nx * nx + 1), node_refs)
+    return fem
+
+
+def test_add_block(quad_fem):
+    assert len(quad_fem.elements) == 100
+    assert quad_fem.elements.max_el_id == 100
+
+    (block,) = quad_fem.elements.to_elem_blocks()
+    assert block.elem_info.type == ShellShapes.QUAD
+    assert block.node_refs.shape == (100, 4)
+
+
+def test_lazy_views(quad_fem):
+    el = quad_fem.elements.from_id(12)
+    assert isinstance(el, Elem)
+    assert [n.id for n in el.nodes] == [13, 14, 25, 24]
+    assert quad_fem.elements.from_id(12) is el
+    assert el in quad_fem.elements
+
+
+def test_duplicate_ids(quad_fem):
+    with pytest.raises(ValueError):
+        quad_fem.elements.add_block("QUAD", [5], [(1, 2, 13, 12)])
+
+
+def test_remove_and_renumber(quad_fem):
+    quad_fem.elements.remove_elements_by_id(list(range(1, 51)))
+    assert len(quad_fem.elements) == 50
+    assert quad_fem.elements.min_el_id == 1
+    assert quad_fem.elements.max_el_id == 50
+
+
+def test_node_renumbering_updates_connectivity(quad_fem):
+    el = quad_fem.elements.from_id(1)
+    old_nodes = [n for n in el.nodes]
+    quad_fem.nodes.renumber(start_id=1000)
+    (block,) = quad_fem.elements.to_elem_blocks()
+    assert block.node_refs[0].tolist() == [n.id for n in old_nodes]
+
+
+def test_mixed_single_adds():
+    n1, n2, n3 = Node((0, 0, 0), 1), Node((1, 0, 0), 2), Node((1, 1, 0), 3)
+    elements = FemElementArrays([Elem(1, [n1, n2], "LINE"), Elem(2, [n2, n3], "LINE")])
+    elements.add(Elem(None, [n1, n2, n3], "TRIANGLE"))
+    assert len(elements) == 3
+    assert elements.max_el_id == 3
+    assert [el.id for el in elements] == [1, 2, 3]
+    assert [el.id for el in elements.to_fem_elements()] == [1, 2, 3]
+    assert isinstance(elements.to_fem_elements(), FemElements)
+
+
+def test_remove_standalones_keeps_array_referenced_nodes(quad_fem):
+    quad_fem.nodes.add(Node((20, 20, 0)))
+    quad_fem.nodes.remove_standalones()
+    assert len(quad_fem.nodes) == 121
+
+
+def test_merge_coincident_remaps_connectivity(quad_fem):
+    duplicate = quad_fem.nodes.add(Node((1, 0, 0)), allow_coincident=True)
+    quad_fem.elements.add_block(ShellShapes.TRI, [101], [(duplicate.id, 1, 12)])
+    quad_fem.nodes.merge_coincident()
+
+    assert len(quad_fem.nodes) == 121
+    (tri_block,) = [x for x in quad_fem.elements.to_elem_blocks() if x.elem_info.type == ShellShapes.TRI]
+    assert tri_block.node_refs[0].tolist() == [2, 1, 12]
+
+
+def test_remap_unknown_node_ids_raises(quad_fem):
+    with pytest.raises(KeyError):
+        quad_fem.elements.remap_node_refs(np.arange(1, 100), np.arange(1, 100))
+
+
+def test_iterated_views_are_not_kept(quad_fem):
+    elements = quad_fem.elements
+    assert len([el for el in elements]) == 100
+    assert len(list(elements.group_by_type()[0][1])) == 100
+    assert len(elements._views) == 0
+    assert len(elements._view_cache) == 0
+    assert all(len(n.refs) == 0 for n in quad_fem.nodes)
+
+    el = elements.from_id(5)
+    assert elements.from_id(5) is el
+    assert len(elements._views) == 0
+
+
+def test_changed_views_are_kept(quad_fem):
+    elements = quad_fem.elements
+    elements.from_id(7).elset = "MySet"
+    assert list(elements._views.keys()) == [7]
+    assert elements.from_id(7).elset == "MySet"
+    assert elements.from_id(7) in elements.from_id(7).nodes[0].refs
+
+    elements.renumber(start_id=11)
+    assert elements.from_id(17).elset == "MySet"
@@ -0,0 +1,32 @@
+import numpy as np
+
+from ada.fem.shapes.definitions import LineShapes, ShellShapes, SolidShapes
+from ada.fem.shapes.topology import get_edges_and_faces, triangulate
+
+# Two hexahedrons sharing the face (1, 2, 6, 5) / (8, 9, 10, 11)
+TWO_HEX = np.array([[0, 1, 2, 3, 4, 5, 6, 7], [1, 8, 9, 2, 5, 10, 11, 6]])
+
+
+def test_line_and_shell_blocks():
+    blocks = [(LineShapes.LINE, np.array([[0, 1], [1, 2]])), (ShellShapes.QUAD, np.array([[0, 1, 2, 3]]))]
+    edges, faces = get_edges_and_faces(blocks)
+    assert edges.tolist() == [[0, 1], [1, 2], [0, 1], [1, 2], [2, 3], [3, 0]]
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    edges, _ = get_edges_and_faces(blocks, remove_duplicate_edges=True)
+    assert edges.tolist() == [[0, 1], [1, 2], [2, 3], [3, 0]]
+
+
+def test_solid_boundary_faces():
+    edges, faces = get_edges_and_faces([(SolidShapes.HEX8, TWO_HEX)])
+    assert edges.shape == (26, 2)
+    assert faces.shape == (24, 3)
+
+    edges, faces = get_edges_and_faces([(SolidShapes.HEX8, TWO_HEX)], remove_duplicate_edges=True, boundary_only=True)
+    assert edges.shape == (20, 2)
+    assert faces.shape == (20, 3)
+    assert not any(set(face) <= {1, 2, 5, 6} for face in faces.tolist())
+
+
+def test_triangulate():
+    assert triangulate(np.array([[4, 5, 6, 7]])).tolist() == [[4, 5, 6], [4, 6, 7]]
@@ -0,0 +1,69 @@
+import pytest
+
+import ada
+from ada.ifc.read.ifc_index import IfcIndex
+from ada.ifc.read.reader_utils import get_ifc_property_sets, get_parent
+
+
+@pytest.fixture
+def ifc_file():
+    a = ada.Assembly("MyAssembly")
+    p = a.add_part(ada.Part("P1"))
+    sub = p.add_part(ada.Part("P2"))
+    for i in range(5):
+        bm = ada.Beam(f"bm{i}", (i, 0, 0), (i + 1, 0, 0), "IPE300", metadata=dict(props=dict(a=i, b=[1, 2])))
+        p.add_beam(bm, add_to_layer="Beams")
+        sub.add_plate(ada.Plate(f"pl{i}", [(0, 0), (1, 0), (1, 1)], 0.01, placement=ada.Placement(origin=(0, 0, i))))
+
+    return a.to_ifc(file_obj_only=True)
+
+
+def read_objects(f, **kwargs) -> list[str]:
+    a = ada.Assembly()
+    a.read_ifc(f, **kwargs)
+    return sorted(obj.name for obj in a.get_all_physical_objects())
+
+
+def test_index_matches_inverse_lookups(ifc_file):
+    index = IfcIndex(ifc_file)
+    for product in ifc_file.by_type("IfcProduct"):
+        assert index.get_parent(product) == get_parent(product)
+        assert index.get_property_sets(product) == get_ifc_property_sets(product)
+
+
+def test_read_selection(ifc_file):
+    beams = [f"bm{i}" for i in range(5)]
+    plates = [f"pl{i}" for i in range(5)]
+
+    assert read_objects(ifc_file) == beams + plates
+    assert read_objects(ifc_file, ifc_classes=["IfcBeam"]) == beams
+    assert read_objects(ifc_file, storeys=["P2"]) == plates
+    assert read_objects(ifc_file, storeys=["P1"]) == beams + plates
+
+    guids = [x.GlobalId for x in ifc_file.by_type("IfcProduct") if x.Name in ("bm1", "pl3")]
+    assert read_objects(ifc_file, guids=guids) == ["bm1", "pl3"]
+    assert read_objects(ifc_file, ifc_classes=["IfcPlate"], guids=guids) == ["pl3"]
+
+
+def test_read_metadata_and_layers(ifc_file):
+    a = ada.Assembly()
+    a.read_ifc(ifc_file)
+    bm = a.get_by_name("bm2")
+    assert bm.metadata["props"] == dict(a=2, b=[1, 2])
+    assert sorted(x.name for x in a.presentation_layers.get_by_name("Beams").members) == [f"bm{i}" for i in range(5)]
+
+
+def test_duplicate_part_names_resolve_to_first_part():
+    a = ada.Assembly("MyAssembly")
+    p1 = a.add_part(ada.Part("P1"))
+    p1.add_part(ada.Part("Sub"))
+    p2 = a.add_part(ada.Part("P2"))
+    p2.add_part(ada.Part("Sub"))
+    p1.parts["Sub"].add_beam(ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300"))
+    f = a.to_ifc(file_obj_only=True)
+
+    b = ada.Assembly()
+    b.read_ifc(f)
+    first, second = [p for p in b.get_all_subparts() if p.name == "Sub"]
+    assert [bm.name for bm in first.beams] == ["bm1"]
+    assert len(second.beams) == 0
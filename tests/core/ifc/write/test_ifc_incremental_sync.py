@@ -0,0 +1,105 @@
+from collections import Counter
+
+import pytest
+
+import ada
+from ada.base.changes import ChangeAction
+from ada.ifc.read.reader_utils import get_ifc_body
+
+
+def count_entities(f) -> Counter:
+    return Counter(x.is_a() for x in f)
+
+
+def build_assembly():
+    a = ada.Assembly("MyAssembly")
+    p = a.add_part(ada.Part("P1"))
+    sub = p.add_part(ada.Part("P2"))
+    for i in range(10):
+        bm = ada.Beam(f"bm{i}", (i, 0, 0), (i + 1, 0, 0), "IPE300", colour="red", metadata=dict(props=dict(a=i)))
+        p.add_beam(bm, add_to_layer="Beams")
+    sub.add_plate(ada.Plate("pl1", [(0, 0), (1, 0), (1, 1)], 0.01))
+    return a
+
+
+def test_modified_objects_are_rewritten():
+    a = build_assembly()
+    p = a.get_part("P1")
+    f = a.to_ifc(file_obj_only=True)
+    num_entities = count_entities(f)
+
+    bm = p.beams[3]
+    assert bm.change_type == ChangeAction.NOCHANGE
+    bm.n2 = ada.Node((4, 1, 0))
+    assert bm.change_type == ChangeAction.MODIFIED
+
+    f = a.to_ifc(file_obj_only=True)
+    assert bm.change_type == ChangeAction.NOCHANGE
+
+    # The beam is replaced by a single new element with the same GlobalId and relationships
+    assert count_entities(f) == num_entities
+    ifc_beam = f.by_guid(bm.guid)
+    assert ifc_beam.ContainedInStructure[0].RelatingStructure.GlobalId == p.guid
+    assert ifc_beam.IsDefinedBy[0].RelatingPropertyDefinition.HasProperties[0].NominalValue.wrappedValue == 3
+    layer = f.by_type("IfcPresentationLayerAssignment")[0]
+    assert len(layer.AssignedItems) == 10
+    assert get_ifc_body(ifc_beam) in layer.AssignedItems
+
+
+def test_removed_objects_are_deleted():
+    a = build_assembly()
+    p = a.get_part("P1")
+    f = a.to_ifc(file_obj_only=True)
+
+    bm = p.beams[5]
+    sub = p.get_part("P2")
+    pl_guid = sub.plates[0].guid
+    bm.remove()
+    sub.remove()
+    f = a.to_ifc(file_obj_only=True)
+
+    num_entities = count_entities(f)
+    assert num_entities["IfcBeam"] == 9
+    assert num_entities["IfcPlate"] == 0
+    assert num_entities["IfcBuildingStorey"] == 1
+    assert num_entities["IfcStyledItem"] == 9
+    assert len([x for x in f.by_type("IfcPropertySet") if x.Name == "props"]) == 9
+    for guid in [bm.guid, pl_guid]:
+        assert len([x for x in f if getattr(x, "GlobalId", None) == guid]) == 0
+
+    spatial_rels = f.by_type("IfcRelContainedInSpatialStructure")
+    assert len(spatial_rels) == 1
+    assert sorted(x.Name for x in spatial_rels[0].RelatedElements) == sorted(x.name for x in p.beams)
+    assert len(f.by_type("IfcPresentationLayerAssignment")[0].AssignedItems) == 9
+    assert bm not in a.presentation_layers.get_by_name("Beams").members
+
+
+def test_modified_part_placement_is_rewritten():
+    a = build_assembly()
+    sub = a.get_part("P1").get_part("P2")
+    f = a.to_ifc(file_obj_only=True)
+    ifc_placement = f.by_guid(sub.guid).ObjectPlacement
+    num_entities = count_entities(f)
+
+    sub.placement = ada.Placement(origin=(0, 0, 5))
+    assert sub.change_type == ChangeAction.MODIFIED
+    f = a.to_ifc(file_obj_only=True)
+
+    assert sub.change_type == ChangeAction.NOCHANGE
+    ifc_sub = f.by_guid(sub.guid)
+    assert ifc_sub.ObjectPlacement == ifc_placement
+    assert tuple(ifc_sub.ObjectPlacement.RelativePlacement.Location.Coordinates) == (0.0, 0.0, 5.0)
+    assert count_entities(f)["IfcLocalPlacement"] == num_entities["IfcLocalPlacement"]
+
+
+def test_modified_object_with_unsynced_material_is_not_rewritten():
+    a = build_assembly()
+    bm = a.get_part("P1").beams[0]
+    f = a.to_ifc(file_obj_only=True)
+    num_entities = count_entities(f)
+
+    bm.material = ada.Material("S420")
+    with pytest.raises(ValueError):
+        a.to_ifc(file_obj_only=True)
+
+    assert count_entities(f) == num_entities
@@ -0,0 +1,42 @@
+import ada
+
+
+def get_material_rels(f) -> dict:
+    return {
+        rel.RelatingMaterial.Name: sorted(x.Name for x in rel.RelatedObjects)
+        for rel in f.by_type("IfcRelAssociatesMaterial")
+        if rel.RelatingMaterial.is_a("IfcMaterial")
+    }
+
+
+def get_spatial_rels(f) -> dict:
+    res = dict()
+    for rel in f.by_type("IfcRelContainedInSpatialStructure"):
+        assert rel.RelatingStructure.Name not in res
+        res[rel.RelatingStructure.Name] = sorted(x.Name for x in rel.RelatedElements)
+    return res
+
+
+def test_material_and_spatial_associations():
+    mats = [ada.Material("S355"), ada.Material("S420")]
+    a = ada.Assembly("MyAssembly")
+    for name in ["P1", "P2"]:
+        p = a.add_part(ada.Part(name))
+        for i in range(10):
+            p.add_beam(ada.Beam(f"{name}_bm{i}", (i, 0, 0), (i + 1, 0, 0), "IPE300", mats[i % 2]))
+
+    f = a.to_ifc(file_obj_only=True)
+    beams = [bm for p in a.get_all_parts_in_assembly() for bm in p.beams]
+
+    for mat in mats:
+        assert get_material_rels(f)[mat.name] == sorted(bm.name for bm in beams if bm.material.name == mat.name)
+
+    spatial_rels = get_spatial_rels(f)
+    for name in ["P1", "P2"]:
+        assert spatial_rels[name] == sorted(f"{name}_bm{i}" for i in range(10))
+
+    # Objects added later are appended to the existing relationships
+    a.get_part("P1").add_beam(ada.Beam("P1_bm10", (10, 0, 0), (11, 0, 0), "IPE300", mats[0]))
+    f = a.to_ifc(file_obj_only=True)
+    assert "P1_bm10" in get_material_rels(f)["S355"]
+    assert get_spatial_rels(f)["P1"] == sorted([f"P1_bm{i}" for i in range(11)])
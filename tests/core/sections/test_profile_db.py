@@ -0,0 +1,45 @@
+import numpy as np
+
+from ada.sections.profile_db import ProfileDB, get_profile_db
+from ada.sections.utils import profile_db_collect
+
+
+def test_lookup():
+    db = get_profile_db()
+    assert db is get_profile_db()
+
+    rec = db.get("IPE", "300")
+    assert rec.name == "IPE300"
+    assert rec.h == 0.3
+
+    assert db.get("HP", "200x10").name == "HP200x10"
+    assert db.get("IPE", "301") is None
+    assert db.get("XYZ", "300") is None
+    assert [x.name if x is not None else None for x in db.get_many(["HEA300", "ipe300", "NA"])] == [
+        "HEA300",
+        "IPE300",
+        None,
+    ]
+
+
+def test_fuzzy_and_nearest():
+    db = get_profile_db()
+    assert "IPE300" in db.get_closest_names("IPE 300")
+    assert db.get_nearest("IPE", h=0.299).name == "IPE300"
+    assert db.get_nearest("HEB", h=0.31, w=0.3).family == "HEB"
+
+
+def test_properties_table():
+    table = get_profile_db().get_properties_table()
+    row = table[table["name"] == "IPE300"][0]
+    sec = profile_db_collect("IPE", "300")
+    assert row["Ax"] == sec.properties.Ax
+    assert np.all(table["Iy"] > 0)
+
+
+def test_npz_roundtrip(tmp_path):
+    db = get_profile_db()
+    db.to_npz(tmp_path / "profiles.npz")
+    db2 = ProfileDB.from_npz(tmp_path / "profiles.npz")
+    assert len(db2) == len(db)
+    assert db2.get("HEA", "300") == db.get("HEA", "300")